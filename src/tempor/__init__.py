@@ -16,10 +16,11 @@ finally:
     del version, PackageNotFoundError
 
 # Import the config type and the configure function:
-from .config import TemporConfig, configure, get_config
+from .config import TemporConfig, configure, fast_mode, get_config
 
 __all__ = [
     "get_config",
     "configure",
+    "fast_mode",
     "TemporConfig",
 ]
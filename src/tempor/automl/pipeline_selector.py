@@ -7,7 +7,7 @@ from tempor.core.types import PredictiveTaskType
 from tempor.plugins import plugin_loader
 from tempor.plugins.core import BaseEstimator, BasePredictor
 from tempor.plugins.core._params import CategoricalParams, Params
-from tempor.plugins.pipeline import PipelineBase, pipeline
+from tempor.plugins.pipeline import PipelineBase, TransformerCache, pipeline
 from tempor.plugins.preprocessing.imputation import BaseImputer
 from tempor.plugins.preprocessing.scaling import BaseScaler
 
@@ -36,6 +36,7 @@ class PipelineSelector:
         static_scalers: List[str] = DEFAULT_STATIC_SCALERS,
         temporal_imputers: List[str] = DEFAULT_TEMPORAL_IMPUTERS,
         temporal_scalers: List[str] = DEFAULT_TEMPORAL_SCALERS,
+        transformer_cache: Optional[TransformerCache] = None,
     ) -> None:
         """A helper class for AutoML pipeline selection.
 
@@ -64,6 +65,10 @@ class PipelineSelector:
                 A list of candidate temporal imputers. Defaults to `DEFAULT_TEMPORAL_IMPUTERS`.
             temporal_scalers (List[str], optional):
                 A list of candidate temporal scalers. Defaults to `DEFAULT_TEMPORAL_SCALERS`.
+            transformer_cache (Optional[TransformerCache], optional):
+                If provided, set as the ``transformer_cache`` of the pipelines created, such that the fitted
+                preprocessing steps (and their outputs) are reused between pipelines which share the same
+                preprocessing steps with the same parameters. Defaults to `None`.
         """
         self.task_type: PredictiveTaskType = task_type
 
@@ -81,6 +86,7 @@ class PipelineSelector:
         ]
 
         self.predictor: Type[BasePredictor] = plugin_loader.get_class(get_fqn(str(self.task_type), predictor))
+        self.transformer_cache = transformer_cache
 
     def _preproc_candidate_lists(self) -> List[List[Type[BaseEstimator]]]:
         list_ = [self.static_imputers, self.static_scalers, self.temporal_imputers, self.temporal_scalers]
@@ -234,7 +240,10 @@ class PipelineSelector:
         predictor_hps = self._get_relevant_hps(self.predictor.name, hps)
         pipeline_init_params[self.predictor.name] = predictor_hps
 
-        return pipeline(pipeline_def), pipeline_init_params
+        pipeline_cls = pipeline(pipeline_def)
+        pipeline_cls.transformer_cache = self.transformer_cache
+
+        return pipeline_cls, pipeline_init_params
 
     def pipeline_from_hps(self, hps: Dict[str, Any]) -> PipelineBase:
         """Return a pipeline instance from the sampled hyperparameters ``hps``.
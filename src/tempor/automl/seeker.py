@@ -4,14 +4,15 @@ import abc
 import copy
 import functools
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
+import joblib
 import numpy as np
 import optuna
-import pydantic
 from typing_extensions import Literal, Type, get_args
 
 from tempor.benchmarks import evaluation
+from tempor.core import pydantic_utils
 from tempor.core.types import PredictiveTaskType
 from tempor.data import data_typing
 from tempor.data.dataset import PredictiveDataset, TimeToEventAnalysisDataset
@@ -19,6 +20,7 @@ from tempor.log import logger
 from tempor.plugins import plugin_loader
 from tempor.plugins.core import BasePredictor
 from tempor.plugins.core._params import Params
+from tempor.plugins.pipeline import TransformerCache
 
 from ._types import AutoMLCompatibleEstimator, OptimDirection
 from .pipeline_selector import (
@@ -90,8 +92,6 @@ METRIC_DIRECTION_MAP: Dict[SupportedMetric, OptimDirection] = {
 }
 """A map from metric (`SupportedMetric`) to its optimization direction (`OptimDirection`)"""
 
-# TODO: Parallelism support (per-estimator).
-
 
 def evaluation_callback_dispatch(
     estimator: Type[BasePredictor],
@@ -186,8 +186,16 @@ def evaluation_callback_dispatch(
     return metrics.loc[metric, "mean"]  # pyright: ignore
 
 
+def _tune_estimator(tuner: BaseTuner, **kwargs: Any) -> Tuple[BaseTuner, Tuple[List[float], List[Dict]]]:
+    """Run ``tuner.tune(**kwargs)`` and return the tuner alongside the results. Used as the unit of work for
+    estimator-level parallelism in `BaseSeeker.search`, where the tuner is a copy living in a worker process.
+    """
+    estimator_results = tuner.tune(**kwargs)
+    return tuner, estimator_results
+
+
 class BaseSeeker(abc.ABC):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         study_name: str,
@@ -211,6 +219,8 @@ class BaseSeeker(abc.ABC):
         custom_tuner: Optional[BaseTuner] = None,
         raise_exceptions: bool = True,
         silence_warnings: bool = False,
+        n_jobs: int = 1,
+        n_trial_jobs: int = 1,
         **kwargs,  # pylint: disable=unused-argument
     ) -> None:
         """The base class for an AutoML Seeker, to be derived from by concrete implementations. Provides an AutoML
@@ -264,6 +274,14 @@ class BaseSeeker(abc.ABC):
             silence_warnings (bool, optional):
                 Whether to silence warnings raised. Some dependencies (e.g. `xgbse`) may circumvent this and raise
                 warnings regardless. Defaults to `False`.
+            n_jobs (int, optional):
+                Number of worker processes to run the searches for the different estimators in (estimator-level
+                parallelism). ``-1`` means using all processors, see `joblib.Parallel`. Defaults to ``1``.
+            n_trial_jobs (int, optional):
+                Number of worker processes to run the trials of each estimator search in (trial-level parallelism).
+                The workers share one `optuna` study, stored in a journal file in a temporary directory. Passed as
+                ``n_jobs`` to the default `OptunaTuner`; not applicable if ``custom_tuner`` is provided, in which case
+                set ``n_jobs`` on the custom tuner itself. Defaults to ``1``.
 
         Raises:
             ValueError: If incompatible / invalid input arguments have been passed.
@@ -288,6 +306,11 @@ class BaseSeeker(abc.ABC):
         self.raise_exceptions = raise_exceptions
         self.silence_warnings = silence_warnings
 
+        if n_jobs == 0 or n_trial_jobs == 0:
+            raise ValueError("`n_jobs` and `n_trial_jobs` must be non-zero integers")
+        self.n_jobs = n_jobs
+        self.n_trial_jobs = n_trial_jobs
+
         if len(estimator_defs) != len(estimator_names):
             raise ValueError("`estimator_defs` and `estimator_names` must be the same length.")
         self.estimator_names = estimator_names
@@ -379,12 +402,14 @@ class BaseSeeker(abc.ABC):
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=optuna.exceptions.ExperimentalWarning)
                     SamplerCls = TUNER_OPTUNA_SAMPLER_MAP[self.tuner_type]
+                    sampler_factory: Callable[..., optuna.samplers.BaseSampler]
                     if self.tuner_type != "grid":
-                        sampler = SamplerCls(seed=self.random_state)
+                        sampler_factory = SamplerCls
                     else:
                         if TYPE_CHECKING:  # pragma: no cover
                             assert self.grid is not None  # nosec B101
-                        sampler = SamplerCls(seed=self.random_state, search_space=self.grid[estimator_name])
+                        sampler_factory = functools.partial(SamplerCls, search_space=self.grid[estimator_name])
+                    sampler = sampler_factory(seed=self.random_state)
                 # Instantiate:
                 if self.tuner_type in TUNER_OPTUNA_SAMPLER_MAP:
                     tuner = OptunaTuner(
@@ -394,6 +419,9 @@ class BaseSeeker(abc.ABC):
                         study_storage=None,
                         study_pruner=pruner,
                         study_load_if_exists=False,
+                        study_sampler_factory=sampler_factory,
+                        n_jobs=self.n_trial_jobs,
+                        random_state=self.random_state,
                     )
                     self.tuners.append(tuner)
                 else:  # pragma: no cover
@@ -417,36 +445,54 @@ class BaseSeeker(abc.ABC):
             Tuple[List[BasePredictor], List[float]]:
                 ``(best_estimators, best_scores)``, the best estimators and the corresponding base scores returned.
         """
-        search_results: List[Tuple[List[float], List[Dict]]] = []
-        for idx, (estimator_name, estimator_cls, tuner) in enumerate(
-            zip(self.estimator_names, self.estimators, self.tuners)
-        ):
-            logger.info(f"Running  search for estimator '{estimator_name}' {idx+1}/{len(self.estimators)}.")
-
+        evaluation_callback = functools.partial(
+            evaluation_callback_dispatch,
+            task_type=self.task_type,
+            metric=self.metric,
+            n_cv_folds=self.num_cv_folds,
+            random_state=self.random_state,
+            horizon=self.horizon,
+            raise_exceptions=self.raise_exceptions,
+            silence_warnings=self.silence_warnings,
+        )
+        tune_kwargs: List[Dict[str, Any]] = []
+        for estimator_name, estimator_cls in zip(self.estimator_names, self.estimators):
             if estimator_name in self.override_hp_space:
                 override = self.override_hp_space[estimator_name]
             else:
                 override = None
+            tune_kwargs.append(
+                dict(
+                    estimator=estimator_cls,
+                    dataset=self.dataset,
+                    evaluation_callback=evaluation_callback,
+                    override_hp_space=override,
+                    compute_baseline_score=self.compute_baseline_score,
+                    # NOTE: The below is OptunaTuner-only kwarg:
+                    optimize_kwargs=dict(n_trials=self.num_iter, timeout=self.timeout),
+                )
+            )
 
-            estimator_results = tuner.tune(
-                estimator=estimator_cls,
-                dataset=self.dataset,
-                evaluation_callback=functools.partial(
-                    evaluation_callback_dispatch,
-                    task_type=self.task_type,
-                    metric=self.metric,
-                    n_cv_folds=self.num_cv_folds,
-                    random_state=self.random_state,
-                    horizon=self.horizon,
-                    raise_exceptions=self.raise_exceptions,
-                    silence_warnings=self.silence_warnings,
-                ),
-                override_hp_space=override,
-                compute_baseline_score=self.compute_baseline_score,
-                # NOTE: The below is OptunaTuner-only kwarg:
-                optimize_kwargs=dict(n_trials=self.num_iter, timeout=self.timeout),
+        search_results: List[Tuple[List[float], List[Dict]]] = []
+        if self.n_jobs == 1:
+            for idx, (estimator_name, tuner, kwargs) in enumerate(zip(self.estimator_names, self.tuners, tune_kwargs)):
+                logger.info(f"Running  search for estimator '{estimator_name}' {idx+1}/{len(self.estimators)}.")
+                search_results.append(tuner.tune(**kwargs))
+        else:
+            logger.info(f"Running search for {len(self.estimators)} estimators in parallel, n_jobs={self.n_jobs}.")
+            outputs = joblib.Parallel(n_jobs=self.n_jobs)(
+                joblib.delayed(_tune_estimator)(tuner, **kwargs) for tuner, kwargs in zip(self.tuners, tune_kwargs)
             )
-            search_results.append(estimator_results)
+            # The tuners were run on copies in the worker processes, keep the copies holding the completed studies.
+            # Results are collected in estimator order, regardless of the order in which the workers finished.
+            tuners = [tuner for tuner, _ in outputs]
+            for tuner, original in zip(tuners, self.tuners):
+                if isinstance(tuner, OptunaTuner) and isinstance(original, OptunaTuner) and tuner is not original:
+                    # The copy shares the journal storage of the original, whose temporary directory is removed when
+                    # its owner is garbage collected, so hand over the ownership.
+                    tuner._storage_dir = original._storage_dir  # pylint: disable=protected-access
+            self.tuners = tuners
+            search_results = [estimator_results for _, estimator_results in outputs]
 
         all_estimators = []
         all_scores = []
@@ -480,7 +526,7 @@ class BaseSeeker(abc.ABC):
 
 
 class MethodSeeker(BaseSeeker):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         study_name: str,
@@ -503,6 +549,8 @@ class MethodSeeker(BaseSeeker):
         custom_tuner: Optional[BaseTuner] = None,
         raise_exceptions: bool = True,
         silence_warnings: bool = False,
+        n_jobs: int = 1,
+        n_trial_jobs: int = 1,
         **kwargs,
     ) -> None:
         """An AutoML seeker which will search the hyperparameter space of each of the predictor estimators defined in
@@ -548,6 +596,10 @@ class MethodSeeker(BaseSeeker):
                 See `~tempor.automl.seeker.BaseSeeker`.
             silence_warnings (bool, optional):
                 See `~tempor.automl.seeker.BaseSeeker`.
+            n_jobs (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            n_trial_jobs (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
         """
         estimator_defs = estimator_names
 
@@ -572,6 +624,8 @@ class MethodSeeker(BaseSeeker):
             custom_tuner=custom_tuner,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            n_jobs=n_jobs,
+            n_trial_jobs=n_trial_jobs,
             **kwargs,
         )
 
@@ -589,7 +643,7 @@ class MethodSeeker(BaseSeeker):
 
 
 class PipelineSeeker(BaseSeeker):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         study_name: str,
@@ -602,6 +656,8 @@ class PipelineSeeker(BaseSeeker):
         static_scalers: List[str] = DEFAULT_STATIC_SCALERS,
         temporal_imputers: List[str] = DEFAULT_TEMPORAL_IMPUTERS,
         temporal_scalers: List[str] = DEFAULT_TEMPORAL_SCALERS,
+        preprocessing_cache: bool = True,
+        preprocessing_cache_dir: Optional[str] = None,
         return_top_k: int = 3,
         num_cv_folds: int = 5,
         num_iter: int = 100,
@@ -616,6 +672,8 @@ class PipelineSeeker(BaseSeeker):
         custom_tuner: Optional[BaseTuner] = None,
         raise_exceptions: bool = True,
         silence_warnings: bool = False,
+        n_jobs: int = 1,
+        n_trial_jobs: int = 1,
         **kwargs,
     ) -> None:
         """An AutoML seeker which will sample pipelines comprised of:
@@ -653,6 +711,14 @@ class PipelineSeeker(BaseSeeker):
                 A list of candidate temporal imputers. Defaults to `DEFAULT_TEMPORAL_IMPUTERS`.
             temporal_scalers (List[str], optional):
                 A list of candidate temporal scalers. Defaults to `DEFAULT_TEMPORAL_SCALERS`.
+            preprocessing_cache (bool, optional):
+                Whether to cache the fitted preprocessing steps (imputers, scalers) and their outputs for each
+                cross-validation fold, such that trials which sample the same preprocessing steps with the same
+                hyperparameters (for any of the predictors) only need to fit the final predictor. Defaults to `True`.
+            preprocessing_cache_dir (Optional[str], optional):
+                If provided, the preprocessing cache will also be stored on disk in this directory, which allows
+                sharing it between worker processes (see ``n_jobs``, ``n_trial_jobs``) and between searches on the
+                same dataset. Otherwise it is kept in memory only. Defaults to `None`.
             return_top_k (int, optional):
                 See `~tempor.automl.seeker.BaseSeeker`.
             num_cv_folds (int, optional):
@@ -683,6 +749,10 @@ class PipelineSeeker(BaseSeeker):
                 See `~tempor.automl.seeker.BaseSeeker`.
             silence_warnings (bool, optional):
                 See `~tempor.automl.seeker.BaseSeeker`.
+            n_jobs (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
+            n_trial_jobs (int, optional):
+                See `~tempor.automl.seeker.BaseSeeker`.
         """
         # Define estimator definitions:
         estimator_defs = []
@@ -718,6 +788,11 @@ class PipelineSeeker(BaseSeeker):
         else:
             override_hp_space_keys_renamed = None
 
+        # Set up the preprocessing cache, shared by the pipelines of all the estimators:
+        self.transformer_cache: Optional[TransformerCache] = None
+        if preprocessing_cache:
+            self.transformer_cache = TransformerCache(cache_dir=preprocessing_cache_dir)
+
         # Grid search not supported.
         if tuner_type == "grid":
             raise ValueError(f"The 'grid' search method not supported with {self.__class__.__name__}")
@@ -743,6 +818,8 @@ class PipelineSeeker(BaseSeeker):
             custom_tuner=custom_tuner,
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            n_jobs=n_jobs,
+            n_trial_jobs=n_trial_jobs,
             **kwargs,
         )
 
@@ -758,6 +835,7 @@ class PipelineSeeker(BaseSeeker):
             static_scalers=estimator_def["static_scalers"],
             temporal_imputers=estimator_def["temporal_imputers"],
             temporal_scalers=estimator_def["temporal_scalers"],
+            transformer_cache=self.transformer_cache,
         )
 
     def _create_estimator_with_hps(
@@ -768,6 +846,7 @@ class PipelineSeeker(BaseSeeker):
         logger.info(f"Selected score {score} for {name} with hyperparameters:\n{hps}")
 
         pipe = estimator_cls.pipeline_from_hps(hps)
+        pipe.transformer_cache = None  # The preprocessing cache is only used during the search.
 
         if not isinstance(pipe, BasePredictor):  # pragma: no cover
             # Should not end up here.
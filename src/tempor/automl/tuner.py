@@ -2,8 +2,13 @@
 
 import abc
 import copy
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+import functools
+import os
+import tempfile
+import warnings
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
+import joblib
 import optuna
 from pydantic import validate_arguments
 from typing_extensions import Protocol, runtime_checkable
@@ -39,6 +44,63 @@ class EvaluationCallback(Protocol):
         ...
 
 
+def _objective(
+    trial: optuna.Trial,
+    estimator: AutoMLCompatibleEstimator,
+    dataset: PredictiveDataset,
+    evaluation_callback: EvaluationCallback,
+    override_hp_space: Optional[List[Params]],
+) -> float:
+    """The `optuna` objective used by `OptunaTuner`. Defined at module level (and bound with `functools.partial`) so
+    that it can be sent to worker processes when trial-level parallelism is used.
+    """
+    # Ensure the override variable doesn't get mutated unintentionally by copying.
+    override_copy = copy.deepcopy(override_hp_space)
+    hps = estimator.sample_hyperparameters(trial, override=override_copy)
+
+    estimator_for_eval: Type[BasePredictor]
+    if isinstance(estimator, PipelineSelector):
+        pipe_cls, pipe_hp_dict = estimator.pipeline_class_from_hps(hps)
+        hps = dict(plugin_params=pipe_hp_dict)
+        name = pipe_cls.pipeline_seq()
+        if TYPE_CHECKING:  # pragma: no cover
+            assert issubclass(pipe_cls, BasePredictor)  # nosec B101
+        estimator_for_eval = pipe_cls
+    else:
+        estimator_for_eval = estimator
+        name = estimator_for_eval.__name__
+
+    logger.info(f"Hyperparameters sampled from {name}:\n{hps}")
+    score = evaluation_callback(estimator_for_eval, copy.deepcopy(dataset), **hps)
+
+    return score
+
+
+def _split_n_trials(n_trials: Optional[int], n_jobs: int) -> List[Optional[int]]:
+    """Split ``n_trials`` as evenly as possible between ``n_jobs`` workers. Workers that would get no trials are
+    dropped. If ``n_trials`` is `None`, each worker runs an unlimited number of trials (e.g. until timeout).
+    """
+    if n_trials is None:
+        return [None] * n_jobs
+    split = [n_trials // n_jobs + (1 if worker_idx < n_trials % n_jobs else 0) for worker_idx in range(n_jobs)]
+    return [n for n in split if n > 0]  # type: ignore [misc]
+
+
+def _optimize_worker(
+    study_name: str,
+    storage: Union[str, optuna.storages.BaseStorage],
+    sampler: optuna.samplers.BaseSampler,
+    pruner: Optional[optuna.pruners.BasePruner],
+    objective: Callable[[optuna.Trial], float],
+    optimize_kwargs: Dict[str, Any],
+) -> None:
+    """Run ``study.optimize`` on the study ``study_name`` loaded from the shared ``storage``. Used as the unit of work
+    for trial-level parallelism in `OptunaTuner`.
+    """
+    study = optuna.load_study(study_name=study_name, storage=storage, sampler=sampler, pruner=pruner)
+    study.optimize(objective, **optimize_kwargs)
+
+
 class BaseTuner(abc.ABC):
     @validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
@@ -105,6 +167,9 @@ class OptunaTuner(BaseTuner):
         study_storage: Optional[Union[str, optuna.storages.BaseStorage]] = None,
         study_pruner: Optional[optuna.pruners.BasePruner] = None,
         study_load_if_exists: bool = False,
+        study_sampler_factory: Optional[Callable[..., optuna.samplers.BaseSampler]] = None,
+        n_jobs: int = 1,
+        random_state: int = 0,
         **kwargs,
     ):
         """Hyper parameter tuning (optimization) helper for an `optuna.study.Study` using any
@@ -123,27 +188,72 @@ class OptunaTuner(BaseTuner):
                 An `optuna` pruner (passed to `optuna.create_study`). Defaults to `None`.
             study_load_if_exists (bool, optional):
                 The `load_if_exists` parameter (passed to `optuna.create_study`). Defaults to `False`.
+            study_sampler_factory (Optional[Callable[..., optuna.samplers.BaseSampler]], optional):
+                A callable that creates a new sampler (like ``study_sampler``) from a ``seed`` keyword argument, e.g.
+                ``functools.partial(optuna.samplers.TPESampler, n_startup_trials=5)``. Used to create the sampler of
+                each worker for trial-level parallelism, so must be provided if ``n_jobs`` is not ``1``. Defaults to
+                `None`.
+            n_jobs (int, optional):
+                Number of worker processes to run the trials in (trial-level parallelism). The workers share one study
+                via ``study_storage``, which must therefore be a storage that can be accessed from multiple processes
+                (e.g. an SQLite URL like ``"sqlite:///study.db"`` or an `optuna.storages.JournalStorage`). If
+                ``n_jobs`` is not ``1`` and ``study_storage`` is `None`, a journal file storage in a temporary
+                directory is used, which is removed when the tuner is garbage collected. ``-1`` means using all
+                processors, see `joblib.Parallel`. Defaults to ``1``.
+            random_state (int, optional):
+                Base seed for trial-level parallelism: each worker gets a sampler created by
+                ``study_sampler_factory(seed=random_state + worker_index)``, so that the workers do not sample identical
+                hyperparameters. Not used when ``n_jobs`` is ``1``. Defaults to ``0``.
         """
         super().__init__(
             study_name=study_name,
             direction=direction,
         )
 
+        if n_jobs == 0:
+            raise ValueError("n_jobs must be a non-zero integer")
+        if n_jobs != 1 and study_sampler_factory is None:
+            raise ValueError("study_sampler_factory must be provided if n_jobs is not 1")
+
         self.sampler = study_sampler
         self.study_storage = study_storage
         self.study_pruner = study_pruner
         self.study_load_if_exists = study_load_if_exists
+        self.study_sampler_factory = study_sampler_factory
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self._storage_dir: Optional[tempfile.TemporaryDirectory] = None
 
         self.create_study()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Copies (e.g. those sent to worker processes) use the same journal storage, but do not own its temporary
+        # directory, so must not remove it.
+        state["_storage_dir"] = None
+        return state
+
     def create_study(self) -> optuna.Study:
         """Create an `optuna.Study` to be used for tuning. Sets the ``self.study`` attribute.
 
         Returns:
             optuna.Study: The created study.
         """
+        self._storage = self.study_storage
+        if self._storage_dir is not None:
+            self._storage_dir.cleanup()
+            self._storage_dir = None
+        if self._storage is None and self.n_jobs != 1:
+            # Trial-level parallelism needs a storage that is shared between processes. The temporary directory is
+            # owned by the tuner, and removed when it is cleaned up (or garbage collected).
+            self._storage_dir = tempfile.TemporaryDirectory(prefix="tempor_optuna_")
+            journal_path = os.path.join(self._storage_dir.name, f"{self.study_name}.log")
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=optuna.exceptions.ExperimentalWarning)
+                self._storage = optuna.storages.JournalStorage(optuna.storages.JournalFileStorage(journal_path))
+            logger.debug(f"Using journal file storage for study {self.study_name}: {journal_path}")
         self.study = optuna.create_study(
-            storage=self.study_storage,
+            storage=self._storage,
             sampler=self.sampler,
             pruner=self.study_pruner,
             study_name=self.study_name,
@@ -207,29 +317,18 @@ class OptunaTuner(BaseTuner):
         if len(estimator.hyperparameter_space()) == 0:
             return scores, params
 
-        def objective(trial: optuna.Trial) -> float:
-            # Ensure the override variable doesn't get mutated unintentionally by copying.
-            override_copy = copy.deepcopy(override_hp_space)
-            hps = estimator.sample_hyperparameters(trial, override=override_copy)
-
-            estimator_for_eval: Type[BasePredictor]
-            if isinstance(estimator, PipelineSelector):
-                pipe_cls, pipe_hp_dict = estimator.pipeline_class_from_hps(hps)
-                hps = dict(plugin_params=pipe_hp_dict)
-                name = pipe_cls.pipeline_seq()
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert issubclass(pipe_cls, BasePredictor)  # nosec B101
-                estimator_for_eval = pipe_cls
-            else:
-                estimator_for_eval = estimator
-                name = estimator_for_eval.__name__
-
-            logger.info(f"Hyperparameters sampled from {name}:\n{hps}")
-            score = evaluation_callback(estimator_for_eval, copy.deepcopy(dataset), **hps)
-
-            return score
+        objective = functools.partial(
+            _objective,
+            estimator=estimator,
+            dataset=dataset,
+            evaluation_callback=evaluation_callback,
+            override_hp_space=override_hp_space,
+        )
 
-        self.study.optimize(objective, **optimize_kwargs)
+        if self.n_jobs == 1:
+            self.study.optimize(objective, **optimize_kwargs)
+        else:
+            self._optimize_parallel(objective, optimize_kwargs)
 
         for trial_idx, trial_info in enumerate(self.study.get_trials(states=[optuna.trial.TrialState.COMPLETE])):
             score_trial = trial_info.values[0]
@@ -241,3 +340,23 @@ class OptunaTuner(BaseTuner):
             params.append(params_trial)
 
         return scores, params
+
+    def _optimize_parallel(self, objective: Callable[[optuna.Trial], float], optimize_kwargs: Dict[str, Any]) -> None:
+        # Each worker process loads the study from the shared storage and runs its share of ``n_trials``. Results are
+        # written to the storage, so are visible to ``self.study`` once all workers are done.
+        n_jobs = joblib.effective_n_jobs(self.n_jobs)
+        worker_n_trials = _split_n_trials(optimize_kwargs.get("n_trials", None), n_jobs)
+        if not worker_n_trials:
+            return
+        logger.info(f"Running trials for study {self.study_name} in {len(worker_n_trials)} worker processes.")
+        joblib.Parallel(n_jobs=len(worker_n_trials))(
+            joblib.delayed(_optimize_worker)(
+                study_name=self.study_name,
+                storage=self._storage,
+                sampler=self.study_sampler_factory(seed=self.random_state + worker_idx),  # type: ignore [misc]
+                pruner=self.study_pruner,
+                objective=objective,
+                optimize_kwargs=dict(optimize_kwargs, n_trials=n_trials),
+            )
+            for worker_idx, n_trials in enumerate(worker_n_trials)
+        )
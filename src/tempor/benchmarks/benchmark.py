@@ -33,6 +33,7 @@ def benchmark_models(
     horizons: Optional[data_typing.TimeIndex] = None,
     raise_exceptions: bool = False,
     silence_warnings: bool = True,
+    n_jobs: int = 1,
 ) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
     """Benchmark the performance of several algorithms.
 
@@ -57,6 +58,9 @@ def benchmark_models(
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Some dependencies (e.g. `xgbse`) may circumvent this and raise warnings
             regardless. Defaults to `True`.
+        n_jobs (int, optional):
+            Number of cross-validation folds to evaluate in parallel, see e.g.
+            :func:`~tempor.benchmarks.evaluation.evaluate_prediction_oneoff_classifier`. Defaults to ``1``.
 
     Returns:
         Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
@@ -105,6 +109,7 @@ def benchmark_models(
             horizons=horizons,  # type: ignore
             raise_exceptions=raise_exceptions,
             silence_warnings=silence_warnings,
+            n_jobs=n_jobs,
         )
 
         mean_score = scores["mean"].to_dict()
@@ -1,8 +1,9 @@
 import copy
 import warnings
 from time import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Sequence, Tuple, Union, cast
 
+import joblib
 import numpy as np
 import pandas as pd
 import pydantic
@@ -176,6 +177,91 @@ class _InternalScores(pydantic.BaseModel):
         arbitrary_types_allowed = True
 
 
+FoldEvaluationCallable = Callable[..., Dict[str, float]]
+"""A function ``(model, train_data, test_data, **kwargs) -> scores`` that fits the ``model`` on ``train_data`` and
+returns the metric scores on ``test_data``.
+"""
+
+
+def _run_fold(
+    evaluate_fold: FoldEvaluationCallable,
+    estimator: Any,
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+    *,
+    random_state: int,
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    error_message: str,
+    **kwargs: Any,
+) -> Tuple[Dict[str, float], int, float]:
+    # Evaluates a single fold, returns (scores, error count, duration). May run in a worker process, so sets up the
+    # random seed and warnings filters itself, so that the result does not depend on where (or in which order) the
+    # folds run.
+    with warnings.catch_warnings():
+        if silence_warnings:
+            warnings.simplefilter("ignore")
+
+        enable_reproducibility(random_state)
+        model = copy.deepcopy(estimator)
+        start = time()
+        try:
+            scores = evaluate_fold(model, train_data, test_data, **kwargs)
+            error = 0
+        except BaseException as e:  # pylint: disable=broad-except
+            logger.error(f"{error_message}: {e}")
+            if raise_exceptions:
+                raise
+            scores = dict()
+            error = 1
+
+        return scores, error, time() - start
+
+
+def _evaluate_folds(
+    evaluate_fold: FoldEvaluationCallable,
+    estimator: Any,
+    folds: Iterable[Tuple[dataset.PredictiveDataset, dataset.PredictiveDataset]],
+    results: _InternalScores,
+    *,
+    n_jobs: int,
+    random_state: int,
+    raise_exceptions: bool,
+    silence_warnings: bool,
+    error_message: str,
+    **kwargs: Any,
+) -> None:
+    # Runs `evaluate_fold` on each of the `folds`, serially if `n_jobs == 1`, otherwise in `joblib` worker processes,
+    # and collects the scores, errors and durations in `results` (in fold order).
+    run_kwargs: Dict[str, Any] = dict(
+        random_state=random_state,
+        raise_exceptions=raise_exceptions,
+        silence_warnings=silence_warnings,
+        error_message=error_message,
+        **kwargs,
+    )
+    if n_jobs == 1:
+        fold_results = [
+            _run_fold(evaluate_fold, estimator, train_data, test_data, **run_kwargs) for train_data, test_data in folds
+        ]
+    else:
+        fold_results = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_run_fold)(evaluate_fold, estimator, train_data, test_data, **run_kwargs)
+            for train_data, test_data in folds
+        )
+
+    for indx, (scores, error, duration) in enumerate(fold_results):  # type: ignore[arg-type]
+        for metric in scores:
+            results.metrics[metric][indx] = scores[metric]
+        results.errors.append(error)
+        results.durations.append(duration)
+
+
+def _validate_n_jobs(n_jobs: int) -> None:
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer")
+
+
 @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
 def _postprocess_results(results: _InternalScores) -> pd.DataFrame:
     output = pd.DataFrame([], columns=output_metrics)
@@ -343,6 +429,7 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating classifiers.
@@ -362,6 +449,10 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        n_jobs (int, optional):
+            Number of cross-validation folds to evaluate in parallel, in `joblib` worker processes. ``-1`` means using
+            all processors. The `joblib` backend can be configured with ``joblib.parallel_config``. Each fold is seeded
+            with ``random_state``, so the results do not depend on ``n_jobs``. Defaults to ``1`` (serial evaluation).
 
     Returns:
         pd.DataFrame:
@@ -380,6 +471,7 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
 
         if n_splits < 2 or not isinstance(n_splits, int):
             raise ValueError("n_splits must be an integer >= 2")
+        _validate_n_jobs(n_jobs)
         estimator_ = cast("BaseOneOffClassifier", estimator)
         enable_reproducibility(random_state)
 
@@ -396,34 +488,38 @@ def evaluate_prediction_oneoff_classifier(  # pylint: disable=unused-argument
         if len(labels.shape) > 1:
             raise ValueError("Classifier evaluation expects 1D output")
 
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter, y=labels):
-            model = copy.deepcopy(estimator_)
-            start = time()
-            try:
-                model.fit(train_data)
-
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert test_data.predictive.targets is not None  # nosec B101
-                test_labels = test_data.predictive.targets.numpy()
-                preds = model.predict_proba(test_data).numpy()
-
-                scores = evaluator.score_proba(test_labels, preds)
-                for metric in scores:
-                    results.metrics[metric][indx] = scores[metric]
-                results.errors.append(0)
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+        _evaluate_folds(
+            _evaluate_classifier_fold,
+            estimator_,
+            data.split(splitter=splitter, y=labels),
+            results,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            raise_exceptions=raise_exceptions,
+            silence_warnings=silence_warnings,
+            error_message="Evaluation failed",
+            evaluator=evaluator,
+        )
 
     return _postprocess_results(results)
 
 
+def _evaluate_classifier_fold(
+    model: "BaseOneOffClassifier",
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+    evaluator: ClassifierMetrics,
+) -> Dict[str, float]:
+    model.fit(train_data)
+
+    if TYPE_CHECKING:  # pragma: no cover
+        assert test_data.predictive.targets is not None  # nosec B101
+    test_labels = test_data.predictive.targets.numpy()
+    preds = model.predict_proba(test_data).numpy()
+
+    return evaluator.score_proba(test_labels, preds)
+
+
 @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
 def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
     estimator: Any,
@@ -432,6 +528,7 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating regression tasks.
@@ -451,6 +548,10 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        n_jobs (int, optional):
+            Number of cross-validation folds to evaluate in parallel, in `joblib` worker processes. ``-1`` means using
+            all processors. The `joblib` backend can be configured with ``joblib.parallel_config``. Each fold is seeded
+            with ``random_state``, so the results do not depend on ``n_jobs``. Defaults to ``1`` (serial evaluation).
 
     Returns:
         pd.DataFrame:
@@ -469,6 +570,7 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
 
         if n_splits < 2 or not isinstance(n_splits, int):
             raise ValueError("n_splits must be an integer >= 2")
+        _validate_n_jobs(n_jobs)
         estimator_ = cast("BaseOneOffRegressor", estimator)
         enable_reproducibility(random_state)
         metrics = regression_supported_metrics
@@ -479,34 +581,40 @@ def evaluate_prediction_oneoff_regressor(  # pylint: disable=unused-argument
 
         splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
 
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter):
-            model = copy.deepcopy(estimator_)
-            start = time()
-            try:
-                model.fit(train_data)
-
-                if TYPE_CHECKING:  # pragma: no cover
-                    assert test_data.predictive.targets is not None  # nosec B101
-                targets = test_data.predictive.targets.numpy().squeeze()
-                preds = model.predict(test_data).numpy().squeeze()
-
-                results.metrics["mse"][indx] = sklearn.metrics.mean_squared_error(targets, preds)
-                results.metrics["mae"][indx] = sklearn.metrics.mean_absolute_error(targets, preds)
-                results.metrics["r2"][indx] = sklearn.metrics.r2_score(targets, preds)
-                results.errors.append(0)
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Regression evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+        _evaluate_folds(
+            _evaluate_regressor_fold,
+            estimator_,
+            data.split(splitter=splitter),
+            results,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            raise_exceptions=raise_exceptions,
+            silence_warnings=silence_warnings,
+            error_message="Regression evaluation failed",
+        )
 
     return _postprocess_results(results)
 
 
+def _evaluate_regressor_fold(
+    model: "BaseOneOffRegressor",
+    train_data: dataset.PredictiveDataset,
+    test_data: dataset.PredictiveDataset,
+) -> Dict[str, float]:
+    model.fit(train_data)
+
+    if TYPE_CHECKING:  # pragma: no cover
+        assert test_data.predictive.targets is not None  # nosec B101
+    targets = test_data.predictive.targets.numpy().squeeze()
+    preds = model.predict(test_data).numpy().squeeze()
+
+    return {
+        "mse": sklearn.metrics.mean_squared_error(targets, preds),
+        "mae": sklearn.metrics.mean_absolute_error(targets, preds),
+        "r2": sklearn.metrics.r2_score(targets, preds),
+    }
+
+
 TimeToEventMetricCallable = Callable[[np.ndarray, np.ndarray, np.ndarray, List[float]], List[float]]
 """Standardized function for time-to-event metric.
 
@@ -594,6 +702,7 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
     random_state: int = 0,
     raise_exceptions: bool = False,
     silence_warnings: bool = False,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> pd.DataFrame:
     """Helper for evaluating time-to-event tasks.
@@ -615,6 +724,10 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
             dataframe. Defaults to `False`.
         silence_warnings (bool, optional):
             Whether to silence warnings raised. Defaults to `False`.
+        n_jobs (int, optional):
+            Number of cross-validation folds to evaluate in parallel, in `joblib` worker processes. ``-1`` means using
+            all processors. The `joblib` backend can be configured with ``joblib.parallel_config``. Each fold is seeded
+            with ``random_state``, so the results do not depend on ``n_jobs``. Defaults to ``1`` (serial evaluation).
 
     Returns:
         pd.DataFrame:
@@ -633,13 +746,10 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
 
         if n_splits < 2 or not isinstance(n_splits, int):
             raise ValueError("n_splits must be an integer >= 2")
+        _validate_n_jobs(n_jobs)
         estimator_ = cast("BaseTimeToEventAnalysis", estimator)
         enable_reproducibility(random_state)
         metrics = time_to_event_supported_metrics
-        metrics_map = {
-            "c_index": compute_c_index,
-            "brier_score": compute_brier_score,
-        }
 
         results = _InternalScores()
         for metric in metrics:
@@ -647,35 +757,44 @@ def evaluate_time_to_event(  # pylint: disable=unused-argument
 
         splitter = sklearn.model_selection.KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
 
-        indx = 0
-        for train_data, test_data in data.split(splitter=splitter):
-            model = copy.deepcopy(estimator_)
-            start = time()
-            try:
-                model.fit(train_data)
-
-                # targets = test_data.predictive.targets.numpy().squeeze()
-                preds = model.predict(test_data, horizons=horizons)
-
-                for metric_name in time_to_event_supported_metrics:
-                    metric_func = metrics_map[metric_name]
-                    results.metrics[metric_name][indx] = _compute_time_to_event_metric(
-                        metric_func,
-                        train_data=train_data,
-                        test_data=test_data,
-                        horizons=horizons,
-                        predictions=preds,
-                    )
-
-                results.errors.append(0)
-
-            except BaseException as e:  # pylint: disable=broad-except
-                logger.error(f"Regression evaluation failed: {e}")
-                results.errors.append(1)
-                if raise_exceptions:
-                    raise
-
-            results.durations.append(time() - start)
-            indx += 1
+        _evaluate_folds(
+            _evaluate_time_to_event_fold,
+            estimator_,
+            data.split(splitter=splitter),
+            results,
+            n_jobs=n_jobs,
+            random_state=random_state,
+            raise_exceptions=raise_exceptions,
+            silence_warnings=silence_warnings,
+            error_message="Regression evaluation failed",
+            horizons=horizons,
+        )
 
     return _postprocess_results(results)
+
+
+def _evaluate_time_to_event_fold(
+    model: "BaseTimeToEventAnalysis",
+    train_data: dataset.TimeToEventAnalysisDataset,
+    test_data: dataset.TimeToEventAnalysisDataset,
+    horizons: data_typing.TimeIndex,
+) -> Dict[str, float]:
+    metrics_map = {
+        "c_index": compute_c_index,
+        "brier_score": compute_brier_score,
+    }
+    model.fit(train_data)
+
+    # targets = test_data.predictive.targets.numpy().squeeze()
+    preds = model.predict(test_data, horizons=horizons)
+
+    return {
+        metric_name: _compute_time_to_event_metric(
+            metrics_map[metric_name],
+            train_data=train_data,
+            test_data=test_data,
+            horizons=horizons,
+            predictions=preds,
+        )
+        for metric_name in time_to_event_supported_metrics
+    }
@@ -1,4 +1,4 @@
-from typing import Any, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 import numpy as np
 import sklearn
@@ -446,37 +446,78 @@ class CensoringDistributionEstimator(SurvivalFunctionEstimator):
         return weights
 
 
-def _get_comparable(event_indicator, event_time, order):
+def _get_time_groups(event_time: np.ndarray, order: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """For each position in the time-sorted ``order``, return the index of its group of tied event times, and the start
+    and end (exclusive) positions of that group.
+    """
+    sorted_time = event_time[order]
+    is_group_start = np.ones(len(order), dtype=bool)
+    is_group_start[1:] = sorted_time[1:] != sorted_time[:-1]
+    group = np.cumsum(is_group_start) - 1
+    group_starts = np.flatnonzero(is_group_start)
+    group_ends = np.append(group_starts[1:], len(order))
+    return group, group_starts[group], group_ends[group]
+
+
+def _get_comparable(event_indicator, event_time, order) -> Tuple[np.ndarray, int]:
+    """Find the uncensored samples that have comparable pairs. A sample with an event is comparable to all the samples
+    with a later time, and to the censored samples at the same time.
+
+    Returns:
+        Tuple[np.ndarray, int]:
+            ``(comparable, tied_time)``: the positions in ``order`` of the comparable samples, and the total number of
+            comparable pairs sharing the same time.
+    """
     n_samples = len(event_time)
-    tied_time = 0
-    comparable = {}
-    i = 0
-    while i < n_samples - 1:
-        time_i = event_time[order[i]]
-        start = i + 1
-        end = start
-        while end < n_samples and event_time[order[end]] == time_i:
-            end += 1
-
-        # check for tied event times
-        event_at_same_time = event_indicator[order[i:end]]
-        censored_at_same_time = ~event_at_same_time
-        for j in range(i, end):
-            if event_indicator[order[j]]:
-                mask = np.zeros(n_samples, dtype=bool)
-                mask[end:] = True
-                # an event is comparable to censored samples at same time point
-                mask[i:end] = censored_at_same_time
-                comparable[j] = mask
-                tied_time += censored_at_same_time.sum()
-        i = end
+    group, group_start, _ = _get_time_groups(event_time, order)
+    sorted_event = event_indicator[order].astype(bool)
+
+    # A group (of tied times) starting at the last position has only one sample, and no later samples to compare to.
+    comparable = np.flatnonzero(sorted_event & (group_start < n_samples - 1))
+
+    n_censored_in_group = np.bincount(group[~sorted_event], minlength=n_samples)
+    tied_time = n_censored_in_group[group[comparable]].sum()
 
     return comparable, tied_time
 
 
+def _count_in_prefix(level_keys: List[np.ndarray], n_ranks: int, end: np.ndarray, rank_bound: np.ndarray) -> np.ndarray:
+    """For each ``i``, count the positions ``p < end[i]`` with ``rank[p] < rank_bound[i]``, by decomposing ``[0, end)``
+    into dyadic blocks. ``level_keys[level]`` are the keys ``(p >> level) * n_ranks + rank[p]``, sorted.
+    """
+    count = np.zeros(len(end), dtype=np.int64)
+    for level, keys in enumerate(level_keys):
+        uses_level = (end >> level) & 1 == 1
+        block = (end[uses_level] >> level) - 1
+        count[uses_level] += np.searchsorted(keys, block * n_ranks + rank_bound[uses_level]) - (block << level)
+    return count
+
+
+def _bisect_ranks(
+    unique_estimate: np.ndarray, estimate: np.ndarray, predicate: Callable[[np.ndarray, np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """For each value in ``estimate``, find the first rank ``r`` for which ``predicate(unique_estimate[r], value)`` is
+    true, where ``predicate`` is monotonic in ``r``. Returns ``len(unique_estimate)`` where the predicate is never true.
+    """
+    low = np.zeros(len(estimate), dtype=np.int64)
+    high = np.full(len(estimate), len(unique_estimate), dtype=np.int64)
+    while np.any(low < high):
+        mid = (low + high) // 2
+        active = low < high
+        is_true = np.zeros(len(estimate), dtype=bool)
+        is_true[active] = predicate(unique_estimate[mid[active]], estimate[active])
+        high = np.where(active & is_true, mid, high)
+        low = np.where(active & ~is_true, mid + 1, low)
+    return low
+
+
 def _estimate_concordance_index(
     event_indicator, event_time, estimate, weights, tied_tol=1e-8
 ) -> Tuple[float, int, int, int, int]:
+    # Each uncensored sample i is compared to the samples with a later time, and the censored samples at the same time
+    # (see `_get_comparable`). Rather than build a mask for each i, the numbers of (concordant, tied) pairs are
+    # counted with order statistics over the ranks of the estimates, in O(n log^2 n) time and O(n log n) memory: each of
+    # the O(log n) levels in `level_keys` is sorted, takes O(n) memory, and is binary searched once per query.
     order = np.argsort(event_time)
 
     comparable, tied_time = _get_comparable(event_indicator, event_time, order)
@@ -484,33 +525,54 @@ def _estimate_concordance_index(
     if len(comparable) == 0:
         raise ValueError("Data has no comparable pairs, cannot estimate concordance index.")
 
-    concordant = 0
-    discordant = 0
-    tied_risk = 0
-    numerator = 0.0
-    denominator = 0.0
-    for ind, mask in comparable.items():
-        est_i = estimate[order[ind]]
-        event_i = event_indicator[order[ind]]
-        w_i = weights[order[ind]]
-
-        est = estimate[order[mask]]
-
-        if not event_i:  # pragma: no cover
-            raise RuntimeError("got censored sample at index %d, but expected uncensored" % order[ind])
-
-        ties = np.absolute(est - est_i) <= tied_tol
-        n_ties = ties.sum()
-        # an event should have a higher score
-        con = est < est_i
-        n_con = con[~ties].sum()
-
-        numerator += w_i * n_con + 0.5 * w_i * n_ties
-        denominator += w_i * mask.sum()
-
-        tied_risk += n_ties
-        concordant += n_con
-        discordant += est.size - n_con - n_ties
+    n_samples = len(order)
+    group, _, group_end = _get_time_groups(event_time, order)
+    sorted_event = event_indicator[order].astype(bool)
+    sorted_estimate = estimate[order]
+
+    # Ranks of the estimates (tied estimates share a rank).
+    unique_estimate, rank = np.unique(sorted_estimate, return_inverse=True)
+    n_ranks = len(unique_estimate) + 1
+
+    est_i = sorted_estimate[comparable]
+    rank_i = rank[comparable]
+    # The range of ranks [tie_low, tie_high) tied with each i, i.e. where abs(est - est_i) <= tied_tol.
+    # NOTE: Floating point subtraction is monotonic, so these are contiguous ranges, found by bisection using exactly
+    # the same expression as the direct comparison.
+    tie_low = _bisect_ranks(unique_estimate, est_i, lambda u, e: (u - e) >= -tied_tol)
+    tie_high = _bisect_ranks(unique_estimate, est_i, lambda u, e: (u - e) > tied_tol)
+
+    # Count the ranks below a bound among the samples with later times, and the censored samples at the same time.
+    level_keys = [np.sort((np.arange(n_samples) >> level) * n_ranks + rank) for level in range(n_samples.bit_length())]
+    all_sorted_rank = np.sort(rank)
+    censored_keys = np.sort(group[~sorted_event] * n_ranks + rank[~sorted_event])
+    group_i = group[comparable]
+    end_i = group_end[comparable]
+
+    def count_below(rank_bound: np.ndarray) -> np.ndarray:
+        later = np.searchsorted(all_sorted_rank, rank_bound) - _count_in_prefix(level_keys, n_ranks, end_i, rank_bound)
+        same_time = np.searchsorted(censored_keys, group_i * n_ranks + rank_bound) - np.searchsorted(
+            censored_keys, group_i * n_ranks
+        )
+        return later + same_time
+
+    n_compared = (n_samples - end_i) + (
+        np.searchsorted(censored_keys, (group_i + 1) * n_ranks) - np.searchsorted(censored_keys, group_i * n_ranks)
+    )
+    n_ties = np.where(tie_low < tie_high, count_below(tie_high) - count_below(tie_low), 0)
+    # An event should have a higher score:
+    below_tie_high = np.minimum(tie_high, rank_i)
+    n_ties_below = np.where(tie_low < below_tie_high, count_below(below_tie_high) - count_below(tie_low), 0)
+    n_con = count_below(rank_i) - n_ties_below
+
+    w_i = weights[order[comparable]]
+    # Accumulate sequentially (rather than with the pairwise `np.sum`), for the same result as a loop over i.
+    numerator = np.add.accumulate(w_i * n_con + 0.5 * w_i * n_ties)[-1]
+    denominator = np.add.accumulate(w_i * n_compared)[-1]
+
+    tied_risk = n_ties.sum()
+    concordant = n_con.sum()
+    discordant = (n_compared - n_con - n_ties).sum()
 
     cindex = numerator / denominator
     return cindex, concordant, discordant, tied_risk, tied_time
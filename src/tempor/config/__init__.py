@@ -1,8 +1,9 @@
+import contextlib
 import dataclasses
 import os
 import pathlib
 import sys
-from typing import TYPE_CHECKING, Callable, Set, Union
+from typing import TYPE_CHECKING, Callable, Iterator, Set, Union
 
 import hydra.core.config_store
 import omegaconf
@@ -33,9 +34,16 @@ class LoggingConfig:
     file_log: bool = omegaconf.MISSING
 
 
+@dataclasses.dataclass
+class PerformanceConfig:
+    fast_mode: bool = omegaconf.MISSING
+
+
 @dataclasses.dataclass
 class TemporConfig:
     logging: LoggingConfig
+    # Has a default, unlike the other fields, so that configs created without it keep working (with fast mode off).
+    performance: PerformanceConfig = dataclasses.field(default_factory=lambda: PerformanceConfig(fast_mode=False))
     working_directory: str = omegaconf.MISSING
 
     def get_working_dir(self):
@@ -115,3 +123,34 @@ def configure(new_config: Union[TemporConfig, omegaconf.DictConfig, str, pathlib
         updater(_this_module._config)
 
     return _this_module._config
+
+
+@contextlib.contextmanager
+def fast_mode(enabled: bool = True) -> Iterator[None]:
+    """A context manager that sets ``performance.fast_mode`` in the library config for the duration of the context,
+    and restores its previous value on exit.
+
+    In fast mode, the runtime argument validation (``pydantic``) of the library's hot-path methods (e.g. ``predict``
+    of the prediction plugins, or the data samples constructors) and the (``pandera``) validation checks of the data
+    samples are skipped. The data samples are otherwise constructed as usual (e.g. their indexes are named). Use this
+    only on trusted paths, where the inputs are known to be valid, e.g.:
+
+    .. code-block:: python
+
+        with tempor.config.fast_mode():
+            for batch in batches:
+                model.predict(batch)
+
+    Note:
+        The setting is process-wide, so it also applies to other threads while the context is active.
+
+    Args:
+        enabled (bool, optional): Whether fast mode is enabled within the context. Defaults to `True`.
+    """
+    config = get_config()
+    previous = config.performance.fast_mode
+    config.performance.fast_mode = enabled
+    try:
+        yield
+    finally:
+        config.performance.fast_mode = previous
@@ -1,7 +1,12 @@
-from typing import Any, Type
+import functools
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
 import pydantic
 
+import tempor.config
+
+AnyCallableT = TypeVar("AnyCallableT", bound=Callable[..., Any])
+
 # Currently unused.
 # def exclusive_args(
 #     values: Dict,
@@ -60,3 +65,39 @@ def make_pydantic_dataclass(builtin_dataclass: Type) -> Type:
     else:
         pydantic_dataclass = PYDANTIC_DATACLASS_WORKAROUND_DICT[name]
     return pydantic_dataclass
+
+
+def validate_arguments(func: Optional[AnyCallableT] = None, *, config: Optional[Dict[str, Any]] = None) -> Any:
+    """A drop-in replacement for ``pydantic.validate_arguments``, to be used on hot paths, which skips the argument
+    validation when ``performance.fast_mode`` is enabled in the library config (see `tempor.config.fast_mode`).
+
+    Note that in fast mode the arguments are passed to the function as they are, without any ``pydantic`` coercion.
+
+    Args:
+        func (Optional[AnyCallableT], optional):
+            The function to decorate, if used as ``@validate_arguments``. Defaults to `None`.
+        config (Optional[Dict[str, Any]], optional):
+            The ``pydantic`` config, as in ``pydantic.validate_arguments``. Defaults to `None`.
+
+    Returns:
+        Any: The decorated function, or the decorator if ``func`` is not provided.
+    """
+
+    def decorate(f: AnyCallableT) -> AnyCallableT:
+        validated: Any = pydantic.validate_arguments(f, config=config)  # type: ignore[arg-type]
+
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if tempor.config.get_config().performance.fast_mode:
+                return f(*args, **kwargs)
+            return validated(*args, **kwargs)
+
+        wrapper.vd = validated.vd  # type: ignore[attr-defined]
+        wrapper.validate = validated.validate  # type: ignore[attr-defined]
+        wrapper.raw_function = f  # type: ignore[attr-defined]
+        wrapper.model = validated.model  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    if func is not None:
+        return decorate(func)
+    return decorate
@@ -1,7 +1,10 @@
-from typing import Any, Dict, Tuple, Type
+import collections
+from typing import Any, Callable, Dict, Hashable, Tuple, Type, TypeVar
 
 from typing_extensions import get_args
 
+_T = TypeVar("_T")
+
 
 def get_class_full_name(o: object):
     # See: https://stackoverflow.com/a/2020083
@@ -25,6 +28,57 @@ class RichReprStrPassthrough:
         return self.string
 
 
+class LRUCache:
+    def __init__(self, maxsize: int = 128) -> None:
+        """A least-recently-used cache for objects built for a given key.
+
+        Args:
+            maxsize (int, optional):
+                Maximum number of cached items. If ``0``, nothing is cached (each `get` builds the item). Can be
+                changed on an existing cache, taking effect on the next `get`. Defaults to ``128``.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "collections.OrderedDict[Hashable, Any]" = collections.OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], _T]) -> _T:
+        """Return the item cached for ``key``, calling ``build()`` to create (and cache) it if not present.
+
+        Args:
+            key (Hashable): The cache key.
+            build (Callable[[], _T]): A function that builds the item.
+
+        Returns:
+            _T: The cached item.
+        """
+        self._evict()  # In case `maxsize` was reduced.
+        try:
+            item = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            item = build()
+            self._cache[key] = item
+            self._evict()
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        return item
+
+    def _evict(self) -> None:
+        while len(self._cache) > max(self.maxsize, 0):
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear the cache and reset the hit/miss counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
 def is_iterable(o: object) -> bool:
     is_iterable_ = True
     try:
@@ -4,10 +4,17 @@ from typing import List, Type
 import pandas as pd
 from clairvoyance2.data import Dataset as Clairvoyance2Dataset
 
+from tempor.core.utils import LRUCache
 from tempor.data import dataset, samples
 
 from . import utils
 
+conversion_cache = LRUCache(maxsize=2)
+"""The least-recently-used cache of :func:`tempor_dataset_to_clairvoyance2_dataset` conversions, keyed by dataset
+fingerprint. It keeps the converted datasets alive until they are evicted (e.g. the training and the test data of the
+last model). Use ``conversion_cache.clear()`` to release them, or set ``conversion_cache.maxsize = 0`` to disable the
+cache."""
+
 
 def _from_clv2_static(df: pd.DataFrame) -> pd.DataFrame:
     df = utils.set_df_column_names_inplace(df, names=[str(c) for c in df.columns])
@@ -114,12 +121,19 @@ def clairvoyance2_dataset_to_tempor_dataset(data: Clairvoyance2Dataset) -> datas
 
 
 def _to_clv2_static(s: samples.StaticSamples) -> pd.DataFrame:
-    int_sample_index = list(range(s.num_samples))
-    return s.dataframe().set_index(keys=pd.Index(int_sample_index), drop=True)
+    return s.dataframe().set_axis(pd.RangeIndex(s.num_samples), axis=0)
 
 
 def _to_clv2_time_series(s: samples.TimeSeriesSamples) -> List[pd.DataFrame]:
-    return [df.droplevel(0) for df in s.list_of_dataframes()]
+    # Replace the (sample, time) multiindex by the time index once, rather than for each sample, then slice the rows
+    # of each sample.
+    metadata = s.index_metadata()
+    df = s.dataframe()
+    if metadata.row_order is not None:
+        df = df.iloc[metadata.row_order]
+    df = df.set_axis(metadata.time_index, axis=0)
+    offsets = metadata.offsets.tolist()
+    return [df.iloc[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
 
 
 def _to_clv2_event(s: samples.EventSamples) -> pd.DataFrame:
@@ -141,12 +155,41 @@ def _to_clv2_event(s: samples.EventSamples) -> pd.DataFrame:
     return df
 
 
-def tempor_dataset_to_clairvoyance2_dataset(data: dataset.BaseDataset) -> Clairvoyance2Dataset:
+def tempor_dataset_to_clairvoyance2_dataset(
+    data: dataset.BaseDataset, *, use_cache: bool = True
+) -> Clairvoyance2Dataset:
+    """Convert a TemporAI dataset to a ``clairvoyance2`` dataset.
+
+    The conversions are memoized in :obj:`conversion_cache`, keyed by `~tempor.data.dataset.BaseDataset.fingerprint`,
+    so that e.g. ``fit`` followed by repeated ``predict`` calls on the same data converts it only once. The fingerprint
+    is recomputed on each call (hashing is much cheaper than the conversion), so data modified in-place is converted
+    again.
+
+    Note:
+        The cached ``clairvoyance2`` dataset is returned to all the callers that convert the same data, so it must not
+        be modified in-place (``clairvoyance2`` models copy the data before modifying it).
+
+    Args:
+        data (dataset.BaseDataset):
+            The dataset to convert.
+        use_cache (bool, optional):
+            Whether to use (and update) :obj:`conversion_cache`. Defaults to `True`.
+
+    Returns:
+        Clairvoyance2Dataset: The ``clairvoyance2`` dataset.
+    """
     if isinstance(data, dataset.OneOffPredictionDataset):
         raise ValueError(
             "Cannot convert a `OneOffPredictionDataset` to a clairvoyance2 dataset, as this setting is not supported"
         )
+    if use_cache:
+        return conversion_cache.get(
+            data.fingerprint(use_cache=False), lambda: _tempor_dataset_to_clairvoyance2_dataset(data)
+        )
+    return _tempor_dataset_to_clairvoyance2_dataset(data)
+
 
+def _tempor_dataset_to_clairvoyance2_dataset(data: dataset.BaseDataset) -> Clairvoyance2Dataset:
     def has_temporal_targets(d: dataset.BaseDataset) -> bool:
         if d.predictive is not None:
             return isinstance(d.predictive.targets, samples.TimeSeriesSamples)
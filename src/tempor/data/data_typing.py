@@ -65,6 +65,14 @@ TimeIndexList = Union[
 GetItemKey = Union[int, Iterable[int], slice]
 
 
+TimeSeriesBackend = Literal["dataframe", "ragged"]
+"""Storage backend of :class:`~tempor.data.samples.TimeSeriesSamples`:
+    - ``"dataframe"``: data is stored as a 2-level multiindex (sample, timestep) `pandas.DataFrame`.
+    - ``"ragged"``: data is stored as a :class:`~tempor.data.ragged.RaggedTimeSeries` (contiguous values buffer and
+      per-sample offsets), the `pandas.DataFrame` is only built when requested.
+"""
+
+
 class PredictiveTask(enum.Enum):
     ONE_OFF_PREDICTION = enum.auto()
     TEMPORAL_PREDICTION = enum.auto()
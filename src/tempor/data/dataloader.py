@@ -1,6 +1,6 @@
 import abc
 import os
-from typing import ClassVar, Optional, Type  # pylint: disable=unused-import
+from typing import ClassVar, Generator, Optional, Type  # pylint: disable=unused-import
 
 import tempor
 
@@ -95,6 +95,22 @@ class DataLoader(abc.ABC):
         """
         ...  # pylint: disable=unnecessary-ellipsis
 
+    def iter_chunks(self, chunk_size: int, **kwargs) -> Generator[dataset.PredictiveDataset, None, None]:
+        """Iterate over the loaded `~tempor.data.dataset.DataSet` in chunks of (up to) ``chunk_size`` samples, see
+        `~tempor.data.dataset.BaseDataset.iter_chunks`. The ``kwargs`` are passed to ``load``.
+
+        Note:
+            This implementation loads the whole dataset first. Data loaders that can read their data source in parts
+            should override this method, so that only one chunk is held in memory at a time.
+
+        Args:
+            chunk_size (int): The (maximum) number of samples in each chunk.
+
+        Yields:
+            Generator[dataset.PredictiveDataset, None, None]: The chunks.
+        """
+        yield from self.load(**kwargs).iter_chunks(chunk_size)
+
 
 class OneOffPredictionDataLoader(DataLoader):
     @property
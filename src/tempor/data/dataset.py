@@ -2,7 +2,8 @@
 
 import abc
 import dataclasses
-from typing import Any, ClassVar, Generator, Optional, Tuple, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Generator, List, Optional, Sequence, Tuple, Type, Union
 
 import rich.pretty
 import sklearn.model_selection
@@ -55,8 +56,8 @@ EXCEPTION_MESSAGES = _ExceptionMessages()
 
 
 class BaseDataset(abc.ABC):
-    _time_series: samples.TimeSeriesSamples
-    _static: Optional[samples.StaticSamples]
+    _time_series: Union[samples.TimeSeriesSamples, samples.SamplesView]
+    _static: Optional[Union[samples.StaticSamples, samples.SamplesView]]
     predictive: Optional[pred.PredictiveTaskData]
 
     def __init__(
@@ -146,7 +147,8 @@ class BaseDataset(abc.ABC):
 
     @property
     def time_series(self) -> samples.TimeSeriesSamples:
-        return self._time_series
+        self._time_series = samples.materialize(self._time_series)  # type: ignore[assignment]
+        return self._time_series  # type: ignore[return-value]
 
     @time_series.setter
     def time_series(self, value: samples.TimeSeriesSamples) -> None:
@@ -155,7 +157,9 @@ class BaseDataset(abc.ABC):
 
     @property
     def static(self) -> Optional[samples.StaticSamples]:
-        return self._static
+        if self._static is not None:
+            self._static = samples.materialize(self._static)  # type: ignore[assignment]
+        return self._static  # type: ignore[return-value]
 
     @static.setter
     def static(self, value: Optional[samples.StaticSamples]) -> None:
@@ -169,26 +173,209 @@ class BaseDataset(abc.ABC):
         ...
 
     def __len__(self) -> int:
+        if isinstance(self._time_series, samples.SamplesView):
+            return len(self._time_series)
         return self.time_series.num_samples
 
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:
+        """Select samples by position (``int``, iterable of ``int``, or ``slice``).
+
+        The returned dataset is a view: it holds this dataset's data and the sample selection, as
+        `~tempor.data.samples.SamplesView` s. Each data modality is only selected when it is first accessed, and since
+        this dataset has already been validated, the selection is not revalidated.
+
+        Args:
+            key (data_typing.GetItemKey): Sample selection key.
+
+        Returns:
+            Self: The dataset with the selected samples.
+        """
         key_ = utils.ensure_pd_iloc_key_returns_df(key)
-        new_dataset = self.__class__(
-            time_series=self.time_series[key_].dataframe(),  # pyright: ignore
-            static=self.static[key_].dataframe() if self.has_static else None,  # type: ignore[union-attr,index]
-            targets=(
-                self.predictive.targets[key_].dataframe()  # type: ignore[union-attr]
-                if (self.has_predictive_data and self.predictive.targets is not None)  # type: ignore[union-attr]
-                else None
-            ),
-            treatments=(
-                self.predictive.treatments[key_].dataframe()  # type: ignore[union-attr]
-                if (self.has_predictive_data and self.predictive.treatments is not None)  # type: ignore[union-attr]
-                else None
-            ),
+        new_dataset = self.__class__.__new__(self.__class__)
+        new_dataset._time_series = samples.SamplesView.of(self._time_series, key_)
+        new_dataset._static = samples.SamplesView.of(self._static, key_) if self._static is not None else None
+        new_dataset.predictive = (
+            self.predictive.select(key_, parent_dataset=new_dataset) if self.predictive is not None else None
         )
         return new_dataset
 
+    def iter_chunks(self, chunk_size: int) -> Generator[Self, None, None]:
+        """Iterate over the dataset in chunks of (up to) ``chunk_size`` consecutive samples. Each chunk is a dataset
+        view (see :meth:`__getitem__`), with the time series, static and predictive data of the same samples.
+
+        The data of each chunk is only selected when it is accessed, so for a dataset loaded lazily with :meth:`load`,
+        only one chunk is read into memory at a time.
+
+        Args:
+            chunk_size (int): The (maximum) number of samples in each chunk.
+
+        Yields:
+            Generator[Self, None, None]: The chunks.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"`chunk_size` must be a positive integer, was {chunk_size}")
+        for start in range(0, len(self), chunk_size):
+            yield self[start : start + chunk_size]
+
+    @classmethod
+    def _from_samples(
+        cls,
+        time_series: samples.TimeSeriesSamples,
+        static: Optional[samples.StaticSamples],
+        predictive_cls: Optional[Type[pred.PredictiveTaskData]],
+        targets: Optional[samples.DataSamples] = None,
+        treatments: Optional[samples.DataSamples] = None,
+    ) -> Self:
+        # Assemble the dataset from already validated (and consistent) parts, without revalidation.
+        data = cls.__new__(cls)
+        data._time_series = time_series
+        data._static = static
+        if predictive_cls is None:
+            data.predictive = None
+        else:
+            predictive = predictive_cls.__new__(predictive_cls)
+            predictive.parent_dataset = data  # type: ignore[assignment]
+            predictive._targets = targets  # pylint: disable=protected-access
+            predictive._treatments = treatments  # pylint: disable=protected-access
+            data.predictive = predictive
+        return data
+
+    def fingerprint(self, *, use_cache: bool = True) -> str:
+        """Return a content fingerprint of the dataset: a stable hash of the dataset class and of the
+        `~tempor.data.samples.DataSamples.fingerprint` s of its time series, static, targets and treatments data.
+        Datasets with the same content (e.g. the same cross-validation fold of the same data) have the same
+        fingerprint, which makes it usable as a cache key.
+
+        The fingerprints of the data samples are cached on the data samples objects, so this is cheap to call
+        repeatedly. Setting the data (e.g. ``dataset.static = ...``) changes the fingerprint accordingly, but modifying
+        the data in-place does not, unless ``use_cache`` is `False`.
+
+        Args:
+            use_cache (bool, optional):
+                Whether to use the cached fingerprints of the data samples, see
+                `~tempor.data.samples.DataSamples.fingerprint`. Defaults to `True`.
+
+        Returns:
+            str: The fingerprint, a hex digest.
+        """
+        parts = [self.time_series, self.static]
+        if self.predictive is not None:
+            parts.extend([self.predictive.targets, self.predictive.treatments])
+        else:
+            parts.extend([None, None])
+        return utils.content_hash(
+            self.__class__.__name__,
+            *[part.fingerprint(use_cache=use_cache) if part is not None else None for part in parts],
+        )
+
+    def compact(self, *, float_dtype: Any = "float32", downcast_int: bool = False) -> Self:
+        """Return the dataset with compact value dtypes: applies `~tempor.data.samples.DataSamples.compact` to the
+        time series, static, targets and treatments data. This is the dtype policy for the whole pipeline: the compact
+        dtypes are kept by the preprocessing plugins, and the models convert the data to ``float32`` tensors without
+        intermediate ``float64`` copies.
+
+        Args:
+            float_dtype (Any, optional):
+                The dtype of the floating point features. Defaults to ``"float32"``.
+            downcast_int (bool, optional):
+                Whether to downcast the integer features to the smallest integer dtype that can hold their values.
+                Defaults to `False`.
+
+        Returns:
+            Self: The dataset with compact dtypes.
+        """
+
+        def compact(data: Optional[samples.DataSamples]) -> Any:
+            return data.compact(float_dtype=float_dtype, downcast_int=downcast_int) if data is not None else None
+
+        return self._from_samples(
+            time_series=compact(self.time_series),
+            static=compact(self.static),
+            predictive_cls=type(self.predictive) if self.predictive is not None else None,
+            targets=compact(self.predictive.targets) if self.predictive is not None else None,
+            treatments=compact(self.predictive.treatments) if self.predictive is not None else None,
+        )
+
+    def append_samples(self, other: Self) -> Self:
+        """Return a new dataset with the samples of ``other`` (of the same dataset class) appended after the samples of
+        this dataset. The data is not revalidated, see :func:`concat`.
+
+        Args:
+            other (Self): The dataset with the samples to append.
+
+        Returns:
+            Self: The combined dataset.
+        """
+        return concat([self, other])  # type: ignore[return-value]
+
+    def append_timesteps(self, other: Self) -> Self:
+        """Return a new dataset with the timesteps of ``other`` (of the same dataset class) appended after the
+        timesteps of the corresponding samples of this dataset, see
+        :meth:`~tempor.data.samples.TimeSeriesSamples.append_timesteps`. This applies to the time series, and the
+        targets and treatments that are time series. The static data and the targets and treatments that are not time
+        series are per-sample, and are taken from this dataset.
+
+        The data is not revalidated, only the consistency of ``other`` with this dataset is checked.
+
+        Args:
+            other (Self): The dataset with the timesteps to append.
+
+        Returns:
+            Self: The combined dataset.
+        """
+        if type(other) is not type(self):
+            raise TypeError(f"Expected a {self.__class__.__name__} to append, but got {other.__class__.__name__}")
+
+        def append(name: str, this: Any, that: Any) -> Any:
+            if not isinstance(this, samples.TimeSeriesSamples):
+                return this
+            if that is None:
+                raise ValueError(f"Expected the dataset to append timesteps from to have {name}")
+            return this.append_timesteps(that)
+
+        time_series = self.time_series.append_timesteps(other.time_series)
+        if self.predictive is None:
+            return self._from_samples(time_series=time_series, static=self.static, predictive_cls=None)
+        predictive, other_predictive = self.predictive, other.predictive
+        if TYPE_CHECKING:  # pragma: no cover
+            assert other_predictive is not None  # nosec B101
+        return self._from_samples(
+            time_series=time_series,
+            static=self.static,
+            predictive_cls=type(predictive),
+            targets=append("targets", predictive.targets, other_predictive.targets),
+            treatments=append("treatments", predictive.treatments, other_predictive.treatments),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the dataset to directory ``path`` in a columnar on-disk format, which can be loaded lazily
+        (memory-mapped) with :meth:`load`. See :func:`tempor.data.storage.save_dataset`.
+
+        Args:
+            path (Union[str, Path]): The directory to save to.
+        """
+        from . import storage  # Avoid circular import.
+
+        storage.save_dataset(self, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs) -> Self:
+        """Load a dataset saved with :meth:`save` from directory ``path``. The ``kwargs`` are passed to
+        :func:`tempor.data.storage.load_dataset`.
+
+        Args:
+            path (Union[str, Path]): The directory the dataset was saved to.
+
+        Returns:
+            Self: The dataset.
+        """
+        from . import storage  # Avoid circular import.
+
+        data = storage.load_dataset(path, **kwargs)
+        if not isinstance(data, cls):
+            raise TypeError(f"Expected a saved {cls.__name__}, but got {data.__class__.__name__}")
+        return data
+
     def train_test_split(
         self,
         *,
@@ -563,3 +750,43 @@ class TemporalTreatmentEffectsDataset(PredictiveDataset):
     @property
     def predict_ready(self) -> bool:
         return self.predictive.treatments is not None
+
+
+def concat(datasets: Sequence[BaseDataset]) -> BaseDataset:
+    """Concatenate datasets of the same class along the samples dimension, e.g. to add newly collected samples to an
+    existing dataset. Each data modality (time series, static, targets, treatments) is concatenated with
+    :func:`~tempor.data.samples.concat`, so the combined data is not revalidated.
+
+    Args:
+        datasets (Sequence[BaseDataset]): The datasets to concatenate, at least one, all of the same class.
+
+    Returns:
+        BaseDataset: The combined dataset, of the same class as the datasets.
+    """
+    if not datasets:
+        raise ValueError("No datasets to concatenate")
+    cls = type(datasets[0])
+    for data in datasets[1:]:
+        if type(data) is not cls:
+            raise TypeError(
+                f"Cannot concatenate datasets of different classes, {cls.__name__} and {type(data).__name__}"
+            )
+
+    def concat_parts(name: str, parts: List[Optional[samples.DataSamples]]) -> Any:
+        if all(part is None for part in parts):
+            return None
+        if any(part is None for part in parts):
+            raise ValueError(f"Cannot concatenate datasets where only some of the datasets have {name}")
+        return samples.concat(parts)  # type: ignore[arg-type]
+
+    predictive = [data.predictive for data in datasets]
+    has_predictive = predictive[0] is not None
+    return cls._from_samples(  # pylint: disable=protected-access
+        time_series=concat_parts("time series", [data.time_series for data in datasets]),
+        static=concat_parts("static data", [data.static for data in datasets]),
+        predictive_cls=type(predictive[0]) if has_predictive else None,
+        targets=concat_parts("targets", [p.targets for p in predictive]) if has_predictive else None,  # type: ignore
+        treatments=(
+            concat_parts("treatments", [p.treatments for p in predictive]) if has_predictive else None  # type: ignore
+        ),
+    )
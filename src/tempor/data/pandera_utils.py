@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -238,6 +238,44 @@ def init_schema(data: pd.DataFrame, **kwargs) -> pa.DataFrameSchema:
     return schema
 
 
+def get_schema_key(data: pd.DataFrame) -> Hashable:
+    """Return a hashable key describing the structure of ``data``: its index type, the dtypes of the index (level(s)),
+    and the dtype of the column index. Schemas created by :func:`init_structural_schema` only depend on this key.
+    """
+    index = data.index
+    index_dtypes = tuple(index.dtypes) if isinstance(index, pd.MultiIndex) else (index.dtype,)
+    return (type(index), index_dtypes, data.columns.dtype)
+
+
+def init_structural_schema(data: pd.DataFrame, **kwargs) -> pa.DataFrameSchema:
+    """Initialize a schema like :func:`init_schema`, but only from the structure of ``data`` (see
+    :func:`get_schema_key`), without inferring per-column schemas and statistics-based checks.
+
+    The schema inferred by :func:`init_schema` always holds for the data it was inferred from (it checks column dtypes,
+    nullability and value ranges against those of ``data`` itself), so it is not useful for validation, but makes the
+    schema specific to ``data``. The structural schema, on the other hand, can be reused (see :class:`SchemaCache`)
+    for any data with the same key.
+    """
+    index = data.index
+    if isinstance(index, pd.MultiIndex):
+        schema_index: Union[pa.Index, pa.MultiIndex] = pa.MultiIndex(
+            [pa.Index(dtype=pd_engine.Engine.dtype(dt), nullable=True) for dt in index.dtypes]
+        )
+    else:
+        schema_index = pa.Index(dtype=pd_engine.Engine.dtype(index.dtype), nullable=True)
+    return pa.DataFrameSchema(index=schema_index, **kwargs)
+
+
+class SchemaCache(tempor.core.utils.LRUCache):
+    """A least-recently-used cache for objects (e.g. compiled schemas) built for a given key, see
+    `~tempor.core.utils.LRUCache`.
+    """
+
+
+schema_cache = SchemaCache()
+"""The :class:`SchemaCache` used by :mod:`tempor.data.samples` to reuse schemas between validations."""
+
+
 def add_df_checks(schema: pa.DataFrameSchema, *, checks_list: List[pa.Check]) -> pa.DataFrameSchema:
     schema = update_schema(schema, checks=checks_list)
     return schema
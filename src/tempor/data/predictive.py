@@ -1,7 +1,8 @@
 import abc
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import rich.pretty
+from typing_extensions import Self
 
 from tempor.core.utils import RichReprStrPassthrough
 
@@ -12,8 +13,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class PredictiveTaskData(abc.ABC):
-    _targets: Optional[samples.DataSamples]
-    _treatments: Optional[samples.DataSamples]
+    _targets: Optional[Union[samples.DataSamples, samples.SamplesView]]
+    _treatments: Optional[Union[samples.DataSamples, samples.SamplesView]]
 
     @property
     @abc.abstractmethod
@@ -44,9 +45,28 @@ class PredictiveTaskData(abc.ABC):
     def __repr__(self) -> str:
         return rich.pretty.pretty_repr(self)
 
+    def select(self, key: data_typing.GetItemKey, parent_dataset: "PredictiveDataset") -> Self:
+        """Return a copy of this object with samples selected by ``key`` as `~tempor.data.samples.SamplesView` s (that
+        is, lazily and without revalidation), belonging to ``parent_dataset``.
+
+        Args:
+            key (data_typing.GetItemKey): Sample selection key.
+            parent_dataset (PredictiveDataset): The parent dataset of the new object.
+
+        Returns:
+            Self: The new object.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.parent_dataset = parent_dataset
+        new._targets = samples.SamplesView.of(self._targets, key) if self._targets is not None else None
+        new._treatments = samples.SamplesView.of(self._treatments, key) if self._treatments is not None else None
+        return new
+
     @property
     def targets(self) -> Optional[samples.DataSamples]:
-        return self._targets
+        if self._targets is not None:
+            self._targets = samples.materialize(self._targets)
+        return self._targets  # type: ignore[return-value]
 
     @targets.setter
     def targets(self, value: Optional[samples.DataSamples]) -> None:
@@ -55,7 +75,9 @@ class PredictiveTaskData(abc.ABC):
 
     @property
     def treatments(self) -> Optional[samples.DataSamples]:
-        return self._treatments
+        if self._treatments is not None:
+            self._treatments = samples.materialize(self._treatments)
+        return self._treatments  # type: ignore[return-value]
 
     @treatments.setter
     def treatments(self, value: Optional[samples.DataSamples]) -> None:
@@ -0,0 +1,536 @@
+"""Ragged (CSR-style) array storage for time series data.
+
+A :class:`RaggedTimeSeries` keeps the values of all samples in one contiguous ``(n_timesteps_total, n_features)``
+buffer, together with an ``offsets`` array of length ``n_samples + 1``, such that the data of sample ``i`` is
+``values[offsets[i] : offsets[i + 1]]``. This makes per-sample access an O(1) view and conversions to padded 3D arrays
+a single vectorized copy.
+"""
+
+import dataclasses
+import functools
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import data_typing, utils
+from .settings import DATA_SETTINGS
+
+
+def lengths_to_offsets(lengths: np.ndarray) -> np.ndarray:
+    """Convert an array of per-sample ``lengths`` to an array of ``offsets`` (of length ``len(lengths) + 1``).
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.ragged import lengths_to_offsets
+        >>>
+        >>> lengths_to_offsets(np.asarray([4, 2, 1]))
+        array([0, 4, 6, 7])
+    """
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def positions_within_samples(offsets: np.ndarray) -> np.ndarray:
+    """Given ``offsets``, return, for each row of the flat values buffer, its position (timestep number) within its
+    sample.
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.ragged import positions_within_samples
+        >>>
+        >>> positions_within_samples(np.asarray([0, 4, 6, 7]))
+        array([0, 1, 2, 3, 0, 1, 0])
+    """
+    lengths = np.diff(offsets)
+    return np.arange(offsets[-1], dtype=np.int64) - np.repeat(offsets[:-1], lengths)
+
+
+def gather_rows(offsets: np.ndarray, sample_ilocs: np.ndarray) -> np.ndarray:
+    """Given ``offsets``, return the row indices into the flat values buffer of the samples at positions
+    ``sample_ilocs`` (in that order).
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.ragged import gather_rows
+        >>>
+        >>> gather_rows(np.asarray([0, 4, 6, 7]), np.asarray([2, 0]))
+        array([6, 0, 1, 2, 3])
+    """
+    starts = offsets[:-1][sample_ilocs]
+    lengths = offsets[1:][sample_ilocs] - starts
+    new_offsets = lengths_to_offsets(lengths)
+    return np.arange(new_offsets[-1], dtype=np.int64) + np.repeat(starts - new_offsets[:-1], lengths)
+
+
+def append_rows_order(
+    offsets: np.ndarray, appended_offsets: np.ndarray, sample_ilocs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Given the ``offsets`` of some samples, and the ``appended_offsets`` of rows to append to the end of the samples
+    at positions ``sample_ilocs`` (one element for each sample of the appended rows, without repetition), return the
+    ``offsets`` of the combined samples, and the ``order`` of the rows, such that ``concatenated[order]`` are the
+    combined rows, where ``concatenated`` are the original rows followed by the appended rows.
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.ragged import append_rows_order
+        >>>
+        >>> new_offsets, order = append_rows_order(np.asarray([0, 2, 3]), np.asarray([0, 1]), np.asarray([0]))
+        >>> new_offsets
+        array([0, 3, 4])
+        >>> order
+        array([0, 1, 3, 2])
+    """
+    lengths = np.diff(offsets)
+    appended_lengths = np.diff(appended_offsets)
+    new_lengths = lengths.copy()
+    new_lengths[sample_ilocs] += appended_lengths
+    new_offsets = lengths_to_offsets(new_lengths)
+    n_rows, n_appended_rows = int(offsets[-1]), int(appended_offsets[-1])
+    # Destination row of each original and each appended row:
+    destination = np.arange(n_rows, dtype=np.int64) + np.repeat(new_offsets[:-1] - offsets[:-1], lengths)
+    destination_appended = np.arange(n_appended_rows, dtype=np.int64) + np.repeat(
+        new_offsets[sample_ilocs] + lengths[sample_ilocs] - appended_offsets[:-1], appended_lengths
+    )
+    order = np.empty(n_rows + n_appended_rows, dtype=np.int64)
+    order[destination] = np.arange(n_rows, dtype=np.int64)
+    order[destination_appended] = np.arange(n_rows, n_rows + n_appended_rows, dtype=np.int64)
+    return new_offsets, order
+
+
+def pad_rows(
+    values: np.ndarray,
+    offsets: np.ndarray,
+    *,
+    padding_indicator: Any,
+    max_timesteps: Optional[int] = None,
+    dtype: Any = None,
+) -> np.ndarray:
+    """Given the flat ``values`` buffer (of shape ``(n_timesteps_total, ...)``) and its ``offsets``, return the padded
+    array of shape ``(n_samples, max_timesteps, ...)``. The output is preallocated (in ``dtype``, if given, otherwise
+    the dtype of ``values``) and the rows are written into it with a single vectorized copy.
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.ragged import pad_rows
+        >>>
+        >>> pad_rows(np.asarray([[1], [2], [3]]), np.asarray([0, 2, 3]), padding_indicator=-1)[:, :, 0]
+        array([[ 1,  2],
+               [ 3, -1]])
+
+    Args:
+        values (np.ndarray):
+            The flat values buffer.
+        offsets (np.ndarray):
+            The offsets of each sample into ``values``, of length ``n_samples + 1``.
+        padding_indicator (Any):
+            The value to pad with.
+        max_timesteps (Optional[int], optional):
+            Size of dim 1 of the output. If `None`, the highest number of timesteps among the samples is used. Samples
+            longer than this are truncated. Defaults to `None`.
+        dtype (Any, optional):
+            The dtype of the output. If `None`, the dtype of ``values``. Defaults to `None`.
+
+    Returns:
+        np.ndarray: The padded array.
+    """
+    lengths = np.diff(offsets)
+    if max_timesteps is None:
+        max_timesteps = int(lengths.max()) if len(lengths) > 0 else 0
+    array = np.full(
+        shape=(len(lengths), max_timesteps) + values.shape[1:],
+        fill_value=padding_indicator,
+        dtype=values.dtype if dtype is None else dtype,
+    )
+    positions = positions_within_samples(offsets)
+    sample_codes = np.repeat(np.arange(len(lengths)), lengths)
+    keep = positions < max_timesteps
+    array[sample_codes[keep], positions[keep]] = values[keep]
+    return array
+
+
+def split_rows(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Given the flat ``values`` buffer and its ``offsets``, return a 1D `object` array with the rows of each sample,
+    as views of ``values``.
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.ragged import split_rows
+        >>>
+        >>> [x.tolist() for x in split_rows(np.asarray([[1], [2], [3]]), np.asarray([0, 2, 3]))]
+        [[[1], [2]], [[3]]]
+    """
+    split = np.empty(len(offsets) - 1, dtype=object)
+    for idx, (start, stop) in enumerate(zip(offsets[:-1].tolist(), offsets[1:].tolist())):
+        split[idx] = values[start:stop]
+    return split
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+@dataclasses.dataclass(frozen=True)
+class SampleIndexMetadata:
+    """The per-sample index metadata of time series data: the sample index, and the offsets, lengths and (flat) time
+    index of the rows of each sample, as with :class:`RaggedTimeSeries`. The arrays are read-only.
+
+    Example:
+        >>> import pandas as pd
+        >>> from tempor.data.ragged import SampleIndexMetadata
+        >>>
+        >>> multiindex = pd.MultiIndex.from_arrays([["a", "a", "b", "a"], [1, 2, 1, 3]])
+        >>> meta = SampleIndexMetadata.from_multiindex(multiindex)
+        >>> meta.lengths
+        array([3, 1])
+        >>> meta.row_order  # The rows of sample "a" are not contiguous.
+        array([0, 1, 3, 2])
+        >>> [list(ti) for ti in meta.time_indexes()]
+        [[1, 2, 3], [1]]
+    """
+
+    sample_index: pd.Index
+    """Sample index, of length ``n_samples``."""
+    offsets: np.ndarray
+    """Offsets of each sample into ``time_index``, of length ``n_samples + 1``."""
+    lengths: np.ndarray
+    """Number of timesteps of each sample, of length ``n_samples``."""
+    time_index: pd.Index
+    """Flat time index, with the timesteps of each sample contiguous, of length ``n_timesteps_total``."""
+    row_order: Optional[np.ndarray] = None
+    """If the rows of some samples are not contiguous in the source data, the positions of the rows of the source in
+    the order of ``time_index``, otherwise `None`.
+    """
+
+    @staticmethod
+    def from_multiindex(multiindex: pd.MultiIndex) -> "SampleIndexMetadata":
+        """Compute the metadata from a 2-level (sample, timestep) `pandas.MultiIndex`.
+
+        The samples will be ordered as they first appear in ``multiindex`` (consistent with
+        :obj:`~tempor.data.utils.get_df_index_level0_unique`). If the rows of a sample are not contiguous, they will be
+        gathered together (preserving their relative order), see ``row_order``.
+
+        Args:
+            multiindex (pd.MultiIndex): The multiindex.
+
+        Returns:
+            SampleIndexMetadata: The metadata.
+        """
+        codes, uniques = pd.factorize(multiindex.get_level_values(0))
+        time_index = multiindex.get_level_values(1)
+        row_order = None
+        if len(codes) > 1 and (np.diff(codes) < 0).any():
+            row_order = np.argsort(codes, kind="stable")
+            time_index = time_index[row_order]
+            row_order = _read_only(row_order)
+        lengths = np.bincount(codes, minlength=len(uniques))
+        return SampleIndexMetadata(
+            sample_index=pd.Index(uniques),
+            offsets=_read_only(lengths_to_offsets(lengths)),
+            lengths=_read_only(lengths),
+            time_index=time_index,
+            row_order=row_order,
+        )
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.sample_index)
+
+    @functools.cached_property
+    def time_index_float(self) -> np.ndarray:
+        """The flat ``time_index`` converted to `float` s (see :obj:`~tempor.data.utils.datetime_time_index_to_float`)
+        in one vectorized conversion, read-only. Computed on first access and cached.
+        """
+        return _read_only(utils.datetime_time_index_to_float(self.time_index))
+
+    def time_indexes(self) -> List[pd.Index]:
+        """Return a list of the time indexes of each sample (as slices of ``time_index``)."""
+        return [self.time_index[start:stop] for start, stop in zip(self.offsets[:-1], self.offsets[1:])]
+
+    def time_indexes_as_lists(self) -> List[List[Any]]:
+        """Return a list of the time indexes of each sample, each as a list of time step elements."""
+        time_index = self.time_index.tolist()
+        return [time_index[start:stop] for start, stop in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())]
+
+
+class RaggedTimeSeries:
+    values: np.ndarray
+    """Contiguous values buffer of shape ``(n_timesteps_total, n_features)``."""
+    offsets: np.ndarray
+    """Sample offsets into ``values`` (and ``time_index``), of length ``n_samples + 1``."""
+    sample_index: pd.Index
+    """Sample index, of length ``n_samples``."""
+    time_index: pd.Index
+    """Flat time index, of length ``n_timesteps_total``."""
+    feature_index: List[str]
+    """List of feature names."""
+    dtypes: Optional[Dict[str, Any]]
+    """Original per-feature dtypes to restore when materializing a `pandas.DataFrame`, if these differ from the dtype
+    of ``values``. `None` if nothing needs to be restored.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        offsets: np.ndarray,
+        *,
+        sample_index: Any,
+        time_index: Any,
+        feature_index: data_typing.FeatureIndex,
+        dtypes: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """A ragged (CSR-style) representation of time series data, see module docstring.
+
+        Args:
+            values (np.ndarray):
+                Contiguous values buffer of shape ``(n_timesteps_total, n_features)``.
+            offsets (np.ndarray):
+                Offsets of each sample into ``values``, of length ``n_samples + 1``, starting at ``0`` and ending at
+                ``n_timesteps_total``.
+            sample_index (Any):
+                Array-like sample index of length ``n_samples``.
+            time_index (Any):
+                Array-like flat time index of length ``n_timesteps_total``.
+            feature_index (List[str]):
+                List of feature names of length ``n_features``.
+            dtypes (Optional[Dict[str, Any]], optional):
+                Per-feature dtypes to restore when converting to a `pandas.DataFrame`. Defaults to `None`.
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        sample_index = pd.Index(sample_index)
+        time_index = pd.Index(time_index)
+        if values.ndim != 2:
+            raise ValueError(utils.EXCEPTION_MESSAGES.expected_array2d)
+        if offsets.ndim != 1 or len(offsets) != len(sample_index) + 1:
+            raise ValueError("Expected `offsets` to be a 1D array of length `len(sample_index) + 1`")
+        if offsets[0] != 0 or offsets[-1] != len(values) or (np.diff(offsets) < 0).any():
+            raise ValueError("Expected `offsets` to be non-decreasing, start at 0 and end at `len(values)`")
+        if len(time_index) != len(values):
+            raise ValueError("Expected `time_index` to be of the same length as `values`")
+        if len(feature_index) != values.shape[1]:
+            raise ValueError("Expected `feature_index` to be of the same length as dim 1 of `values`")
+        self.values = values
+        self.offsets = offsets
+        self.sample_index = sample_index
+        self.time_index = time_index
+        self.feature_index = list(feature_index)
+        self.dtypes = dtypes
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(num_samples={self.num_samples}, num_timesteps_total={len(self.values)}, "
+            f"num_features={self.num_features})"
+        )
+
+    @property
+    def num_samples(self) -> int:
+        return len(self.sample_index)
+
+    @property
+    def num_features(self) -> int:
+        return self.values.shape[1]
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of timesteps of each sample, 1D array of length ``n_samples``."""
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    # --- Conversion from other representations. ---
+
+    @staticmethod
+    def from_dataframe(df: pd.DataFrame) -> "RaggedTimeSeries":
+        """Build a :class:`RaggedTimeSeries` from a 2-level multiindex (sample, timestep) `pandas.DataFrame`.
+
+        The samples will be ordered as they first appear in ``df`` (consistent with
+        :obj:`~tempor.data.utils.get_df_index_level0_unique`). If the rows of a sample are not contiguous in ``df``,
+        they will be gathered together (preserving their relative order).
+
+        Args:
+            df (pd.DataFrame): The input dataframe.
+
+        Returns:
+            RaggedTimeSeries: The ragged representation.
+        """
+        multiindex = df.index
+        if TYPE_CHECKING:  # pragma: no cover
+            assert isinstance(multiindex, pd.MultiIndex)  # nosec B101
+        meta = SampleIndexMetadata.from_multiindex(multiindex)
+        values = df.to_numpy()
+        if meta.row_order is not None:
+            values = values[meta.row_order]
+        dtypes = {str(c): dt for c, dt in df.dtypes.items() if dt != values.dtype}
+        return RaggedTimeSeries(
+            values,
+            meta.offsets,
+            sample_index=meta.sample_index,
+            time_index=meta.time_index,
+            feature_index=list(df.columns),
+            dtypes=dtypes if dtypes else None,
+        )
+
+    @staticmethod
+    def from_array3d(
+        array: np.ndarray,
+        *,
+        padding_indicator: Any = None,
+        sample_index: Optional[data_typing.SampleIndex] = None,
+        time_indexes: Optional[data_typing.TimeIndexList] = None,
+        feature_index: Optional[data_typing.FeatureIndex] = None,
+    ) -> "RaggedTimeSeries":
+        """Build a :class:`RaggedTimeSeries` from a padded 3D array ``(sample, timestep, feature)``. See
+        :obj:`~tempor.data.utils.array3d_to_multiindex_timeseries_dataframe` for the meaning of the arguments.
+        ``sample_index``, ``time_indexes``, and ``feature_index`` get defaults as in
+        :class:`~tempor.data.samples.TimeSeriesSamples` if not provided.
+
+        Returns:
+            RaggedTimeSeries: The ragged representation.
+        """
+        values, lengths = utils.unpad_timeseries_array3d_flat(array, padding_indicator)
+        n_samples, _, n_features = array.shape
+        offsets = lengths_to_offsets(lengths)
+        if sample_index is None:
+            sample_index = list(range(n_samples))  # type: ignore [assignment]
+        if feature_index is None:
+            feature_index = [f"feat_{x}" for x in range(n_features)]
+        if time_indexes is None:
+            time_index = positions_within_samples(offsets)
+        else:
+            if len(time_indexes) != n_samples:
+                raise ValueError("Expected the same number of elements in `sample_index` and `time_indexes`")
+            if any(len(ti) != l for ti, l in zip(time_indexes, lengths)):
+                raise ValueError("Expected each element of `time_indexes` to match the number of timesteps in `array`")
+            time_index = pd.Index([t for ti in time_indexes for t in ti])
+        return RaggedTimeSeries(
+            values,
+            offsets,
+            sample_index=sample_index,
+            time_index=time_index,
+            feature_index=feature_index,  # type: ignore [arg-type]
+        )
+
+    # --- Conversion to other representations. ---
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialize a 2-level multiindex (sample, timestep) `pandas.DataFrame`.
+
+        Returns:
+            pd.DataFrame: The dataframe.
+        """
+        multiindex = pd.MultiIndex.from_arrays(
+            [self.sample_index.repeat(self.lengths), self.time_index],
+            names=[DATA_SETTINGS.sample_index_name, DATA_SETTINGS.time_index_name],
+        )
+        df = pd.DataFrame(self.values, index=multiindex, columns=self.feature_index, copy=True)
+        if self.dtypes:
+            df = df.astype(self.dtypes)
+        return df
+
+    def to_array3d(self, *, padding_indicator: Any, max_timesteps: Optional[int] = None) -> np.ndarray:
+        """Return a padded 3D array ``(sample, timestep, feature)``, built with a single vectorized copy.
+
+        Args:
+            padding_indicator (Any):
+                Padding indicator value to pad the output array with.
+            max_timesteps (Optional[int], optional):
+                Size of dim 1 of the output. If `None`, the highest number of timesteps among the samples is used.
+                Samples longer than this will be truncated. Defaults to `None`.
+
+        Returns:
+            np.ndarray: The padded 3D array.
+        """
+        return pad_rows(self.values, self.offsets, padding_indicator=padding_indicator, max_timesteps=max_timesteps)
+
+    # --- Access. ---
+
+    def sample_values(self, iloc: int) -> np.ndarray:
+        """Return the values of sample at position ``iloc`` as a ``(n_timesteps, n_features)`` view."""
+        return self.values[self.offsets[iloc] : self.offsets[iloc + 1]]
+
+    def sample_time_index(self, iloc: int) -> pd.Index:
+        """Return the time index of sample at position ``iloc``."""
+        return self.time_index[self.offsets[iloc] : self.offsets[iloc + 1]]
+
+    def time_indexes(self) -> List[pd.Index]:
+        """Return a list of the time indexes of each sample (as slices of ``time_index``)."""
+        return [self.time_index[start:stop] for start, stop in zip(self.offsets[:-1], self.offsets[1:])]
+
+    def index_metadata(self) -> SampleIndexMetadata:
+        """Return the :class:`SampleIndexMetadata` of the data (sharing the index arrays, made read-only)."""
+        return SampleIndexMetadata(
+            sample_index=self.sample_index,
+            offsets=_read_only(self.offsets),
+            lengths=_read_only(self.lengths),
+            time_index=self.time_index,
+        )
+
+    def take(self, key: data_typing.GetItemKey) -> "RaggedTimeSeries":
+        """Select samples by position. A slice with step ``1`` gives views into the buffers, otherwise the selected
+        rows are gathered with a single vectorized copy.
+
+        Args:
+            key (data_typing.GetItemKey): Integer, iterable of integers, or slice.
+
+        Returns:
+            RaggedTimeSeries: The selected samples.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.num_samples)
+            if step == 1:
+                stop = max(start, stop)
+                row_start, row_stop = self.offsets[start], self.offsets[stop]
+                return RaggedTimeSeries(
+                    self.values[row_start:row_stop],
+                    self.offsets[start : stop + 1] - row_start,
+                    sample_index=self.sample_index[start:stop],
+                    time_index=self.time_index[row_start:row_stop],
+                    feature_index=self.feature_index,
+                    dtypes=self.dtypes,
+                )
+            sample_ilocs = np.arange(start, stop, step)
+        else:
+            sample_ilocs = np.asarray(utils.ensure_pd_iloc_key_returns_df(key), dtype=np.int64).reshape(-1)
+        rows = gather_rows(self.offsets, sample_ilocs)
+        return RaggedTimeSeries(
+            self.values[rows],
+            lengths_to_offsets(self.lengths[sample_ilocs]),
+            sample_index=self.sample_index[sample_ilocs],
+            time_index=self.time_index[rows],
+            feature_index=self.feature_index,
+            dtypes=self.dtypes,
+        )
+
+    def __getitem__(self, key: data_typing.GetItemKey) -> "RaggedTimeSeries":
+        return self.take(key)
+
+    # --- Combination. ---
+
+    @staticmethod
+    def concat(items: Sequence["RaggedTimeSeries"]) -> "RaggedTimeSeries":
+        """Concatenate ``items`` along the samples dimension. The items are expected to have the same features and
+        dtypes, the result takes the ``feature_index`` and ``dtypes`` of the first item.
+
+        Args:
+            items (Sequence[RaggedTimeSeries]): The items to concatenate, at least one.
+
+        Returns:
+            RaggedTimeSeries: The concatenated samples.
+        """
+        first, rest = items[0], list(items[1:])
+        row_starts = np.cumsum([0] + [len(item.values) for item in items])
+        offsets = np.concatenate(
+            [item.offsets[:-1] + start for item, start in zip(items, row_starts[:-1])] + [row_starts[-1:]]
+        )
+        return RaggedTimeSeries(
+            np.concatenate([item.values for item in items]),
+            offsets,
+            sample_index=first.sample_index.append([item.sample_index for item in rest]),
+            time_index=first.time_index.append([item.time_index for item in rest]),
+            feature_index=first.feature_index,
+            dtypes=first.dtypes,
+        )
@@ -4,24 +4,66 @@
 
 import abc
 import contextlib
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+import dataclasses
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import pandera as pa
-import pydantic
 from packaging.version import Version
 from typing_extensions import Self
 
+import tempor.config
 import tempor.exc
+from tempor.core import pydantic_utils
 from tempor.log import log_helpers, logger
 
-from . import data_typing, pandera_utils, utils
+from . import data_typing, pandera_utils, ragged, utils
 from .settings import DATA_SETTINGS
 
 
+@dataclasses.dataclass(frozen=True)
+class _ValidationSchemas:
+    """The schemas used to validate a :class:`DataSamples` object, built once per
+    `~tempor.data.pandera_utils.get_schema_key` and reused via `~tempor.data.pandera_utils.schema_cache`.
+    """
+
+    df_checks: pa.DataFrameSchema
+    """DataFrame-level checks."""
+    values: pa.DataFrameSchema
+    """Values (column) checks."""
+    index: pa.DataFrameSchema
+    """Index checks."""
+    full: pa.DataFrameSchema
+    """All of the above, kept as the ``_schema`` of the validated object."""
+    split: Optional[pa.DataFrameSchema] = None
+    """Checks of the event time and value components, in case of :class:`EventSamples`."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _ValidatedState:
+    """The structure of the data of a :class:`DataSamples` object, recorded when it was validated, and used to validate
+    data derived from it incrementally.
+    """
+
+    key: Any
+    """The `~tempor.data.pandera_utils.get_schema_key` of the data."""
+    index: pd.Index
+    """The validated index."""
+    dtypes: Dict[Any, Any]
+    """The column dtypes."""
+
+    @staticmethod
+    def of(data: pd.DataFrame) -> "_ValidatedState":
+        return _ValidatedState(
+            key=pandera_utils.get_schema_key(data), index=data.index, dtypes=dict(data.dtypes.items())
+        )
+
+
 class DataSamples(abc.ABC):
     _data: Any
+    _validated: Optional[_ValidatedState] = None
+    _fingerprint_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
 
     @property
     @abc.abstractmethod
@@ -36,7 +78,12 @@ class DataSamples(abc.ABC):
         if "_skip_validate" not in kwargs:
             # For efficiency, pass `_skip_validate` internally (e.g. in `__getitem__`)
             # when there is no need to validate.
-            self.validate()
+            if tempor.config.get_config().performance.fast_mode:
+                # The validation checks are skipped in fast mode, see `tempor.config.fast_mode`.
+                self._normalize()
+            else:
+                # Pass `_reference` (see `validate`) when the data was derived from already validated data.
+                self.validate(reference=kwargs.get("_reference", None))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__} with data:\n{self.dataframe()}"
@@ -49,10 +96,20 @@ class DataSamples(abc.ABC):
         )
         return repr_
 
-    def validate(self) -> None:
+    def validate(self, reference: Optional["DataSamples"] = None) -> None:
+        """Validate the data samples, raise `~tempor.exc.DataValidationException` if validation fails.
+
+        Args:
+            reference (DataSamples, optional):
+                A trusted (validated) data samples object of the same type, which the data was derived from, e.g. by a
+                TemporAI transformer that rescales or imputes the values. If the data has the same index as
+                ``reference``, only the columns that are new or have changed dtype are validated. Otherwise, falls back
+                to full validation. Defaults to `None`.
+        """
         with log_helpers.exc_to_log():
             try:
-                self._validate()
+                if reference is None or not self._validate_incremental(reference):
+                    self._validate()
             except (
                 pa.errors.SchemaError,  # pyright: ignore
                 pa.errors.SchemaErrors,  # pyright: ignore
@@ -71,6 +128,52 @@ class DataSamples(abc.ABC):
         """
         ...
 
+    def _normalize(self) -> None:
+        """Normalize the data like :meth:`_validate` does, but without the validation checks: copy the data (so that it
+        is not shared with the caller) and name the index. Used instead of validation in fast mode. By default, the
+        data is kept as is.
+        """
+
+    def _validate_incremental(self, reference: "DataSamples") -> bool:
+        """Validate the data incrementally, relative to the trusted ``reference``, see :meth:`validate`. Return `False`
+        (without raising) if incremental validation is not possible, in which case full validation is performed.
+        """
+        return False
+
+    def _validate_incremental_values(
+        self,
+        reference: "DataSamples",
+        build_schemas: Callable[[pd.DataFrame], _ValidationSchemas],
+        values_nullable: bool,
+    ) -> bool:
+        # Shared implementation of `_validate_incremental` for data that is validated column-by-column.
+        validated = reference._validated
+        if type(reference) is not type(self) or validated is None:
+            return False
+        data = self._data
+        if not (
+            data.index is validated.index
+            or (pandera_utils.get_schema_key(data) == validated.key and data.index.equals(validated.index))
+        ):
+            return False
+        schemas = _get_validation_schemas(self, data, build_schemas)
+        reference_dtypes = validated.dtypes if values_nullable else dict()
+
+        # DataFrame-level validation:
+        data = schemas.df_checks.validate(data)
+        # Values validation, of new or changed columns only:
+        # If values are not nullable, a column may gain missing values without changing dtype, so check all.
+        changed = [reference_dtypes.get(c, None) != dt for c, dt in data.dtypes.items()]
+        if any(changed):
+            schemas.values.validate(data.loc[:, changed], inplace=True)
+        # Index validation: the index equals the validated index of the reference, only set its names.
+        data.index.set_names(validated.index.names, inplace=True)
+
+        self._data = data
+        self._schema = schemas.full  # type: ignore[attr-defined]
+        self._validated = _ValidatedState.of(data)
+        return True
+
     @staticmethod
     @abc.abstractmethod
     def from_numpy(
@@ -141,12 +244,126 @@ class DataSamples(abc.ABC):
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:  # pragma: no cover
         ...
 
+    def fingerprint(self, *, use_cache: bool = True) -> str:
+        """Return a content fingerprint of the data: a stable hash (the same across processes) of the data type, the
+        features, the indexes and the values, computed with vectorized hashing of each column. Objects with the same
+        content have the same fingerprint, which makes it usable as a cache key.
+
+        The fingerprint is computed on first access and cached. The cache is invalidated if the underlying data is
+        replaced (e.g. by validation), but not if it is modified in-place.
+
+        Note:
+            In-place modification of the underlying data, e.g. of the `pandas.DataFrame` returned by `dataframe`, is
+            not detected by the cache. Pass ``use_cache=False`` where the data may have been modified in-place, e.g.
+            to key other caches on the fingerprint.
+
+        Args:
+            use_cache (bool, optional):
+                Whether to return the cached fingerprint, if any. If `False`, the fingerprint is recomputed (and
+                cached). Defaults to `True`.
+
+        Returns:
+            str: The fingerprint, a hex digest.
+        """
+        source = self._fingerprint_source()
+        cached = self._fingerprint_cache
+        if (
+            use_cache
+            and cached is not None
+            and len(cached[0]) == len(source)
+            and all(a is b for a, b in zip(cached[0], source))
+        ):
+            return cached[1]
+        fingerprint = utils.content_hash(self.__class__.__name__, *self._fingerprint_parts())
+        self._fingerprint_cache = (source, fingerprint)
+        return fingerprint
+
+    def _fingerprint_source(self) -> Tuple[Any, ...]:
+        """The objects holding the data, the fingerprint is recomputed if any of them is replaced. By default, the
+        ``_data`` attribute.
+        """
+        return (self._data,)
+
+    def _fingerprint_parts(self) -> List[Any]:
+        """The parts of the data to hash with `~tempor.data.utils.content_hash`. By default, the columns, the index and
+        the columns' values of the `dataframe`.
+        """
+        df = self.dataframe()
+        return [list(df.columns), df.index] + [df.iloc[:, i] for i in range(df.shape[1])]
+
+    def compact(self, *, float_dtype: Any = "float32", downcast_int: bool = False) -> Self:
+        """Return the data samples with compact value dtypes, see `~tempor.data.utils.compact_dtypes`: floating point
+        features cast to ``float_dtype`` (halving the memory of ``float64`` data, and avoiding a cast when the data is
+        converted to ``float32`` tensors by the models) and, if ``downcast_int``, integer features downcast to the
+        smallest integer dtype that can hold their values. The dtypes are preserved by indexing, by
+        :meth:`numpy` and by the preprocessing plugins (scaling, imputation).
+
+        Args:
+            float_dtype (Any, optional):
+                The dtype of the floating point features. Defaults to ``"float32"``.
+            downcast_int (bool, optional):
+                Whether to downcast the integer features. Defaults to `False`.
+
+        Note:
+            Data samples types that do not implement this return the data samples unchanged.
+
+        Returns:
+            Self: The data samples with compact dtypes.
+        """
+        return self
+
+    def append_samples(self, other: Self) -> Self:
+        """Return a new object with the samples of ``other`` (of the same type) appended after the samples of this
+        object. The data is not revalidated, see :func:`concat`.
+
+        Args:
+            other (Self): The samples to append, with the same features and different sample indexes.
+
+        Returns:
+            Self: The combined samples.
+        """
+        return concat([self, other])  # type: ignore[return-value]
+
+    @staticmethod
+    def _concat(objs: List[Any]) -> "DataSamples":
+        """Concatenate ``objs`` (at least one, all of this type) along the samples dimension, see :func:`concat`."""
+        raise NotImplementedError(f"Concatenation is not supported by {objs[0].__class__.__name__}")
+
+
+def _check_concat_features(features: List[List[Any]]) -> None:
+    for features_ in features[1:]:
+        if features_ != features[0]:
+            raise ValueError(
+                f"Cannot concatenate data samples with different features, expected {features[0]} but got {features_}"
+            )
+
+
+def _check_concat_sample_indexes(sample_indexes: List[pd.Index]) -> None:
+    seen = sample_indexes[0]
+    for sample_index in sample_indexes[1:]:
+        # Only the elements of the appended sample index are looked up in the (unique) sample index seen so far.
+        overlap = sample_index[seen.get_indexer(sample_index) != -1]
+        if len(overlap) > 0:
+            raise ValueError(
+                f"Cannot concatenate data samples with overlapping sample indexes, found {list(overlap)} more than once"
+            )
+        seen = seen.append(sample_index)
+
 
 def _array_default_sample_index(array: np.ndarray) -> List[int]:
     n_samples, *_ = array.shape
     return list(range(0, n_samples))
 
 
+def _get_validation_schemas(
+    samples: DataSamples,
+    data: pd.DataFrame,
+    build_schemas: Callable[[pd.DataFrame], _ValidationSchemas],
+) -> _ValidationSchemas:
+    key = (samples.__class__, pandera_utils.get_schema_key(data))
+    return pandera_utils.schema_cache.get(key, lambda: build_schemas(data))
+
+
 def _array_default_feature_index(array: np.ndarray) -> List[str]:
     *_, n_features = array.shape
     return [f"feat_{x}" for x in range(0, n_features)]
@@ -157,11 +374,17 @@ def _array_default_time_indexes(array: np.ndarray, padding_indicator: Any) -> Li
     return [list(range(x)) for x in lengths]
 
 
+def _structure_key(data: pd.DataFrame) -> Tuple:
+    # The features, their dtypes, and the index structure: data with equal keys can be concatenated without
+    # changing any dtypes.
+    return (list(data.dtypes.items()), pandera_utils.get_schema_key(data))
+
+
 class StaticSamples(DataSamples):
     _data: pd.DataFrame
     _schema: pa.DataFrameSchema
 
-    @pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+    @pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
     def __init__(
         self,
         data: data_typing.DataContainer,
@@ -194,11 +417,12 @@ class StaticSamples(DataSamples):
     def modality(self) -> data_typing.DataModality:
         return data_typing.DataModality.STATIC
 
-    def _validate(self) -> None:
-        schema = pandera_utils.init_schema(self._data, coerce=False)
+    @staticmethod
+    def _build_schemas(data: pd.DataFrame) -> _ValidationSchemas:
+        schema = pandera_utils.init_structural_schema(data, coerce=False)
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(schema, pa.DataFrameSchema)  # nosec B101
-        logger.debug(f"Inferred schema:\n{schema}")
+        logger.debug(f"Structural schema:\n{schema}")
 
         # DataFrame-level validation:
         schema = pandera_utils.add_df_checks(
@@ -212,31 +436,57 @@ class StaticSamples(DataSamples):
                 ),
             ],
         )
-        self._data = schema.validate(self._data)
+        schema_df_checks = pandera_utils.update_schema(schema, index=None)
 
         # Values validation:
-        schema = pandera_utils.add_regex_column_checks(
-            schema,
+        schema_values = pandera_utils.add_regex_column_checks(
+            pa.DataFrameSchema(coerce=False),
             regex=".*",
             dtype=pandera_utils.UnionDtype[DATA_SETTINGS.static_value_dtypes],  # type: ignore
             nullable=DATA_SETTINGS.static_values_nullable,
         )
-        self._data = schema.validate(self._data)
+        schema = pandera_utils.update_schema(schema, columns=schema_values.columns)
 
         # Index validation:
-        schema, data = pandera_utils.set_up_index(
+        if isinstance(schema.index, pa.MultiIndex):
+            # A MultiIndex, the DataFrame-level validation will fail.
+            return _ValidationSchemas(df_checks=schema_df_checks, values=schema_values, index=schema, full=schema)
+        schema, _ = pandera_utils.set_up_index(
             schema,
-            self._data,
+            data.iloc[:0],
             dtype=pandera_utils.UnionDtype[DATA_SETTINGS.sample_index_dtypes],  # type: ignore
             name=DATA_SETTINGS.sample_index_name,
             nullable=DATA_SETTINGS.sample_index_nullable,
             coerce=False,
             unique=DATA_SETTINGS.sample_index_unique,
         )
-        self._data = schema.validate(data)
+        schema_index = pa.DataFrameSchema(index=schema.index, coerce=False)
 
         logger.debug(f"Final schema:\n{schema}")
-        self._schema = schema
+        return _ValidationSchemas(df_checks=schema_df_checks, values=schema_values, index=schema_index, full=schema)
+
+    def _validate(self) -> None:
+        schemas = _get_validation_schemas(self, self._data, self._build_schemas)
+        # DataFrame-level validation (validates a copy, the subsequent validations are in place):
+        data = schemas.df_checks.validate(self._data)
+        # Values validation:
+        schemas.values.validate(data, inplace=True)
+        # Index validation:
+        data.index.set_names(DATA_SETTINGS.sample_index_name, inplace=True)  # Name the index.
+        schemas.index.validate(data, inplace=True)
+        self._data = data
+        self._schema = schemas.full
+        self._validated = _ValidatedState.of(data)
+
+    def _normalize(self) -> None:
+        data = self._data.copy()
+        data.index = data.index.set_names(DATA_SETTINGS.sample_index_name)
+        self._data = data
+
+    def _validate_incremental(self, reference: DataSamples) -> bool:
+        return self._validate_incremental_values(
+            reference, self._build_schemas, values_nullable=DATA_SETTINGS.static_values_nullable
+        )
 
     @staticmethod
     def from_dataframe(dataframe: pd.DataFrame, **kwargs) -> "StaticSamples":
@@ -293,6 +543,32 @@ class StaticSamples(DataSamples):
             _skip_validate=True,
         )
 
+    def _fingerprint_source(self) -> Tuple[Any, ...]:
+        return (self._data,)
+
+    def _fingerprint_parts(self) -> List[Any]:
+        df = self._data
+        return [list(df.columns), df.index] + [df.iloc[:, i] for i in range(df.shape[1])]
+
+    def compact(self, *, float_dtype: Any = "float32", downcast_int: bool = False) -> Self:
+        data = utils.compact_dtypes(self._data, float_dtype=float_dtype, downcast_int=downcast_int)
+        if data is self._data:
+            return self
+        return StaticSamples(data, _reference=self)  # type: ignore[return-value]
+
+    @staticmethod
+    def _concat(objs: List[Any]) -> "StaticSamples":
+        dfs: List[pd.DataFrame] = [obj.dataframe() for obj in objs]
+        _check_concat_features([list(df.columns) for df in dfs])
+        _check_concat_sample_indexes([df.index for df in dfs])
+        data = pd.concat(dfs)
+        if any(_structure_key(df) != _structure_key(dfs[0]) for df in dfs[1:]):
+            # The dtypes differ, so the combined dtypes need validating.
+            return StaticSamples(data)
+        static_samples = StaticSamples(data, _skip_validate=True)
+        static_samples._validated = _ValidatedState.of(data)
+        return static_samples
+
 
 @contextlib.contextmanager
 def workaround_pandera_pd2_1_0_multiindex_compatibility(schema: pa.DataFrameSchema, data: pd.DataFrame):
@@ -324,14 +600,17 @@ def workaround_pandera_pd2_1_0_multiindex_compatibility(schema: pa.DataFrameSche
 
 
 class TimeSeriesSamples(DataSamples):
-    _data: pd.DataFrame
+    _df: Optional[pd.DataFrame]
+    _ragged: Optional[ragged.RaggedTimeSeries]
+    _backend: data_typing.TimeSeriesBackend
     _schema: pa.DataFrameSchema
+    _index_metadata_cache: Optional[Tuple[Any, ragged.SampleIndexMetadata]] = None
 
     @property
     def modality(self) -> data_typing.DataModality:
         return data_typing.DataModality.TIME_SERIES
 
-    @pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+    @pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
     def __init__(
         self,
         data: data_typing.DataContainer,
@@ -340,6 +619,7 @@ class TimeSeriesSamples(DataSamples):
         sample_index: Optional[data_typing.SampleIndex] = None,
         time_indexes: Optional[data_typing.TimeIndexList] = None,
         feature_index: Optional[data_typing.FeatureIndex] = None,
+        backend: data_typing.TimeSeriesBackend = "dataframe",
         **kwargs,
     ) -> None:
         """Create a :class:`TimeSeriesSamples` object from the ``data``.
@@ -367,27 +647,88 @@ class TimeSeriesSamples(DataSamples):
             feature_index (List[<feature element>], optional):
                 Used only if ``data`` is a `numpy.ndarray`.  List with feature (column) index for each feature.
                 Optional, if `None`, will be of form ``["feat_0", "feat_1", ...]``.
+            backend (Literal["dataframe", "ragged"], optional):
+                The storage backend, see :obj:`~tempor.data.data_typing.TimeSeriesBackend`. With the ``"ragged"``
+                backend, the data is kept as a :class:`~tempor.data.ragged.RaggedTimeSeries`, which makes
+                `numpy`, ``__getitem__``, and `time_indexes` vectorized operations, and the `pandas.DataFrame` is
+                built on each call to `dataframe`. Defaults to ``"dataframe"``.
         """
+        self._backend = backend
+        self._df = None
+        self._ragged = None
         if isinstance(data, pd.DataFrame):
             self._data = data
         elif isinstance(data, np.ndarray):
-            self._data = self._array_to_df(
-                data,
-                padding_indicator=padding_indicator,
-                sample_index=sample_index,
-                time_indexes=time_indexes,
-                feature_index=feature_index,
-                **kwargs,
-            )
+            if backend == "ragged":
+                self._ragged = ragged.RaggedTimeSeries.from_array3d(
+                    data,
+                    padding_indicator=padding_indicator,
+                    sample_index=sample_index,
+                    time_indexes=time_indexes,
+                    feature_index=feature_index,
+                )
+            else:
+                self._data = self._array_to_df(
+                    data,
+                    padding_indicator=padding_indicator,
+                    sample_index=sample_index,
+                    time_indexes=time_indexes,
+                    feature_index=feature_index,
+                    **kwargs,
+                )
         else:  # pragma: no cover  # Prevented by pydantic check.
             raise ValueError(f"Data object {type(data)} not supported")
         super().__init__(data, **kwargs)
+        self._finalize_backend()
 
-    def _validate(self) -> None:
-        schema = pandera_utils.init_schema(self._data, coerce=False)
+    def _finalize_backend(self) -> None:
+        if self._backend == "ragged":
+            if self._ragged is None:
+                self._ragged = ragged.RaggedTimeSeries.from_dataframe(self._data)
+            # Only the ragged storage is kept, the dataframe is built on demand.
+            self._df = None
+
+    def validate(self, reference: Optional[DataSamples] = None) -> None:
+        super().validate(reference=reference)
+        # Validation sets the (validated) dataframe, do not keep it in case of the "ragged" backend.
+        self._finalize_backend()
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        # NOTE: In case of the "ragged" backend, the dataframe is built on each access, so methods should access this
+        # at most once (and e.g. prefer `index_metadata`, or the ragged buffers directly, where possible).
+        if self._df is not None:
+            return self._df
+        if TYPE_CHECKING:  # pragma: no cover
+            assert self._ragged is not None  # nosec B101
+        return self._ragged.to_dataframe()
+
+    @_data.setter
+    def _data(self, value: pd.DataFrame) -> None:
+        self._df = value
+
+    @property
+    def backend(self) -> data_typing.TimeSeriesBackend:
+        """The storage backend, see :obj:`~tempor.data.data_typing.TimeSeriesBackend`."""
+        return self._backend
+
+    def ragged_array(self) -> ragged.RaggedTimeSeries:
+        """Return the :class:`~tempor.data.ragged.RaggedTimeSeries` representation of the data. In case of the
+        ``"ragged"`` backend, this is the underlying storage (not a copy), otherwise it is built from the dataframe.
+
+        Returns:
+            ragged.RaggedTimeSeries: The ragged representation of the data.
+        """
+        if self._ragged is not None:
+            return self._ragged
+        return ragged.RaggedTimeSeries.from_dataframe(self._data)
+
+    @staticmethod
+    def _build_schemas(data: pd.DataFrame) -> _ValidationSchemas:
+        schema = pandera_utils.init_structural_schema(data, coerce=False)
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(schema, pa.DataFrameSchema)  # nosec B101
-        logger.debug(f"Inferred schema:\n{schema}")
+        logger.debug(f"Structural schema:\n{schema}")
 
         # DataFrame-level validation:
         schema = pandera_utils.add_df_checks(
@@ -401,24 +742,27 @@ class TimeSeriesSamples(DataSamples):
                 ),
             ],
         )
-        self._data = schema.validate(self._data)
+        schema_df_checks = pandera_utils.update_schema(schema, index=None)
 
         # Values validation:
-        schema = pandera_utils.add_regex_column_checks(
-            schema,
+        schema_values = pandera_utils.add_regex_column_checks(
+            pa.DataFrameSchema(coerce=False),
             regex=".*",
             dtype=pandera_utils.UnionDtype[DATA_SETTINGS.time_series_value_dtypes],  # type: ignore
             nullable=DATA_SETTINGS.time_series_values_nullable,
         )
-        self._data = schema.validate(self._data)
+        schema = pandera_utils.update_schema(schema, columns=schema_values.columns)
 
         # Index validation:
         if not (DATA_SETTINGS.sample_index_unique and DATA_SETTINGS.sample_timestep_index_unique):
             raise NotImplementedError("Only supported case: unique sample and unique timestep indexes")
         multiindex_unique_def = (DATA_SETTINGS.sample_index_name, DATA_SETTINGS.time_index_name)
-        schema, data = pandera_utils.set_up_2level_multiindex(
+        if not isinstance(schema.index, pa.MultiIndex):
+            # Not a MultiIndex, the DataFrame-level validation will fail.
+            return _ValidationSchemas(df_checks=schema_df_checks, values=schema_values, index=schema, full=schema)
+        schema, _ = pandera_utils.set_up_2level_multiindex(
             schema,
-            self._data,
+            data.iloc[:0],
             dtypes=(
                 pandera_utils.UnionDtype[DATA_SETTINGS.sample_index_dtypes],  # type: ignore
                 pandera_utils.UnionDtype[DATA_SETTINGS.time_index_dtypes],  # type: ignore
@@ -428,21 +772,67 @@ class TimeSeriesSamples(DataSamples):
             coerce=False,
             unique=multiindex_unique_def,
         )
-        with workaround_pandera_pd2_1_0_multiindex_compatibility(schema, data):
-            self._data = schema.validate(data)
+        schema_index = pa.DataFrameSchema(index=schema.index, coerce=False)
 
         logger.debug(f"Final schema:\n{schema}")
-        self._schema = schema
+        return _ValidationSchemas(df_checks=schema_df_checks, values=schema_values, index=schema_index, full=schema)
+
+    def _validate(self) -> None:
+        data = self._data
+        schemas = _get_validation_schemas(self, data, self._build_schemas)
+        # DataFrame-level validation (validates a copy, the subsequent validations are in place):
+        data = schemas.df_checks.validate(data)
+        # Values validation:
+        schemas.values.validate(data, inplace=True)
+        # Index validation:
+        data.index.set_names([DATA_SETTINGS.sample_index_name, DATA_SETTINGS.time_index_name], inplace=True)
+        with workaround_pandera_pd2_1_0_multiindex_compatibility(schemas.index, data):
+            schemas.index.validate(data, inplace=True)
+        self._data = data
+        self._schema = schemas.full
+        self._validated = _ValidatedState.of(data)
 
         # TODO:
         # Possible additional validation checks:
         # - Ensure time index sorted ascending within each sample.
         # - Time index float / int expected non-negative values.
 
+    def _normalize(self) -> None:
+        # In case of data from an array with the "ragged" backend, there is no dataframe, and the index is named.
+        if self._df is not None:
+            data = self._df.copy()
+            data.index = data.index.set_names([DATA_SETTINGS.sample_index_name, DATA_SETTINGS.time_index_name])
+            self._data = data
+
+    def _validate_incremental(self, reference: DataSamples) -> bool:
+        return self._validate_incremental_values(
+            reference, self._build_schemas, values_nullable=DATA_SETTINGS.time_series_values_nullable
+        )
+
     @staticmethod
     def from_dataframe(dataframe: pd.DataFrame, **kwargs) -> "TimeSeriesSamples":
         return TimeSeriesSamples(dataframe, **kwargs)
 
+    @staticmethod
+    def from_ragged(data: ragged.RaggedTimeSeries, **kwargs) -> "TimeSeriesSamples":
+        """Create :class:`TimeSeriesSamples` with the ``"ragged"`` backend directly from a
+        :class:`~tempor.data.ragged.RaggedTimeSeries`, without building a `pandas.DataFrame` first (except for the
+        purposes of validation).
+
+        Args:
+            data (ragged.RaggedTimeSeries): The ragged time series data.
+
+        Returns:
+            TimeSeriesSamples: :class:`TimeSeriesSamples` object using ``data`` as its storage.
+        """
+        ts_samples = TimeSeriesSamples.__new__(TimeSeriesSamples)
+        ts_samples._backend = "ragged"
+        ts_samples._df = None
+        ts_samples._ragged = data
+        super(TimeSeriesSamples, ts_samples).__init__(data, **kwargs)  # type: ignore [arg-type]
+        ts_samples._finalize_backend()
+        return ts_samples
+
     @staticmethod
     def from_numpy(
         array: np.ndarray,
@@ -489,15 +879,49 @@ class TimeSeriesSamples(DataSamples):
         )
 
     def numpy(self, *, padding_indicator: Any = DATA_SETTINGS.default_padding_indicator, **kwargs) -> np.ndarray:
+        if self._ragged is not None:
+            if utils.value_in_array(self._ragged.values, value=padding_indicator):
+                raise ValueError(
+                    f"Value `{padding_indicator}` found in data frame, choose a different padding indicator"
+                )
+            return self._ragged.to_array3d(padding_indicator=padding_indicator)
         return utils.multiindex_timeseries_dataframe_to_array3d(
             df=self._data, padding_indicator=padding_indicator, max_timesteps=None
         )
 
     def dataframe(self, **kwargs) -> pd.DataFrame:
+        """Return `pandas.DataFrame` representation of the data.
+
+        Note:
+            In case of the ``"ragged"`` backend, the dataframe is built on each call, so modifying it in-place will
+            not modify the data of this object.
+        """
         return self._data
 
+    def index_metadata(self) -> ragged.SampleIndexMetadata:
+        """Return the per-sample index metadata (sample index, and the offsets, lengths and time index of the rows of
+        each sample, as `numpy.ndarray` s / `pandas.Index` es), see :class:`~tempor.data.ragged.SampleIndexMetadata`.
+
+        The metadata is computed on first access and cached. The cache is invalidated if the data (in case of the
+        ``"dataframe"`` backend, the index of the dataframe) is replaced. The methods that return information about
+        the time indexes of the samples, like `time_indexes` and `num_timesteps`, all use this metadata.
+
+        Returns:
+            ragged.SampleIndexMetadata: The (immutable) metadata.
+        """
+        source: Any = self._ragged if self._ragged is not None else self._data.index
+        cached = self._index_metadata_cache
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        if self._ragged is not None:
+            metadata = self._ragged.index_metadata()
+        else:
+            metadata = ragged.SampleIndexMetadata.from_multiindex(source)
+        self._index_metadata_cache = (source, metadata)
+        return metadata
+
     def sample_index(self) -> data_typing.SampleIndex:
-        return list(utils.get_df_index_level0_unique(self._data))  # pyright: ignore
+        return list(self.index_metadata().sample_index)  # pyright: ignore
 
     def time_indexes(self) -> data_typing.TimeIndexList:
         """Get a list containing time indexes for each sample. Each time index is represented as a list of time step
@@ -506,7 +930,7 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[List[<timestep element>]]: A list containing time indexes for each sample.
         """
-        return list(self.time_indexes_as_dict().values())  # pyright: ignore
+        return self.index_metadata().time_indexes_as_lists()  # pyright: ignore
 
     def time_indexes_as_dict(self) -> data_typing.SampleToTimeIndexDict:
         """Get a dictionary mapping each sample index to its time index. Time index is represented as a list of time
@@ -515,25 +939,37 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             Dict[<sample element>, List[<timestep element>]]: A list containing time indexes for each sample.
         """
-        multiindex = self._data.index
-        if TYPE_CHECKING:  # pragma: no cover
-            assert isinstance(multiindex, pd.MultiIndex)  # nosec B101
-        sample_index = self.sample_index()
-        d = dict()
-        for s in sample_index:
-            time_index_locs = multiindex.get_locs([s, slice(None)])
-            d[s] = list(multiindex.get_level_values(1)[time_index_locs])
-        return d  # type: ignore[return-value]
+        metadata = self.index_metadata()
+        return dict(zip(metadata.sample_index, metadata.time_indexes_as_lists()))  # type: ignore[return-value]
 
     def time_indexes_float(self) -> List[np.ndarray]:
         """Return time indexes but converting their elements to `float` values.
 
-        Date-time time index will be converted using :obj:`~tempor.data.utils.datetime_time_index_to_float`.
+        Date-time time index will be converted using :obj:`~tempor.data.utils.datetime_time_index_to_float`. The
+        time indexes of all the samples are converted at once, and the result is cached, see
+        :meth:`time_indexes_float_ragged`.
+
+        Returns:
+            List[np.ndarray]:
+                List of 1D `numpy.ndarray` s of `float` values, corresponding to the time index. These are read-only
+                views of the cached result, copy them before modifying.
+        """
+        values, offsets = self.time_indexes_float_ragged()
+        offsets_ = offsets.tolist()
+        return [values[start:stop] for start, stop in zip(offsets_[:-1], offsets_[1:])]
+
+    def time_indexes_float_ragged(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the time indexes of all the samples converted to `float` values, as in :meth:`time_indexes_float`,
+        in ragged form: the time index of sample ``i`` is ``values[offsets[i] : offsets[i + 1]]``, see
+        :mod:`~tempor.data.ragged`.
 
         Returns:
-            List[np.ndarray]: List of 1D `numpy.ndarray` s of `float` values, corresponding to the time index.
+            Tuple[np.ndarray, np.ndarray]:
+                The (read-only) flat ``values`` array of length ``n_timesteps_total``, and the ``offsets`` array of
+                length ``n_samples + 1``.
         """
-        return [utils.datetime_time_index_to_float(ti) for ti in self.time_indexes()]
+        metadata = self.index_metadata()
+        return metadata.time_index_float, metadata.offsets
 
     def num_timesteps(self) -> List[int]:
         """Get the number of timesteps for each sample.
@@ -541,7 +977,7 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[int]: List containing the number of timesteps for each sample.
         """
-        return [len(x) for x in self.time_indexes()]
+        return self.index_metadata().lengths.tolist()
 
     def num_timesteps_as_dict(self) -> data_typing.SampleToNumTimestepsDict:
         """Get a dictionary mapping each sample index to its the number of timesteps.
@@ -549,7 +985,8 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[int]: List containing the number of timesteps for each sample.
         """
-        return {key: len(x) for key, x in self.time_indexes_as_dict().items()}  # type: ignore
+        metadata = self.index_metadata()
+        return dict(zip(metadata.sample_index, metadata.lengths.tolist()))  # type: ignore
 
     def num_timesteps_equal(self) -> bool:
         """Returns `True` if all samples share the same number of timesteps, `False` otherwise.
@@ -557,8 +994,8 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             bool: whether all samples share the same number of timesteps.
         """
-        timesteps = self.num_timesteps()
-        return True if len(timesteps) == 0 else all([x == timesteps[0] for x in timesteps])
+        lengths = self.index_metadata().lengths
+        return True if len(lengths) == 0 else bool((lengths == lengths[0]).all())
 
     def list_of_dataframes(self) -> List[pd.DataFrame]:
         """Returns a list of dataframes where each dataframe has the data for each sample.
@@ -566,15 +1003,23 @@ class TimeSeriesSamples(DataSamples):
         Returns:
             List[pd.DataFrame]: List of dataframes for each sample.
         """
-        return utils.multiindex_timeseries_dataframe_to_list_of_dataframes(self._data)
+        df = self._data
+        metadata = self.index_metadata()
+        if metadata.row_order is not None:
+            df = df.iloc[metadata.row_order]
+        offsets = metadata.offsets.tolist()
+        return [df.iloc[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
 
     @property
     def num_samples(self) -> int:
-        sample_ids = utils.get_df_index_level0_unique(self._data)
-        return len(sample_ids)
+        if self._ragged is not None:
+            return self._ragged.num_samples
+        return self.index_metadata().num_samples
 
     @property
     def num_features(self) -> int:
+        if self._ragged is not None:
+            return self._ragged.num_features
         return self._data.shape[1]
 
     def short_repr(self) -> str:
@@ -582,6 +1027,11 @@ class TimeSeriesSamples(DataSamples):
 
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:
         key_ = utils.ensure_pd_iloc_key_returns_df(key)
+        if self._ragged is not None:
+            return TimeSeriesSamples.from_ragged(  # type: ignore[return-value]
+                self._ragged.take(key_),
+                _skip_validate=True,
+            )
         sample_index = utils.get_df_index_level0_unique(self._data)
         selected = list(sample_index[key_])  # pyright: ignore
         return TimeSeriesSamples(  # type: ignore[return-value]
@@ -589,12 +1039,208 @@ class TimeSeriesSamples(DataSamples):
             _skip_validate=True,
         )
 
+    def _structure_key(self) -> Tuple:
+        # As `_structure_key` of the dataframe, without building the dataframe in case of the "ragged" backend.
+        if self._ragged is None:
+            return _structure_key(self._data)
+        rag = self._ragged
+        dtypes = rag.dtypes if rag.dtypes is not None else dict()
+        return (
+            [(f, dtypes.get(f, rag.values.dtype)) for f in rag.feature_index],
+            (pd.MultiIndex, (rag.sample_index.dtype, rag.time_index.dtype), pd.Index(rag.feature_index).dtype),
+        )
+
+    def _grouped_dataframe(self) -> pd.DataFrame:
+        # The dataframe with the rows of each sample contiguous, in the order of `index_metadata`.
+        row_order = self.index_metadata().row_order
+        df = self._data
+        return df if row_order is None else df.iloc[row_order]
+
+    @staticmethod
+    def _from_trusted_dataframe(data: pd.DataFrame) -> "TimeSeriesSamples":
+        ts_samples = TimeSeriesSamples(data, _skip_validate=True)
+        ts_samples._validated = _ValidatedState.of(data)
+        return ts_samples
+
+    def _fingerprint_source(self) -> Tuple[Any, ...]:
+        return (self._ragged if self._ragged is not None else self._df,)
+
+    def _fingerprint_parts(self) -> List[Any]:
+        # The same for both backends: the rows of each sample are hashed contiguously, as in `index_metadata`.
+        metadata = self.index_metadata()
+        if self._ragged is not None:
+            rag = self._ragged
+            dtypes = rag.dtypes if rag.dtypes is not None else dict()
+            features = rag.feature_index
+            columns = [
+                pd.Series(rag.values[:, i]).astype(dtypes[f]) if f in dtypes else rag.values[:, i]
+                for i, f in enumerate(features)
+            ]
+        else:
+            df = self._grouped_dataframe()
+            features = list(df.columns)
+            columns = [df.iloc[:, i] for i in range(df.shape[1])]
+        return [features, metadata.sample_index, metadata.lengths, metadata.time_index] + columns
+
+    def compact(self, *, float_dtype: Any = "float32", downcast_int: bool = False) -> Self:
+        if self._ragged is not None:
+            rag = self._ragged
+            if rag.dtypes is None and pd.api.types.is_float_dtype(rag.values.dtype):
+                # All the features are stored in the floating point values buffer, cast it directly.
+                if rag.values.dtype == pd.api.types.pandas_dtype(float_dtype):
+                    return self
+                rag = ragged.RaggedTimeSeries(
+                    rag.values.astype(float_dtype),
+                    rag.offsets,
+                    sample_index=rag.sample_index,
+                    time_index=rag.time_index,
+                    feature_index=rag.feature_index,
+                )
+                return TimeSeriesSamples.from_ragged(rag, _skip_validate=True)  # type: ignore[return-value]
+            df = rag.to_dataframe()
+            data = utils.compact_dtypes(df, float_dtype=float_dtype, downcast_int=downcast_int)
+            if data is df:
+                return self
+            return TimeSeriesSamples(data, backend="ragged", _reference=self)  # type: ignore[return-value]
+        data = utils.compact_dtypes(self._data, float_dtype=float_dtype, downcast_int=downcast_int)
+        if data is self._data:
+            return self
+        return TimeSeriesSamples(data, _reference=self)  # type: ignore[return-value]
+
+    @staticmethod
+    def _concat(objs: List[Any]) -> "TimeSeriesSamples":
+        first: TimeSeriesSamples = objs[0]
+        keys = [obj._structure_key() for obj in objs]
+        _check_concat_features([[f for f, _ in key[0]] for key in keys])
+        _check_concat_sample_indexes([obj.index_metadata().sample_index for obj in objs])
+        if any(key != keys[0] for key in keys[1:]):
+            # The dtypes differ, so the combined dtypes need validating.
+            return TimeSeriesSamples(pd.concat([obj.dataframe() for obj in objs]), backend=first.backend)
+        if first.backend == "ragged":
+            return TimeSeriesSamples.from_ragged(
+                ragged.RaggedTimeSeries.concat([obj.ragged_array() for obj in objs]), _skip_validate=True
+            )
+        return TimeSeriesSamples._from_trusted_dataframe(pd.concat([obj.dataframe() for obj in objs]))
+
+    def append_timesteps(self, other: "TimeSeriesSamples") -> "TimeSeriesSamples":
+        """Return a new :class:`TimeSeriesSamples` object with the timesteps of ``other`` appended after the timesteps
+        of the corresponding samples of this object. The samples of ``other`` must be present in this object, with
+        timesteps different from the existing ones (e.g. newly recorded timesteps). The samples not in ``other`` are
+        unchanged.
+
+        The data is not revalidated: ``other`` has been validated when it was created, and only its consistency with
+        this object (the features, the samples, and the timesteps) is checked, which only involves the samples of
+        ``other``. If the dtypes of the data differ, however, the combined data is validated in full.
+
+        Args:
+            other (TimeSeriesSamples): The timesteps to append.
+
+        Returns:
+            TimeSeriesSamples: The combined samples, with the same backend as this object.
+        """
+        key, other_key = self._structure_key(), other._structure_key()
+        _check_concat_features([[f for f, _ in key[0]], [f for f, _ in other_key[0]]])
+        metadata, other_metadata = self.index_metadata(), other.index_metadata()
+
+        sample_ilocs = metadata.sample_index.get_indexer(other_metadata.sample_index)
+        if (sample_ilocs == -1).any():
+            raise ValueError(
+                "Cannot append timesteps to samples that are not present in the data, "
+                f"{list(other_metadata.sample_index[sample_ilocs == -1])}, use `append_samples` to append new samples"
+            )
+        existing = pd.MultiIndex.from_arrays(
+            [
+                np.repeat(sample_ilocs, metadata.lengths[sample_ilocs]),
+                metadata.time_index[ragged.gather_rows(metadata.offsets, sample_ilocs)],
+            ]
+        )
+        appended = pd.MultiIndex.from_arrays(
+            [np.repeat(sample_ilocs, other_metadata.lengths), other_metadata.time_index]
+        )
+        overlap = appended.isin(existing)
+        if overlap.any():
+            sample_index = other_metadata.sample_index.repeat(other_metadata.lengths)
+            raise ValueError(
+                "Cannot append timesteps that are already present in the data, found (sample, timestep) "
+                f"{list(zip(sample_index[overlap], other_metadata.time_index[overlap]))}"
+            )
+
+        offsets, order = ragged.append_rows_order(metadata.offsets, other_metadata.offsets, sample_ilocs)
+        if key != other_key:
+            # The dtypes differ, so the combined dtypes need validating.
+            data = pd.concat([self._grouped_dataframe(), other._grouped_dataframe()]).iloc[order]
+            return TimeSeriesSamples(data, backend=self.backend)
+        if self._ragged is not None:
+            rag, other_rag = self._ragged, other.ragged_array()
+            return TimeSeriesSamples.from_ragged(
+                ragged.RaggedTimeSeries(
+                    np.concatenate([rag.values, other_rag.values])[order],
+                    offsets,
+                    sample_index=rag.sample_index,
+                    time_index=rag.time_index.append(other_rag.time_index)[order],
+                    feature_index=rag.feature_index,
+                    dtypes=rag.dtypes,
+                ),
+                _skip_validate=True,
+            )
+        return TimeSeriesSamples._from_trusted_dataframe(
+            pd.concat([self._grouped_dataframe(), other._grouped_dataframe()]).iloc[order]
+        )
+
 
 _DEFAULT_EVENTS_TIME_FEATURE_SUFFIX = "_time"
 
 
+def _split_events(data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Split a dataframe of ``(event time, event value)`` tuples into a dataframe of the event times and a dataframe of
+    the event values, with the same index and columns as ``data``.
+    """
+    times: Dict[int, List[Any]] = dict()
+    values: Dict[int, List[Any]] = dict()
+    for f_idx in range(data.shape[1]):
+        column = data.iloc[:, f_idx].tolist()
+        times[f_idx] = [x[0] for x in column]
+        values[f_idx] = [x[1] for x in column]
+    df_times = pd.DataFrame(times, index=data.index)
+    df_values = pd.DataFrame(values, index=data.index)
+    df_times.columns = data.columns
+    df_values.columns = data.columns
+    return df_times, df_values
+
+
+def _join_events(times: pd.DataFrame, values: pd.DataFrame) -> pd.DataFrame:
+    """The inverse of :func:`_split_events`: build the dataframe of ``(event time, event value)`` tuples."""
+    data = pd.DataFrame(
+        {
+            f_idx: pd.Series(
+                list(zip(times.iloc[:, f_idx].tolist(), values.iloc[:, f_idx].tolist())),
+                index=times.index,
+                dtype=object,
+            )
+            for f_idx in range(times.shape[1])
+        },
+        index=times.index,
+    )
+    data.columns = times.columns
+    return data
+
+
+def _interleave_events(times: pd.DataFrame, values: pd.DataFrame, time_feature_suffix: str) -> pd.DataFrame:
+    """Return the dataframe of :meth:`EventSamples.split`, with the event time column of each feature followed by
+    its event value column.
+    """
+    features = list(times.columns)
+    if any(time_feature_suffix in str(c) for c in features):
+        raise ValueError(f"Column names must not contain '{time_feature_suffix}'")
+    times = times.set_axis([f"{f}{time_feature_suffix}" for f in features], axis=1)
+    order = np.arange(2 * len(features)).reshape(2, -1).T.ravel()
+    return pd.concat([times, values], axis=1).iloc[:, order]
+
+
 class EventSamples(DataSamples):
-    _data: pd.DataFrame
+    _df: Optional[pd.DataFrame]
+    _times: pd.DataFrame
+    _values: pd.DataFrame
     _schema: pa.DataFrameSchema
     _schema_split: pa.DataFrameSchema
 
@@ -602,7 +1248,7 @@ class EventSamples(DataSamples):
     def modality(self) -> data_typing.DataModality:
         return data_typing.DataModality.EVENT
 
-    @pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+    @pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
     def __init__(
         self,
         data: data_typing.DataContainer,
@@ -622,7 +1268,13 @@ class EventSamples(DataSamples):
             feature_index (List[<feature element>], optional):
                 Used only if ``data`` is a `numpy.ndarray`.  List with feature (column) index for each feature.
                 Optional, if `None`, will be of form ``["feat_0", "feat_1", ...]``. Defaults to `None`.
+
+        Note:
+            The event times and the event values are stored separately, as a column of times and a column of values
+            for each feature (see :meth:`from_arrays`, :meth:`split_as_two_dataframes`), and the dataframe of
+            ``(event time, event value)`` tuples is built on each call to `dataframe`.
         """
+        self._df = None
         if isinstance(data, pd.DataFrame):
             self._data = data
         elif isinstance(data, np.ndarray):
@@ -630,12 +1282,38 @@ class EventSamples(DataSamples):
         else:  # pragma: no cover  # Prevented by pydantic check.
             raise ValueError(f"Data object {type(data)} not supported")
         super().__init__(data, **kwargs)
+        self._finalize_split()
 
-    def _validate(self) -> None:
-        schema = pandera_utils.init_schema(self._data, coerce=False)
+    def _finalize_split(self) -> None:
+        if self._df is not None:
+            self._times, self._values = _split_events(self._df)
+            # Only the event times and values are kept, the dataframe of tuples is built on demand.
+            self._df = None
+
+    def validate(self, reference: Optional[DataSamples] = None) -> None:
+        super().validate(reference=reference)
+        # Validation sets the (validated) dataframe, only keep the event times and values.
+        self._finalize_split()
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        # NOTE: The dataframe is built on each access, so methods should access this at most once.
+        if self._df is not None:
+            return self._df
+        return _join_events(self._times, self._values)
+
+    @_data.setter
+    def _data(self, value: pd.DataFrame) -> None:
+        self._df = value
+
+    @staticmethod
+    def _build_schemas(data: pd.DataFrame) -> _ValidationSchemas:
+        # NOTE: Only the structure of the index and the columns of ``data`` is used, which is the same for the
+        # dataframe of tuples and for the dataframes of event times and event values.
+        schema = pandera_utils.init_structural_schema(data, coerce=False)
         if TYPE_CHECKING:  # pragma: no cover
             assert isinstance(schema, pa.DataFrameSchema)  # nosec B101
-        logger.debug(f"Inferred schema:\n{schema}")
+        logger.debug(f"Structural schema:\n{schema}")
 
         # DataFrame-level validation:
         schema = pandera_utils.add_df_checks(
@@ -649,23 +1327,21 @@ class EventSamples(DataSamples):
                 ),
             ],
         )
-        self._data = schema.validate(self._data)
+        schema_df_checks = pandera_utils.update_schema(schema, index=None)
 
         # Values validation:
-        schema = pandera_utils.add_regex_column_checks(
-            schema,
+        schema_values = pandera_utils.add_regex_column_checks(
+            pa.DataFrameSchema(coerce=False),
             regex=".*",
             dtype=None,
             nullable=DATA_SETTINGS.event_values_nullable,
             checks_list=[pandera_utils.checks.require_element_len_2],
         )
-        self._data = schema.validate(self._data)
+        schema = pandera_utils.update_schema(schema, columns=schema_values.columns)
         # Validate event time and value components:
         suffix = _DEFAULT_EVENTS_TIME_FEATURE_SUFFIX
-        data_split = self.split(time_feature_suffix=suffix)
-        schema_split = pandera_utils.init_schema(data_split, coerce=False)
         schema_split = pandera_utils.add_regex_column_checks(
-            schema_split,
+            pa.DataFrameSchema(coerce=False),
             regex=f".*{suffix}$",  # Event time columns, end in "_time".
             dtype=pandera_utils.UnionDtype[DATA_SETTINGS.time_index_dtypes],  # type: ignore
             nullable=DATA_SETTINGS.time_index_nullable,
@@ -677,23 +1353,68 @@ class EventSamples(DataSamples):
             nullable=DATA_SETTINGS.event_values_nullable,
         )
         logger.debug(f"Time split-off schema (checks event time and values separately):\n{schema_split}")
-        schema_split.validate(data_split)
-        self._schema_split = schema_split
 
         # Index validation:
-        schema, data = pandera_utils.set_up_index(
+        if isinstance(schema.index, pa.MultiIndex):
+            # A MultiIndex, the DataFrame-level validation will fail.
+            return _ValidationSchemas(
+                df_checks=schema_df_checks, values=schema_values, index=schema, full=schema, split=schema_split
+            )
+        schema, _ = pandera_utils.set_up_index(
             schema,
-            self._data,
+            data.iloc[:0],
             dtype=pandera_utils.UnionDtype[DATA_SETTINGS.sample_index_dtypes],  # type: ignore
             name=DATA_SETTINGS.sample_index_name,
             nullable=DATA_SETTINGS.sample_index_nullable,
             coerce=False,
             unique=DATA_SETTINGS.sample_index_unique,
         )
-        self._data = schema.validate(data)
+        schema_index = pa.DataFrameSchema(index=schema.index, coerce=False)
 
         logger.debug(f"Final schema:\n{schema}")
-        self._schema = schema
+        return _ValidationSchemas(
+            df_checks=schema_df_checks, values=schema_values, index=schema_index, full=schema, split=schema_split
+        )
+
+    def _validate(self) -> None:
+        if self._df is not None:
+            schemas = _get_validation_schemas(self, self._df, self._build_schemas)
+            # DataFrame-level validation (validates a copy, the subsequent validations are in place):
+            data = schemas.df_checks.validate(self._df)
+            # Values validation (the elements are (event time, event value) tuples):
+            schemas.values.validate(data, inplace=True)
+            times, values = _split_events(data)
+        else:
+            schemas = _get_validation_schemas(self, self._times, self._build_schemas)
+            # DataFrame-level validation (validates a copy, the subsequent validations are in place):
+            times = schemas.df_checks.validate(self._times)
+            values = self._values.copy(deep=False)
+            values.index = times.index
+        if TYPE_CHECKING:  # pragma: no cover
+            assert schemas.split is not None  # nosec B101
+        # Validate event time and value components:
+        schemas.split.validate(
+            _interleave_events(times, values, time_feature_suffix=_DEFAULT_EVENTS_TIME_FEATURE_SUFFIX), inplace=True
+        )
+        self._schema_split = schemas.split
+        # Index validation:
+        times.index.set_names(DATA_SETTINGS.sample_index_name, inplace=True)  # Name the index (shared by `values`).
+        schemas.index.validate(times, inplace=True)
+        self._times, self._values = times, values
+        self._df = None
+        self._schema = schemas.full
+        self._validated = _ValidatedState.of(times)
+
+    def _normalize(self) -> None:
+        if self._df is not None:
+            # The event times and values are new dataframes, only the index is shared with the caller's data.
+            times, values = _split_events(self._df)
+        else:
+            times, values = self._times.copy(), self._values.copy()
+        times.index = times.index.set_names(DATA_SETTINGS.sample_index_name)
+        values.index = times.index
+        self._times, self._values = times, values
+        self._df = None
 
     @staticmethod
     def from_dataframe(dataframe: pd.DataFrame, **kwargs) -> "EventSamples":
@@ -709,6 +1430,58 @@ class EventSamples(DataSamples):
     ) -> "EventSamples":
         return EventSamples(array, sample_index=sample_index, feature_index=feature_index, **kwargs)
 
+    @staticmethod
+    def from_arrays(
+        times: np.ndarray,
+        values: np.ndarray,
+        *,
+        sample_index: Optional[data_typing.SampleIndex] = None,
+        feature_index: Optional[data_typing.FeatureIndex] = None,
+        **kwargs,
+    ) -> "EventSamples":
+        """Create :class:`EventSamples` directly from the array of event times and the array of event values, without
+        building the ``(event time, event value)`` tuples.
+
+        Args:
+            times (np.ndarray):
+                The event times, of shape ``(n_samples, n_features)``. If this is an array of objects, the dtype of the
+                times of each feature is inferred.
+            values (np.ndarray):
+                The event values (`True`/`False`), of the same shape as ``times``.
+            sample_index (List[<sample element>], optional):
+                List with sample (row) index for each sample. Optional, if `None`, will be of form ``[0, 1, ...]``.
+                Defaults to `None`.
+            feature_index (List[<feature element>], optional):
+                List with feature (column) index for each feature. Optional, if `None`, will be of form
+                ``["feat_0", "feat_1", ...]``. Defaults to `None`.
+
+        Returns:
+            EventSamples: :class:`EventSamples` object with the data.
+        """
+        times, values = np.asarray(times), np.asarray(values)
+        if times.ndim != 2 or times.shape != values.shape:
+            raise ValueError(
+                f"Event times and values must be 2D arrays of the same shape, were {times.shape} and {values.shape}"
+            )
+        index = pd.Index(
+            sample_index if sample_index is not None else _array_default_sample_index(times),
+            name=DATA_SETTINGS.sample_index_name,
+        )
+        columns = pd.Index(feature_index if feature_index is not None else _array_default_feature_index(times))
+        df_times = pd.DataFrame(times, index=index, columns=columns)
+        if times.dtype == object:
+            df_times = df_times.infer_objects()
+        return EventSamples._from_split(df_times, pd.DataFrame(values, index=index, columns=columns), **kwargs)
+
+    @staticmethod
+    def _from_split(times: pd.DataFrame, values: pd.DataFrame, **kwargs) -> "EventSamples":
+        event_samples = EventSamples.__new__(EventSamples)
+        event_samples._df = None
+        event_samples._times = times
+        event_samples._values = values
+        super(EventSamples, event_samples).__init__(times, **kwargs)
+        return event_samples
+
     @staticmethod
     def _array_to_df(
         array: np.ndarray,
@@ -728,20 +1501,27 @@ class EventSamples(DataSamples):
         return self._data.to_numpy()
 
     def dataframe(self, **kwargs) -> pd.DataFrame:
+        """Return `pandas.DataFrame` representation of the data, with an ``(event time, event value)`` tuple for each
+        element.
+
+        Note:
+            The dataframe is built on each call, so modifying it in-place will not modify the data of this object.
+            Use :meth:`split_as_two_dataframes` to access the event times and values without building the tuples.
+        """
         return self._data
 
     def sample_index(self) -> data_typing.SampleIndex:
-        return list(self._data.index)  # pyright: ignore
+        return list(self._times.index)  # pyright: ignore
 
     @property
     def num_samples(self) -> int:
-        return self._data.shape[0]
+        return self._times.shape[0]
 
     @property
     def num_features(self) -> int:
-        return self._data.shape[1]
+        return self._times.shape[1]
 
-    @pydantic.validate_arguments(config={"arbitrary_types_allowed": True})
+    @pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True})
     def split(self, time_feature_suffix: str = _DEFAULT_EVENTS_TIME_FEATURE_SUFFIX) -> pd.DataFrame:
         """Return a `pandas.DataFrame` where the time component of each event feature has been split off to its own
         column. The new columns that contain the times will be named ``"<original column name><time_feature_suffix>"``
@@ -756,15 +1536,7 @@ class EventSamples(DataSamples):
         Returns:
             pd.DataFrame: The output dataframe.
         """
-        df = self._data.copy()
-        features = list(df.columns)
-        if any(time_feature_suffix in str(c) for c in features):
-            raise ValueError(f"Column names must not contain '{time_feature_suffix}'")
-        for f_idx, f in enumerate(features):
-            df.insert(f_idx * 2, f"{f}{time_feature_suffix}", df[f].apply(lambda x: x[0]))
-        for f in features:
-            df[f] = df[f].apply(lambda x: x[1])
-        return df
+        return _interleave_events(self._times, self._values, time_feature_suffix=time_feature_suffix)
 
     def split_as_two_dataframes(
         self, time_feature_suffix: str = _DEFAULT_EVENTS_TIME_FEATURE_SUFFIX
@@ -781,17 +1553,160 @@ class EventSamples(DataSamples):
         Returns:
             Tuple[pd.DataFrame, pd.DataFrame]: Two `pandas.DataFrame` s containing event times and values respectively.
         """
-        df_split = self.split(time_feature_suffix=time_feature_suffix)
-        df_event_times = df_split.loc[:, [c for c in df_split.columns if time_feature_suffix in c]]
-        df_event_values = df_split.loc[:, [c for c in df_split.columns if time_feature_suffix not in c]]
-        return df_event_times, df_event_values
+        features = list(self._times.columns)
+        if any(time_feature_suffix in str(c) for c in features):
+            raise ValueError(f"Column names must not contain '{time_feature_suffix}'")
+        df_event_times = self._times.set_axis([f"{f}{time_feature_suffix}" for f in features], axis=1)
+        return df_event_times, self._values.copy()
 
     def short_repr(self) -> str:
         return f"{self.__class__.__name__}([{self.num_samples}, {self.num_features}])"
 
     def __getitem__(self, key: data_typing.GetItemKey) -> Self:
         key_ = utils.ensure_pd_iloc_key_returns_df(key)
-        return EventSamples(  # type: ignore[return-value]
-            self._data.iloc[key_, :],  # pyright: ignore
+        return EventSamples._from_split(  # type: ignore[return-value]
+            self._times.iloc[key_, :],  # pyright: ignore
+            self._values.iloc[key_, :],  # pyright: ignore
             _skip_validate=True,
         )
+
+    def _fingerprint_source(self) -> Tuple[Any, ...]:
+        return (self._times, self._values)
+
+    def _fingerprint_parts(self) -> List[Any]:
+        times, values = self._times, self._values
+        return (
+            [list(times.columns), times.index]
+            + [times.iloc[:, i] for i in range(times.shape[1])]
+            + [values.iloc[:, i] for i in range(values.shape[1])]
+        )
+
+    def compact(self, *, float_dtype: Any = "float32", downcast_int: bool = False) -> Self:
+        """Return the event samples unchanged: the event values are `bool`, and the event times are kept in full
+        precision, as they are compared with the evaluation horizons.
+
+        Args:
+            float_dtype (Any, optional):
+                Not used. Defaults to ``"float32"``.
+            downcast_int (bool, optional):
+                Not used. Defaults to `False`.
+
+        Returns:
+            Self: This object.
+        """
+        return self
+
+    @staticmethod
+    def _concat(objs: List[Any]) -> "EventSamples":
+        times: List[pd.DataFrame] = [obj._times for obj in objs]
+        values: List[pd.DataFrame] = [obj._values for obj in objs]
+        _check_concat_features([list(df.columns) for df in times])
+        _check_concat_sample_indexes([df.index for df in times])
+        keys = [(_structure_key(t), _structure_key(v)) for t, v in zip(times, values)]
+        times_, values_ = pd.concat(times), pd.concat(values)
+        values_.index = times_.index
+        if any(key != keys[0] for key in keys[1:]):
+            # The dtypes differ, so the combined dtypes need validating.
+            return EventSamples._from_split(times_, values_)
+        event_samples = EventSamples._from_split(times_, values_, _skip_validate=True)
+        event_samples._validated = _ValidatedState.of(times_)
+        return event_samples
+
+
+def concat(objs: Sequence[Union[DataSamples, "SamplesView"]]) -> DataSamples:
+    """Concatenate data samples objects of the same type along the samples dimension, e.g. to add newly collected
+    samples to existing data.
+
+    The objects have been validated when they were created, so the combined data is not revalidated. Only the
+    consistency of the objects is checked: they must have the same features, and no sample index elements in common.
+    Checking the sample indexes only involves looking up the sample index elements of the appended objects. If the
+    dtypes of the objects differ (e.g. ``int`` and ``float`` values of a feature), however, the combined data is
+    validated in full. :class:`TimeSeriesSamples` are combined with the backend of the first object.
+
+    Example:
+        >>> import pandas as pd
+        >>> from tempor.data.samples import StaticSamples, concat
+        >>>
+        >>> static = StaticSamples(pd.DataFrame({"a": [1.0, 2.0]}, index=[0, 1]))
+        >>> new = StaticSamples(pd.DataFrame({"a": [3.0]}, index=[2]))
+        >>> concat([static, new]).sample_index()
+        [0, 1, 2]
+
+    Args:
+        objs (Sequence[Union[DataSamples, SamplesView]]):
+            The objects to concatenate, at least one, all of the same type.
+
+    Returns:
+        DataSamples: The combined samples, of the same type as the objects.
+    """
+    objs_ = [materialize(obj) for obj in objs]
+    if not objs_:
+        raise ValueError("No data samples to concatenate")
+    cls = type(objs_[0])
+    for obj in objs_[1:]:
+        if type(obj) is not cls:
+            raise TypeError(
+                f"Cannot concatenate data samples of different types, {cls.__name__} and {type(obj).__name__}"
+            )
+    return cls._concat(objs_)  # pylint: disable=protected-access
+
+
+def _passthrough(obj: Any) -> Any:
+    return obj
+
+
+class SamplesView:
+    source: DataSamples
+    """The :class:`DataSamples` object the samples are selected from."""
+
+    def __init__(self, source: DataSamples, key: data_typing.GetItemKey) -> None:
+        """A lazy selection of samples (by position) from a :class:`DataSamples` object. No data is copied or
+        validated until :meth:`materialize` is called, which returns ``source[key]``.
+
+        Used by `~tempor.data.dataset.BaseDataset.__getitem__` to avoid selecting (and revalidating) data that has
+        already been validated as part of the parent dataset.
+
+        When serialized (pickled, deep-copied), the view is materialized first, so that only the selected samples
+        are serialized.
+
+        Args:
+            source (DataSamples): The :class:`DataSamples` object to select the samples from.
+            key (data_typing.GetItemKey): The selection key, as in ``DataSamples.__getitem__``.
+        """
+        self.source = source
+        self.key = utils.ensure_pd_iloc_key_returns_df(key)
+
+    @staticmethod
+    def of(data: Union[DataSamples, "SamplesView"], key: data_typing.GetItemKey) -> "SamplesView":
+        """Return a :class:`SamplesView` selecting ``key`` from ``data``. If ``data`` is itself a
+        :class:`SamplesView`, the selections are composed, rather than nested.
+        """
+        if isinstance(data, SamplesView):
+            return data.select(key)
+        return SamplesView(data, key)
+
+    def select(self, key: data_typing.GetItemKey) -> "SamplesView":
+        """Compose this view's selection with a further selection ``key``."""
+        sample_ilocs = np.arange(len(self.source))[self.key]
+        return SamplesView(self.source, sample_ilocs[utils.ensure_pd_iloc_key_returns_df(key)])
+
+    def __len__(self) -> int:
+        return len(np.arange(len(self.source))[self.key])
+
+    def materialize(self) -> DataSamples:
+        """Select the samples from ``source``.
+
+        Returns:
+            DataSamples: ``source[key]``.
+        """
+        return self.source[self.key]
+
+    def __reduce__(self):
+        return (_passthrough, (self.materialize(),))
+
+
+def materialize(data: Union[DataSamples, SamplesView]) -> DataSamples:
+    """Return ``data`` if it is a :class:`DataSamples`, or the materialized samples if it is a :class:`SamplesView`."""
+    if isinstance(data, SamplesView):
+        return data.materialize()
+    return data
@@ -0,0 +1,276 @@
+"""Columnar on-disk storage for TemporAI datasets, with lazy, memory-mapped loading.
+
+A dataset is saved to a directory as follows::
+
+    <path>/
+        manifest.json           # Format version, dataset and samples classes, feature names and dtypes.
+        time_series/            # One directory for each of: time_series, static, targets, treatments (if present).
+            values.npy          # The values, stored column-major: shape (n_features, n_rows).
+            sample_index.npy
+            offsets.npy         # TimeSeriesSamples only: offsets of each sample into the rows, see ragged module.
+            time_index.npy      # TimeSeriesSamples only: the (flat) time index, one element for each row.
+        ...
+
+For :class:`~tempor.data.samples.EventSamples`, the event times and event values are stored as separate
+``times.npy`` and ``values.npy`` arrays, both of shape ``(n_features, n_samples)``.
+
+On loading, the arrays are memory-mapped rather than read: only the parts of the files that are accessed are read from
+disk, and processes that load the same dataset share the pages in the operating system's page cache. Since the
+arrays are stored column-major, accessing a subset of the features only reads the corresponding columns, and since
+the rows of each sample are contiguous, selecting samples (e.g. ``data[sample_ilocs]``) only reads the rows of those
+samples. Time series are loaded with the ``"ragged"`` backend (see :class:`~tempor.data.ragged.RaggedTimeSeries`),
+which works on the memory-mapped buffers directly.
+
+Numeric and datetime sample and time indexes are memory-mapped too (`pandas.Index` wraps the memory-mapped arrays
+without a copy). String indexes, however, are read into memory in full on loading, as `pandas` stores them as arrays of
+Python objects.
+
+Note:
+    Arrays of Python objects (e.g. time series with categorical features, whose values are stored as objects)
+    cannot be memory-mapped, and are read in full (using pickle, so only load trusted data).
+"""
+
+import json
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union
+
+import numpy as np
+import pandas as pd
+from typing_extensions import Literal
+
+from . import dataset
+from . import predictive as pred
+from . import ragged, samples
+from .settings import DATA_SETTINGS
+
+FORMAT_VERSION = 1
+"""The version of the on-disk format written by :func:`save_dataset`."""
+
+MmapMode = Literal["r", "r+", "c"]
+"""The `numpy.load` memory-map modes supported by :func:`load_dataset`."""
+
+_MANIFEST_FILE = "manifest.json"
+_SAMPLES_NAMES = ("time_series", "static", "targets", "treatments")
+
+
+def _encode_dtype(dtype: Any) -> Dict[str, Any]:
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {"name": "category", "categories": dtype.categories.tolist(), "ordered": bool(dtype.ordered)}
+    return {"name": str(dtype)}
+
+
+def _decode_dtype(encoded: Dict[str, Any]) -> Any:
+    if encoded["name"] == "category":
+        return pd.CategoricalDtype(encoded["categories"], ordered=encoded["ordered"])
+    return pd.api.types.pandas_dtype(encoded["name"])
+
+
+def _dtypes_to_restore(df: pd.DataFrame, values: np.ndarray) -> Dict[str, Dict[str, Any]]:
+    return {str(c): _encode_dtype(dt) for c, dt in df.dtypes.items() if dt != values.dtype}
+
+
+def _save_array(path: Path, array: Any) -> None:
+    array = np.asarray(array)
+    if array.dtype == object and all(isinstance(x, str) for x in array.ravel()):
+        # Store strings (e.g. a string sample index) as a fixed-width unicode array, which can be memory-mapped.
+        array = array.astype(str)
+    np.save(path, np.ascontiguousarray(array), allow_pickle=array.dtype == object)
+
+
+def _load_array(path: Path, mmap_mode: Optional[MmapMode]) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+    except ValueError:
+        # Arrays of Python objects cannot be memory-mapped (or loaded without pickle).
+        return np.load(path, allow_pickle=True)  # nosec B301
+
+
+def _save_time_series(data: samples.TimeSeriesSamples, path: Path) -> Dict[str, Any]:
+    rag = data.ragged_array()
+    _save_array(path / "values.npy", rag.values.T)
+    _save_array(path / "offsets.npy", rag.offsets)
+    _save_array(path / "sample_index.npy", rag.sample_index.to_numpy())
+    _save_array(path / "time_index.npy", rag.time_index.to_numpy())
+    dtypes = {c: _encode_dtype(dt) for c, dt in rag.dtypes.items()} if rag.dtypes else {}
+    return {"features": rag.feature_index, "dtypes": dtypes}
+
+
+def _load_time_series(path: Path, meta: Dict[str, Any], mmap_mode: Optional[MmapMode]) -> samples.TimeSeriesSamples:
+    dtypes = {c: _decode_dtype(dt) for c, dt in meta["dtypes"].items()}
+    rag = ragged.RaggedTimeSeries(
+        _load_array(path / "values.npy", mmap_mode).T,
+        _load_array(path / "offsets.npy", mmap_mode),
+        sample_index=_load_array(path / "sample_index.npy", mmap_mode),
+        time_index=_load_array(path / "time_index.npy", mmap_mode),
+        feature_index=meta["features"],
+        dtypes=dtypes if dtypes else None,
+    )
+    return samples.TimeSeriesSamples.from_ragged(rag, _skip_validate=True)
+
+
+def _save_static(data: samples.StaticSamples, path: Path) -> Dict[str, Any]:
+    df = data.dataframe()
+    values = df.to_numpy()
+    _save_array(path / "values.npy", values.T)
+    _save_array(path / "sample_index.npy", df.index.to_numpy())
+    return {"features": list(df.columns), "dtypes": _dtypes_to_restore(df, values)}
+
+
+def _load_static(path: Path, meta: Dict[str, Any], mmap_mode: Optional[MmapMode]) -> samples.StaticSamples:
+    # The (n_samples, n_features) transposed view of the column-major buffer is used by the dataframe without a copy.
+    df = pd.DataFrame(
+        _load_array(path / "values.npy", mmap_mode).T,
+        index=pd.Index(
+            _load_array(path / "sample_index.npy", mmap_mode), name=DATA_SETTINGS.sample_index_name, copy=False
+        ),
+        columns=meta["features"],
+        copy=False,
+    )
+    if meta["dtypes"]:
+        df = df.astype({c: _decode_dtype(dt) for c, dt in meta["dtypes"].items()})
+    return samples.StaticSamples(df, _skip_validate=True)
+
+
+def _save_events(data: samples.EventSamples, path: Path) -> Dict[str, Any]:
+    df_times, df_values = data.split_as_two_dataframes()
+    _save_array(path / "times.npy", np.stack([df_times[c].to_numpy() for c in df_times.columns]))
+    _save_array(path / "values.npy", np.stack([df_values[c].to_numpy() for c in df_values.columns]))
+    _save_array(path / "sample_index.npy", df_times.index.to_numpy())
+    return {"features": list(df_values.columns), "dtypes": {}}
+
+
+def _load_events(path: Path, meta: Dict[str, Any], mmap_mode: Optional[MmapMode]) -> samples.EventSamples:
+    # The (n_samples, n_features) transposed views of the feature-major buffers are used without a copy.
+    return samples.EventSamples.from_arrays(
+        _load_array(path / "times.npy", mmap_mode).T,
+        _load_array(path / "values.npy", mmap_mode).T,
+        sample_index=_load_array(path / "sample_index.npy", mmap_mode),  # type: ignore[arg-type]
+        feature_index=meta["features"],
+        _skip_validate=True,
+    )
+
+
+_SAVERS = {
+    "TimeSeriesSamples": _save_time_series,
+    "StaticSamples": _save_static,
+    "EventSamples": _save_events,
+}
+_LOADERS = {
+    "TimeSeriesSamples": _load_time_series,
+    "StaticSamples": _load_static,
+    "EventSamples": _load_events,
+}
+
+
+def _get_class(module: Any, name: str, base: Type) -> Type:
+    cls = getattr(module, name, None)
+    if not (isinstance(cls, type) and issubclass(cls, base)):
+        raise ValueError(f"Unknown class '{name}' in the saved dataset, expected a subclass of {base.__name__}")
+    return cls
+
+
+def _save_dataset_files(data: dataset.BaseDataset, path: Path) -> None:
+    samples_objects: Dict[str, Optional[samples.DataSamples]] = {
+        "time_series": data.time_series,
+        "static": data.static,
+        "targets": data.predictive.targets if data.predictive is not None else None,
+        "treatments": data.predictive.treatments if data.predictive is not None else None,
+    }
+    samples_meta: Dict[str, Any] = dict()
+    for name, samples_object in samples_objects.items():
+        if samples_object is None:
+            continue
+        samples_path = path / name
+        samples_path.mkdir()
+        class_name = samples_object.__class__.__name__
+        samples_meta[name] = {"class": class_name, **_SAVERS[class_name](samples_object, samples_path)}
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "dataset_class": data.__class__.__name__,
+        "predictive_class": data.predictive.__class__.__name__ if data.predictive is not None else None,
+        "samples": samples_meta,
+    }
+    (path / _MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+
+
+def save_dataset(data: dataset.BaseDataset, path: Union[str, Path]) -> None:
+    """Save the dataset ``data`` to directory ``path`` in the columnar on-disk format (see module docstring), which
+    can then be loaded lazily with :func:`load_dataset`. A dataset previously saved in ``path`` is replaced.
+
+    The dataset is written to a temporary directory next to ``path``, which is only moved into place once complete, so
+    an interrupted save leaves any previously saved dataset intact. Datasets already loaded (memory-mapped) from
+    ``path`` keep working, as their files are removed rather than overwritten.
+
+    Args:
+        data (dataset.BaseDataset): The dataset to save.
+        path (Union[str, Path]):
+            The directory to save to. Must not exist, be empty, or contain a previously saved dataset.
+
+    Raises:
+        ValueError: If ``path`` exists, but is not an empty directory or a previously saved dataset.
+    """
+    path = Path(path)
+    if path.exists() and not (path.is_dir() and ((path / _MANIFEST_FILE).exists() or not any(path.iterdir()))):
+        raise ValueError(f"Cannot save the dataset to '{path}', which exists but is not a previously saved dataset")
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.mkdir()
+    try:
+        _save_dataset_files(data, tmp_path)
+        if path.exists():
+            old_path = tmp_path.with_suffix(".old")
+            path.rename(old_path)
+            tmp_path.rename(path)
+            shutil.rmtree(old_path)
+        else:
+            tmp_path.rename(path)
+    finally:
+        if tmp_path.exists():
+            shutil.rmtree(tmp_path)
+
+
+def load_dataset(path: Union[str, Path], *, mmap_mode: Optional[MmapMode] = "c") -> dataset.BaseDataset:
+    """Load a dataset saved with :func:`save_dataset` from directory ``path``.
+
+    The data is not validated again, as it was validated before it was saved.
+
+    Args:
+        path (Union[str, Path]):
+            The directory the dataset was saved to.
+        mmap_mode (Optional[MmapMode], optional):
+            The `numpy.load` memory-map mode. The default, ``"c"`` (copy-on-write), means that the data can be
+            modified in memory (e.g. by transformers that work in place) without modifying the files. Use ``"r"``
+            for read-only data, or `None` to read all the data into memory immediately. Defaults to ``"c"``.
+
+    Returns:
+        dataset.BaseDataset: The dataset, of the same class as the saved one.
+    """
+    path = Path(path)
+    manifest = json.loads((path / _MANIFEST_FILE).read_text())
+    if manifest["format_version"] > FORMAT_VERSION:
+        raise ValueError(
+            f"Dataset saved in format version {manifest['format_version']}, which is newer than the supported version "
+            f"{FORMAT_VERSION}"
+        )
+
+    loaded: Dict[str, Optional[samples.DataSamples]] = {name: None for name in _SAMPLES_NAMES}
+    for name, meta in manifest["samples"].items():
+        loaded[name] = _LOADERS[meta["class"]](path / name, meta, mmap_mode)
+
+    dataset_cls = _get_class(dataset, manifest["dataset_class"], dataset.BaseDataset)
+    predictive_cls = (
+        _get_class(pred, manifest["predictive_class"], pred.PredictiveTaskData)
+        if manifest["predictive_class"] is not None
+        else None
+    )
+    return dataset_cls._from_samples(  # pylint: disable=protected-access
+        time_series=loaded["time_series"],  # type: ignore[arg-type]
+        static=loaded["static"],  # type: ignore[arg-type]
+        predictive_cls=predictive_cls,
+        targets=loaded["targets"],
+        treatments=loaded["treatments"],
+    )
@@ -1,13 +1,14 @@
 import dataclasses
+import hashlib
 import itertools
 from typing import Any, ClassVar, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
-import pydantic
 from packaging.version import Version
 
 import tempor.core.utils
+from tempor.core import pydantic_utils
 
 from . import data_typing, settings
 
@@ -30,6 +31,13 @@ def value_in_df(df: pd.DataFrame, *, value: Any) -> bool:
     return (pd.isnull(value) and df.isna().any().any()) or (df == value).any().any()
 
 
+def value_in_array(array: np.ndarray, *, value: Any) -> bool:
+    """Check if ``value`` exists in ``array``, accounting for the case where ``value`` is `numpy.nan`."""
+    if pd.isnull(value):
+        return bool(pd.isnull(array).any())
+    return bool((array == value).any())
+
+
 def set_df_column_names_inplace(df: pd.DataFrame, names: Sequence) -> pd.DataFrame:
     if Version(pd.__version__) < Version("1.5"):  # pragma: no cover
         df.set_axis(names, axis="columns", inplace=True)  # pyright: ignore
@@ -42,10 +50,73 @@ def get_df_index_level0_unique(df: pd.DataFrame) -> pd.Index:
     return df.index.get_level_values(level=0).unique()
 
 
+def content_hash(*parts: Any) -> str:
+    """Return a stable (not salted per process) SHA-256 hex digest of ``parts``.
+
+    `pandas.Index`, `pandas.Series` and 1D `numpy.ndarray` parts are hashed together with their dtype, using the
+    vectorized `pandas.util.hash_pandas_object` / `pandas.util.hash_array`, so a `pandas.Series` and the
+    `numpy.ndarray` of its values give the same hash. Other parts are hashed by their ``repr``.
+
+    Args:
+        *parts (Any): The parts to hash.
+
+    Returns:
+        str: The hex digest.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (pd.Index, pd.Series)):
+            h.update(str(part.dtype).encode())
+            h.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+        elif isinstance(part, np.ndarray):
+            h.update(str(part.dtype).encode())
+            h.update(pd.util.hash_array(part).tobytes())
+        else:
+            h.update(repr(part).encode())
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def compact_dtypes(df: pd.DataFrame, *, float_dtype: Any = "float32", downcast_int: bool = False) -> pd.DataFrame:
+    """Return ``df`` with compact column dtypes: the floating point columns cast to ``float_dtype`` and, if
+    ``downcast_int``, the integer columns cast to the smallest integer dtype that can hold their values (see
+    `pandas.to_numeric`). Other columns (e.g. `bool`, categorical) are kept as they are.
+
+    Example:
+        >>> import pandas as pd
+        >>> from tempor.data.utils import compact_dtypes
+        >>>
+        >>> df = pd.DataFrame({"a": [1.5, 2.5], "b": [1, 200], "c": [True, False]})
+        >>> compact_dtypes(df, downcast_int=True).dtypes.tolist()
+        [dtype('float32'), dtype('int16'), dtype('bool')]
+
+    Args:
+        df (pd.DataFrame):
+            The dataframe.
+        float_dtype (Any, optional):
+            The dtype of the floating point columns. Defaults to ``"float32"``.
+        downcast_int (bool, optional):
+            Whether to downcast the integer columns. Defaults to `False`.
+
+    Returns:
+        pd.DataFrame: The dataframe with compact dtypes, ``df`` itself if no dtypes change.
+    """
+    float_dtype = pd.api.types.pandas_dtype(float_dtype)
+    dtypes = dict()
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype) and dtype != float_dtype:
+            dtypes[column] = float_dtype
+        elif downcast_int and pd.api.types.is_integer_dtype(dtype):
+            downcast = pd.to_numeric(df[column], downcast="integer").dtype
+            if downcast != dtype:
+                dtypes[column] = downcast
+    return df.astype(dtypes) if dtypes else df
+
+
 # --- Multiindex timeseries dataframe --> 3D numpy array. ---
 
 
-@pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+@pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
 def multiindex_timeseries_dataframe_to_array3d(
     df: pd.DataFrame, *, padding_indicator: Any, max_timesteps: Optional[int] = None
 ) -> np.ndarray:
@@ -70,18 +141,23 @@ def multiindex_timeseries_dataframe_to_array3d(
     """
     if value_in_df(df, value=padding_indicator):
         raise ValueError(f"Value `{padding_indicator}` found in data frame, choose a different padding indicator")
-    samples = get_df_index_level0_unique(df)
+    # Vectorized: each row is scattered into the output array at (<sample group code>, <position within sample>).
+    sample_codes, samples = pd.factorize(df.index.get_level_values(level=0))
+    positions = df.groupby(level=0, sort=False).cumcount().to_numpy()
     num_samples = len(samples)
     num_features = len(df.columns)
-    num_timesteps_per_sample = df.groupby(level=0).size()
+    num_timesteps_per_sample = np.bincount(sample_codes, minlength=num_samples)
     max_actual_timesteps = num_timesteps_per_sample.max()
     max_timesteps = max_actual_timesteps if max_timesteps is None else max_timesteps
-    array = np.full(shape=(num_samples, max_timesteps, num_features), fill_value=padding_indicator)
-    for i_sample, idx_sample in enumerate(samples):
-        set_vals = df.loc[idx_sample, :, :].to_numpy()[:max_timesteps, :]  # pyright: ignore
-        if i_sample == 0:
-            array = array.astype(set_vals.dtype)  # Need to cast to the type matching source data.
-        array[i_sample, : num_timesteps_per_sample[idx_sample], :] = set_vals  # pyright: ignore
+    values = df.to_numpy()
+    # Allocate directly in the type of the source data (e.g. without a float64 intermediate for float32 data).
+    array = np.full(
+        shape=(num_samples, max_timesteps, num_features),
+        fill_value=np.asarray(padding_indicator).astype(values.dtype),
+        dtype=values.dtype,
+    )
+    keep = positions < max_timesteps
+    array[sample_codes[keep], positions[keep], :] = values[keep]
     return array
 
 
@@ -213,23 +289,26 @@ def get_seq_lengths_timeseries_array3d(array: np.ndarray, padding_indicator: Any
     validate_timeseries_array3d(array, padding_indicator)
     is_padded = padding_indicator is not None
     if is_padded:
-        lengths = []
-        for array_sample in array:
-            array_sample_padding = array_sample == padding_indicator
-            if not check_bool_array2d_identical_along_dim1(array_sample_padding):
-                raise ValueError(
-                    "Expected padding to be indicated identically across all features for each sample. "
-                    f"Problem sample as array:\n{array_sample}"
-                )
-            array_sample_feat0, array_sample_padding_feat0 = array_sample[:, 0], array_sample_padding[:, 0]
-            if not check_bool_array1d_trues_consecutive(array_sample_padding_feat0, at_end=True):
-                raise ValueError(
-                    "Expected all padding values to be consecutive and at the end. "
-                    f"Problem sample 0th feature as array:\n{array_sample[0, :]}"
-                )
-            n_timesteps = get_array1d_length_until_padding(array_sample_feat0, padding_indicator)
-            lengths.append(n_timesteps)
-        return lengths
+        # Vectorized: all checks are done as whole-array reductions.
+        array_padding = array == padding_indicator
+        array_padding_feat0 = array_padding[:, :, 0]
+        identical_across_features = (array_padding == array_padding_feat0[:, :, np.newaxis]).all(axis=(1, 2))
+        if not identical_across_features.all():
+            problem_sample = np.argmin(identical_across_features)
+            raise ValueError(
+                "Expected padding to be indicated identically across all features for each sample. "
+                f"Problem sample as array:\n{array[problem_sample]}"
+            )
+        # Padding is consecutive and at the end <=> padding indicator is non-decreasing along the timestep dimension.
+        consecutive_at_end = (np.diff(array_padding_feat0.astype(np.int8), axis=1) >= 0).all(axis=1)
+        if not consecutive_at_end.all():
+            problem_sample = np.argmin(consecutive_at_end)
+            raise ValueError(
+                "Expected all padding values to be consecutive and at the end. "
+                f"Problem sample 0th feature as array:\n{array[problem_sample, :, 0]}"
+            )
+        lengths = array.shape[1] - array_padding_feat0.sum(axis=1)
+        return lengths.tolist()
     else:
         return [array.shape[1]] * array.shape[0]
 
@@ -241,10 +320,29 @@ def unpad_timeseries_array3d(array: np.ndarray, padding_indicator: Any) -> List[
     """
     validate_timeseries_array3d(array, padding_indicator)
     lengths = get_seq_lengths_timeseries_array3d(array, padding_indicator)
-    arrays_unpadded = []
-    for sample_i, length in enumerate(lengths):
-        arrays_unpadded.append(array[sample_i, :length, :])
-    return arrays_unpadded
+    return [array[sample_i, :length, :] for sample_i, length in enumerate(lengths)]
+
+
+def unpad_timeseries_array3d_flat(array: np.ndarray, padding_indicator: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized variant of :obj:`~tempor.data.utils.unpad_timeseries_array3d`, which returns the non-padding
+    timesteps of all samples concatenated into a single ``(timestep, feature)`` array, and the per-sample lengths.
+
+    Example:
+        >>> import numpy as np
+        >>> from tempor.data.utils import *
+        >>>
+        >>> pad = 999.0
+        >>> array = np.asarray([[[1.0], [2.0], [pad]], [[3.0], [pad], [pad]]])
+        >>> values, lengths = unpad_timeseries_array3d_flat(array, padding_indicator=pad)
+        >>> values.ravel()
+        array([1., 2., 3.])
+        >>> lengths
+        array([2, 1])
+    """
+    validate_timeseries_array3d(array, padding_indicator)
+    lengths = np.asarray(get_seq_lengths_timeseries_array3d(array, padding_indicator), dtype=np.int64)
+    mask = np.arange(array.shape[1])[np.newaxis, :] < lengths[:, np.newaxis]
+    return array[mask], lengths
 
 
 def make_sample_time_index_tuples(
@@ -271,7 +369,7 @@ def make_sample_time_index_tuples(
     return pairs  # type: ignore
 
 
-@pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+@pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
 def array3d_to_multiindex_timeseries_dataframe(
     array: np.ndarray,
     *,
@@ -307,19 +405,23 @@ def array3d_to_multiindex_timeseries_dataframe(
         pd.DataFrame: Resultant dataframe.
     """
     validate_timeseries_array3d(array, padding_indicator)
-    unpadded_arrays = unpad_timeseries_array3d(array, padding_indicator)
-    data = np.concatenate(unpadded_arrays)
-    return pd.DataFrame(
-        data,
-        index=pd.MultiIndex.from_tuples(make_sample_time_index_tuples(sample_index, time_indexes)),
-        columns=feature_index,
+    if len(sample_index) != len(time_indexes):
+        raise ValueError("Expected the same number of elements in `sample_index` and `time_indexes`")
+    data, _ = unpad_timeseries_array3d_flat(array, padding_indicator)
+    time_index_lengths = [len(ti) for ti in time_indexes]
+    multiindex = pd.MultiIndex.from_arrays(
+        [
+            pd.Index(sample_index).repeat(time_index_lengths),
+            pd.Index(list(itertools.chain.from_iterable(time_indexes))),
+        ]
     )
+    return pd.DataFrame(data, index=multiindex, columns=feature_index)
 
 
 # --- List of dataframes --> Multiindex timeseries dataframe. ---
 
 
-@pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+@pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
 def list_of_dataframes_to_multiindex_timeseries_dataframe(
     list_of_dataframes: List[pd.DataFrame],
     *,
@@ -380,7 +482,7 @@ def multiindex_timeseries_dataframe_to_list_of_dataframes(df: pd.DataFrame) -> L
 # --- [(event_times, event_values), ...] --> DataFrame compatible with EventSamples. ---
 
 
-@pydantic.validate_arguments(config={"arbitrary_types_allowed": False, "smart_union": True})
+@pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": False, "smart_union": True})
 def event_time_value_pairs_to_event_dataframe(
     event_time_value_pairs: Sequence[Tuple[data_typing.TimeIndex, List[bool]]],
     sample_index: data_typing.SampleIndex,
@@ -426,7 +528,7 @@ def event_time_value_pairs_to_event_dataframe(
 # --- Date-time time index -related ---
 
 
-@pydantic.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
+@pydantic_utils.validate_arguments(config={"arbitrary_types_allowed": True, "smart_union": True})
 def datetime_time_index_to_float(time_index: Union[data_typing.TimeIndex, pd.Index, pd.Series]) -> np.ndarray:
     """Convert a date-time ``time_index`` to floats. The conversion is done by calling
     ``<time_index as a numpy array>.astype(float)``.
@@ -7,7 +7,8 @@ import torch
 import torch.nn as nn
 from typing_extensions import Literal, Self, get_args
 
-from tempor.models import constants
+from tempor.data import ragged
+from tempor.models import constants, distributed
 
 from .mlp import MLP
 from .transformer import TransformerModel
@@ -39,21 +40,21 @@ output_modes = get_args(OutputMode)
 def get_padded_features(
     x: Union[np.ndarray, List[np.ndarray]], pad_size: Optional[int] = None, fill: float = np.nan
 ) -> np.ndarray:
-    """Helper function to pad variable length RNN inputs with nans."""
-    if pad_size is None:
-        pad_size = max([len(x_) for x_ in x])
-
-    x_padded = []
-    for i in range(len(x)):
-        if pad_size == len(x[i]):
-            x_padded.append(x[i].astype(float))
-        elif pad_size > len(x[i]):
-            pads = fill * np.ones((pad_size - len(x[i]),) + x[i].shape[1:])
-            x_padded.append(np.concatenate([x[i], pads]).astype(float))
-        else:
-            x_padded.append(x[i][:pad_size].astype(float))
+    """Helper function to pad variable length RNN inputs with nans. Returns a ``float32`` array of shape
+    ``(n_samples, pad_size, n_features)``, sequences longer than ``pad_size`` are truncated.
 
-    return np.asarray(x_padded)
+    The sequences are concatenated and written into the preallocated output with one vectorized copy, see
+    `~tempor.data.ragged.pad_rows`.
+    """
+    lengths = np.fromiter((len(x_) for x_ in x), dtype=np.int64, count=len(x))
+    values = np.concatenate(list(x), axis=0, dtype=np.float32, casting="unsafe")
+    return ragged.pad_rows(
+        values,
+        ragged.lengths_to_offsets(lengths),
+        padding_indicator=fill,
+        max_timesteps=pad_size,
+        dtype=np.float32,
+    )
 
 
 class DynamicDeepHitModel:
@@ -80,6 +81,7 @@ class DynamicDeepHitModel:
         random_state: int = 0,
         clipping_value: int = 1,
         output_mode: str = "MLP",
+        n_workers: int = 1,
     ) -> None:
         self.split = split
         self.split_time = None
@@ -105,6 +107,7 @@ class DynamicDeepHitModel:
         self.patience = patience
         self.random_state = random_state
         self.output_type = output_mode
+        self.n_workers = n_workers
 
         self.model: Optional[DynamicDeepHitLayers] = None
 
@@ -131,6 +134,15 @@ class DynamicDeepHitModel:
         x: np.ndarray,
         t: np.ndarray,
         e: np.ndarray,
+    ) -> Self:
+        # If n_workers > 1, train with data parallelism in worker processes, see `tempor.models.distributed`.
+        return distributed.train(self, "_fit", x, t, e, n_workers=self.n_workers)
+
+    def _fit(
+        self,
+        x: np.ndarray,
+        t: np.ndarray,
+        e: np.ndarray,
     ) -> Self:
         discretized_t, self.split_time = self.discretize(t, self.split, self.split_time)
         processed_data = self._preprocess_training_data(x, discretized_t, e)
@@ -151,6 +163,7 @@ class DynamicDeepHitModel:
 
         for i in range(self.n_iter):  # pylint: disable=unused-variable
             self.model.train()
+            distributed.sync_random_state()
             for j in range(nbatches):
                 xb = x_train[j * self.batch_size : (j + 1) * self.batch_size]
                 tb = t_train[j * self.batch_size : (j + 1) * self.batch_size]
@@ -160,8 +173,12 @@ class DynamicDeepHitModel:
                     continue
 
                 optimizer.zero_grad()
-                loss = self.total_loss(xb, tb, eb)
-                loss.backward()
+                # If distributed, each worker computes the gradients on its shard of the batch.
+                xb_shard, tb_shard, eb_shard = distributed.shard(xb, tb, eb)
+                if xb_shard.shape[0] > 0:
+                    loss = self.total_loss(xb_shard, tb_shard, eb_shard)
+                    loss.backward()
+                distributed.all_reduce_gradients(self.model.parameters(), weight=xb_shard.shape[0] / xb.shape[0])
 
                 if self.clipping_value > 0:
                     torch.nn.utils.clip_grad_norm_(  # pyright: ignore [reportPrivateImportUsage]
@@ -186,7 +203,8 @@ class DynamicDeepHitModel:
             if torch.isnan(valid_loss):  # pragma: no cover
                 raise RuntimeError("NaNs detected in the total loss")
 
-            valid_loss = valid_loss.item()
+            # The same in all the workers, if distributed, so that they stop at the same time.
+            valid_loss = distributed.broadcast(valid_loss.item())
 
             if valid_loss < old_loss:
                 patience = 0
@@ -222,7 +240,7 @@ class DynamicDeepHitModel:
         return t_discretized, split_time
 
     def _preprocess_test_data(self, x: Union[np.ndarray, List[np.ndarray]]) -> torch.Tensor:
-        data = torch.from_numpy(get_padded_features(x, pad_size=self.pad_size)).float().to(self.device)
+        data = torch.from_numpy(get_padded_features(x, pad_size=self.pad_size)).to(self.device)
         return data
 
     def _preprocess_training_data(
@@ -241,8 +259,8 @@ class DynamicDeepHitModel:
         self.pad_size = x.shape[1]
         x_train_np, t_train_np, e_train_np = x[idx], t[idx], e[idx]
 
-        x_train = torch.from_numpy(x_train_np.astype(float)).float().to(self.device)
-        t_train = torch.from_numpy(t_train_np.astype(float)).float().to(self.device)
+        x_train = torch.from_numpy(x_train_np).to(self.device)
+        t_train = torch.from_numpy(t_train_np.astype(np.float32)).to(self.device)
         e_train = torch.from_numpy(e_train_np.astype(int)).float().to(self.device)
 
         val_size = int(self.val_size * x_train.shape[0])
@@ -291,43 +309,67 @@ class DynamicDeepHitModel:
         all_step: bool = False,
         batch_size: int = 100,
     ) -> np.ndarray:
+        """Predict the survival probabilities of the sequences ``x`` at the time horizons ``t``.
+
+        The predictions are made in batches of ``batch_size``: the cumulative incidence is computed once for each
+        batch, and all the horizons are gathered from it with one index operation.
+
+        Args:
+            x (np.ndarray):
+                The (variable length) sequences.
+            t (List):
+                The time horizons.
+            risk (int, optional):
+                The risk (event type), starting from ``1``. Defaults to ``1``.
+            all_step (bool, optional):
+                If `True`, predict for every prefix of every sequence (i.e. at every step), ordered by sequence and
+                then by prefix length. The prefixes are obtained by masking the padded sequences batch by batch,
+                rather than materialized. Defaults to `False`.
+            batch_size (int, optional):
+                The batch size. Defaults to ``100``.
+
+        Returns:
+            np.ndarray:
+                The survival probabilities, of shape ``(n_sequences, len(t))``, or ``(n_prefixes, len(t))`` if
+                ``all_step``.
+        """
         if self.model is None:
             raise RuntimeError(
                 "The model has not been fitted yet. Please fit the "
                 + "model using the `fit` method on some training data "
                 + "before calling `predict_survival`."
             )
-        lens = [len(x_) for x_ in x]
-
-        x_in: Any = x
-        if all_step:
-            new_x = []
-            for x_, l_ in zip(x, lens):
-                new_x += [x_[: li + 1] for li in range(l_)]
-            x_in = new_x
 
         # TODO: The below [t] is messy, need to investigate...
         t = self.discretize([t], self.split, self.split_time)[0][0]  # type: ignore
+        horizons = torch.as_tensor(np.asarray(t, dtype=np.int64), device=self.device)
 
-        x_in_tensor: torch.Tensor = self._preprocess_test_data(x_in)
-        batches = int(len(x) / batch_size) + 1
-        scores: dict = {t_: [] for t_ in t}
-        for j in range(batches):
-            xb = x_in_tensor[j * batch_size : (j + 1) * batch_size]
-            _, f = self.model(xb)  # pylint: disable=not-callable
-            for t_ in t:
-                pred = torch.cumsum(f[int(risk) - 1], dim=1)[:, t_].squeeze().detach().cpu().numpy().tolist()
-
-                if isinstance(pred, list):
-                    scores[t_].extend(pred)
-                else:  # pragma: no cover
-                    scores[t_].append(pred)
-
-        output = []
-        for t_ in t:
-            output.append(scores[t_])
-
-        return 1 - np.asarray(output).T
+        x_in_tensor: torch.Tensor = self._preprocess_test_data(x)
+        if all_step:
+            # Row `i` of the output is the prefix of length `prefix_lens[i]` of sequence `sequence_ilocs[i]`.
+            lens = np.fromiter((len(x_) for x_ in x), dtype=np.int64, count=len(x))
+            sequence_ilocs = np.repeat(np.arange(len(x)), lens)
+            prefix_lens = ragged.positions_within_samples(ragged.lengths_to_offsets(lens)) + 1
+            n_rows = len(sequence_ilocs)
+        else:
+            n_rows = len(x_in_tensor)
+        positions = torch.arange(x_in_tensor.shape[1], device=self.device)
+
+        output = np.empty((n_rows, len(horizons)))
+        with torch.no_grad():
+            for start in range(0, n_rows, batch_size):
+                stop = min(start + batch_size, n_rows)
+                if all_step:
+                    xb = x_in_tensor[torch.from_numpy(sequence_ilocs[start:stop]).to(self.device)]
+                    prefix_lens_b = torch.from_numpy(prefix_lens[start:stop]).to(self.device)
+                    xb[positions.unsqueeze(0) >= prefix_lens_b.unsqueeze(1)] = float("nan")
+                else:
+                    xb = x_in_tensor[start:stop]
+                _, f = self.model(xb)  # pylint: disable=not-callable
+                cdf = torch.cumsum(f[int(risk) - 1], dim=1)
+                output[start:stop] = cdf[:, torch.remainder(horizons, cdf.shape[1])].cpu().numpy()
+
+        return 1 - output
 
     def predict_risk(self, x: np.ndarray, t: List, **kwargs: Any) -> np.ndarray:
         return 1 - self.predict_survival(x, t, **kwargs)
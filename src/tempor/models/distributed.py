@@ -0,0 +1,212 @@
+"""Opt-in data-parallel training of the torch models on CPU, using `torch.distributed` with the ``"gloo"`` backend.
+
+The model is trained in ``n_workers`` local worker processes, each with a replica of the model:
+
+* Each worker sees the same minibatches in the same order, and computes the gradients on its own shard (a contiguous
+  part) of each minibatch, see :func:`shard`.
+* The gradients are then all-reduced, weighted by the size of each shard, so that every worker takes the same optimizer
+  step, see :func:`all_reduce_gradients`. Gradient clipping is applied after the reduction, to the gradients of the
+  whole minibatch.
+* The random state of the workers is synchronized at the start of each epoch (so that e.g. random samplers draw the
+  same minibatches in every worker), and the workers use the validation loss of the first worker, so they make the
+  same early stopping decisions, which are the same as those of single process training.
+
+Once trained, the state of the first worker's replica is copied back into the model, see :func:`train`.
+
+The optimizer step is the same as that of a single process on the whole minibatch only if the model is deterministic
+in training mode and computes each sample's loss independently of the other samples in the minibatch. Otherwise it is
+equivalent in expectation, but not the same:
+
+* Random layers (e.g. dropout) draw different random numbers for each sample than a single process would.
+* Batch normalization layers compute the batch statistics (and update the running statistics) on each worker's shard
+  rather than on the whole minibatch. Models with such layers should pass a ``min_size`` of ``2`` to :func:`shard`.
+* Losses that are not a mean over the samples of the minibatch (e.g. the ranking loss of
+  :class:`~tempor.models.ddh.DynamicDeepHitModel`, which compares the samples of a minibatch with each other) are
+  approximated.
+
+Note:
+    The workers are started with the ``"spawn"`` start method, so scripts that train with ``n_workers > 1`` need the
+    usual ``if __name__ == "__main__":`` guard, and the model must be picklable.
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Tuple, TypeVar
+
+import numpy as np
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from tempor.utils import serialization
+
+T = TypeVar("T")
+
+BACKEND = "gloo"
+"""The `torch.distributed` backend used, which supports training on CPU."""
+
+
+def is_distributed() -> bool:
+    """Whether this is a worker process of data-parallel training (i.e. the default process group is initialized).
+
+    Returns:
+        bool: Whether this is a worker process of data-parallel training.
+    """
+    return dist.is_available() and dist.is_initialized()
+
+
+def shard(*tensors: torch.Tensor, min_size: int = 1) -> Tuple[torch.Tensor, ...]:
+    """Get the shard of each of the (minibatch) ``tensors`` for this worker, splitting them into contiguous parts
+    along the first dimension. The minibatch is split into fewer parts than there are workers if needed for each part
+    to have at least ``min_size`` samples, and the shards of the remaining workers are empty. The first worker's shard
+    is never empty. If not distributed, the ``tensors`` are returned as they are.
+
+    Args:
+        *tensors (torch.Tensor):
+            The tensors of the minibatch, with the same length along the first dimension.
+        min_size (int, optional):
+            The minimum number of samples of a (non-empty) shard, e.g. ``2`` for models with batch normalization
+            layers. Defaults to ``1``.
+
+    Returns:
+        Tuple[torch.Tensor, ...]: The shards of the ``tensors``.
+    """
+    if not is_distributed():
+        return tensors
+    rank, world_size = dist.get_rank(), dist.get_world_size()
+    n_shards = min(world_size, max(1, len(tensors[0]) // min_size))
+    if rank >= n_shards:
+        return tuple(t[:0] for t in tensors)
+    return tuple(torch.tensor_split(t, n_shards)[rank] for t in tensors)
+
+
+def all_reduce_gradients(parameters: Iterable[torch.nn.Parameter], weight: float) -> None:
+    """Sum the gradients of the ``parameters`` multiplied by ``weight`` across the workers, in place. With ``weight``
+    the fraction of the minibatch in this worker's shard, and a loss that is the mean over the samples, the result is
+    the gradient of the loss on the whole minibatch. No-op if not distributed.
+
+    Parameters that have no gradient in any of the workers are left without a gradient (as the optimizer skips these).
+
+    Args:
+        parameters (Iterable[torch.nn.Parameter]): The parameters.
+        weight (float): The weight of the gradients of this worker.
+    """
+    if not is_distributed():
+        return
+    params = [p for p in parameters if p.requires_grad]
+    has_grad = torch.tensor([p.grad is not None for p in params], dtype=torch.uint8)
+    dist.all_reduce(has_grad, op=dist.ReduceOp.MAX)
+    params = [p for p, has in zip(params, has_grad.tolist()) if has]
+    if not params:
+        return
+
+    # Reduce all the gradients at once, in a single flat buffer.
+    flat = torch.cat([(p.grad if p.grad is not None else torch.zeros_like(p)).reshape(-1) for p in params])
+    flat *= weight
+    dist.all_reduce(flat)
+    offset = 0
+    for p in params:
+        p.grad = flat[offset : offset + p.numel()].view_as(p)
+        offset += p.numel()
+
+
+def broadcast(value: T) -> T:
+    """Get the ``value`` of the first worker, in every worker (e.g. for early stopping decisions to be the same in all
+    workers). If not distributed, the ``value`` is returned as it is.
+
+    Args:
+        value (T): A picklable value.
+
+    Returns:
+        T: The value of the first worker.
+    """
+    if not is_distributed():
+        return value
+    values = [value]
+    dist.broadcast_object_list(values, src=0)
+    return values[0]
+
+
+def _get_random_state() -> Tuple:
+    return random.getstate(), np.random.get_state(), torch.get_rng_state()
+
+
+def _set_random_state(state: Tuple) -> None:
+    random.setstate(state[0])
+    np.random.set_state(state[1])
+    torch.set_rng_state(state[2])
+
+
+def sync_random_state() -> None:
+    """Set the random state (of `random`, `numpy` and `torch`) of all the workers to that of the first worker.
+    No-op if not distributed.
+    """
+    if is_distributed():
+        _set_random_state(broadcast(_get_random_state()))
+
+
+def _worker(
+    rank: int,
+    n_workers: int,
+    work_dir: str,
+    n_threads: int,
+    random_state: Tuple,
+    obj_bytes: bytes,
+    method: str,
+    args: Tuple,
+) -> None:
+    # Share the cores between the workers, rather than each using all of them.
+    torch.set_num_threads(n_threads)
+    _set_random_state(random_state)
+    dist.init_process_group(
+        BACKEND, init_method=(Path(work_dir) / "rendezvous").as_uri(), rank=rank, world_size=n_workers
+    )
+    try:
+        obj = serialization.load(obj_bytes)
+        getattr(obj, method)(*args)
+        if rank == 0:
+            serialization.save_to_file(Path(work_dir) / "trained.p", obj)
+    finally:
+        dist.destroy_process_group()
+
+
+def train(obj: Any, method: str, *args: Any, n_workers: int) -> Any:
+    """Train ``obj`` by calling ``obj.<method>(*args)`` in ``n_workers`` worker processes, with data-parallel training
+    (see module docstring), then copy the state of the first worker's trained ``obj`` into ``obj``.
+
+    If ``n_workers`` is ``1``, or this is already a worker process, ``obj.<method>(*args)`` is simply called.
+
+    Args:
+        obj (Any): The model to train, on CPU. The training ``method`` should use this module's functions.
+        method (str): The name of the training method of ``obj``.
+        *args (Any): The arguments of the training method.
+        n_workers (int): The number of worker processes.
+
+    Returns:
+        Any: ``obj``, or the return value of ``obj.<method>(*args)`` if it was simply called.
+    """
+    if n_workers < 1:
+        raise ValueError(f"`n_workers` must be a positive integer, was {n_workers}")
+    if n_workers == 1 or is_distributed():
+        return getattr(obj, method)(*args)
+
+    device = getattr(obj, "device", None)
+    if device is not None and torch.device(device).type != "cpu":
+        raise ValueError(f"Data-parallel training with `n_workers` > 1 is only supported on CPU, device was {device}")
+
+    n_threads = max(1, torch.get_num_threads() // n_workers)
+    with tempfile.TemporaryDirectory() as work_dir:
+        mp.start_processes(
+            _worker,
+            # The model is passed serialized, as each worker needs its own replica. The tensors of the (read-only)
+            # training data are passed as they are, so that they are shared with the workers rather than copied.
+            args=(n_workers, work_dir, n_threads, _get_random_state(), serialization.save(obj), method, args),
+            nprocs=n_workers,
+            join=True,
+            start_method="spawn",
+        )
+        trained = serialization.load_from_file(Path(work_dir) / "trained.p")
+
+    obj.__dict__.update(trained.__dict__)
+    return obj
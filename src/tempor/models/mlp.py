@@ -1,20 +1,20 @@
 from typing import Any, Callable, List, Optional, Tuple, Type, Union
 
 import numpy as np
-import pydantic
 import torch
 import torch.utils.data
 from torch import nn
 
+from tempor.core import pydantic_utils
 from tempor.log import logger
-from tempor.models import constants, utils
+from tempor.models import constants, distributed, utils
 
 from .constants import Nonlin
 from .utils import GumbelSoftmax, get_nonlin
 
 
 class LinearLayer(nn.Module):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         n_units_in: int,
@@ -41,13 +41,13 @@ class LinearLayer(nn.Module):
 
         self.model = nn.Sequential(*layers).to(self.device)
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def forward(self, X: torch.Tensor) -> torch.Tensor:
         return self.model(X.float()).to(self.device)  # pylint: disable=not-callable
 
 
 class ResidualLayer(LinearLayer):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         n_units_in: int,
@@ -68,7 +68,7 @@ class ResidualLayer(LinearLayer):
         self.device = device
         self.n_units_out = n_units_out
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def forward(self, X: torch.Tensor) -> torch.Tensor:
         if X.shape[-1] == 0:
             return torch.zeros((*X.shape[:-1], self.n_units_out)).to(self.device)
@@ -94,7 +94,7 @@ class MultiActivationHead(nn.Module):
             self.activations.append(activation)
             self.activation_lengths.append(length)
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def forward(self, X: torch.Tensor) -> torch.Tensor:
         if X.shape[-1] != np.sum(self.activation_lengths):
             raise RuntimeError(
@@ -113,7 +113,7 @@ class MultiActivationHead(nn.Module):
 
 
 class MLP(nn.Module):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         task_type: constants.ModelTaskType,
@@ -139,6 +139,7 @@ class MLP(nn.Module):
         residual: bool = False,
         loss: Optional[Callable] = None,
         device: Any = constants.DEVICE,
+        n_workers: int = 1,
     ) -> None:
         """Fully connected or residual neural nets for classification and regression.
 
@@ -194,6 +195,9 @@ class MLP(nn.Module):
                 tasks, or `torch.nn.MSELoss` for regression. Defaults to `None`.
             device (Any, optional):
                 PyTorch device to use. Defaults to `~tempor.models.constants.DEVICE`.
+            n_workers (int, optional):
+                If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+                :mod:`~tempor.models.distributed`. Defaults to ``1``.
         """
         super(MLP, self).__init__()
 
@@ -284,6 +288,7 @@ class MLP(nn.Module):
         self.patience = patience
         self.clipping_value = clipping_value
         self.early_stopping = early_stopping
+        self.n_workers = n_workers
         if loss is not None:
             self.loss = loss
         else:
@@ -296,11 +301,11 @@ class MLP(nn.Module):
         Xt = self._check_tensor(X)
         yt = self._check_tensor(y)
 
-        self._train(Xt, yt)
+        distributed.train(self, "_train", Xt, yt, n_workers=self.n_workers)
 
         return self
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         if self.task_type != "classification":
             raise ValueError(f"Invalid task type for predict_proba {self.task_type}")
@@ -312,7 +317,7 @@ class MLP(nn.Module):
 
             return yt.cpu().numpy().squeeze()
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict(self, X: np.ndarray) -> np.ndarray:
         with torch.no_grad():
             Xt = self._check_tensor(X)
@@ -331,12 +336,13 @@ class MLP(nn.Module):
         else:
             return np.mean(np.inner(y - y_pred, y - y_pred) / 2.0)
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def forward(self, X: torch.Tensor) -> torch.Tensor:
         return self.model(X.float())  # pylint: disable=not-callable
 
     def _train_epoch(self, loader: torch.utils.data.DataLoader) -> float:
         train_loss = []
+        distributed.sync_random_state()
 
         for batch_ndx, sample in enumerate(loader):  # pylint: disable=unused-variable
             self.optimizer.zero_grad()
@@ -345,11 +351,18 @@ class MLP(nn.Module):
             if len(X_next) < 2:  # pragma: no cover
                 continue
 
-            preds = self.forward(X_next).squeeze()
+            # If distributed, each worker computes the gradients on its shard of the batch. Like the batch, the
+            # (non-empty) shards need at least 2 samples for the batch normalization layers, if any.
+            X_shard, y_shard = distributed.shard(X_next, y_next, min_size=2)
+            if len(X_shard) > 0:
+                preds = self.forward(X_shard).squeeze()
 
-            batch_loss = self.loss(preds.squeeze(), y_next.squeeze())
+                batch_loss = self.loss(preds.squeeze(), y_shard.squeeze())
 
-            batch_loss.backward()
+                batch_loss.backward()
+
+                train_loss.append(batch_loss.detach())
+            distributed.all_reduce_gradients(self.parameters(), weight=len(X_shard) / len(X_next))
 
             if self.clipping_value > 0:
                 torch.nn.utils.clip_grad_norm_(  # pyright: ignore [reportPrivateImportUsage]
@@ -359,8 +372,6 @@ class MLP(nn.Module):
 
             self.optimizer.step()
 
-            train_loss.append(batch_loss.detach())
-
         return torch.mean(torch.Tensor(train_loss)).item()
 
     def _train(self, X: torch.Tensor, y: torch.Tensor) -> "MLP":
@@ -391,7 +402,8 @@ class MLP(nn.Module):
                     X_val, y_val = test_dataset.dataset.tensors  # type: ignore
 
                     preds = self.forward(X_val).squeeze()
-                    val_loss = self.loss(preds.squeeze(), y_val.squeeze())
+                    # The same in all the workers, if distributed, so that they stop at the same time.
+                    val_loss = distributed.broadcast(self.loss(preds.squeeze(), y_val.squeeze()))
 
                     if self.early_stopping:
                         if val_loss_best > val_loss:
@@ -1,10 +1,11 @@
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 import numpy as np
 import pydantic
 import torch
 from sklearn.model_selection import train_test_split
 from torch import nn
+from torch.nn.utils.rnn import pack_padded_sequence, pad_packed_sequence
 from torch.utils.data import DataLoader, TensorDataset, sampler
 from tsai.models.InceptionTime import InceptionTime
 from tsai.models.InceptionTimePlus import InceptionTimePlus
@@ -17,12 +18,13 @@ from tsai.models.XceptionTime import XceptionTime
 from tsai.models.XCM import XCM
 from typing_extensions import Literal
 
+from tempor.core import pydantic_utils
 from tempor.log import logger as log
-from tempor.models import constants
+from tempor.models import constants, distributed
 from tempor.models.constants import DEVICE, ModelTaskType, Nonlin
 from tempor.models.mlp import MLP, MultiActivationHead
 from tempor.models.samplers import ImbalancedDatasetSampler
-from tempor.models.utils import enable_reproducibility, get_nonlin
+from tempor.models.utils import ChunkedPredictionMixin, enable_reproducibility, get_nonlin, to_float32_array
 
 TSModelMode = Literal[
     "LSTM",
@@ -39,9 +41,11 @@ TSModelMode = Literal[
     "XCM",
 ]
 
+RECURRENT_MODES = ["RNN", "LSTM", "GRU"]
 
-class TimeSeriesModel(nn.Module):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+
+class TimeSeriesModel(ChunkedPredictionMixin, nn.Module):
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         task_type: ModelTaskType,
@@ -71,6 +75,9 @@ class TimeSeriesModel(nn.Module):
         patience: int = 20,
         train_ratio: float = 0.8,
         use_horizon_condition: bool = True,
+        length_buckets: Optional[int] = None,
+        inference_batch_size: Optional[int] = None,
+        n_workers: int = 1,
     ) -> None:
         """Basic neural net for time series.
 
@@ -134,12 +141,31 @@ class TimeSeriesModel(nn.Module):
             use_horizon_condition (bool, optional):
                 Whether to predict using the observation times (`True`) or just the covariates (`False`).
                 Defaults to `True`.
+            length_buckets (Optional[int], optional):
+                If `None`, samples are batched by their exact sequence length. Otherwise, samples are grouped into
+                (at most) this many buckets of similar sequence lengths, and padded to the longest sequence in the
+                bucket, which avoids many small batches on data with many distinct sequence lengths. The padding is
+                skipped using packed sequences, so this is only supported for the recurrent modes (``"RNN"``,
+                ``"LSTM"``, ``"GRU"``). Defaults to `None`.
+            inference_batch_size (Optional[int], optional):
+                If not `None`, ``predict`` and ``predict_proba`` run the model on chunks of (up to) this many samples
+                at a time, which bounds their memory use, see :meth:`iter_predict`. Defaults to `None`.
+            n_workers (int, optional):
+                If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+                :mod:`~tempor.models.distributed`. Defaults to ``1``.
         """
         super(TimeSeriesModel, self).__init__()
 
         enable_reproducibility(random_state)
         if len(output_shape) == 0:
             raise ValueError("Invalid output shape")
+        if length_buckets is not None:
+            if length_buckets < 1:
+                raise ValueError(f"`length_buckets` must be a positive integer, was {length_buckets}")
+            if mode not in RECURRENT_MODES:
+                raise ValueError(f"`length_buckets` is only supported for modes {RECURRENT_MODES}, was {mode}")
+        if inference_batch_size is not None and inference_batch_size < 1:
+            raise ValueError(f"`inference_batch_size` must be a positive integer, was {inference_batch_size}")
 
         self.task_type = task_type
 
@@ -170,6 +196,9 @@ class TimeSeriesModel(nn.Module):
         self.n_units_out = int(np.prod(self.output_shape))
         self.clipping_value = clipping_value
         self.use_horizon_condition = use_horizon_condition
+        self.length_buckets = length_buckets
+        self.inference_batch_size = inference_batch_size
+        self.n_workers = n_workers
 
         self.patience = patience
         self.train_ratio = train_ratio
@@ -219,15 +248,17 @@ class TimeSeriesModel(nn.Module):
             weight_decay=weight_decay,
         )  # optimize all rnn parameters
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def forward(
         self,
         static_data: torch.Tensor,
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
+        lengths: Optional[torch.Tensor] = None,
     ) -> torch.Tensor:
         # x shape (batch, time_step, input_size)
         # r_out shape (batch, time_step, output_size)
+        # lengths shape (batch,): the sequence lengths, if the sequences are padded.
 
         if torch.isnan(static_data).sum() != 0:
             raise ValueError("NaNs detected in the static data")
@@ -244,7 +275,7 @@ class TimeSeriesModel(nn.Module):
         if torch.isnan(temporal_data_merged).sum() != 0:  # pragma: no cover
             raise ValueError("NaNs detected in the temporal merged data")
 
-        pred = self.temporal_layer(static_data, temporal_data_merged)
+        pred = self.temporal_layer(static_data, temporal_data_merged, lengths)
 
         if self.out_activation is not None:
             pred = pred.reshape(-1, self.n_act_out)
@@ -254,68 +285,84 @@ class TimeSeriesModel(nn.Module):
 
         return pred
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
-    def predict(
+    def _predict_chunk(
         self,
         static_data: Union[List, np.ndarray],
         temporal_data: Union[List, np.ndarray],
         observation_times: Union[List, np.ndarray],
     ) -> np.ndarray:
-        self.eval()
-        with torch.no_grad():
-            (
-                static_data_t,
-                temporal_data_t,
-                observation_times_t,
-                _,
-                window_batches,
-            ) = self._prepare_input(static_data, temporal_data, observation_times)
-
-            yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
-                local_yt = self(
-                    static_data_t[widx],
-                    temporal_data_t[widx],
-                    observation_times_t[widx],
-                )
-                yt[window_batches[window_size]] = local_yt
+        (
+            static_data_t,
+            temporal_data_t,
+            observation_times_t,
+            _,
+            window_batches,
+            lengths_t,
+        ) = self._prepare_input(static_data, temporal_data, observation_times)
+
+        output = np.empty((len(temporal_data), *self.output_shape), dtype=np.float32)
+        for widx in range(len(temporal_data_t)):
+            window_size = len(observation_times_t[widx][0])
+            local_yt = self(
+                static_data_t[widx],
+                temporal_data_t[widx],
+                observation_times_t[widx],
+                lengths_t[widx],
+            )
+            output[window_batches[window_size]] = local_yt.cpu().numpy()
+        return output
 
-            if self.task_type == "classification":
-                return np.argmax(yt.cpu().numpy(), -1)
-            else:
-                return yt.cpu().numpy()
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def predict(
+        self,
+        static_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray],
+        observation_times: Union[List, np.ndarray],
+    ) -> np.ndarray:
+        output = self._predict_output(static_data, temporal_data, observation_times)
+        if self.task_type == "classification":
+            return np.argmax(output, -1)
+        else:
+            return output
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict_proba(
         self,
         static_data: Union[List, np.ndarray],
         temporal_data: Union[List, np.ndarray],
         observation_times: Union[List, np.ndarray],
     ) -> np.ndarray:
-        self.eval()
         if self.task_type != "classification":
             raise RuntimeError("Task valid only for classification")
-        with torch.no_grad():
-            (
-                static_data_t,
-                temporal_data_t,
-                observation_times_t,
-                _,
-                window_batches,
-            ) = self._prepare_input(static_data, temporal_data, observation_times)
-
-            yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
-                local_yt = self(
-                    static_data_t[widx],
-                    temporal_data_t[widx],
-                    observation_times_t[widx],
-                )
-                yt[window_batches[window_size]] = local_yt
+        return self._predict_output(static_data, temporal_data, observation_times)
 
-            return yt.cpu().numpy()
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def iter_predict(
+        self,
+        static_data: Union[List, np.ndarray],
+        temporal_data: Union[List, np.ndarray],
+        observation_times: Union[List, np.ndarray],
+        chunk_size: Optional[int] = None,
+        proba: bool = False,
+    ) -> Generator[np.ndarray, None, None]:
+        """Iterate over the predictions in chunks of (up to) ``chunk_size`` consecutive samples, so that only one
+        chunk of the input is prepared and run through the model at a time.
+
+        Args:
+            static_data (Union[List, np.ndarray]): Static data.
+            temporal_data (Union[List, np.ndarray]): Temporal data.
+            observation_times (Union[List, np.ndarray]): Observation times.
+            chunk_size (Optional[int], optional):
+                The (maximum) number of samples in each chunk. If `None`, ``inference_batch_size`` is used, and if
+                that is `None`, all the samples are predicted in one chunk. Defaults to `None`.
+            proba (bool, optional):
+                Whether to yield the predicted probabilities (as in ``predict_proba``) rather than the predictions (as
+                in ``predict``). Defaults to `False`.
+
+        Returns:
+            Generator[np.ndarray, None, None]: The predictions for each chunk, in the order of the samples.
+        """
+        return self._iter_predictions(static_data, temporal_data, observation_times, chunk_size, proba)
 
     def score(
         self,
@@ -330,7 +377,7 @@ class TimeSeriesModel(nn.Module):
         else:
             return np.mean(np.inner(outcome - y_pred, outcome - y_pred) / 2.0)
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def fit(
         self,
         static_data: Union[List, np.ndarray],
@@ -344,17 +391,28 @@ class TimeSeriesModel(nn.Module):
             observation_times_t,
             outcome_t,
             _,
+            lengths_t,
         ) = self._prepare_input(static_data, temporal_data, observation_times, outcome)
 
-        return self._train(static_data_t, temporal_data_t, observation_times_t, outcome_t)
+        return distributed.train(
+            self,
+            "_train",
+            static_data_t,
+            temporal_data_t,
+            observation_times_t,
+            outcome_t,
+            lengths_t,
+            n_workers=self.n_workers,
+        )
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def _train(
         self,
         static_data: List[torch.Tensor],
         temporal_data: List[torch.Tensor],
         observation_times: List[torch.Tensor],
         outcome: List[torch.Tensor],
+        lengths: List[torch.Tensor],
     ) -> Any:
         patience = 0
         prev_error = np.inf
@@ -367,6 +425,7 @@ class TimeSeriesModel(nn.Module):
                 temporal_data[widx],
                 observation_times[widx],
                 outcome[widx],
+                lengths[widx],
             )
             train_dataloaders.append(train_dl)
             test_dataloaders.append(test_dl)
@@ -375,7 +434,8 @@ class TimeSeriesModel(nn.Module):
         for it in range(self.n_iter):
             train_loss = self._train_epoch(train_dataloaders)
             if it % self.n_iter_print == 0:
-                val_loss = self._test_epoch(test_dataloaders)
+                # The same in all the workers, if distributed, so that they stop at the same time.
+                val_loss = distributed.broadcast(self._test_epoch(test_dataloaders))
                 log.info(f"Epoch:{it}| train loss: {train_loss}, validation loss: {val_loss}")
                 if val_loss < prev_error:
                     patience = 0
@@ -389,36 +449,39 @@ class TimeSeriesModel(nn.Module):
 
     def _train_epoch(self, loaders: List[DataLoader]) -> float:
         self.train()
+        distributed.sync_random_state()
 
         losses = []
         for loader in loaders:
-            for step, (static_mb, temporal_mb, horizons_mb, y_mb) in enumerate(  # pylint: disable=unused-variable
-                loader
-            ):
+            for batch in loader:
                 self.optimizer.zero_grad()  # clear gradients for this training step
 
-                pred = self(static_mb, temporal_mb, horizons_mb)  # rnn output
+                # If distributed, each worker computes the gradients on its shard of the batch.
+                static_mb, temporal_mb, horizons_mb, y_mb, lengths_mb = distributed.shard(*batch)
+                if len(y_mb) > 0:
+                    pred = self(static_mb, temporal_mb, horizons_mb, lengths_mb)  # rnn output
 
-                loss = self.loss(pred.squeeze(), y_mb.squeeze())
+                    loss = self.loss(pred.squeeze(), y_mb.squeeze())
+
+                    loss.backward()  # backpropagation, compute gradients
+                    losses.append(loss.detach().cpu())
+                distributed.all_reduce_gradients(self.parameters(), weight=len(y_mb) / len(batch[0]))
 
-                loss.backward()  # backpropagation, compute gradients
                 if self.clipping_value > 0:
                     torch.nn.utils.clip_grad_norm_(self.parameters(), self.clipping_value)  # pyright: ignore
                 self.optimizer.step()  # apply gradients
 
-                losses.append(loss.detach().cpu())
-
-        return float(np.mean(losses))
+        return float(np.mean(losses)) if losses else np.nan
 
     def _test_epoch(self, loaders: List[DataLoader]) -> float:
         self.eval()
 
         losses = []
         for loader in loaders:
-            for step, (static_mb, temporal_mb, horizons_mb, y_mb) in enumerate(  # pylint: disable=unused-variable
+            for step, (static_mb, temporal_mb, horizons_mb, y_mb, lengths_mb) in enumerate(  # pylint: disable=W0612
                 loader
             ):
-                pred = self(static_mb, temporal_mb, horizons_mb)  # rnn output
+                pred = self(static_mb, temporal_mb, horizons_mb, lengths_mb)  # rnn output
                 loss = self.loss(pred.squeeze(), y_mb.squeeze())
 
                 losses.append(loss.detach().cpu())
@@ -431,6 +494,7 @@ class TimeSeriesModel(nn.Module):
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
         outcome: torch.Tensor,
+        lengths: torch.Tensor,
     ) -> Tuple[DataLoader, DataLoader]:
         stratify = None
         _, out_counts = torch.unique(outcome, return_counts=True)
@@ -442,6 +506,7 @@ class TimeSeriesModel(nn.Module):
             temporal_data.cpu(),
             observation_times.cpu(),
             outcome.cpu(),
+            lengths.cpu(),
             train_size=self.train_ratio,
             random_state=self.random_state,
             stratify=stratify,
@@ -455,18 +520,22 @@ class TimeSeriesModel(nn.Module):
             observation_times_test,
             outcome_train,
             outcome_test,
+            lengths_train,
+            lengths_test,
         ) = split
         train_dataset = TensorDataset(
             static_data_train.to(self.device),
             temporal_data_train.to(self.device),
             observation_times_train.to(self.device),
             outcome_train.to(self.device),
+            lengths_train,
         )
         test_dataset = TensorDataset(
             static_data_test.to(self.device),
             temporal_data_test.to(self.device),
             observation_times_test.to(self.device),
             outcome_test.to(self.device),
+            lengths_test,
         )
 
         sampler_ = self.dataloader_sampler
@@ -493,6 +562,32 @@ class TimeSeriesModel(nn.Module):
         else:
             return torch.from_numpy(np.asarray(X)).to(self.device)
 
+    def _window_batches(self, observation_times: np.ndarray) -> Dict[int, List[int]]:
+        """Group the sample indices into batches, keyed by the (padded) sequence length of the batch."""
+        window_batches: Dict[int, List[int]] = {}
+        if self.length_buckets is None:
+            for idx, item in enumerate(observation_times):
+                window_len = len(item)
+                if window_len not in window_batches:
+                    window_batches[window_len] = []
+                window_batches[window_len].append(idx)
+            return window_batches
+
+        window_lens = np.asarray([len(item) for item in observation_times])
+
+        # Split the distinct lengths (in ascending order) into buckets with roughly equal numbers of samples.
+        distinct_lens, counts = np.unique(window_lens, return_counts=True)
+        n_before = np.cumsum(counts) - counts
+        bucket = (n_before * self.length_buckets) // len(window_lens)
+        bucket_max_len = {b: int(distinct_lens[bucket == b].max()) for b in np.unique(bucket)}
+        window_bucket = bucket[np.searchsorted(distinct_lens, window_lens)]
+        for idx, b in enumerate(window_bucket):
+            window_len = bucket_max_len[b]
+            if window_len not in window_batches:
+                window_batches[window_len] = []
+            window_batches[window_len].append(idx)
+        return window_batches
+
     def _prepare_input(
         self,
         static_data: Union[List, np.ndarray],
@@ -506,31 +601,40 @@ class TimeSeriesModel(nn.Module):
         if outcome is not None:
             outcome = np.asarray(outcome)
 
-        window_batches: Dict[int, List[int]] = {}
-        for idx, item in enumerate(observation_times):
-            window_len = len(item)
-            if window_len not in window_batches:
-                window_batches[window_len] = []
-            window_batches[window_len].append(idx)
+        window_batches = self._window_batches(observation_times)
 
         static_data_mb = []
         temporal_data_mb = []
         observation_times_mb = []
         outcome_mb = []
+        lengths_mb = []
 
         for widx in window_batches:
             indices = window_batches[widx]
 
-            static_data_t = self._check_tensor(static_data[indices]).float()
+            static_data_t = self._check_tensor(to_float32_array(static_data[indices]))
 
-            local_temporal_data = np.array(temporal_data[indices].tolist()).astype(float)
-            temporal_data_t = self._check_tensor(local_temporal_data).float()
-            local_observation_times = np.array(observation_times[indices].tolist()).astype(float)
-            observation_times_t = self._check_tensor(local_observation_times).float()
+            if self.length_buckets is None:
+                local_temporal_data = to_float32_array(temporal_data[indices])
+                local_observation_times = to_float32_array(observation_times[indices])
+                lengths = np.full(len(indices), widx)
+            else:
+                # Pad the sequences (at the end) to the longest in the bucket.
+                lengths = np.asarray([len(observation_times[idx]) for idx in indices])
+                n_features = np.asarray(temporal_data[indices[0]]).shape[-1]
+                local_temporal_data = np.zeros((len(indices), widx, n_features), dtype=np.float32)
+                local_observation_times = np.zeros((len(indices), widx), dtype=np.float32)
+                for local_idx, (idx, length) in enumerate(zip(indices, lengths)):
+                    local_temporal_data[local_idx, :length] = np.asarray(temporal_data[idx], dtype=np.float32)[:length]
+                    local_observation_times[local_idx, :length] = np.asarray(observation_times[idx], dtype=np.float32)
+            temporal_data_t = self._check_tensor(local_temporal_data)
+            observation_times_t = self._check_tensor(local_observation_times)
 
             static_data_mb.append(static_data_t)
             temporal_data_mb.append(temporal_data_t)
             observation_times_mb.append(observation_times_t)
+            # NOTE: Kept on the CPU, as required by `pack_padded_sequence`.
+            lengths_mb.append(torch.from_numpy(lengths).long())
 
             if outcome is not None:
                 outcome_t = self._check_tensor(outcome[indices]).float()
@@ -545,6 +649,7 @@ class TimeSeriesModel(nn.Module):
             observation_times_mb,
             outcome_mb,
             window_batches,
+            lengths_mb,
         )
 
 
@@ -579,7 +684,7 @@ class TimeSeriesLayer(nn.Module):
             "GRU": nn.GRU,
         }
 
-        if mode in ["RNN", "LSTM", "GRU"]:
+        if mode in RECURRENT_MODES:
             self.temporal_layer = temporal_models[mode](**temporal_params)
         elif mode == "MLSTM_FCN":
             self.temporal_layer = MLSTM_FCN(
@@ -647,7 +752,7 @@ class TimeSeriesLayer(nn.Module):
         self.device = device
         self.mode = mode
 
-        if mode in ["RNN", "LSTM", "GRU"]:
+        if mode in RECURRENT_MODES:
             self.out = WindowLinearLayer(
                 n_static_units_in=n_static_units_in,
                 n_temporal_units_in=n_temporal_units_hidden,
@@ -673,14 +778,24 @@ class TimeSeriesLayer(nn.Module):
         self.temporal_layer.to(device)
         self.out.to(device)
 
-    def forward(self, static_data: torch.Tensor, temporal_data: torch.Tensor) -> torch.Tensor:
-        if self.mode in ["RNN", "LSTM", "GRU"]:
-            X_interm, _ = self.temporal_layer(temporal_data)
+    def forward(
+        self, static_data: torch.Tensor, temporal_data: torch.Tensor, lengths: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
+        if self.mode in RECURRENT_MODES:
+            seq_len = temporal_data.shape[1]
+            if lengths is not None and bool((lengths < seq_len).any()):
+                # Padded sequences: skip the padding, rather than run the recurrent layer over it.
+                packed = pack_padded_sequence(temporal_data, lengths.cpu(), batch_first=True, enforce_sorted=False)
+                X_packed, _ = self.temporal_layer(packed)
+                X_interm, _ = pad_packed_sequence(X_packed, batch_first=True, total_length=seq_len)
+            else:
+                X_interm, _ = self.temporal_layer(temporal_data)
+                lengths = None
 
             if torch.isnan(X_interm).sum() != 0:
                 raise RuntimeError("NaNs detected in the temporal embeddings")
 
-            return self.out(static_data, X_interm)
+            return self.out(static_data, X_interm, lengths)
         else:
             X_interm = self.temporal_layer(torch.swapaxes(temporal_data, 1, 2))
 
@@ -691,7 +806,7 @@ class TimeSeriesLayer(nn.Module):
 
 
 class WindowLinearLayer(nn.Module):
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def __init__(
         self,
         n_static_units_in: int,
@@ -720,15 +835,24 @@ class WindowLinearLayer(nn.Module):
             device=device,
         )
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
-    def forward(self, static_data: torch.Tensor, temporal_data: torch.Tensor) -> torch.Tensor:
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def forward(
+        self, static_data: torch.Tensor, temporal_data: torch.Tensor, lengths: Optional[torch.Tensor] = None
+    ) -> torch.Tensor:
         if self.n_static_units_in > 0 and len(static_data) != len(temporal_data):
             raise ValueError("Length mismatch between static and temporal data")
 
         batch_size, seq_len, n_feats = temporal_data.shape
-        temporal_batch = temporal_data[:, seq_len - self.window_size :, :].reshape(
-            batch_size, n_feats * self.window_size
-        )
+        if lengths is None:
+            temporal_window = temporal_data[:, seq_len - self.window_size :, :]
+        else:
+            # Padded sequences: take the last `window_size` steps before the padding of each sequence. The steps
+            # before the start of a sequence shorter than `window_size` are zeroed, as if the sequence was left-padded.
+            steps = lengths.to(temporal_data.device).unsqueeze(1) - self.window_size
+            steps = steps + torch.arange(self.window_size, device=temporal_data.device)
+            temporal_window = torch.gather(temporal_data, 1, steps.clamp(min=0).unsqueeze(2).expand(-1, -1, n_feats))
+            temporal_window = temporal_window.masked_fill((steps < 0).unsqueeze(2), 0.0)
+        temporal_batch = temporal_window.reshape(batch_size, n_feats * self.window_size)
         batch = torch.cat([static_data, temporal_batch], dim=1)
 
         return self.model(batch).to(self.device)
@@ -1,7 +1,6 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import numpy as np
-import pydantic
 import torch
 import torchcde
 import torchdiffeq
@@ -12,15 +11,21 @@ from torch import nn
 from torch.utils.data import DataLoader, TensorDataset, sampler
 from typing_extensions import Literal
 
+from tempor.core import pydantic_utils
 from tempor.log import logger as log
+from tempor.models import distributed
 from tempor.models.constants import DEVICE, ModelTaskType, Nonlin, ODEBackend
 from tempor.models.mlp import MLP
 from tempor.models.samplers import ImbalancedDatasetSampler
-from tempor.models.utils import enable_reproducibility
+from tempor.models.utils import ChunkedPredictionMixin, enable_reproducibility, to_float32_array
 
 Interpolation = Literal["cubic", "linear"]
+ODEMethod = Literal["dopri5", "bosh3", "adaptive_heun", "rk4", "midpoint", "euler"]
 ILTAlgorithm = Literal["fourier", "dehoog", "cme", "fixed_tablot", "stehfest"]
 
+FIXED_STEP_METHODS = ("rk4", "midpoint", "euler")
+"""The fixed-step :obj:`ODEMethod` solvers, which use ``step_size`` rather than the ``atol``/``rtol`` tolerances."""
+
 
 class CDEFunc(torch.nn.Module):
     def __init__(
@@ -183,7 +188,7 @@ class LaplaceFunc(nn.Module):
         return theta, phi
 
 
-class NeuralODE(torch.nn.Module):
+class NeuralODE(ChunkedPredictionMixin, torch.nn.Module):
     def __init__(
         self,
         task_type: ModelTaskType,
@@ -200,6 +205,9 @@ class NeuralODE(torch.nn.Module):
         atol: float = 1e-2,
         rtol: float = 1e-2,
         interpolation: Interpolation = "cubic",
+        method: ODEMethod = "dopri5",
+        step_size: Optional[float] = None,
+        precompute_coeffs: bool = True,
         # Laplace specific:
         ilt_reconstruction_terms: int = 33,
         ilt_algorithm: ILTAlgorithm = "fourier",
@@ -216,6 +224,8 @@ class NeuralODE(torch.nn.Module):
         train_ratio: float = 0.8,
         device: Any = DEVICE,
         dataloader_sampler: Optional[sampler.Sampler] = None,
+        inference_batch_size: Optional[int] = None,
+        n_workers: int = 1,
     ):
         r"""The model that computes the integral in: :math:`z_t = z_0 + \int_0^t f_\theta(z_s) dX_s`.
 
@@ -254,7 +264,20 @@ class NeuralODE(torch.nn.Module):
             rtol (float, optional):
                 Specific to ``"ode"`` and ``"cde"`` backends. Relative tolerance for solution. Defaults to ``1e-2``.
             interpolation (Interpolation, optional):
-                Specific to ``"ode"`` and ``"cde"`` backends. ``"cubic"`` or ``"linear"``. Defaults to ``"cubic"``.
+                Specific to ``"cde"`` backend. ``"cubic"`` or ``"linear"``. Defaults to ``"cubic"``.
+            method (ODEMethod, optional):
+                Specific to ``"ode"`` and ``"cde"`` backends. The solver to use. The adaptive solvers (``"dopri5"``,
+                ``"bosh3"``, ``"adaptive_heun"``) use ``atol`` and ``rtol``, the fixed-step solvers (``"rk4"``,
+                ``"midpoint"``, ``"euler"``) use ``step_size`` instead, trading accuracy for speed.
+                Defaults to ``"dopri5"``.
+            step_size (Optional[float], optional):
+                Specific to the fixed-step ``method`` solvers. The step size, in units of the time steps of the input
+                sequences. If `None`, one solver step is taken per time step. Defaults to `None`.
+            precompute_coeffs (bool, optional):
+                Specific to ``"cde"`` backend. Whether to compute the interpolation coefficients of the input once, when
+                the input is prepared, rather than on every forward pass. This uses more memory (the coefficients of
+                ``"cubic"`` interpolation are four times the size of the input), but saves recomputing the coefficients
+                of each batch on every training epoch. Defaults to `True`.
             ilt_reconstruction_terms (int, optional):
                 Specific to ``"laplace"`` backend. Number of ILT reconstruction terms, i.e. the number of complex
                 :math:`s` points in ``laplace_rep_func`` to reconstruct a single time point. Defaults to ``33``.
@@ -286,12 +309,22 @@ class NeuralODE(torch.nn.Module):
                 PyTorch device to use. Defaults to `~tempor.models.constants.DEVICE`.
             dataloader_sampler (Optional[sampler.Sampler], optional):
                 Custom data sampler for training. Defaults to `None`.
+            inference_batch_size (Optional[int], optional):
+                If not `None`, ``predict`` and ``predict_proba`` run the model on chunks of (up to) this many samples
+                at a time, which bounds their memory use, see :meth:`iter_predict`. Note that the steps of the adaptive
+                ``method`` solvers are adapted to all the samples in a batch, so predictions may differ slightly with
+                the chunk size. Defaults to `None`.
+            n_workers (int, optional):
+                If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+                :mod:`~tempor.models.distributed`. Defaults to ``1``.
         """
         super(NeuralODE, self).__init__()
 
         enable_reproducibility(random_state)
         if len(output_shape) == 0:
             raise ValueError("Invalid output shape")
+        if inference_batch_size is not None and inference_batch_size < 1:
+            raise ValueError(f"`inference_batch_size` must be a positive integer, was {inference_batch_size}")
 
         self.task_type = task_type
         self.backend = backend
@@ -379,6 +412,9 @@ class NeuralODE(torch.nn.Module):
         self.atol = atol
         self.rtol = rtol
         self.interpolation = interpolation
+        self.method = method
+        self.step_size = step_size
+        self.precompute_coeffs = precompute_coeffs
         self.ilt_reconstruction_terms = ilt_reconstruction_terms
         self.ilt_algorithm = ilt_algorithm
 
@@ -393,6 +429,8 @@ class NeuralODE(torch.nn.Module):
         self.train_ratio = train_ratio
         self.random_state = random_state
         self.dataloader_sampler = dataloader_sampler
+        self.inference_batch_size = inference_batch_size
+        self.n_workers = n_workers
 
         if self.backend == "laplace":
             # Kludge to make sure `torchlaplace` uses the correct device.
@@ -412,55 +450,72 @@ class NeuralODE(torch.nn.Module):
             weight_decay=weight_decay,
         )  # optimize all rnn parameters
 
+    def _interpolation_coeffs(self, temporal_data: torch.Tensor, observation_times: torch.Tensor) -> torch.Tensor:
+        # Include the observation times as a channel in the dataset, and convert the dataset into a continuous path.
+        temporal_data_ext = torch.cat([temporal_data, observation_times.unsqueeze(-1)], dim=-1)
+        if self.interpolation == "linear":
+            return torchcde.linear_interpolation_coeffs(temporal_data_ext)
+        elif self.interpolation == "cubic":
+            return torchcde.hermite_cubic_coefficients_with_backward_differences(temporal_data_ext)
+        else:
+            raise RuntimeError(f"Invalid interpolation {self.interpolation}")
+
+    def _solver_kwargs(self) -> Dict[str, Any]:
+        if self.method in FIXED_STEP_METHODS:
+            step_size = self.step_size if self.step_size is not None else 1.0
+            return dict(method=self.method, options=dict(step_size=step_size))
+        return dict(method=self.method, atol=self.atol, rtol=self.rtol)
+
     def forward(
         self,
         static_data: torch.Tensor,
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
+        coeffs: Optional[torch.Tensor] = None,
     ) -> torch.Tensor:
-        # sanity
-        if torch.isnan(static_data).sum() != 0:
-            raise ValueError("NaNs detected in the static data")
-        if torch.isnan(temporal_data).sum() != 0:
-            raise ValueError("NaNs detected in the temporal data")
-        if torch.isnan(observation_times).sum() != 0:
-            raise ValueError("NaNs detected in the temporal horizons")
-
-        # Include the observation times as a channel in the dataset
-        temporal_data_ext = torch.cat([temporal_data, observation_times.unsqueeze(-1)], dim=-1)
-
-        # Convert the dataset into a continuous path.
-        coeffs = torchcde.hermite_cubic_coefficients_with_backward_differences(temporal_data_ext)
-
-        # Interpolate the input
-        if self.interpolation == "linear":
-            spline = torchcde.LinearInterpolation(coeffs)
-        elif self.interpolation == "cubic":
-            spline = torchcde.CubicSpline(coeffs)
-        else:
-            raise RuntimeError(f"Invalid interpolation {self.interpolation}")
+        """Forward pass. The input is expected to be free of NaNs, which is checked when the input is prepared.
 
+        Args:
+            static_data (torch.Tensor): Static data, shape ``(n_samples, n_static_features)``.
+            temporal_data (torch.Tensor): Temporal data, shape ``(n_samples, n_timesteps, n_temporal_features)``.
+            observation_times (torch.Tensor): Observation times, shape ``(n_samples, n_timesteps)``.
+            coeffs (Optional[torch.Tensor], optional):
+                Specific to ``"cde"`` backend. Precomputed interpolation coefficients of the input. If `None`,
+                these are computed here. Defaults to `None`.
+
+        Returns:
+            torch.Tensor: The output, shape ``(n_samples, *output_shape)``.
+        """
         # Solve the ODE using a solver
         if self.backend == "cde":
+            if coeffs is None:
+                coeffs = self._interpolation_coeffs(temporal_data, observation_times)
+
+            # Interpolate the input
+            if self.interpolation == "linear":
+                spline = torchcde.LinearInterpolation(coeffs)
+            elif self.interpolation == "cubic":
+                spline = torchcde.CubicSpline(coeffs)
+            else:
+                raise RuntimeError(f"Invalid interpolation {self.interpolation}")
+
             #  Initial hidden state should be a function of the first observation.
             X0 = spline.evaluate(spline.interval[0])
             z0 = self.initial_temporal(X0)
 
-            z_T = torchcde.cdeint(X=spline, func=self.func, z0=z0, t=spline.interval, atol=self.atol, rtol=self.rtol)
+            z_T = torchcde.cdeint(X=spline, func=self.func, z0=z0, t=spline.interval, **self._solver_kwargs())
             z_T = z_T[:, 1]  # pyright: ignore
         elif self.backend == "ode":
+            temporal_data_ext = torch.cat([temporal_data, observation_times.unsqueeze(-1)], dim=-1)
             X_emb = self.initial_temporal(temporal_data_ext)
 
-            z_T = torchdiffeq.odeint_adjoint(
-                self.func,
-                X_emb,
-                spline.interval,
-                atol=self.atol,
-                rtol=self.rtol,
-            )
+            # Integrate over the time steps of the input, as the interval of its interpolation would be.
+            interval = torch.tensor([0, temporal_data.shape[1] - 1], dtype=X_emb.dtype, device=X_emb.device)
+            z_T = torchdiffeq.odeint_adjoint(self.func, X_emb, interval, **self._solver_kwargs())
             z_T = z_T[1]
             z_T = z_T[:, -1, :]  # pyright: ignore  # Last time point.
         elif self.backend == "laplace":
+            temporal_data_ext = torch.cat([temporal_data, observation_times.unsqueeze(-1)], dim=-1)
             X_emb = self.initial_temporal(temporal_data_ext)
             z_T = torchlaplace.laplace_reconstruct(
                 laplace_rep_func=self.func,
@@ -481,68 +536,84 @@ class NeuralODE(torch.nn.Module):
         out = self.output(z_T)
         return out.reshape(-1, *self.output_shape)
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def _predict_chunk(
+        self,
+        static_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        observation_times: Union[List, np.ndarray, torch.Tensor],
+    ) -> np.ndarray:
+        (
+            static_data_t,
+            temporal_data_t,
+            observation_times_t,
+            _,
+            window_batches,
+            coeffs_t,
+        ) = self._prepare_input(static_data, temporal_data, observation_times)
+
+        output = np.empty((len(temporal_data), *self.output_shape), dtype=np.float32)
+        for widx in range(len(temporal_data_t)):
+            window_size = len(observation_times_t[widx][0])
+            local_yt = self(
+                static_data_t[widx],
+                temporal_data_t[widx],
+                observation_times_t[widx],
+                coeffs_t[widx],
+            )
+            output[window_batches[window_size]] = local_yt.cpu().numpy()
+        return output
+
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
         temporal_data: Union[List, np.ndarray, torch.Tensor],
         observation_times: Union[List, np.ndarray, torch.Tensor],
     ) -> np.ndarray:
-        self.eval()
-        with torch.no_grad():
-            (
-                static_data_t,
-                temporal_data_t,
-                observation_times_t,
-                _,
-                window_batches,
-            ) = self._prepare_input(static_data, temporal_data, observation_times)
-
-            yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
-                local_yt = self(
-                    static_data_t[widx],
-                    temporal_data_t[widx],
-                    observation_times_t[widx],
-                )
-                yt[window_batches[window_size]] = local_yt
-
-            if self.task_type == "classification":
-                return np.argmax(yt.cpu().numpy(), -1)
-            else:
-                return yt.cpu().numpy()
+        output = self._predict_output(static_data, temporal_data, observation_times)
+        if self.task_type == "classification":
+            return np.argmax(output, -1)
+        else:
+            return output
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict_proba(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
         temporal_data: Union[List, np.ndarray, torch.Tensor],
         observation_times: Union[List, np.ndarray, torch.Tensor],
     ) -> np.ndarray:
-        self.eval()
         if self.task_type != "classification":
             raise RuntimeError("Task valid only for classification")
-        with torch.no_grad():
-            (
-                static_data_t,
-                temporal_data_t,
-                observation_times_t,
-                _,
-                window_batches,
-            ) = self._prepare_input(static_data, temporal_data, observation_times)
-
-            yt = torch.zeros(len(temporal_data), *self.output_shape).to(self.device)
-            for widx in range(len(temporal_data_t)):
-                window_size = len(observation_times_t[widx][0])
-                local_yt = self(
-                    static_data_t[widx],
-                    temporal_data_t[widx],
-                    observation_times_t[widx],
-                )
-                yt[window_batches[window_size]] = local_yt
-
-            return yt.cpu().numpy()
+        return self._predict_output(static_data, temporal_data, observation_times)
+
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def iter_predict(
+        self,
+        static_data: Union[List, np.ndarray, torch.Tensor],
+        temporal_data: Union[List, np.ndarray, torch.Tensor],
+        observation_times: Union[List, np.ndarray, torch.Tensor],
+        chunk_size: Optional[int] = None,
+        proba: bool = False,
+    ) -> Generator[np.ndarray, None, None]:
+        """Iterate over the predictions in chunks of (up to) ``chunk_size`` consecutive samples, so that only one
+        chunk of the input is prepared and run through the model at a time.
+
+        Args:
+            static_data (Union[List, np.ndarray, torch.Tensor]): Static data.
+            temporal_data (Union[List, np.ndarray, torch.Tensor]): Temporal data.
+            observation_times (Union[List, np.ndarray, torch.Tensor]): Observation times.
+            chunk_size (Optional[int], optional):
+                The (maximum) number of samples in each chunk. If `None`, ``inference_batch_size`` is used, and if
+                that is `None`, all the samples are predicted in one chunk. Defaults to `None`.
+            proba (bool, optional):
+                Whether to yield the predicted probabilities (as in ``predict_proba``) rather than the predictions (as
+                in ``predict``). Defaults to `False`.
+
+        Returns:
+            Generator[np.ndarray, None, None]: The predictions for each chunk, in the order of the samples.
+        """
+        return self._iter_predictions(static_data, temporal_data, observation_times, chunk_size, proba)
 
     def score(
         self,
@@ -558,7 +629,7 @@ class NeuralODE(torch.nn.Module):
         else:
             return np.mean(np.inner(outcome - y_pred, outcome - y_pred) / 2.0)
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def fit(
         self,
         static_data: Union[List, np.ndarray, torch.Tensor],
@@ -572,17 +643,28 @@ class NeuralODE(torch.nn.Module):
             observation_times_t,
             outcome_t,
             _,
+            coeffs_t,
         ) = self._prepare_input(static_data, temporal_data, observation_times, outcome)
 
-        return self._train(static_data_t, temporal_data_t, observation_times_t, outcome_t)
+        return distributed.train(
+            self,
+            "_train",
+            static_data_t,
+            temporal_data_t,
+            observation_times_t,
+            outcome_t,
+            coeffs_t,
+            n_workers=self.n_workers,
+        )
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def _train(
         self,
         static_data: List[torch.Tensor],
         temporal_data: List[torch.Tensor],
         observation_times: List[torch.Tensor],
         outcome: List[torch.Tensor],
+        coeffs: List[Optional[torch.Tensor]],
     ) -> Any:
         patience = 0
         prev_error = np.inf
@@ -595,6 +677,7 @@ class NeuralODE(torch.nn.Module):
                 temporal_data[widx],
                 observation_times[widx],
                 outcome[widx],
+                coeffs[widx],
             )
             train_dataloaders.append(train_dl)
             test_dataloaders.append(test_dl)
@@ -603,7 +686,8 @@ class NeuralODE(torch.nn.Module):
         for it in range(self.n_iter):
             train_loss = self._train_epoch(train_dataloaders)
             if (it + 1) % self.n_iter_print == 0:
-                val_loss = self._test_epoch(test_dataloaders)
+                # The same in all the workers, if distributed, so that they stop at the same time.
+                val_loss = distributed.broadcast(self._test_epoch(test_dataloaders))
                 log.info(f"Epoch:{it}| train loss: {train_loss}, validation loss: {val_loss}")
 
                 if val_loss < prev_error:
@@ -618,41 +702,41 @@ class NeuralODE(torch.nn.Module):
 
     def _train_epoch(self, loaders: List[DataLoader]) -> float:
         self.train()
+        distributed.sync_random_state()
 
         losses = []
         for loader in loaders:
-            for step, (static_mb, temporal_mb, horizons_mb, y_mb) in enumerate(  # pylint: disable=unused-variable
-                loader
-            ):
+            for batch in loader:
                 self.optimizer.zero_grad()  # clear gradients for this training step
 
-                pred = self(static_mb, temporal_mb, horizons_mb)  # rnn output
-                if torch.isnan(pred).sum() > 0:  # pragma: no cover
-                    raise RuntimeError("NaNs in the training prediction")
+                # If distributed, each worker computes the gradients on its shard of the batch.
+                static_mb, temporal_mb, horizons_mb, y_mb, *coeffs_mb = distributed.shard(*batch)
+                if len(y_mb) > 0:
+                    pred = self(static_mb, temporal_mb, horizons_mb, *coeffs_mb)  # rnn output
+                    if torch.isnan(pred).sum() > 0:  # pragma: no cover
+                        raise RuntimeError("NaNs in the training prediction")
 
-                loss = self.loss(pred.squeeze(), y_mb.squeeze())
+                    loss = self.loss(pred.squeeze(), y_mb.squeeze())
+                    if torch.isnan(loss):  # pragma: no cover
+                        raise RuntimeError("NaNs in the loss")
+
+                    loss.backward()  # backpropagation, compute gradients
+                    losses.append(loss.detach().cpu())
+                distributed.all_reduce_gradients(self.parameters(), weight=len(y_mb) / len(batch[0]))
 
-                loss.backward()  # backpropagation, compute gradients
                 if self.clipping_value > 0:
                     torch.nn.utils.clip_grad_norm_(self.parameters(), self.clipping_value)  # pyright: ignore
                 self.optimizer.step()  # apply gradients
 
-                if torch.isnan(loss):  # pragma: no cover
-                    raise RuntimeError("NaNs in the loss")
-
-                losses.append(loss.detach().cpu())
-
-        return float(np.mean(losses))
+        return float(np.mean(losses)) if losses else np.nan
 
     def _test_epoch(self, loaders: List[DataLoader]) -> float:
         self.eval()
 
         losses = []
         for loader in loaders:
-            for step, (static_mb, temporal_mb, horizons_mb, y_mb) in enumerate(  # pylint: disable=unused-variable
-                loader
-            ):
-                pred = self(static_mb, temporal_mb, horizons_mb)  # ODE output
+            for static_mb, temporal_mb, horizons_mb, y_mb, *coeffs_mb in loader:
+                pred = self(static_mb, temporal_mb, horizons_mb, *coeffs_mb)  # ODE output
                 if torch.isnan(pred).sum() > 0:  # pragma: no cover
                     raise RuntimeError("NaNs in the test prediction")
                 loss = self.loss(pred.squeeze(), y_mb.squeeze())
@@ -667,43 +751,26 @@ class NeuralODE(torch.nn.Module):
         temporal_data: torch.Tensor,
         observation_times: torch.Tensor,
         outcome: torch.Tensor,
+        coeffs: Optional[torch.Tensor] = None,
     ) -> Tuple[DataLoader, DataLoader]:
         stratify = None
         _, out_counts = torch.unique(outcome, return_counts=True)
         if out_counts.min() > 1:
             stratify = outcome.cpu()
 
-        split: Tuple[torch.Tensor, ...] = train_test_split(  # type: ignore
-            static_data.cpu(),
-            temporal_data.cpu(),
-            observation_times.cpu(),
-            outcome.cpu(),
+        tensors = [static_data, temporal_data, observation_times, outcome]
+        if coeffs is not None:
+            tensors.append(coeffs)
+        split: List[torch.Tensor] = train_test_split(  # type: ignore
+            *[t.cpu() for t in tensors],
             train_size=self.train_ratio,
             random_state=self.random_state,
             stratify=stratify,
         )
-        (
-            static_data_train,
-            static_data_test,
-            temporal_data_train,
-            temporal_data_test,
-            observation_times_train,
-            observation_times_test,
-            outcome_train,
-            outcome_test,
-        ) = split
-        train_dataset = TensorDataset(
-            static_data_train.to(self.device),
-            temporal_data_train.to(self.device),
-            observation_times_train.to(self.device),
-            outcome_train.to(self.device),
-        )
-        test_dataset = TensorDataset(
-            static_data_test.to(self.device),
-            temporal_data_test.to(self.device),
-            observation_times_test.to(self.device),
-            outcome_test.to(self.device),
-        )
+        outcome_train = split[6]
+        # The split alternates the train and test parts of each tensor.
+        train_dataset = TensorDataset(*[t.to(self.device) for t in split[0::2]])
+        test_dataset = TensorDataset(*[t.to(self.device) for t in split[1::2]])
 
         sampler_ = self.dataloader_sampler
         if sampler_ is None and self.task_type == "classification":
@@ -753,20 +820,34 @@ class NeuralODE(torch.nn.Module):
         temporal_data_mb = []
         observation_times_mb = []
         outcome_mb = []
+        coeffs_mb: List[Optional[torch.Tensor]] = []
 
         for widx in window_batches:
             indices = window_batches[widx]
 
-            static_data_t = self._check_tensor(static_data[indices]).float()
+            static_data_np = to_float32_array(static_data[indices])
+            temporal_data_np = to_float32_array(temporal_data[indices])
+            observation_times_np = to_float32_array(observation_times[indices])
+
+            # sanity, checked once here rather than on every forward pass.
+            if np.isnan(static_data_np).any():
+                raise ValueError("NaNs detected in the static data")
+            if np.isnan(temporal_data_np).any():
+                raise ValueError("NaNs detected in the temporal data")
+            if np.isnan(observation_times_np).any():
+                raise ValueError("NaNs detected in the temporal horizons")
 
-            local_temporal_data = np.array(temporal_data[indices].tolist()).astype(float)
-            temporal_data_t = self._check_tensor(local_temporal_data).float()
-            local_observation_times = np.array(observation_times[indices].tolist()).astype(float)
-            observation_times_t = self._check_tensor(local_observation_times).float()
+            static_data_t = self._check_tensor(static_data_np)
+            temporal_data_t = self._check_tensor(temporal_data_np)
+            observation_times_t = self._check_tensor(observation_times_np)
 
             static_data_mb.append(static_data_t)
             temporal_data_mb.append(temporal_data_t)
             observation_times_mb.append(observation_times_t)
+            if self.backend == "cde" and self.precompute_coeffs:
+                coeffs_mb.append(self._interpolation_coeffs(temporal_data_t, observation_times_t))
+            else:
+                coeffs_mb.append(None)
 
             if outcome is not None:
                 outcome_t = self._check_tensor(outcome[indices]).float()
@@ -781,4 +862,5 @@ class NeuralODE(torch.nn.Module):
             observation_times_mb,
             outcome_mb,
             window_batches,
+            coeffs_mb,
         )
@@ -1,7 +1,7 @@
 import os
 import random
 import warnings
-from typing import Dict, Type, Union
+from typing import Any, Callable, Dict, Generator, Optional, Type, Union
 
 import numpy as np
 import torch
@@ -113,6 +113,68 @@ NONLIN_MAP: Dict[str, nn.Module] = {
 tempor.core.utils.ensure_literal_matches_dict_keys(Nonlin, NONLIN_MAP, "Nonlin", "NONLIN_MAP")
 
 
+class ChunkedPredictionMixin:
+    """Mixin for the time series models that predict a batch of samples in chunks of consecutive samples, so that only
+    one chunk of the input is prepared and run through the model at a time.
+
+    The class using the mixin must be an ``nn.Module`` and define ``output_shape``, ``task_type``,
+    ``inference_batch_size``, and a ``_predict_chunk(static_data, temporal_data, observation_times)`` method returning
+    the output for one chunk as a ``float32`` array.
+    """
+
+    output_shape: Any
+    task_type: str
+    inference_batch_size: Optional[int]
+    _predict_chunk: Callable[[Any, Any, Any], np.ndarray]
+
+    def _iter_outputs(
+        self,
+        static_data: Any,
+        temporal_data: Any,
+        observation_times: Any,
+        chunk_size: Optional[int],
+    ) -> Generator[np.ndarray, None, None]:
+        if chunk_size is None:
+            chunk_size = max(len(temporal_data), 1)
+        self.eval()  # type: ignore [attr-defined]
+        for start in range(0, len(temporal_data), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            # NOTE: Not held across the `yield`, which would disable gradients in the caller's code.
+            with torch.no_grad():
+                output = self._predict_chunk(static_data[chunk], temporal_data[chunk], observation_times[chunk])
+            yield output
+
+    def _predict_output(self, static_data: Any, temporal_data: Any, observation_times: Any) -> np.ndarray:
+        output = np.empty((len(temporal_data), *self.output_shape), dtype=np.float32)
+        start = 0
+        for chunk_output in self._iter_outputs(
+            static_data, temporal_data, observation_times, chunk_size=self.inference_batch_size
+        ):
+            output[start : start + len(chunk_output)] = chunk_output
+            start += len(chunk_output)
+        return output
+
+    def _iter_predictions(
+        self,
+        static_data: Any,
+        temporal_data: Any,
+        observation_times: Any,
+        chunk_size: Optional[int],
+        proba: bool,
+    ) -> Generator[np.ndarray, None, None]:
+        if proba and self.task_type != "classification":
+            raise RuntimeError("Task valid only for classification")
+        if chunk_size is None:
+            chunk_size = self.inference_batch_size
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"`chunk_size` must be a positive integer, was {chunk_size}")
+
+        outputs = self._iter_outputs(static_data, temporal_data, observation_times, chunk_size=chunk_size)
+        if self.task_type == "classification" and not proba:
+            return (np.argmax(output, -1) for output in outputs)
+        return outputs
+
+
 def get_nonlin(name: Nonlin) -> nn.Module:
     try:
         return NONLIN_MAP[name]
@@ -143,3 +205,19 @@ def get_device(device: Union[None, int, str, torch.device]) -> torch.device:
         return DEVICE
     else:
         return torch.device(device)
+
+
+def to_float32_array(data: np.ndarray) -> np.ndarray:
+    """Return ``data`` as a ``float32`` array (the dtype of the model inputs), cast directly rather than via an
+    intermediate ``float64`` copy. An `object` array of equally-shaped array-likes (e.g. of per-sample time series) is
+    stacked.
+
+    Args:
+        data (np.ndarray): The data.
+
+    Returns:
+        np.ndarray: The ``float32`` array, ``data`` itself if already of this dtype.
+    """
+    if data.dtype == object and len(data) > 0:
+        return np.stack([np.asarray(item, dtype=np.float32) for item in data])
+    return np.asarray(data, dtype=np.float32)
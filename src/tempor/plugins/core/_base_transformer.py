@@ -1,8 +1,9 @@
 import abc
-from typing import Any
+from typing import Any, ClassVar, Generator, Iterable
 
-import pydantic
+from typing_extensions import Self
 
+from tempor.core import pydantic_utils
 from tempor.data import dataset
 from tempor.log import logger
 
@@ -10,6 +11,9 @@ from . import _base_estimator as estimator
 
 
 class BaseTransformer(estimator.BaseEstimator):
+    supports_partial_fit: ClassVar[bool] = False
+    """Whether the transformer can be fitted incrementally, on chunks of the data, see :meth:`partial_fit`."""
+
     def __init__(self, **params) -> None:  # pylint: disable=useless-super-delegation
         super().__init__(**params)
 
@@ -24,7 +28,7 @@ class BaseTransformer(estimator.BaseEstimator):
 
         return transformed_data
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def fit_transform(
         self,
         data: dataset.BaseDataset,
@@ -34,6 +38,90 @@ class BaseTransformer(estimator.BaseEstimator):
         self.fit(data, *args, **kwargs)
         return self.transform(data, *args, **kwargs)
 
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    def partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args,
+        **kwargs,
+    ) -> Self:
+        """Update the fitted transformer with a chunk of the data, e.g. from
+        `~tempor.data.dataset.BaseDataset.iter_chunks`. Only supported by transformers with
+        :attr:`supports_partial_fit`. Use :meth:`fit_chunks` to fit on all the chunks of a dataset.
+
+        Args:
+            data (dataset.BaseDataset): The chunk of the data.
+
+        Returns:
+            Self: The fitted transformer.
+        """
+        if not self.supports_partial_fit:
+            raise NotImplementedError(f"{self.__class__.__name__} does not support fitting on chunks of the data")
+        if not data.fit_ready:
+            raise ValueError(
+                f"The dataset was not fit-ready, check that all necessary data components are present:\n{data}"
+            )
+
+        logger.debug(f"Calling _partial_fit() implementation on {self.__class__.__name__}")
+        self._partial_fit(data, *args, **kwargs)
+
+        self._fitted = True
+        return self
+
+    def fit_chunks(self, chunks: Iterable[dataset.BaseDataset], *args, **kwargs) -> Self:
+        """Fit the transformer on all the ``chunks`` of a dataset in turn, holding only one chunk in memory at a time.
+        Gives the same result as :meth:`fit` on the whole dataset. Only supported by transformers with
+        :attr:`supports_partial_fit`.
+
+        Example:
+            >>> from tempor.utils.dataloaders import SineDataLoader
+            >>> from tempor.plugins import plugin_loader
+            >>>
+            >>> dataset = SineDataLoader().load()
+            >>> scaler = plugin_loader.get("preprocessing.scaling.temporal.ts_minmax_scaler")
+            >>>
+            >>> scaler.fit_chunks(dataset.iter_chunks(chunk_size=20))
+            TimeSeriesMinMaxScaler(...)
+            >>> scaled = [chunk for chunk in scaler.transform_chunks(dataset.iter_chunks(chunk_size=20))]
+
+        Args:
+            chunks (Iterable[dataset.BaseDataset]): The chunks of the data.
+
+        Returns:
+            Self: The fitted transformer.
+        """
+        if not self.supports_partial_fit:
+            raise NotImplementedError(f"{self.__class__.__name__} does not support fitting on chunks of the data")
+        self._reset_partial_fit()
+        for chunk in chunks:
+            self.partial_fit(chunk, *args, **kwargs)
+        return self
+
+    def transform_chunks(
+        self, chunks: Iterable[dataset.BaseDataset], *args, **kwargs
+    ) -> Generator[dataset.BaseDataset, None, None]:
+        """Transform each of the ``chunks`` of a dataset in turn, lazily.
+
+        Args:
+            chunks (Iterable[dataset.BaseDataset]): The chunks of the data.
+
+        Yields:
+            Generator[dataset.BaseDataset, None, None]: The transformed chunks.
+        """
+        for chunk in chunks:
+            yield self.transform(chunk, *args, **kwargs)
+
+    def _partial_fit(self, data: dataset.BaseDataset, *args, **kwargs) -> Self:  # pragma: no cover
+        """Update the fitted state with a chunk of the data. Implement in transformers with
+        :attr:`supports_partial_fit`.
+        """
+        raise NotImplementedError
+
+    def _reset_partial_fit(self) -> None:
+        """Reset the fitted state, before fitting on the chunks of a new dataset. Implement in transformers with
+        :attr:`supports_partial_fit` which have such state.
+        """
+
     @abc.abstractmethod
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:  # pragma: no cover
         ...
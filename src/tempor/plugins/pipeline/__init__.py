@@ -17,6 +17,7 @@ from tempor.plugins.time_to_event import BaseTimeToEventAnalysis
 from tempor.plugins.treatments.one_off import BaseOneOffTreatmentEffects
 from tempor.plugins.treatments.temporal import BaseTemporalTreatmentEffects
 
+from .cache import TransformerCache
 from .generators import (
     _generate_constructor,
     _generate_fit,
@@ -48,6 +49,10 @@ class PipelineBase:
     """A list of method plugin instances corresponding to each step in the pipeline."""
     plugin_types: List[Type]
     """A list of types denoting the class of each step in the pipeline."""
+    transformer_cache: Optional[TransformerCache] = None
+    """If set, the fitted data transformer steps (all but the last step) and their outputs are cached in and reused
+    from this :class:`~tempor.plugins.pipeline.cache.TransformerCache`, keyed by the content of the input data, and the
+    plugin and parameters of each step. Used by AutoML to avoid refitting the same preprocessing on the same folds."""
 
     def __init__(self, plugin_params: Optional[Dict[str, Dict]] = None, **kwargs) -> None:  # pragma: no cover
         """Instantiate the pipeline, (optionally) providing initialization parameters for constituent step plugins.
@@ -0,0 +1,216 @@
+"""A content-addressed cache for the fitted data transformer steps of pipelines and their outputs."""
+
+import collections
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import omegaconf
+
+from tempor.data import dataset
+from tempor.log import logger
+from tempor.utils import serialization
+
+
+def _hash(*parts: Union[str, bytes]) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode() if isinstance(part, str) else part)
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def dataset_key(data: dataset.BaseDataset) -> str:
+    """Return a content hash of ``data``: its `~tempor.data.dataset.BaseDataset.fingerprint`, which covers the dataset
+    type and the contents of all of its samples (time series, static, targets and treatments). Datasets with the same
+    content, e.g. the same cross-validation fold of the same dataset, will have the same key. The fingerprint is
+    recomputed rather than taken from the cache, so that data modified in-place gets a new key.
+
+    Args:
+        data (dataset.BaseDataset): The dataset.
+
+    Returns:
+        str: The key.
+    """
+    return data.fingerprint(use_cache=False)
+
+
+def stage_key(upstream_key: str, stage: Any) -> str:
+    """Return the cache key of a data transformer ``stage`` fitted on data with key ``upstream_key`` (the
+    `dataset_key` of the pipeline input, or the `stage_key` of the preceding stage).
+
+    Args:
+        upstream_key (str): The key of the data the stage is fitted on.
+        stage (Any): The (not yet fitted) transformer plugin instance.
+
+    Returns:
+        str: The key.
+    """
+    params = omegaconf.OmegaConf.to_container(stage.params, resolve=True)
+    return _hash(upstream_key, stage.fqn(), json.dumps(params, sort_keys=True, default=repr))
+
+
+class TransformerCache:
+    def __init__(self, maxsize: int = 64, cache_dir: Optional[Union[str, Path]] = None) -> None:
+        """A cache for the fitted data transformer steps of pipelines and their outputs, used to avoid refitting
+        the same preprocessing steps on the same data (e.g. in repeated AutoML trials on the same cross-validation
+        folds).
+
+        Items are keyed by content (see `dataset_key` and `stage_key`) and stored serialized, so each `get` returns
+        a fresh copy. There are two tiers: an in-memory least-recently-used tier of up to ``maxsize`` items, and an
+        (optional) on-disk tier in ``cache_dir``, which is not size-limited and can be shared between processes.
+
+        Note:
+            When a `TransformerCache` is pickled (e.g. sent to a worker process), the in-memory items are not
+            included, only the on-disk tier is shared.
+
+        Args:
+            maxsize (int, optional):
+                Maximum number of items in the in-memory tier. Defaults to ``64``.
+            cache_dir (Optional[Union[str, Path]], optional):
+                Directory for the on-disk tier. If `None`, only the in-memory tier is used. Defaults to `None`.
+        """
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._cache: "collections.OrderedDict[str, bytes]" = collections.OrderedDict()
+
+    def _path(self, key: str) -> Path:
+        if self.cache_dir is None:  # pragma: no cover
+            raise RuntimeError("No cache directory set")
+        return self.cache_dir / f"{key}.pkl"
+
+    def _put_memory(self, key: str, buff: bytes) -> None:
+        self._cache[key] = buff
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return (a copy of) the item cached for ``key``, or `None` if not present.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Any]: The cached item or `None`.
+        """
+        buff = self._cache.get(key, None)
+        if buff is not None:
+            self._cache.move_to_end(key)
+        elif self.cache_dir is not None and self._path(key).exists():
+            buff = self._path(key).read_bytes()
+            self._put_memory(key, buff)
+        if buff is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return serialization.load(buff)
+
+    def put(self, key: str, item: Any) -> None:
+        """Cache ``item`` for ``key``.
+
+        Args:
+            key (str): The cache key.
+            item (Any): The item to cache.
+        """
+        buff = serialization.save(item)
+        self._put_memory(key, buff)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename, so that concurrent readers never see a partial file.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(buff)
+            os.replace(tmp_path, self._path(key))
+
+    def clear(self) -> None:
+        """Clear the in-memory tier and reset the hit/miss counters. The on-disk tier is left as is."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_cache"] = collections.OrderedDict()
+        return state
+
+
+def fit_transform_stages(
+    stages: Sequence[Any], data: dataset.BaseDataset, cache: TransformerCache
+) -> Tuple[List[Any], dataset.BaseDataset, List[str]]:
+    """Call ``fit_transform`` on each of the data transformer ``stages`` in turn, reusing the fitted stages and
+    outputs from ``cache`` where available.
+
+    Args:
+        stages (Sequence[Any]): The data transformer stages.
+        data (dataset.BaseDataset): The input dataset.
+        cache (TransformerCache): The cache.
+
+    Note:
+        The input ``data`` is never modified, whether or not the stages are cached: on a cache miss, the stages are
+        run on a copy of it (as transformers may modify their input in place).
+
+    Returns:
+        Tuple[List[Any], dataset.BaseDataset, List[str]]:
+            ``(fitted_stages, output, stage_keys)``, the fitted stages (which will be the cached instances in case of
+            cache hits), the output of the last stage, and the cache keys of the stages.
+    """
+    key = dataset_key(data)
+    fitted_stages: List[Any] = []
+    stage_keys: List[str] = []
+    is_input = True
+    for stage in stages:
+        key = stage_key(key, stage)
+        cached = cache.get(key)
+        if cached is None:
+            data = stage.fit_transform(copy.deepcopy(data) if is_input else data)
+            cache.put(key, (stage, data))
+        else:
+            logger.debug(f"Reusing cached fitted stage {stage.fqn()}")
+            stage, data = cached
+        is_input = False
+        fitted_stages.append(stage)
+        stage_keys.append(key)
+    return fitted_stages, data, stage_keys
+
+
+def transform_stages(
+    stages: Sequence[Any], stage_keys: Sequence[str], data: dataset.BaseDataset, cache: TransformerCache
+) -> dataset.BaseDataset:
+    """Call ``transform`` on each of the fitted data transformer ``stages`` in turn, reusing the outputs from
+    ``cache`` where available.
+
+    Args:
+        stages (Sequence[Any]): The fitted data transformer stages.
+        stage_keys (Sequence[str]): The cache keys of the stages, as returned by `fit_transform_stages`.
+        data (dataset.BaseDataset): The input dataset.
+        cache (TransformerCache): The cache.
+
+    Note:
+        As in `fit_transform_stages`, the input ``data`` is never modified.
+
+    Returns:
+        dataset.BaseDataset: The output of the last stage.
+    """
+    key = dataset_key(data)
+    is_input = True
+    for stage, key_fitted in zip(stages, stage_keys):
+        key = _hash(key_fitted, key)
+        cached = cache.get(key)
+        if cached is None:
+            data = stage.transform(copy.deepcopy(data) if is_input else data)
+            cache.put(key, data)
+        else:
+            logger.debug(f"Reusing cached transform output of stage {stage.fqn()}")
+            data = cached
+        is_input = False
+    return data
@@ -2,6 +2,8 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Ty
 
 from tempor.data import dataset
 
+from . import cache
+
 if TYPE_CHECKING:  # pragma: no cover
     from tempor.plugins.core._params import Params
 
@@ -80,8 +82,15 @@ def _generate_constructor() -> Callable:
 def _generate_fit() -> Callable:
     def fit_impl(self: Any, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> Any:
         local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.fit_transform(local_X)
+        if self.transformer_cache is None:
+            for stage in self.stages[:-1]:
+                local_X = stage.fit_transform(local_X)
+            self._stage_keys = None
+        else:
+            fitted_stages, local_X, self._stage_keys = cache.fit_transform_stages(
+                self.stages[:-1], local_X, self.transformer_cache
+            )
+            self.stages[:-1] = fitted_stages
 
         self.stages[-1].fit(local_X, *args, **kwargs)
 
@@ -90,11 +99,20 @@ def _generate_fit() -> Callable:
     return fit_impl
 
 
+def _transform(self: Any, data: dataset.BaseDataset, *args: Any, **kwargs: Any) -> dataset.BaseDataset:
+    # Apply the data transformer steps of the pipeline, using the transformer cache if the stages were fitted with it.
+    stage_keys = getattr(self, "_stage_keys", None)
+    if self.transformer_cache is not None and stage_keys is not None and not args and not kwargs:
+        return cache.transform_stages(self.stages[:-1], stage_keys, data, self.transformer_cache)
+    local_X = data
+    for stage in self.stages[:-1]:
+        local_X = stage.transform(local_X, *args, **kwargs)
+    return local_X
+
+
 def _generate_predict() -> Callable:
     def predict_impl(self: Any, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:
-        local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.transform(local_X)
+        local_X = _transform(self, data)
 
         return self.stages[-1].predict(local_X, *args, **kwargs)
 
@@ -103,9 +121,7 @@ def _generate_predict() -> Callable:
 
 def _generate_predict_proba() -> Callable:
     def predict_proba_impl(self: Any, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:
-        local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.transform(local_X, *args, **kwargs)
+        local_X = _transform(self, data, *args, **kwargs)
 
         return self.stages[-1].predict_proba(local_X)
 
@@ -114,9 +130,7 @@ def _generate_predict_proba() -> Callable:
 
 def _generate_predict_counterfactuals() -> Callable:
     def predict_counterfactuals_impl(self: Any, data: dataset.PredictiveDataset, *args: Any, **kwargs: Any) -> Any:
-        local_X = data
-        for stage in self.stages[:-1]:
-            local_X = stage.transform(local_X, *args, **kwargs)
+        local_X = _transform(self, data, *args, **kwargs)
 
         return self.stages[-1].predict_counterfactuals(local_X, *args, **kwargs)
 
@@ -8,7 +8,7 @@ import tempor.plugins.core as plugins
 from tempor.data import dataset, samples
 from tempor.models import utils as model_utils
 from tempor.models.constants import Nonlin, Samp
-from tempor.models.ts_ode import Interpolation, NeuralODE
+from tempor.models.ts_ode import Interpolation, NeuralODE, ODEMethod
 from tempor.plugins.core._params import CategoricalParams, FloatParams, IntegerParams
 from tempor.plugins.prediction.one_off.classification import BaseOneOffClassifier
 
@@ -33,6 +33,14 @@ class CDEClassifierParams:
     """Relative tolerance for solution."""
     interpolation: Interpolation = "cubic"
     """``"cubic"`` or ``"linear"``."""
+    method: ODEMethod = "dopri5"
+    """The solver. The adaptive solvers (``"dopri5"``, ``"bosh3"``, ``"adaptive_heun"``) use ``atol`` and ``rtol``,
+    the fixed-step solvers (``"rk4"``, ``"midpoint"``, ``"euler"``) use ``step_size`` instead, trading accuracy for
+    speed."""
+    step_size: Optional[float] = None
+    """Step size of the fixed-step solvers, in time steps. If `None`, one solver step is taken per time step."""
+    precompute_coeffs: bool = True
+    """Whether to compute the interpolation coefficients once, rather than on every forward pass (uses more memory)."""
 
     # Training:
     lr: float = 1e-3
@@ -57,6 +65,12 @@ class CDEClassifierParams:
     """String representing PyTorch device. If `None`, `~tempor.models.constants.DEVICE`."""
     dataloader_sampler: Optional[Samp] = None
     """Custom data sampler for training."""
+    inference_batch_size: Optional[int] = None
+    """If not `None`, predict on chunks of (up to) this many samples at a time, which bounds the memory use of
+    prediction. See :class:`~tempor.models.ts_ode.NeuralODE`."""
+    n_workers: int = 1
+    """If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+    :mod:`~tempor.models.distributed`."""
 
 
 @plugins.register_plugin(name="cde_classifier", category="prediction.one_off.classification")
@@ -121,6 +135,9 @@ class CDEClassifier(BaseOneOffClassifier):
             atol=self.params.atol,
             rtol=self.params.rtol,
             interpolation=self.params.interpolation,
+            method=self.params.method,
+            step_size=self.params.step_size,
+            precompute_coeffs=self.params.precompute_coeffs,
             # training
             n_iter=self.params.n_iter,
             n_iter_print=self.params.n_iter_print,
@@ -135,6 +152,8 @@ class CDEClassifier(BaseOneOffClassifier):
             clipping_value=self.params.clipping_value,
             patience=self.params.patience,
             train_ratio=self.params.train_ratio,
+            inference_batch_size=self.params.inference_batch_size,
+            n_workers=self.params.n_workers,
         )
 
         self.model.fit(static, temporal, observation_times, outcome)
@@ -57,6 +57,12 @@ class LaplaceODEClassifierParams:
     """String representing PyTorch device. If `None`, `~tempor.models.constants.DEVICE`."""
     dataloader_sampler: Optional[Samp] = None
     """Custom data sampler for training."""
+    inference_batch_size: Optional[int] = None
+    """If not `None`, predict on chunks of (up to) this many samples at a time, which bounds the memory use of
+    prediction. See :class:`~tempor.models.ts_ode.NeuralODE`."""
+    n_workers: int = 1
+    """If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+    :mod:`~tempor.models.distributed`."""
 
 
 @plugins.register_plugin(name="laplace_ode_classifier", category="prediction.one_off.classification")
@@ -138,6 +144,8 @@ class LaplaceODEClassifier(BaseOneOffClassifier):
             clipping_value=self.params.clipping_value,
             patience=self.params.patience,
             train_ratio=self.params.train_ratio,
+            inference_batch_size=self.params.inference_batch_size,
+            n_workers=self.params.n_workers,
         )
 
         self.model.fit(static, temporal, observation_times, outcome)
@@ -2,10 +2,10 @@ import abc
 from typing import Tuple
 
 import numpy as np
-import pydantic
 from typing_extensions import Self
 
 import tempor.plugins.core as plugins
+from tempor.core import pydantic_utils
 from tempor.data import dataset, samples
 
 
@@ -26,7 +26,7 @@ class BaseOneOffRegressor(plugins.BasePredictor):
         super().fit(data, *args, **kwargs)
         return self
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict(
         self,
         data: dataset.PredictiveDataset,
@@ -42,7 +42,7 @@ class BaseOneOffRegressor(plugins.BasePredictor):
 
     def _unpack_dataset(self, data: dataset.BaseDataset) -> Tuple:
         temporal = data.time_series.numpy()
-        observation_times = data.time_series.time_indexes()
+        observation_times = data.time_series.time_indexes_float()
         if data.predictive is not None and data.predictive.targets is not None:
             outcome = data.predictive.targets.numpy()
         else:
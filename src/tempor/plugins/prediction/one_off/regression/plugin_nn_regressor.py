@@ -54,6 +54,15 @@ class NeuralNetRegressorParams:
     """How many ``epoch * n_iter_print`` to wait without loss improvement."""
     train_ratio: float = 0.8
     """Train/test split ratio."""
+    length_buckets: Optional[int] = None
+    """If not `None`, batch the samples in (at most) this many buckets of similar sequence lengths, rather than by exact
+    sequence length. Only supported for the recurrent modes. See :class:`~tempor.models.ts_model.TimeSeriesModel`."""
+    inference_batch_size: Optional[int] = None
+    """If not `None`, predict on chunks of (up to) this many samples at a time, which bounds the memory use of
+    prediction. See :class:`~tempor.models.ts_model.TimeSeriesModel`."""
+    n_workers: int = 1
+    """If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+    :mod:`~tempor.models.distributed`."""
 
 
 @plugins.register_plugin(name="nn_regressor", category="prediction.one_off.regression")
@@ -125,6 +134,9 @@ class NeuralNetRegressor(BaseOneOffRegressor):
             clipping_value=self.params.clipping_value,
             patience=self.params.patience,
             train_ratio=self.params.train_ratio,
+            length_buckets=self.params.length_buckets,
+            inference_batch_size=self.params.inference_batch_size,
+            n_workers=self.params.n_workers,
         )
 
         self.model.fit(static, temporal, observation_times, outcome)
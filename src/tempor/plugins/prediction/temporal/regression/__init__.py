@@ -1,9 +1,9 @@
 import abc
 
-import pydantic
 from typing_extensions import Self
 
 import tempor.plugins.core as plugins
+from tempor.core import pydantic_utils
 from tempor.data import dataset, samples
 
 
@@ -24,7 +24,7 @@ class BaseTemporalRegressor(plugins.BasePredictor):
         super().fit(data, *args, **kwargs)
         return self
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict(  # type: ignore[override]  # pylint: disable=arguments-differ
         self,
         data: dataset.PredictiveDataset,
@@ -1,6 +1,44 @@
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import OneHotEncoder
+
 import tempor.plugins.core as plugins
 
 
 class BaseEncoder(plugins.BaseTransformer):
     def __init__(self, **params) -> None:  # pylint: disable=useless-super-delegation
         super().__init__(**params)
+
+
+def onehot_encoder_partial_fit(
+    model: OneHotEncoder, df: pd.DataFrame, seen_values: Dict[Any, np.ndarray]
+) -> Dict[Any, np.ndarray]:
+    """Fit the one-hot encoder ``model`` incrementally: the values in ``df`` are added to the (unique) values of each
+    column seen so far, ``seen_values``, and the model is refitted on these, which gives the same categories as
+    fitting on all the data.
+
+    Args:
+        model (OneHotEncoder): The encoder.
+        df (pd.DataFrame): The data (of the columns to encode) to fit on.
+        seen_values (Dict[Any, np.ndarray]): The unique values of each column seen so far, empty to start.
+
+    Returns:
+        Dict[Any, np.ndarray]: The updated ``seen_values``.
+    """
+    if model.min_frequency is not None or model.max_categories is not None:
+        raise ValueError(
+            "Fitting on chunks of the data is not supported with `min_frequency` or `max_categories` set, as these "
+            "depend on the frequencies of the categories in all the data"
+        )
+    seen_values = dict(seen_values)
+    for col in df.columns:
+        values = np.asarray(pd.unique(df[col]))
+        if col in seen_values:
+            values = np.asarray(pd.unique(np.concatenate([seen_values[col], values])))
+        seen_values[col] = values
+    n_rows = max(len(values) for values in seen_values.values())
+    # Columns of different lengths are padded out by repeating their values, which does not change the categories.
+    model.fit(pd.DataFrame({col: np.resize(seen_values[col], n_rows) for col in df.columns}))
+    return seen_values
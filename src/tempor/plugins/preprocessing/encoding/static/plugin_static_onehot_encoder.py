@@ -1,6 +1,7 @@
 import dataclasses
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+import numpy as np
 import pandas as pd
 import sklearn
 from packaging.version import Version
@@ -12,7 +13,7 @@ from tempor.data import dataset
 from tempor.data.data_typing import FeatureIndex
 from tempor.data.samples import StaticSamples
 from tempor.plugins.core._params import CategoricalParams, FloatParams
-from tempor.plugins.preprocessing.encoding._base import BaseEncoder
+from tempor.plugins.preprocessing.encoding._base import BaseEncoder, onehot_encoder_partial_fit
 
 # TODO: Handle SklearnArrayLike rather than just list, requires dropping OmegaConf stuff.
 # TODO: Remember the column positions - esp. relevant for when inverse_transform is introduced.
@@ -52,6 +53,8 @@ class StaticOneHotEncoder(BaseEncoder):
     ParamsDefinition = StaticOneHotEncoderParams
     params: StaticOneHotEncoderParams  # type: ignore
 
+    supports_partial_fit = True
+
     def __init__(self, **params) -> None:
         """One-hot encoding for the static data.
 
@@ -109,6 +112,7 @@ class StaticOneHotEncoder(BaseEncoder):
             del sklearn_params["sparse_output"]
 
         self.model = OneHotEncoder(**sklearn_params)
+        self._seen_values: Dict[Any, np.ndarray] = dict()
 
     def _fit(
         self,
@@ -127,6 +131,25 @@ class StaticOneHotEncoder(BaseEncoder):
         self.model.fit(df_to_use)
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args,
+        **kwargs,
+    ) -> Self:
+        if data.static is None:
+            return self
+
+        df_to_use = data.static.dataframe()
+        if self.features is None:
+            self.features = df_to_use.columns.tolist()
+        self._seen_values = onehot_encoder_partial_fit(self.model, df_to_use[self.features], self._seen_values)
+        return self
+
+    def _reset_partial_fit(self) -> None:
+        self.features = self.params.features
+        self._seen_values = dict()
+
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:
         if data.static is None:
             return data
@@ -139,10 +162,10 @@ class StaticOneHotEncoder(BaseEncoder):
         original_df = data.static.dataframe().drop(columns=self.features)
 
         # Append new encoded columns.
-        encoded_df = pd.DataFrame(encoded_arr, columns=encoded_col_names)
+        encoded_df = pd.DataFrame(encoded_arr, columns=encoded_col_names, index=original_df.index)
         final_df = pd.concat([original_df, encoded_df], axis=1)
 
-        data.static = StaticSamples.from_dataframe(final_df)
+        data.static = StaticSamples.from_dataframe(final_df, _reference=data.static)
 
         return data
 
@@ -1,6 +1,7 @@
 import dataclasses
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+import numpy as np
 import pandas as pd
 import sklearn
 from packaging.version import Version
@@ -12,7 +13,7 @@ from tempor.data import dataset
 from tempor.data.data_typing import FeatureIndex
 from tempor.data.samples import TimeSeriesSamples
 from tempor.plugins.core._params import CategoricalParams, FloatParams
-from tempor.plugins.preprocessing.encoding._base import BaseEncoder
+from tempor.plugins.preprocessing.encoding._base import BaseEncoder, onehot_encoder_partial_fit
 
 # TODO: Factor out code for applying sklearn transformer to arbitrary subset of columns.
 
@@ -50,6 +51,8 @@ class TimeSeriesOneHotEncoder(BaseEncoder):
     ParamsDefinition = TimeSeriesOneHotEncoderParams
     params: TimeSeriesOneHotEncoderParams  # type: ignore
 
+    supports_partial_fit = True
+
     def __init__(self, **params) -> None:
         """One-hot encoding for the time series data.
 
@@ -107,6 +110,7 @@ class TimeSeriesOneHotEncoder(BaseEncoder):
             del sklearn_params["sparse_output"]
 
         self.model = OneHotEncoder(**sklearn_params)
+        self._seen_values: Dict[Any, np.ndarray] = dict()
 
     def _fit(
         self,
@@ -122,6 +126,22 @@ class TimeSeriesOneHotEncoder(BaseEncoder):
         self.model.fit(df_to_use)
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args,
+        **kwargs,
+    ) -> Self:
+        df_to_use = data.time_series.dataframe()
+        if self.features is None:
+            self.features = df_to_use.columns.tolist()
+        self._seen_values = onehot_encoder_partial_fit(self.model, df_to_use[self.features], self._seen_values)
+        return self
+
+    def _reset_partial_fit(self) -> None:
+        self.features = self.params.features
+        self._seen_values = dict()
+
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:
         df_to_encode = data.time_series.dataframe()[self.features]
         encoded_arr = self.model.transform(df_to_encode)
@@ -134,7 +154,9 @@ class TimeSeriesOneHotEncoder(BaseEncoder):
         encoded_df = pd.DataFrame(encoded_arr, columns=encoded_col_names, index=original_df.index)
         final_df = pd.concat([original_df, encoded_df], axis=1)
 
-        data.time_series = TimeSeriesSamples.from_dataframe(final_df)
+        data.time_series = TimeSeriesSamples.from_dataframe(
+            final_df, backend=data.time_series.backend, _reference=data.time_series
+        )
 
         return data
 
@@ -77,7 +77,7 @@ class StaticTabularImputer(BaseImputer):
             imputed_static_data = self.imputer.transform(static_data)
             imputed_static_data.columns = static_data.columns
             imputed_static_data.index = static_data.index
-            data.static = StaticSamples.from_dataframe(imputed_static_data)
+            data.static = StaticSamples.from_dataframe(imputed_static_data, _reference=data.static)
         return data
 
     @staticmethod
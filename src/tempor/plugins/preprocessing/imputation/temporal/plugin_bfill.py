@@ -11,6 +11,9 @@ from tempor.plugins.preprocessing.imputation._base import BaseImputer
 
 @plugins.register_plugin(name="bfill", category="preprocessing.imputation.temporal")
 class BFillImputer(BaseImputer):
+    supports_partial_fit = True
+    """Each sample is imputed independently, so the imputer works on chunks of the data."""
+
     def __init__(self, **params) -> None:  # pylint: disable=useless-super-delegation
         """Backward-first Time-Series Imputation.
 
@@ -41,15 +44,19 @@ class BFillImputer(BaseImputer):
     def _fit(self, data: dataset.BaseDataset, *args, **kwargs) -> Self:
         return self
 
+    def _partial_fit(self, data: dataset.BaseDataset, *args, **kwargs) -> Self:
+        return self
+
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:
         # Impute temporal data.
-        sample_ts_index = data.time_series.sample_index()
+        # Fill within each sample (level 0 of the index), all samples at once.
         imputed_ts = data.time_series.dataframe()
-        for idx in sample_ts_index:
-            imputed_ts.loc[(idx, slice(None)), :] = imputed_ts.loc[(idx, slice(None)), :].bfill()  # pyright: ignore
-            imputed_ts.loc[(idx, slice(None)), :] = imputed_ts.loc[(idx, slice(None)), :].ffill()  # pyright: ignore
-            imputed_ts.loc[(idx, slice(None)), :] = imputed_ts.loc[(idx, slice(None)), :].fillna(0.0)  # pyright: ignore
-        data.time_series = TimeSeriesSamples.from_dataframe(imputed_ts)
+        imputed_ts = imputed_ts.groupby(level=0, sort=False).bfill()
+        imputed_ts = imputed_ts.groupby(level=0, sort=False).ffill()
+        imputed_ts = imputed_ts.fillna(0.0)
+        data.time_series = TimeSeriesSamples.from_dataframe(
+            imputed_ts, backend=data.time_series.backend, _reference=data.time_series
+        )
         return data
 
     @staticmethod
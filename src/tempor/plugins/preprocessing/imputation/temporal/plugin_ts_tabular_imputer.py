@@ -79,7 +79,9 @@ class TemporalTabularImputer(BaseImputer):
         imputed_ts_data = self.imputer.transform(ts_data)
         imputed_ts_data.columns = ts_data.columns
         imputed_ts_data.index = ts_data.index
-        data.time_series = TimeSeriesSamples.from_dataframe(imputed_ts_data)
+        data.time_series = TimeSeriesSamples.from_dataframe(
+            imputed_ts_data, backend=data.time_series.backend, _reference=data.time_series
+        )
         return data
 
     @staticmethod
@@ -2,6 +2,7 @@ import dataclasses
 from typing import Any, Dict, Tuple
 
 import pandas as pd
+from sklearn.base import clone
 from sklearn.preprocessing import MinMaxScaler
 from typing_extensions import Self
 
@@ -29,6 +30,8 @@ class StaticMinMaxScaler(BaseScaler):
     ParamsDefinition = StaticMinMaxScalerParams
     params: StaticMinMaxScalerParams  # type: ignore
 
+    supports_partial_fit = True
+
     def __init__(self, **params) -> None:
         """MinMax scaling for the static data.
 
@@ -72,6 +75,21 @@ class StaticMinMaxScaler(BaseScaler):
         self.model.fit(data.static.dataframe())
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args,
+        **kwargs,
+    ) -> Self:
+        if data.static is None:
+            return self
+
+        self.model.partial_fit(data.static.dataframe())
+        return self
+
+    def _reset_partial_fit(self) -> None:
+        self.model = clone(self.model)
+
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:
         if data.static is None:
             return data
@@ -81,7 +99,7 @@ class StaticMinMaxScaler(BaseScaler):
         scaled.columns = static_data.columns
         scaled.index = static_data.index
 
-        data.static = StaticSamples.from_dataframe(scaled)
+        data.static = StaticSamples.from_dataframe(scaled, _reference=data.static)
 
         return data
 
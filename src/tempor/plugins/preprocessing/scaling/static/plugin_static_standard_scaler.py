@@ -2,6 +2,7 @@ import dataclasses
 from typing import Any, Dict
 
 import pandas as pd
+from sklearn.base import clone
 from sklearn.preprocessing import StandardScaler
 from typing_extensions import Self
 
@@ -26,6 +27,8 @@ class StaticStandardScaler(BaseScaler):
     ParamsDefinition = StaticStandardScalerParams
     params: StaticStandardScalerParams  # type: ignore
 
+    supports_partial_fit = True
+
     def __init__(self, **params) -> None:
         """Standard scaling for the static data.
 
@@ -67,6 +70,21 @@ class StaticStandardScaler(BaseScaler):
         self.model.fit(data.static.dataframe())
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args,
+        **kwargs,
+    ) -> Self:
+        if data.static is None:
+            return self
+
+        self.model.partial_fit(data.static.dataframe())
+        return self
+
+    def _reset_partial_fit(self) -> None:
+        self.model = clone(self.model)
+
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:
         if data.static is None:
             return data
@@ -76,7 +94,7 @@ class StaticStandardScaler(BaseScaler):
         scaled.columns = static_data.columns
         scaled.index = static_data.index
 
-        data.static = StaticSamples.from_dataframe(scaled)
+        data.static = StaticSamples.from_dataframe(scaled, _reference=data.static)
 
         return data
 
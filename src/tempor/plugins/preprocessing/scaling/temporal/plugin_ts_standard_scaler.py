@@ -2,6 +2,7 @@ import dataclasses
 from typing import Any, Dict
 
 import pandas as pd
+from sklearn.base import clone
 from sklearn.preprocessing import StandardScaler
 from typing_extensions import Self
 
@@ -26,6 +27,8 @@ class TimeSeriesStandardScaler(BaseScaler):
     ParamsDefinition = TimeSeriesStandardScalerParams
     params: TimeSeriesStandardScalerParams  # type: ignore
 
+    supports_partial_fit = True
+
     def __init__(self, **params) -> None:
         """Standard scaling for the time-series data.
 
@@ -66,13 +69,27 @@ class TimeSeriesStandardScaler(BaseScaler):
         self.model.fit(data.time_series.dataframe())
         return self
 
+    def _partial_fit(
+        self,
+        data: dataset.BaseDataset,
+        *args,
+        **kwargs,
+    ) -> Self:
+        self.model.partial_fit(data.time_series.dataframe())
+        return self
+
+    def _reset_partial_fit(self) -> None:
+        self.model = clone(self.model)
+
     def _transform(self, data: dataset.BaseDataset, *args, **kwargs) -> dataset.BaseDataset:
         temporal_data = data.time_series.dataframe()
         scaled = pd.DataFrame(self.model.transform(temporal_data))
         scaled.columns = temporal_data.columns
         scaled.index = temporal_data.index
 
-        data.time_series = TimeSeriesSamples.from_dataframe(scaled)
+        data.time_series = TimeSeriesSamples.from_dataframe(
+            scaled, backend=data.time_series.backend, _reference=data.time_series
+        )
 
         return data
 
@@ -1,10 +1,10 @@
 import abc
 
-import pydantic
 from typing_extensions import Any, Self
 
 import tempor.exc
 import tempor.plugins.core as plugins
+from tempor.core import pydantic_utils
 from tempor.data import data_typing, dataset, samples
 
 
@@ -25,7 +25,7 @@ class BaseTimeToEventAnalysis(plugins.BasePredictor):
         super().fit(data, *args, **kwargs)
         return self
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict(  # type: ignore[override]  # pylint: disable=arguments-differ
         self,
         data: dataset.PredictiveDataset,
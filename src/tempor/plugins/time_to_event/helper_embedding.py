@@ -6,7 +6,7 @@ import pandas as pd
 from typing_extensions import Self
 
 import tempor.exc
-from tempor.data import data_typing, dataset, samples
+from tempor.data import data_typing, dataset, ragged, samples
 from tempor.models import utils
 from tempor.models.ddh import DynamicDeepHitModel, output_modes, rnn_modes
 from tempor.plugins.core._params import CategoricalParams, FloatParams, IntegerParams
@@ -41,21 +41,17 @@ class DDHEmbedding:
         if static is None:
             static = np.zeros((len(temporal), 0))
 
-        merged = []
-        for idx, item in enumerate(temporal):  # pylint: disable=unused-variable
-            local_static = static[idx].reshape(1, -1)
-            local_static = np.repeat(local_static, len(temporal[idx]), axis=0)
-            tst = np.concatenate(
-                [
-                    temporal[idx],
-                    local_static,
-                    np.asarray(observation_times[idx]).reshape(-1, 1),
-                ],
-                axis=1,
-            )
-            merged.append(tst)
-
-        return np.array(merged, dtype=object)
+        # Build the merged rows of all the samples at once, then split them into per-sample views.
+        lengths = np.fromiter((len(item) for item in temporal), dtype=np.int64, count=len(temporal))
+        merged = np.concatenate(
+            [
+                np.concatenate(list(temporal), axis=0),
+                np.repeat(static, lengths, axis=0),
+                np.concatenate([np.asarray(item) for item in observation_times]).reshape(-1, 1),
+            ],
+            axis=1,
+        )
+        return ragged.split_rows(merged, ragged.lengths_to_offsets(lengths))
 
     def _validate_data(self, data: dataset.TimeToEventAnalysisDataset) -> None:
         if data.predictive.targets is not None and data.predictive.targets.num_features > 1:
@@ -75,7 +71,8 @@ class DDHEmbedding:
             static = data.static.numpy() if data.static is not None else None
         else:
             static = np.zeros((data.time_series.num_samples, 0))
-        temporal = [df.to_numpy() for df in data.time_series.list_of_dataframes()]
+        rag = data.time_series.ragged_array()
+        temporal = list(ragged.split_rows(rag.values, rag.offsets))
         observation_times = data.time_series.time_indexes_float()
         if data.predictive is not None and data.predictive.targets is not None:
             event_times, event_values = (
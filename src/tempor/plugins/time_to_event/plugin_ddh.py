@@ -44,6 +44,9 @@ class DynamicDeepHitTimeToEventAnalysisParams:
     """Output network, on of `OutputMode`."""
     random_state: int = 0
     """Random seed."""
+    n_workers: int = 1
+    """If greater than ``1``, train with data parallelism in this many local worker processes, on CPU. See
+    :mod:`~tempor.models.distributed`."""
 
 
 @plugins.register_plugin(name="dynamic_deephit", category="time_to_event")
@@ -85,6 +88,7 @@ class DynamicDeepHitTimeToEventAnalysis(BaseTimeToEventAnalysis, DDHEmbedding):
             n_iter=self.params.n_iter,
             output_mode=self.params.output_mode,
             device=self.params.device,
+            n_workers=self.params.n_workers,
         )
         DDHEmbedding.__init__(self, emb_model=self.model)
 
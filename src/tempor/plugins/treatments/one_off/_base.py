@@ -1,10 +1,10 @@
 import abc
 from typing import List
 
-import pydantic
 from typing_extensions import Self
 
 import tempor.plugins.core as plugins
+from tempor.core import pydantic_utils
 from tempor.data import dataset, samples
 
 
@@ -25,7 +25,7 @@ class BaseOneOffTreatmentEffects(plugins.BasePredictor):
         super().fit(data, *args, **kwargs)
         return self
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict(
         self,
         data: dataset.PredictiveDataset,
@@ -39,7 +39,7 @@ class BaseOneOffTreatmentEffects(plugins.BasePredictor):
     def _predict(self, data: dataset.PredictiveDataset, *args, **kwargs) -> samples.StaticSamples:  # pragma: no cover
         ...
 
-    @pydantic.validate_arguments(config=dict(arbitrary_types_allowed=True))
+    @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
     def predict_counterfactuals(
         self,
         data: dataset.PredictiveDataset,
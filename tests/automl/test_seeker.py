@@ -393,6 +393,91 @@ class TestMethodSeeker:
         with pytest.raises(ValueError, match=".*dataset.*"):
             seeker.search()
 
+    @pytest.mark.parametrize("n_jobs,n_trial_jobs", [(2, 1), (1, 2), (2, 2)])
+    def test_search_parallel(self, n_jobs: int, n_trial_jobs: int, patch_slow):
+        import joblib
+
+        estimator_names = ["cde_regressor", "ode_regressor", "nn_regressor"]
+
+        def search(n_jobs: int, n_trial_jobs: int):
+            seeker = MethodSeeker(
+                study_name="test_study",
+                task_type="prediction.one_off.regression",
+                estimator_names=estimator_names,
+                metric="mse",
+                dataset=MagicMock(PredictiveDataset),
+                return_top_k=3,
+                num_iter=4,
+                n_jobs=n_jobs,
+                n_trial_jobs=n_trial_jobs,
+            )
+            # Use the threading backend, such that the `patch_slow` patches apply in the workers.
+            with joblib.parallel_backend("threading"):
+                estimators, scores = seeker.search()
+            return seeker, estimators, scores
+
+        seeker, estimators, scores = search(n_jobs, n_trial_jobs)
+
+        assert len(estimators) == len(scores) == 3
+        assert sorted(scores, reverse=False) == scores
+        for tuner in seeker.tuners:
+            assert len(tuner.study.trials) == 4  # type: ignore
+        if n_trial_jobs == 1:
+            # Estimator-level parallelism alone gives the same result as the serial search.
+            _, estimators_serial, scores_serial = search(1, 1)
+            assert scores == scores_serial
+            assert [e.name for e in estimators] == [e.name for e in estimators_serial]
+
+    def test_search_parallel_tuner_copies_keep_storage(self, patch_slow, monkeypatch):
+        import gc
+        import os
+        import pickle
+
+        import joblib
+
+        from tempor.automl import seeker as seeker_module
+
+        # Run the search on copies of the tuners, as would be the case in worker processes.
+        tune_estimator = seeker_module._tune_estimator  # pylint: disable=protected-access
+        monkeypatch.setattr(
+            seeker_module,
+            "_tune_estimator",
+            lambda tuner, **kwargs: tune_estimator(pickle.loads(pickle.dumps(tuner)), **kwargs),
+        )
+
+        seeker = MethodSeeker(
+            study_name="test_study",
+            task_type="prediction.one_off.regression",
+            estimator_names=["cde_regressor", "nn_regressor"],
+            metric="mse",
+            dataset=MagicMock(PredictiveDataset),
+            num_iter=2,
+            n_jobs=2,
+            n_trial_jobs=2,
+        )
+        originals = list(seeker.tuners)
+        with joblib.parallel_backend("threading"):
+            seeker.search()
+        assert all(tuner is not original for tuner, original in zip(seeker.tuners, originals))
+
+        # The original tuners are dropped, the copies now own the journal storage.
+        del originals
+        gc.collect()
+        for tuner in seeker.tuners:
+            assert os.path.isdir(tuner._storage_dir.name)  # type: ignore [attr-defined]
+            assert len(tuner.study.trials) == 2  # type: ignore [attr-defined]
+
+    def test_init_fails_n_jobs_zero(self, get_dataset: Callable):
+        with pytest.raises(ValueError, match=".*n_jobs.*"):
+            MethodSeeker(
+                study_name="test_study",
+                task_type="prediction.one_off.classification",
+                estimator_names=["nn_classifier"],
+                metric="aucroc",
+                dataset=get_dataset("sine_data_small"),
+                n_jobs=0,
+            )
+
     # TODO: May wish to add more cases of slow tests, mark them as extra.
     @pytest.mark.slow
     def test_search_end2end(self, get_dataset: Callable):
@@ -680,6 +765,33 @@ class TestPipelineSeeker:
         else:
             assert sorted(scores, reverse=False) == scores
 
+    @pytest.mark.parametrize("preprocessing_cache", [True, False])
+    def test_preprocessing_cache(self, preprocessing_cache: bool, tmp_path, get_dataset: Callable):
+        seeker = PipelineSeeker(
+            study_name="test_study",
+            task_type="prediction.one_off.regression",
+            estimator_names=["nn_regressor", "ode_regressor"],
+            metric="mse",
+            dataset=get_dataset("sine_data_small"),
+            preprocessing_cache=preprocessing_cache,
+            preprocessing_cache_dir=str(tmp_path),
+        )
+
+        if preprocessing_cache:
+            assert seeker.transformer_cache is not None
+            assert seeker.transformer_cache.cache_dir == tmp_path
+            # The cache is shared by the pipelines of all the estimators.
+            for estimator in seeker.estimators:
+                assert estimator.transformer_cache is seeker.transformer_cache  # type: ignore
+        else:
+            assert seeker.transformer_cache is None
+
+        # The cache is not attached to the pipelines returned from the search.
+        pipe = seeker._create_estimator_with_hps(  # pylint: disable=protected-access
+            seeker.estimators[0], seeker.estimators[0].sample_hyperparameters(), 0.0
+        )
+        assert pipe.transformer_cache is None  # type: ignore
+
     @pytest.mark.slow
     def test_search_end2end(self, get_dataset: Callable):
         from tempor.plugins.pipeline import PipelineBase
@@ -1,8 +1,11 @@
 # pylint: disable=redefined-outer-name
 
+import copy
 import functools
+import gc
+import os
 import warnings
-from typing import Any, Callable, Dict, Type
+from typing import Any, Callable, Dict, List, Type
 from unittest.mock import Mock
 
 import optuna
@@ -197,6 +200,11 @@ def tune_objective(get_event0_time_percentiles: Callable):
 # TestOptunaTuner helper functions. ---
 
 
+def _score_n_units_hidden(estimator: Type[BasePredictor], dataset: PredictiveDataset, **kwargs) -> float:
+    # A quick evaluation callback, which does not fit the estimator.
+    return float(kwargs["n_units_hidden"])
+
+
 @pytest.fixture
 def helper_initialize(limit_int_param: Callable, get_dataset: Callable):
     def func(data: str, plugin: str):
@@ -490,6 +498,153 @@ class TestOptunaTuner:
 
         assert scores == params == []
 
+    @pytest.mark.parametrize("use_sqlite_storage", [False, True])
+    def test_tune_n_jobs(
+        self,
+        use_sqlite_storage: bool,
+        helper_initialize: Callable,
+        tune_objective: Callable,
+        tmp_path,
+    ):
+        dataset, p = helper_initialize(
+            data="sine_data_small",
+            plugin="prediction.one_off.regression.nn_regressor",
+        )
+
+        hp_tuner = tuner.OptunaTuner(
+            study_name="my_study",
+            direction="minimize",
+            study_sampler=optuna.samplers.RandomSampler(seed=SEED),
+            study_storage=f"sqlite:///{tmp_path / 'study.db'}" if use_sqlite_storage else None,
+            study_pruner=None,
+            study_sampler_factory=optuna.samplers.RandomSampler,
+            n_jobs=2,
+            random_state=SEED,
+        )
+        assert not isinstance(hp_tuner.study._storage, optuna.storages.InMemoryStorage)
+
+        scores, params = hp_tuner.tune(
+            estimator=p,
+            dataset=dataset,
+            evaluation_callback=functools.partial(
+                tune_objective,
+                evaluation_case="prediction.one_off.regression",
+                metric="mse",
+            ),
+            # NOTE: The `limit_int_param` patching does not apply in the worker processes, so limit via override.
+            override_hp_space=[
+                IntegerParams(name="n_units_hidden", low=5, high=100),
+                IntegerParams(name="n_iter", low=2, high=2),
+            ],
+            compute_baseline_score=False,
+            optimize_kwargs={"n_trials": 3},
+        )
+
+        # Trials from all workers are collected from the shared study.
+        assert len(scores) == len(params) == 3
+        assert len(hp_tuner.study.trials) == 3
+        # Workers are seeded differently, so should not sample the same hyperparameters.
+        assert params[0] != params[1] or params[0] != params[2]
+
+    def test_journal_storage_dir_removed(self):
+        hp_tuner = tuner.OptunaTuner(
+            study_name="my_study",
+            direction="minimize",
+            study_sampler=optuna.samplers.RandomSampler(seed=SEED),
+            study_sampler_factory=optuna.samplers.RandomSampler,
+            n_jobs=2,
+        )
+        storage_dir = hp_tuner._storage_dir.name  # type: ignore [union-attr]
+        assert os.path.isdir(storage_dir)
+
+        hp_tuner.create_study()
+        assert not os.path.exists(storage_dir)
+
+        storage_dir = hp_tuner._storage_dir.name  # type: ignore [union-attr]
+        del hp_tuner
+        gc.collect()
+        assert not os.path.exists(storage_dir)
+
+    def test_journal_storage_dir_not_owned_by_copies(self):
+        hp_tuner = tuner.OptunaTuner(
+            study_name="my_study",
+            direction="minimize",
+            study_sampler=optuna.samplers.RandomSampler(seed=SEED),
+            study_sampler_factory=optuna.samplers.RandomSampler,
+            n_jobs=2,
+        )
+        storage_dir = hp_tuner._storage_dir.name  # type: ignore [union-attr]
+
+        tuner_copy = copy.deepcopy(hp_tuner)
+        assert tuner_copy._storage_dir is None
+        tuner_copy.create_study()
+        del tuner_copy
+        gc.collect()
+        assert os.path.isdir(storage_dir)
+
+    def test_init_fails_n_jobs_zero(self):
+        with pytest.raises(ValueError, match=".*n_jobs.*"):
+            tuner.OptunaTuner(
+                study_name="my_study",
+                direction="maximize",
+                study_sampler=optuna.samplers.TPESampler(seed=SEED),
+                n_jobs=0,
+            )
+
+    def test_tune_n_jobs_process_backend_reproducible(self, get_dataset: Callable):
+        dataset = get_dataset("sine_data_small")
+        p = plugin_loader.get_class("prediction.one_off.regression.nn_regressor")
+
+        def tune() -> List[Dict]:
+            hp_tuner = tuner.OptunaTuner(
+                study_name="my_study",
+                direction="minimize",
+                study_sampler=optuna.samplers.RandomSampler(seed=SEED),
+                study_sampler_factory=optuna.samplers.RandomSampler,
+                n_jobs=2,
+                random_state=SEED,
+            )
+            # Uses the default (process-based) `joblib` backend: the objective is sent to the worker processes, which
+            # share the journal storage.
+            _, params = hp_tuner.tune(
+                estimator=p,
+                dataset=dataset,
+                evaluation_callback=_score_n_units_hidden,
+                override_hp_space=[IntegerParams(name="n_units_hidden", low=5, high=100)],
+                compute_baseline_score=False,
+                optimize_kwargs={"n_trials": 4},
+            )
+            return params
+
+        params = tune()
+
+        assert len(params) == 4
+        # The worker samplers are created with different seeds, so should not sample the same hyperparameters.
+        assert len({hps["n_units_hidden"] for hps in params}) > 1
+        # ...and the same seeds in each search (the random sampler does not depend on the order of the trials).
+        assert sorted(hps["n_units_hidden"] for hps in tune()) == sorted(hps["n_units_hidden"] for hps in params)
+
+    def test_init_fails_no_sampler_factory(self):
+        with pytest.raises(ValueError, match=".*study_sampler_factory.*"):
+            tuner.OptunaTuner(
+                study_name="my_study",
+                direction="minimize",
+                study_sampler=optuna.samplers.RandomSampler(seed=SEED),
+                n_jobs=2,
+            )
+
+    @pytest.mark.parametrize(
+        "n_trials,n_jobs,expected",
+        [
+            (6, 2, [3, 3]),
+            (5, 3, [2, 2, 1]),
+            (1, 3, [1]),
+            (None, 2, [None, None]),
+        ],
+    )
+    def test_split_n_trials(self, n_trials, n_jobs, expected):
+        assert tuner._split_n_trials(n_trials, n_jobs) == expected
+
     class TestPredictionOneOffClassification:
         @pytest.mark.parametrize("data", SETTINGS["prediction.one_off.classification"]["TEST_ON_DATASETS"])
         @pytest.mark.parametrize("plugin", SETTINGS["prediction.one_off.classification"]["TEST_WITH_PLUGINS"])
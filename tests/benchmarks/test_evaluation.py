@@ -132,6 +132,40 @@ def test_evaluate_prediction_oneoff_classifier_model_error(
         assert (scores["errors"] > 0).all()
 
 
+@pytest.mark.parametrize("data", TEST_ON_DATASETS_CLASSIFIER)
+def test_evaluate_prediction_oneoff_regressor_n_jobs(data: str, request: pytest.FixtureRequest) -> None:
+    dataset = request.getfixturevalue(data)
+    p = plugin_loader.get(PREDICTOR_REGRESSION, n_iter=N_ITER)
+
+    scores_serial = evaluate_prediction_oneoff_regressor(p, dataset, n_splits=2, random_state=1, n_jobs=1)
+    scores_parallel = evaluate_prediction_oneoff_regressor(p, dataset, n_splits=2, random_state=1, n_jobs=2)
+
+    for metric in regression_supported_metrics:
+        assert scores_parallel.loc[metric, "mean"] == scores_serial.loc[metric, "mean"]
+    assert (scores_parallel["errors"] == 0).all()
+    assert (scores_parallel["rounds"] == 2).all()
+
+
+@pytest.mark.parametrize("data", TEST_ON_DATASETS_CLASSIFIER)
+def test_evaluate_prediction_oneoff_classifier_n_jobs_error(data: str, request: pytest.FixtureRequest, monkeypatch):
+    dataset = request.getfixturevalue(data)
+    p = plugin_loader.get(PREDICTOR_CLASSIFICATION, n_iter=N_ITER)
+
+    def raise_(*args, **kwargs):
+        raise ValueError("test error")
+
+    monkeypatch.setattr(p, "fit", raise_)
+
+    scores = evaluate_prediction_oneoff_classifier(p, dataset, n_splits=2, n_jobs=2)
+    assert (scores["errors"] == 2).all()
+
+    with pytest.raises(ValueError, match=".*test error.*"):
+        evaluate_prediction_oneoff_classifier(p, dataset, n_splits=2, n_jobs=2, raise_exceptions=True)
+
+    with pytest.raises(ValueError, match=".*n_jobs.*"):
+        evaluate_prediction_oneoff_classifier(p, dataset, n_splits=2, n_jobs=0)
+
+
 @pytest.mark.parametrize("data", TEST_ON_DATASETS_REGRESSOR)
 @pytest.mark.parametrize(
     "model_template",
@@ -151,6 +151,70 @@ def test_estimate_concordance_index_invalid_comparable(monkeypatch):
         metrics._estimate_concordance_index(Mock(), Mock(), Mock(), Mock())
 
 
+def _estimate_concordance_index_reference(event_indicator, event_time, estimate, weights, tied_tol=1e-8):
+    # Direct pairwise implementation, building a mask of comparable samples for each uncensored sample.
+    order = np.argsort(event_time)
+    n_samples = len(event_time)
+    concordant, discordant, tied_risk, tied_time = 0, 0, 0, 0
+    numerator, denominator = 0.0, 0.0
+    i = 0
+    while i < n_samples - 1:
+        end = i + 1
+        while end < n_samples and event_time[order[end]] == event_time[order[i]]:
+            end += 1
+        censored_at_same_time = ~event_indicator[order[i:end]]
+        for j in range(i, end):
+            if not event_indicator[order[j]]:
+                continue
+            mask = np.zeros(n_samples, dtype=bool)
+            mask[end:] = True
+            mask[i:end] = censored_at_same_time
+            tied_time += censored_at_same_time.sum()
+
+            est_i, w_i = estimate[order[j]], weights[order[j]]
+            est = estimate[order[mask]]
+            ties = np.absolute(est - est_i) <= tied_tol
+            n_ties = ties.sum()
+            n_con = (est < est_i)[~ties].sum()
+
+            numerator += w_i * n_con + 0.5 * w_i * n_ties
+            denominator += w_i * mask.sum()
+            tied_risk += n_ties
+            concordant += n_con
+            discordant += est.size - n_con - n_ties
+        i = end
+    return numerator / denominator, concordant, discordant, tied_risk, tied_time
+
+
+@pytest.mark.parametrize("n_samples", [2, 3, 50, 500])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_estimate_concordance_index_matches_reference(n_samples: int, seed: int):
+    rng = np.random.default_rng(seed)
+    event_indicator = rng.random(n_samples) < 0.6
+    event_indicator[0] = True
+    # Few distinct values, for many tied times and estimates, and some estimates tied within the tolerance.
+    event_time = rng.integers(0, max(n_samples // 4, 2), size=n_samples).astype(float)
+    estimate = rng.integers(0, 10, size=n_samples) / 10.0
+    estimate[rng.random(n_samples) < 0.2] += 1e-9
+    weights = np.square(rng.random(n_samples) + 0.5)
+
+    out = metrics._estimate_concordance_index(event_indicator, event_time, estimate, weights)
+    expected = _estimate_concordance_index_reference(event_indicator, event_time, estimate, weights)
+
+    np.testing.assert_equal(out, expected)  # Exactly equal (including NaN in degenerate cases).
+
+
+def test_get_comparable():
+    event_indicator = np.asarray([True, False, True, True, False, True])
+    event_time = np.asarray([1.0, 1.0, 2.0, 3.0, 3.0, 4.0])
+
+    comparable, tied_time = metrics._get_comparable(event_indicator, event_time, np.argsort(event_time))
+
+    # The last sample has no later samples to compare to.
+    assert list(comparable) == [0, 2, 3]
+    assert tied_time == 2
+
+
 def test_create_structured_array_validation():
     with pytest.raises(ValueError, match=".*different.*"):
         metrics.create_structured_array([], [], name_event="a", name_time="a")
@@ -105,3 +105,24 @@ def test_observer(monkeypatch):
     config = tempor.get_config()
     tempor.configure(config)
     mock_func.assert_called_once()
+
+
+def test_fast_mode_default():
+    assert tempor.get_config().performance.fast_mode is False
+    assert TemporConfig(logging=Mock(), working_directory="~").performance.fast_mode is False
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_fast_mode(enabled):
+    config = tempor.get_config()
+    previous = config.performance.fast_mode
+    with tempor.fast_mode(enabled):
+        assert tempor.get_config().performance.fast_mode is enabled
+    assert tempor.get_config().performance.fast_mode is previous
+
+
+def test_fast_mode_restored_on_exception():
+    with pytest.raises(RuntimeError):
+        with tempor.config.fast_mode():
+            raise RuntimeError
+    assert tempor.get_config().performance.fast_mode is False
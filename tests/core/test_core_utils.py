@@ -149,3 +149,23 @@ class TestGetFromArgsOrKwargs:
 
 
 # Test get_from_args_or_kwargs (end) -----
+
+
+class TestLRUCache:
+    def test_get(self):
+        cache = utils.LRUCache(maxsize=1)
+        a = cache.get("a", object)
+        assert cache.get("a", object) is a
+        assert cache.get("b", object) is not a
+        assert len(cache) == 1
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_disabled(self):
+        cache = utils.LRUCache(maxsize=2)
+        cache.get("a", lambda: 1)
+        cache.maxsize = 0
+
+        assert cache.get("a", lambda: -1) == -1
+        assert cache.get("b", lambda: 2) == 2
+        assert len(cache) == 0
+        assert cache.get("b", lambda: -2) == -2
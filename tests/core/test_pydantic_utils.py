@@ -4,6 +4,7 @@ from typing import List
 import pydantic
 import pytest
 
+import tempor
 from tempor.core import pydantic_utils
 
 
@@ -54,3 +55,37 @@ def test_make_pydantic_dataclass_workaround():
     MyPydanticDataclass(a="abc", b=[10, 11, 12])
     with pytest.raises(ValueError):
         MyPydanticDataclass(a="abc", b="should_be_list")
+
+
+def test_validate_arguments():
+    @pydantic_utils.validate_arguments
+    def func(a: int, b: List[int]) -> int:
+        return a + len(b)
+
+    assert func(1, b=[1, 2]) == 3
+    assert func.raw_function(1, b=[1, 2]) == 3  # type: ignore[attr-defined]
+    with pytest.raises(pydantic.ValidationError):
+        func("not_int", b=[1, 2])
+
+
+def test_validate_arguments_method_with_config():
+    class MyClass:
+        @pydantic_utils.validate_arguments(config=dict(arbitrary_types_allowed=True))
+        def method(self, a: int) -> int:
+            return a * 2
+
+    assert MyClass().method(a=2) == 4
+    with pytest.raises(pydantic.ValidationError):
+        MyClass().method("not_int")
+
+
+def test_validate_arguments_fast_mode():
+    @pydantic_utils.validate_arguments
+    def func(a: int) -> int:
+        return a
+
+    with tempor.fast_mode():
+        # Passed as is, neither validated nor coerced.
+        assert func("not_int") == "not_int"
+        assert func(a="1") == "1"
+    assert func(a="1") == 1
@@ -291,6 +291,47 @@ class TestTemporDatasetToClairvoyance2Dataset:
             assert data_converted.static_covariates is not None
             assert data.static.num_features == data_converted.static_covariates.n_features  # pyright: ignore
 
+    def test_time_series_conversion(self, load_sine: dataset.OneOffPredictionDataset):
+        s = load_sine.time_series[[2, 0, 1]]
+
+        converted = clv2conv._to_clv2_time_series(s)  # pylint: disable=protected-access
+
+        expected = [df.droplevel(0) for df in s.list_of_dataframes()]
+        assert len(converted) == len(expected)
+        for df, df_expected in zip(converted, expected):
+            pd.testing.assert_frame_equal(df, df_expected)
+
+    def test_cached(self, load_sine: dataset.OneOffPredictionDataset):
+        data_ = load_sine
+        data = dataset.TemporalPredictionDataset(
+            time_series=data_.time_series.dataframe(),
+            targets=data_.time_series.dataframe().copy(),
+        )
+        clv2conv.conversion_cache.clear()
+
+        data_converted = clv2conv.tempor_dataset_to_clairvoyance2_dataset(data)
+        assert clv2conv.conversion_cache.misses == 1
+
+        assert clv2conv.tempor_dataset_to_clairvoyance2_dataset(data) is data_converted
+        assert clv2conv.tempor_dataset_to_clairvoyance2_dataset(data[:]) is data_converted  # Same content.
+        assert clv2conv.conversion_cache.hits == 2
+        assert clv2conv.tempor_dataset_to_clairvoyance2_dataset(data[:5]) is not data_converted
+        assert clv2conv.tempor_dataset_to_clairvoyance2_dataset(data, use_cache=False) is not data_converted
+        assert clv2conv.conversion_cache.misses == 2
+
+    def test_cache_disabled(self, load_sine: dataset.OneOffPredictionDataset, monkeypatch):
+        data_ = load_sine
+        data = dataset.TemporalPredictionDataset(
+            time_series=data_.time_series.dataframe(),
+            targets=data_.time_series.dataframe().copy(),
+        )
+        monkeypatch.setattr(clv2conv.conversion_cache, "maxsize", 0)
+
+        data_converted = clv2conv.tempor_dataset_to_clairvoyance2_dataset(data)
+
+        assert clv2conv.tempor_dataset_to_clairvoyance2_dataset(data) is not data_converted
+        assert len(clv2conv.conversion_cache) == 0
+
     def test_unsupported(self, load_sine: dataset.OneOffTreatmentEffectsDataset):
         data_ = load_sine
         data = dataset.CovariatesDataset(
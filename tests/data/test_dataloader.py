@@ -1,4 +1,5 @@
 from tempor.data import data_typing, dataloader, dataset
+from tempor.utils.dataloaders import SineDataLoader
 
 
 def test_dataloaders():
@@ -119,3 +120,22 @@ def test_requires_internet():
 
     assert case_url.requires_internet()
     assert not case_no_url.requires_internet()
+
+
+def test_iter_chunks():
+    class MyDataLoader(dataloader.OneOffPredictionDataLoader):
+        def load(self, **kwargs) -> dataset.OneOffPredictionDataset:
+            return SineDataLoader(no=10, **kwargs).load()
+
+        @staticmethod
+        def dataset_dir() -> None:
+            return None
+
+        @staticmethod
+        def url() -> None:
+            return None
+
+    chunks = list(MyDataLoader().iter_chunks(chunk_size=4, seq_len=5))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert all(chunk.time_series.num_timesteps() == [5] * len(chunk) for chunk in chunks)
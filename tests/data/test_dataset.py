@@ -1,6 +1,8 @@
 # pylint: disable=redefined-outer-name, unused-argument, protected-access
 
+import copy
 import dataclasses
+import pickle
 from typing import TYPE_CHECKING, Tuple, Type
 from unittest.mock import Mock
 
@@ -1495,3 +1497,164 @@ class TestWithConcreteData:
             n += 1
 
         assert n == 5
+
+    def test_getitem_returns_view(self, dummy_dfs_for_split_tests, monkeypatch):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+
+        validate = Mock()
+        monkeypatch.setattr(dataset.OneOffPredictionDataset, "validate", validate)
+        data_sub = data[[3, 1, 7]]
+
+        assert isinstance(data_sub, dataset.OneOffPredictionDataset)
+        assert isinstance(data_sub._time_series, samples.SamplesView)
+        assert isinstance(data_sub._static, samples.SamplesView)
+        assert data_sub.predictive.parent_dataset is data_sub
+        assert len(data_sub) == 3
+        validate.assert_not_called()
+
+        assert data_sub.time_series.sample_index() == ["sample_3", "sample_1", "sample_7"]
+        assert isinstance(data_sub._time_series, samples.TimeSeriesSamples)
+        assert data_sub.static is not None
+        assert data_sub.static.dataframe().equals(df_s.iloc[[3, 1, 7]])
+        assert data_sub.predictive.targets is not None
+        assert data_sub.predictive.targets.dataframe().equals(df_s_target.iloc[[3, 1, 7]])
+
+    def test_getitem_nested_views_compose(self, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+
+        data_sub = data[10:20][[0, 5]][1]
+
+        assert isinstance(data_sub._time_series, samples.SamplesView)
+        assert data_sub._time_series.source is data.time_series
+        assert len(data_sub) == 1
+        assert data_sub.time_series.sample_index() == ["sample_15"]
+        assert data_sub.predictive.targets.sample_index() == ["sample_15"]  # type: ignore
+
+    @pytest.mark.parametrize("copy_fn", [copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))])
+    def test_getitem_view_copy(self, copy_fn, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+
+        data_copy = copy_fn(data[[2, 4]])
+
+        assert isinstance(data_copy._time_series, samples.TimeSeriesSamples)
+        assert data_copy.time_series.num_samples == 2
+        assert data_copy.time_series.dataframe().equals(df_t.loc[["sample_2", "sample_4"]])
+        assert data_copy.predictive.parent_dataset is data_copy
+
+    @pytest.mark.parametrize("chunk_size", [1, 30, 100, 1000])
+    def test_iter_chunks(self, chunk_size, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+
+        chunks = list(data.iter_chunks(chunk_size))
+
+        assert len(chunks) == -(-len(data) // chunk_size)
+        assert all(isinstance(chunk, dataset.OneOffPredictionDataset) for chunk in chunks)
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        assert [s for chunk in chunks for s in chunk.time_series.sample_index()] == data.time_series.sample_index()
+        for chunk in chunks:
+            assert chunk.static.sample_index() == chunk.time_series.sample_index()  # type: ignore
+            assert chunk.predictive.targets.sample_index() == chunk.time_series.sample_index()  # type: ignore
+
+    def test_iter_chunks_invalid_chunk_size(self, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+
+        with pytest.raises(ValueError, match=".*chunk_size.*"):
+            next(data.iter_chunks(0))
+
+    def test_append_samples(self, dummy_dfs_for_split_tests, monkeypatch):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+        validate = Mock()
+        monkeypatch.setattr(samples.TimeSeriesSamples, "_validate", validate)
+        monkeypatch.setattr(samples.StaticSamples, "_validate", validate)
+
+        combined = data[:90].append_samples(data[90:])
+
+        validate.assert_not_called()
+        assert isinstance(combined, dataset.OneOffPredictionDataset)
+        combined.validate()
+        assert combined.time_series.dataframe().equals(df_t)
+        assert combined.static.dataframe().equals(df_s)  # type: ignore
+        assert combined.predictive.targets.dataframe().equals(df_s_target)  # type: ignore
+        assert combined.predictive.parent_dataset is combined
+
+    def test_fingerprint(self, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+        fingerprint = data.fingerprint()
+
+        assert (
+            fingerprint
+            == dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target).fingerprint()
+        )
+        assert fingerprint == data[:90].append_samples(data[90:]).fingerprint()
+        assert fingerprint != data[:90].fingerprint()
+        assert fingerprint != dataset.OneOffPredictionDataset(time_series=df_t, targets=df_s_target).fingerprint()
+        assert fingerprint != dataset.CovariatesDataset(time_series=df_t, static=df_s).fingerprint()
+
+        data.static = None
+
+        assert data.fingerprint() != fingerprint
+
+    def test_compact(self, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+
+        compacted = data.compact()
+
+        assert isinstance(compacted, dataset.OneOffPredictionDataset)
+        for samples_ in (compacted.time_series, compacted.static, compacted.predictive.targets):  # type: ignore
+            assert all(dtype != np.float64 for dtype in samples_.dataframe().dtypes)
+        assert compacted.predictive.parent_dataset is compacted  # type: ignore
+        assert len(compacted) == len(data)
+
+    def test_concat_fails(self, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+        no_static = dataset.OneOffPredictionDataset(time_series=df_t, targets=df_s_target)
+
+        with pytest.raises(ValueError, match=".*No datasets.*"):
+            dataset.concat([])
+        with pytest.raises(TypeError, match=".*different classes.*"):
+            dataset.concat([data, dataset.CovariatesDataset(time_series=df_t)])
+        with pytest.raises(ValueError, match=".*only some.*static.*"):
+            dataset.concat([data[:10], no_static[10:]])
+        with pytest.raises(ValueError, match=".*overlapping.*"):
+            dataset.concat([data[:10], data[5:]])
+
+    def test_append_timesteps(self):
+        index = pd.MultiIndex.from_product([["s1", "s2", "s3"], [1, 2]])
+        new_index = pd.MultiIndex.from_tuples([("s3", 3), ("s1", 3)])
+        data = dataset.TemporalTreatmentEffectsDataset(
+            time_series=pd.DataFrame({"a": np.arange(6.0)}, index=index),
+            static=pd.DataFrame({"s": [1.0, 2.0, 3.0]}, index=["s1", "s2", "s3"]),
+            targets=pd.DataFrame({"y": np.arange(6.0)}, index=index),
+            treatments=pd.DataFrame({"u": np.arange(6.0)}, index=index),
+        )
+        new = dataset.TemporalTreatmentEffectsDataset(
+            time_series=pd.DataFrame({"a": [10.0, 11.0]}, index=new_index),
+            targets=pd.DataFrame({"y": [10.0, 11.0]}, index=new_index),
+            treatments=pd.DataFrame({"u": [10.0, 11.0]}, index=new_index),
+        )
+
+        combined = data.append_timesteps(new)
+
+        combined.validate()
+        expected = [[1, 2, 3], [1, 2], [1, 2, 3]]
+        assert combined.time_series.time_indexes() == expected
+        assert combined.predictive.targets.time_indexes() == expected  # type: ignore
+        assert combined.predictive.treatments.time_indexes() == expected  # type: ignore
+        assert combined.static is data.static
+
+    def test_append_timesteps_fails(self, dummy_dfs_for_split_tests):
+        df_t, df_s, df_s_target = dummy_dfs_for_split_tests
+        data = dataset.OneOffPredictionDataset(time_series=df_t, static=df_s, targets=df_s_target)
+        with pytest.raises(TypeError, match=".*OneOffPredictionDataset.*"):
+            data.append_timesteps(dataset.CovariatesDataset(time_series=df_t))  # type: ignore
+        with pytest.raises(ValueError, match=".*already present.*"):
+            data.append_timesteps(data[:2])
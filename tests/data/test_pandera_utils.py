@@ -1,10 +1,18 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pandera as pa
 import pytest
 
-from tempor.data.pandera_utils import UnionDtype, set_up_2level_multiindex, set_up_index
+from tempor.data.pandera_utils import (
+    SchemaCache,
+    UnionDtype,
+    get_schema_key,
+    init_structural_schema,
+    set_up_2level_multiindex,
+    set_up_index,
+)
 
 
 class TestUnionDtype:
@@ -226,3 +234,69 @@ class TestHelpers:
                 coerce=Mock(),
                 unique=Mock(),
             )
+
+
+class TestStructuralSchema:
+    def test_get_schema_key(self):
+        df_a = pd.DataFrame({"a": [1, 2], "b": [1.0, np.nan]}, index=["s1", "s2"])
+        df_b = pd.DataFrame({"c": [0.5, 0.7]}, index=["s3", "s4"])
+        df_c = pd.DataFrame({"a": [1, 2]}, index=[1, 2])
+        df_d = pd.DataFrame({"a": [1, 2]}, index=pd.MultiIndex.from_tuples([("s1", 0), ("s1", 1)]))
+
+        assert get_schema_key(df_a) == get_schema_key(df_b)
+        assert get_schema_key(df_a) != get_schema_key(df_c)
+        assert get_schema_key(df_a) != get_schema_key(df_d)
+        assert hash(get_schema_key(df_d))
+
+    @pytest.mark.parametrize(
+        "df",
+        [
+            pd.DataFrame({"a": [1, 2], "b": [1.0, np.nan]}, index=["s1", None]),
+            pd.DataFrame({"a": [1, 2]}, index=pd.MultiIndex.from_tuples([("s1", 0.0), ("s1", 1.5)])),
+        ],
+    )
+    def test_init_structural_schema(self, df):
+        schema = init_structural_schema(df, coerce=False)
+
+        assert schema.columns == dict()
+        assert schema.validate(df) is not None
+        # Reusable for different data with the same structure:
+        schema.validate(df.iloc[::-1] * 10)
+
+    def test_init_structural_schema_dtype(self):
+        schema = init_structural_schema(pd.DataFrame({"a": [1, 2]}, index=["s1", "s2"]))
+        with pytest.raises(pa.errors.SchemaError):
+            schema.validate(pd.DataFrame({"a": [1, 2]}, index=[1, 2]))
+
+
+class TestSchemaCache:
+    def test_get(self):
+        cache = SchemaCache(maxsize=2)
+        build = Mock(side_effect=lambda: object())
+
+        a = cache.get("a", build)
+        assert cache.get("a", build) is a
+        assert build.call_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        b = cache.get("b", build)
+        assert b is not a
+        assert len(cache) == 2
+
+    def test_lru_eviction(self):
+        cache = SchemaCache(maxsize=2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 1)  # "b" is now the least recently used.
+        cache.get("c", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get("a", lambda: -1) == 1
+        assert cache.get("b", lambda: -2) == -2
+
+    def test_clear(self):
+        cache = SchemaCache()
+        cache.get("a", lambda: 1)
+        cache.clear()
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,226 @@
+# pylint: disable=redefined-outer-name
+
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tempor.data import ragged
+
+PAD = 999.0
+
+
+@pytest.fixture
+def multiindex_timeseries_df() -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "sample_idx": ["a", "a", "a", "a", "b", "b", "c"],
+            "time_idx": [1, 2, 3, 4, 2, 4, 9],
+            "feat_1": [11, 12, 13, 14, 21, 22, 31],
+            "feat_2": [1.1, 1.2, 1.3, 1.4, 2.1, 2.2, 3.1],
+        }
+    )
+    df.set_index(keys=["sample_idx", "time_idx"], drop=True, inplace=True)
+    return df
+
+
+def test_lengths_to_offsets():
+    assert (ragged.lengths_to_offsets(np.asarray([4, 2, 1])) == np.asarray([0, 4, 6, 7])).all()
+    assert (ragged.lengths_to_offsets(np.asarray([], dtype=int)) == np.asarray([0])).all()
+
+
+def test_positions_within_samples():
+    positions = ragged.positions_within_samples(np.asarray([0, 4, 4, 6, 7]))
+    assert (positions == np.asarray([0, 1, 2, 3, 0, 1, 0])).all()
+
+
+def test_gather_rows():
+    rows = ragged.gather_rows(np.asarray([0, 4, 6, 7]), np.asarray([2, 0]))
+    assert (rows == np.asarray([6, 0, 1, 2, 3])).all()
+
+
+def test_append_rows_order():
+    # Append 2 rows to sample 2 and 1 row to sample 0.
+    offsets, order = ragged.append_rows_order(np.asarray([0, 2, 3, 6]), np.asarray([0, 2, 3]), np.asarray([2, 0]))
+    assert (offsets == np.asarray([0, 3, 4, 9])).all()
+    assert (order == np.asarray([0, 1, 8, 2, 3, 4, 5, 6, 7])).all()
+
+
+@pytest.mark.parametrize("max_timesteps", [None, 2, 5])
+def test_pad_rows(max_timesteps):
+    values = np.arange(7 * 2).reshape(7, 2)
+    offsets = np.asarray([0, 4, 4, 6, 7])
+
+    padded = ragged.pad_rows(values, offsets, padding_indicator=np.nan, max_timesteps=max_timesteps, dtype=np.float32)
+
+    width = 4 if max_timesteps is None else max_timesteps
+    assert padded.shape == (4, width, 2)
+    assert padded.dtype == np.float32
+    for idx, (start, stop) in enumerate(zip(offsets[:-1], offsets[1:])):
+        length = min(stop - start, width)
+        assert (padded[idx, :length] == values[start : start + length]).all()
+        assert np.isnan(padded[idx, length:]).all()
+
+
+def test_split_rows():
+    values = np.arange(7 * 2).reshape(7, 2)
+
+    split = ragged.split_rows(values, np.asarray([0, 4, 4, 6, 7]))
+
+    assert split.dtype == object
+    assert [len(x) for x in split] == [4, 0, 2, 1]
+    assert np.shares_memory(split[0], values)
+    assert (np.concatenate(list(split)) == values).all()
+
+
+class TestSampleIndexMetadata:
+    def test_from_multiindex(self, multiindex_timeseries_df: pd.DataFrame):
+        meta = ragged.SampleIndexMetadata.from_multiindex(multiindex_timeseries_df.index)
+        assert meta.num_samples == 3
+        assert list(meta.sample_index) == ["a", "b", "c"]
+        assert list(meta.offsets) == [0, 4, 6, 7]
+        assert list(meta.lengths) == [4, 2, 1]
+        assert meta.row_order is None
+        assert [list(x) for x in meta.time_indexes()] == [[1, 2, 3, 4], [2, 4], [9]]
+        assert meta.time_indexes_as_lists() == [[1, 2, 3, 4], [2, 4], [9]]
+
+    def test_from_multiindex_noncontiguous_samples(self, multiindex_timeseries_df: pd.DataFrame):
+        df = multiindex_timeseries_df.iloc[[0, 4, 1, 6, 2, 5, 3], :]
+        meta = ragged.SampleIndexMetadata.from_multiindex(df.index)
+        assert list(meta.sample_index) == ["a", "b", "c"]
+        assert list(meta.row_order) == [0, 2, 4, 6, 1, 5, 3]  # type: ignore
+        assert meta.time_indexes_as_lists() == [[1, 2, 3, 4], [2, 4], [9]]
+
+    def test_time_index_float(self, multiindex_timeseries_df: pd.DataFrame):
+        df = multiindex_timeseries_df.iloc[[0, 4, 1, 6, 2, 5, 3], :]
+        meta = ragged.SampleIndexMetadata.from_multiindex(df.index)
+        assert meta.time_index_float.dtype == float
+        assert list(meta.time_index_float) == [1.0, 2.0, 3.0, 4.0, 2.0, 4.0, 9.0]
+        assert meta.time_index_float is meta.time_index_float
+
+    def test_read_only(self, multiindex_timeseries_df: pd.DataFrame):
+        meta = ragged.RaggedTimeSeries.from_dataframe(multiindex_timeseries_df).index_metadata()
+        with pytest.raises(ValueError, match=".*read-only.*"):
+            meta.lengths[0] = 0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            meta.offsets = np.asarray([0, 7])  # type: ignore
+
+
+class TestRaggedTimeSeries:
+    def test_from_dataframe(self, multiindex_timeseries_df: pd.DataFrame):
+        r = ragged.RaggedTimeSeries.from_dataframe(multiindex_timeseries_df)
+        assert r.num_samples == 3
+        assert r.num_features == 2
+        assert len(r) == 3
+        assert list(r.offsets) == [0, 4, 6, 7]
+        assert list(r.lengths) == [4, 2, 1]
+        assert list(r.sample_index) == ["a", "b", "c"]
+        assert [list(x) for x in r.time_indexes()] == [[1, 2, 3, 4], [2, 4], [9]]
+        assert (r.sample_values(1) == np.asarray([[21, 2.1], [22, 2.2]])).all()
+        assert list(r.sample_time_index(2)) == [9]
+
+    def test_from_dataframe_noncontiguous_samples(self, multiindex_timeseries_df: pd.DataFrame):
+        df = multiindex_timeseries_df.iloc[[0, 4, 1, 6, 2, 5, 3], :]
+        r = ragged.RaggedTimeSeries.from_dataframe(df)
+        assert list(r.sample_index) == ["a", "b", "c"]
+        assert [list(x) for x in r.time_indexes()] == [[1, 2, 3, 4], [2, 4], [9]]
+
+    def test_to_dataframe_roundtrip(self, multiindex_timeseries_df: pd.DataFrame):
+        df = multiindex_timeseries_df.copy()
+        df["feat_3"] = pd.Categorical(["x", "y", "x", "x", "y", "y", "x"])
+        r = ragged.RaggedTimeSeries.from_dataframe(df)
+        assert r.dtypes is not None
+        df_out = r.to_dataframe()
+        assert df_out.equals(df)
+        assert list(df_out.dtypes) == list(df.dtypes)
+
+    @pytest.mark.parametrize("max_timesteps", [None, 2, 6])
+    def test_to_array3d(self, multiindex_timeseries_df: pd.DataFrame, max_timesteps):
+        r = ragged.RaggedTimeSeries.from_dataframe(multiindex_timeseries_df)
+        array = r.to_array3d(padding_indicator=PAD, max_timesteps=max_timesteps)
+        expected = np.full((3, 6, 2), PAD)
+        expected[0, :4] = [[11, 1.1], [12, 1.2], [13, 1.3], [14, 1.4]]
+        expected[1, :2] = [[21, 2.1], [22, 2.2]]
+        expected[2, :1] = [[31, 3.1]]
+        n_timesteps = 4 if max_timesteps is None else max_timesteps
+        assert array.shape == (3, n_timesteps, 2)
+        assert (array == expected[:, :n_timesteps, :]).all()
+
+    def test_from_array3d(self):
+        array = np.asarray(
+            [
+                [[1.0, 10.0], [2.0, 20.0], [3.0, 30.0]],
+                [[4.0, 40.0], [PAD, PAD], [PAD, PAD]],
+            ]
+        )
+        r = ragged.RaggedTimeSeries.from_array3d(
+            array,
+            padding_indicator=PAD,
+            sample_index=["s1", "s2"],
+            time_indexes=[[0.5, 1.5, 2.5], [7.0]],
+            feature_index=["f1", "f2"],
+        )
+        assert list(r.lengths) == [3, 1]
+        assert list(r.time_index) == [0.5, 1.5, 2.5, 7.0]
+        assert r.feature_index == ["f1", "f2"]
+        assert (r.to_array3d(padding_indicator=PAD) == array).all()
+
+    def test_from_array3d_defaults(self):
+        r = ragged.RaggedTimeSeries.from_array3d(np.ones((2, 3, 1)))
+        assert list(r.sample_index) == [0, 1]
+        assert [list(x) for x in r.time_indexes()] == [[0, 1, 2], [0, 1, 2]]
+        assert r.feature_index == ["feat_0"]
+
+    def test_from_array3d_fails_time_indexes_mismatch(self):
+        with pytest.raises(ValueError, match=".*time_indexes.*"):
+            ragged.RaggedTimeSeries.from_array3d(np.ones((2, 3, 1)), time_indexes=[[0, 1], [0, 1, 2]])
+
+    @pytest.mark.parametrize(
+        "key, expected_sample_index, expected_time_indexes",
+        [
+            (0, ["a"], [[1, 2, 3, 4]]),
+            ([2, 0], ["c", "a"], [[9], [1, 2, 3, 4]]),
+            (slice(1, None), ["b", "c"], [[2, 4], [9]]),
+            (slice(None, None, 2), ["a", "c"], [[1, 2, 3, 4], [9]]),
+        ],
+    )
+    def test_take(self, multiindex_timeseries_df: pd.DataFrame, key, expected_sample_index, expected_time_indexes):
+        r = ragged.RaggedTimeSeries.from_dataframe(multiindex_timeseries_df)
+        r_selected = r[key]
+        assert list(r_selected.sample_index) == expected_sample_index
+        assert [list(x) for x in r_selected.time_indexes()] == expected_time_indexes
+        df_expected = multiindex_timeseries_df.loc[(expected_sample_index, slice(None)), :]
+        assert (r_selected.to_dataframe().to_numpy() == df_expected.to_numpy()).all()
+
+    def test_take_slice_is_view(self, multiindex_timeseries_df: pd.DataFrame):
+        r = ragged.RaggedTimeSeries.from_dataframe(multiindex_timeseries_df)
+        assert np.shares_memory(r[1:3].values, r.values)
+
+    @pytest.mark.parametrize(
+        "offsets, match",
+        [
+            ([0, 4, 6], ".*len.*sample_index.*"),
+            ([1, 4, 6, 7], ".*non-decreasing.*"),
+            ([0, 4, 3, 7], ".*non-decreasing.*"),
+        ],
+    )
+    def test_init_fails(self, offsets, match):
+        with pytest.raises(ValueError, match=match):
+            ragged.RaggedTimeSeries(
+                np.ones((7, 1)),
+                np.asarray(offsets),
+                sample_index=["a", "b", "c"],
+                time_index=list(range(7)),
+                feature_index=["f"],
+            )
+
+    def test_concat(self, multiindex_timeseries_df: pd.DataFrame):
+        rag = ragged.RaggedTimeSeries.from_dataframe(multiindex_timeseries_df)
+
+        concatenated = ragged.RaggedTimeSeries.concat([rag[[2]], rag[[0]], rag[[1]]])
+
+        assert list(concatenated.sample_index) == ["c", "a", "b"]
+        assert (concatenated.offsets == np.asarray([0, 1, 5, 7])).all()
+        assert [list(ti) for ti in concatenated.time_indexes()] == [[9], [1, 2, 3, 4], [2, 4]]
+        assert (concatenated.sample_values(1) == rag.sample_values(0)).all()
@@ -1,6 +1,7 @@
 # pylint: disable=redefined-outer-name
 
 import dataclasses
+import pickle
 import re
 from typing import List, Tuple
 from unittest.mock import Mock
@@ -10,7 +11,7 @@ import pandas as pd
 import pytest
 
 import tempor.exc
-from tempor.data import data_typing, samples
+from tempor.data import data_typing, pandera_utils, samples, utils
 
 PAD = 999.0
 
@@ -224,6 +225,31 @@ def array_event() -> np.ndarray:
     return dfs_test.df_event_success[0].to_numpy()
 
 
+@pytest.mark.parametrize(
+    "samples_cls, df_fixture, kwargs",
+    [
+        (samples.StaticSamples, "df_static", dict()),
+        (samples.TimeSeriesSamples, "df_time_series", dict()),
+        (samples.TimeSeriesSamples, "df_time_series", dict(backend="ragged")),
+        (samples.EventSamples, "df_event", dict()),
+    ],
+)
+def test_init_fast_mode_same_as_validated(samples_cls, df_fixture: str, kwargs, request):
+    df = request.getfixturevalue(df_fixture).copy()
+    df.index = df.index.set_names([None] * df.index.nlevels)
+
+    validated = samples_cls(df, **kwargs)
+    with tempor.fast_mode():
+        fast = samples_cls(df, **kwargs)
+
+    pd.testing.assert_frame_equal(fast.dataframe(), validated.dataframe())
+    assert list(fast.dataframe().index.names) == list(validated.dataframe().index.names)
+    # The caller's data is neither modified nor shared.
+    assert list(df.index.names) == [None] * df.index.nlevels
+    df.iloc[0, 0] = df.iloc[1, 0]
+    pd.testing.assert_frame_equal(fast.dataframe(), validated.dataframe())
+
+
 class TestStaticSamples:
     def test_modality(self, df_static: pd.DataFrame):
         s = samples.StaticSamples(data=df_static)
@@ -296,6 +322,95 @@ class TestStaticSamples:
     def test_init_array_data_success(self, array_static: np.ndarray):
         samples.StaticSamples(data=array_static)
 
+    def test_append_samples(self, df_static: pd.DataFrame, monkeypatch):
+        s = samples.StaticSamples(data=df_static)
+        validate = Mock()
+        monkeypatch.setattr(samples.StaticSamples, "_validate", validate)
+
+        combined = s[:2].append_samples(s[2:])
+
+        validate.assert_not_called()
+        assert isinstance(combined, samples.StaticSamples)
+        pd.testing.assert_frame_equal(combined.dataframe(), s.dataframe())
+
+    def test_append_samples_different_dtypes_validated(self):
+        s = samples.StaticSamples(pd.DataFrame({"a": [1, 2]}, index=[0, 1]))
+        other = samples.StaticSamples(pd.DataFrame({"a": [1.5]}, index=[2]))
+
+        combined = s.append_samples(other)
+
+        assert combined.dataframe()["a"].tolist() == [1.0, 2.0, 1.5]
+        assert combined._validated is not None  # pylint: disable=protected-access
+
+    def test_append_samples_fails_overlapping(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+        with pytest.raises(ValueError, match=".*overlapping sample indexes.*"):
+            s.append_samples(s[[0]])
+
+    def test_append_samples_fails_features(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+        other = samples.StaticSamples(s.dataframe().iloc[:1, :1].rename(index=lambda x: "new"))
+        with pytest.raises(ValueError, match=".*different features.*"):
+            s.append_samples(other)
+
+    def test_fingerprint(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+        fingerprint = s.fingerprint()
+
+        assert fingerprint == samples.StaticSamples(data=df_static.copy()).fingerprint()
+        assert fingerprint == s[:2].append_samples(s[2:]).fingerprint()
+        assert fingerprint != s[:2].fingerprint()
+        changed = df_static.copy()
+        changed["num_feat_1"] += 1
+        assert fingerprint != samples.StaticSamples(data=changed).fingerprint()
+
+    def test_compact(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+
+        compacted = s.compact()
+
+        assert compacted.dataframe().dtypes["num_feat_1"] == np.float32
+        assert compacted.dataframe().dtypes["cat_feat_1"] == "category"
+        assert compacted.numpy().dtype == object  # Because of the categorical features.
+        assert compacted[:2].dataframe().dtypes.equals(compacted.dataframe().dtypes)
+        assert compacted.compact() is compacted
+
+    def test_fingerprint_cached(self, df_static: pd.DataFrame, monkeypatch):
+        s = samples.StaticSamples(data=df_static)
+        fingerprint = s.fingerprint()
+        content_hash = Mock(wraps=utils.content_hash)
+        monkeypatch.setattr(utils, "content_hash", content_hash)
+
+        assert s.fingerprint() == fingerprint
+        content_hash.assert_not_called()
+
+        s._data = df_static.iloc[:2]  # pylint: disable=protected-access
+
+        assert s.fingerprint() != fingerprint
+        content_hash.assert_called_once()
+
+    def test_fingerprint_modified_in_place(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+        fingerprint = s.fingerprint()
+
+        df = s.dataframe()
+        df.loc[df.index[0], df.select_dtypes("number").columns[0]] += 1
+
+        # In-place modification is not detected by the cache.
+        assert s.fingerprint() == fingerprint
+        assert s.fingerprint(use_cache=False) != fingerprint
+        assert s.fingerprint(use_cache=False) == samples.StaticSamples(data=s.dataframe().copy()).fingerprint()
+
+    def test_init_fast_mode_skips_validation(self, df_static: pd.DataFrame, monkeypatch):
+        validate = Mock()
+        monkeypatch.setattr(samples.StaticSamples, "validate", validate)
+        with tempor.fast_mode():
+            s = samples.StaticSamples(data=df_static)
+        validate.assert_not_called()
+        assert s.num_samples == len(df_static)
+        samples.StaticSamples(data=df_static)
+        validate.assert_called_once()
+
     def test_short_repr(self, df_static: pd.DataFrame):
         s = samples.StaticSamples.from_dataframe(df_static)
         assert s.short_repr() == "StaticSamples([10, 4])"
@@ -597,6 +712,26 @@ class TestTimeSeriesSamples:
         assert all(issubclass(type(x), float) for x in float_time_index[0])
         assert all(issubclass(type(x), float) for x in float_time_index[1])
 
+    def test_time_indexes_float_ragged(self):
+        df = pd.DataFrame(
+            {
+                "sample_idx": ["s1", "s1", "s2"],
+                "time_idx": pd.to_datetime(["2000-01-02 15:31", "2000-02-03 23:11", "2020-01-01 00:15"]),
+                "feat_1": [11, 12, 21],
+            }
+        )
+        df.set_index(keys=["sample_idx", "time_idx"], drop=True, inplace=True)
+        s = samples.TimeSeriesSamples.from_dataframe(df)
+
+        values, offsets = s.time_indexes_float_ragged()
+
+        assert list(offsets) == [0, 2, 3]
+        assert values.dtype == float
+        assert not values.flags.writeable
+        for ti_float, ti in zip(s.time_indexes_float(), s.time_indexes()):
+            assert (ti_float == utils.datetime_time_index_to_float(ti)).all()
+        assert s.time_indexes_float_ragged()[0] is values  # Cached.
+
     def test_num_timesteps(self, df_time_series: pd.DataFrame):
         s = samples.TimeSeriesSamples.from_dataframe(df_time_series)
         assert s.num_timesteps() == [4, 2, 1]
@@ -605,6 +740,87 @@ class TestTimeSeriesSamples:
         s = samples.TimeSeriesSamples.from_dataframe(df_time_series)
         assert s.num_timesteps_as_dict() == {"a": 4, "b": 2, "c": 1}
 
+    def test_index_metadata(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples.from_dataframe(df_time_series)
+        metadata = s.index_metadata()
+
+        assert list(metadata.sample_index) == ["a", "b", "c"]
+        assert list(metadata.offsets) == [0, 4, 6, 7]
+        assert list(metadata.lengths) == [4, 2, 1]
+        assert list(metadata.time_index) == [1, 2, 3, 4, 2, 4, 9]
+        assert metadata.row_order is None
+        assert not metadata.lengths.flags.writeable
+        assert s.index_metadata() is metadata  # Cached.
+
+    def test_index_metadata_invalidated(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples.from_dataframe(df_time_series)
+        metadata = s.index_metadata()
+
+        s._data = df_time_series.iloc[:4]  # pylint: disable=protected-access
+
+        assert s.index_metadata() is not metadata
+        assert s.num_timesteps() == [4]
+
+    def test_fingerprint(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples.from_dataframe(df_time_series)
+        fingerprint = s.fingerprint()
+
+        assert fingerprint == s.fingerprint()
+        assert fingerprint == samples.TimeSeriesSamples(data=df_time_series, backend="ragged").fingerprint()
+        # Rows of the samples not contiguous:
+        assert fingerprint == samples.TimeSeriesSamples(df_time_series.iloc[[0, 4, 1, 6, 2, 5, 3], :]).fingerprint()
+        assert fingerprint != s[:2].fingerprint()
+        changed = df_time_series.copy()
+        changed.iloc[-1, -1] += 1
+        assert fingerprint != samples.TimeSeriesSamples(data=changed).fingerprint()
+
+    @pytest.mark.parametrize("backend", ["dataframe", "ragged"])
+    def test_compact(self, backend, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend=backend)
+
+        compacted = s.compact(downcast_int=True)
+
+        assert compacted.dataframe().dtypes.tolist() == [np.int8, np.float32]
+        pd.testing.assert_frame_equal(compacted.dataframe(), s.dataframe(), check_dtype=False)
+        assert compacted.numpy(padding_indicator=999.0).dtype == np.float32
+
+    def test_compact_ragged_float(self):
+        s = samples.TimeSeriesSamples.from_numpy(np.random.rand(3, 4, 2), backend="ragged")
+
+        compacted = s.compact()
+
+        assert compacted.ragged_array().values.dtype == np.float32
+        assert compacted.compact() is compacted
+
+    def test_fingerprint_invalidated(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples.from_dataframe(df_time_series)
+        fingerprint = s.fingerprint()
+
+        s._data = df_time_series.iloc[:4]  # pylint: disable=protected-access
+
+        assert s.fingerprint() != fingerprint
+        assert s.fingerprint() == samples.TimeSeriesSamples(df_time_series.iloc[:4]).fingerprint()
+
+    def test_index_metadata_noncontiguous_samples(self, df_time_series: pd.DataFrame):
+        df = df_time_series.iloc[[0, 4, 1, 6, 2, 5, 3], :]
+        s = samples.TimeSeriesSamples.from_dataframe(df, _skip_validate=True)
+
+        assert s.sample_index() == ["a", "b", "c"]
+        assert s.time_indexes() == [[1, 2, 3, 4], [2, 4], [9]]
+        assert [list(x.index) for x in s.list_of_dataframes()] == [
+            list(df_time_series.index[:4]),
+            list(df_time_series.index[4:6]),
+            list(df_time_series.index[6:]),
+        ]
+
+    def test_index_metadata_ragged(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+        metadata = s.index_metadata()
+
+        assert list(metadata.offsets) == [0, 4, 6, 7]
+        assert s.time_indexes_as_dict() == {"a": [1, 2, 3, 4], "b": [2, 4], "c": [9]}
+        assert s.num_timesteps_as_dict() == {"a": 4, "b": 2, "c": 1}
+
     @pytest.mark.parametrize(
         "samples, expected",
         [
@@ -667,6 +883,165 @@ class TestTimeSeriesSamples:
         assert s.sample_index() == expected_sample_index
 
 
+class TestTimeSeriesSamplesAppend:
+    @pytest.fixture
+    def df_new_timesteps(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {"feat_1": [15, 32, 33], "feat_2": [1.5, 3.2, 3.3]},
+            index=pd.MultiIndex.from_tuples([("c", 10), ("a", 5), ("c", 11)], names=["sample_idx", "time_idx"]),
+        )
+
+    @pytest.mark.parametrize("backend", ["dataframe", "ragged"])
+    def test_append_samples(self, backend, df_time_series: pd.DataFrame, monkeypatch):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend=backend)
+        validate = Mock()
+        monkeypatch.setattr(samples.TimeSeriesSamples, "_validate", validate)
+
+        combined = s[[2]].append_samples(s[[0, 1]])
+
+        validate.assert_not_called()
+        assert combined.backend == backend
+        assert combined.sample_index() == ["c", "a", "b"]
+        assert combined.time_indexes() == [[9], [1, 2, 3, 4], [2, 4]]
+        pd.testing.assert_frame_equal(combined.dataframe().loc[["a", "b"]], s.dataframe().loc[["a", "b"]])
+
+    def test_concat_mixed_backends(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        s_ragged = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+
+        combined = samples.concat([s_ragged[[0]], s[[1]], s_ragged[[2]]])
+
+        assert combined.backend == "ragged"  # type: ignore
+        pd.testing.assert_frame_equal(combined.dataframe(), s.dataframe())
+
+    def test_append_samples_different_dtypes_validated(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        other = samples.TimeSeriesSamples(
+            pd.DataFrame({"feat_1": [1.5], "feat_2": [1.0]}, index=pd.MultiIndex.from_tuples([("d", 1)]))
+        )
+
+        combined = s.append_samples(other)
+
+        assert combined.dataframe()["feat_1"].dtype == float
+        assert combined.sample_index() == ["a", "b", "c", "d"]
+
+    def test_append_samples_fails_overlapping(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        with pytest.raises(ValueError, match=".*overlapping sample indexes.*'b'.*"):
+            s[:2].append_samples(s[1:])
+
+    @pytest.mark.parametrize("backend", ["dataframe", "ragged"])
+    def test_append_timesteps(self, backend, df_time_series: pd.DataFrame, df_new_timesteps: pd.DataFrame, monkeypatch):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend=backend)
+        new = samples.TimeSeriesSamples(data=df_new_timesteps)
+        validate = Mock()
+        monkeypatch.setattr(samples.TimeSeriesSamples, "_validate", validate)
+
+        combined = s.append_timesteps(new)
+
+        validate.assert_not_called()
+        assert combined.backend == backend
+        assert combined.sample_index() == ["a", "b", "c"]
+        assert combined.time_indexes() == [[1, 2, 3, 4, 5], [2, 4], [9, 10, 11]]
+        assert combined.dataframe().loc[("c", 11), "feat_2"] == 3.3
+        assert combined.dataframe().loc[("a", 5), "feat_1"] == 32
+        assert combined.dataframe().dtypes.equals(df_time_series.dtypes)
+        assert s.num_timesteps() == [4, 2, 1]  # Unchanged.
+
+    def test_append_timesteps_noncontiguous_samples(self, df_time_series: pd.DataFrame, df_new_timesteps):
+        s = samples.TimeSeriesSamples(data=df_time_series.iloc[[0, 4, 1, 6, 2, 3, 5]])
+        combined = s.append_timesteps(samples.TimeSeriesSamples(data=df_new_timesteps))
+        assert combined.sample_index() == ["a", "b", "c"]
+        assert combined.time_indexes() == [[1, 2, 3, 4, 5], [2, 4], [9, 10, 11]]
+
+    def test_append_timesteps_fails_sample_not_present(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        with pytest.raises(ValueError, match=".*not present.*'c'.*"):
+            s[:2].append_timesteps(s[2:])
+
+    def test_append_timesteps_fails_overlapping(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        with pytest.raises(ValueError, match=r".*already present.*\('b', 4\).*"):
+            s.append_timesteps(s[[1]])
+
+    def test_append_timesteps_fails_features(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series)
+        other = samples.TimeSeriesSamples(data=df_time_series.iloc[:1, :1].rename(index={1: 100}, level=1))
+        with pytest.raises(ValueError, match=".*different features.*"):
+            s.append_timesteps(other)
+
+
+class TestTimeSeriesSamplesRaggedBackend:
+    def test_same_as_dataframe_backend(self, df_time_series: pd.DataFrame):
+        s_df = samples.TimeSeriesSamples(data=df_time_series)
+        s = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+
+        assert s.backend == "ragged"
+        assert s_df.backend == "dataframe"
+        assert s.num_samples == s_df.num_samples
+        assert s.num_features == s_df.num_features
+        assert s.sample_index() == s_df.sample_index()
+        assert s.time_indexes() == s_df.time_indexes()
+        assert s.time_indexes_as_dict() == s_df.time_indexes_as_dict()
+        assert s.num_timesteps() == s_df.num_timesteps()
+        assert (s.numpy(padding_indicator=PAD) == s_df.numpy(padding_indicator=PAD)).all()
+        assert s.dataframe().equals(s_df.dataframe())
+        assert s.short_repr() == s_df.short_repr()
+
+    def test_dataframe_not_stored(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+        assert s._df is None  # pylint: disable=protected-access
+        assert s.ragged_array() is s.ragged_array()
+
+    def test_validate_builds_dataframe_once(self, df_time_series: pd.DataFrame, monkeypatch):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+        to_dataframe = Mock(wraps=s.ragged_array().to_dataframe)
+        monkeypatch.setattr(s.ragged_array(), "to_dataframe", to_dataframe)
+
+        s.validate()
+
+        to_dataframe.assert_called_once()
+        assert s._df is None  # pylint: disable=protected-access
+
+    def test_numpy_fails_padding_found(self, df_time_series: pd.DataFrame):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+        with pytest.raises(ValueError, match=".*padding.*"):
+            s.numpy(padding_indicator=11)
+
+    def test_from_numpy(self):
+        array = np.asarray([[[1.0], [2.0], [3.0]], [[4.0], [PAD], [PAD]]])
+        s = samples.TimeSeriesSamples.from_numpy(array, padding_indicator=PAD, backend="ragged")
+        assert s.backend == "ragged"
+        assert s.num_timesteps() == [3, 1]
+        assert (s.numpy(padding_indicator=PAD) == array).all()
+
+    def test_from_ragged(self, df_time_series: pd.DataFrame):
+        s_df = samples.TimeSeriesSamples(data=df_time_series)
+        s = samples.TimeSeriesSamples.from_ragged(s_df.ragged_array())
+        assert s.backend == "ragged"
+        assert s.dataframe().equals(s_df.dataframe())
+
+    def test_init_fail(self):
+        df = dfs_test.df_time_series_fail[0][0]
+        with pytest.raises(tempor.exc.DataValidationException):
+            samples.TimeSeriesSamples(data=df, backend="ragged")
+
+    @pytest.mark.parametrize(
+        "key, expected_sample_index",
+        [
+            (0, ["a"]),
+            ([0, 2], ["a", "c"]),
+            (slice(1, None), ["b", "c"]),
+        ],
+    )
+    def test_getitem(self, df_time_series: pd.DataFrame, key, expected_sample_index):
+        s = samples.TimeSeriesSamples(data=df_time_series, backend="ragged")
+        s = s[key]
+        assert isinstance(s, samples.TimeSeriesSamples)
+        assert s.backend == "ragged"
+        assert s.sample_index() == expected_sample_index
+
+
 class TestEventSamples:
     def test_modality(self, df_event: pd.DataFrame):
         s = samples.EventSamples(data=df_event)
@@ -689,6 +1064,38 @@ class TestEventSamples:
         s = samples.EventSamples(data=df_event)
         assert (s.numpy() == s._data.to_numpy()).all()  # pylint: disable=protected-access
 
+    def test_append_samples(self, df_event: pd.DataFrame, monkeypatch):
+        s = samples.EventSamples(data=df_event)
+        validate = Mock()
+        monkeypatch.setattr(samples.EventSamples, "_validate", validate)
+
+        combined = s[[2]].append_samples(s[:2])
+
+        validate.assert_not_called()
+        assert combined.sample_index() == ["sample_3", "sample_1", "sample_2"]
+        pd.testing.assert_frame_equal(combined.dataframe(), s.dataframe().iloc[[2, 0, 1]])
+        times, _ = combined.split_as_two_dataframes()
+        assert times.dtypes.equals(s.split_as_two_dataframes()[0].dtypes)
+
+    def test_fingerprint(self, df_event: pd.DataFrame):
+        s = samples.EventSamples(data=df_event)
+        fingerprint = s.fingerprint()
+
+        assert fingerprint == samples.EventSamples(data=df_event.copy()).fingerprint()
+        assert fingerprint != s[:2].fingerprint()
+        times, values = s.split_as_two_dataframes()
+        values.iloc[0, 0] = not values.iloc[0, 0]
+        assert fingerprint != samples.EventSamples.from_arrays(times.to_numpy(), values.to_numpy()).fingerprint()
+
+    def test_compact(self, df_event: pd.DataFrame):
+        s = samples.EventSamples(data=df_event)
+        assert s.compact(downcast_int=True) is s
+
+    def test_append_samples_fails_overlapping(self, df_event: pd.DataFrame):
+        s = samples.EventSamples(data=df_event)
+        with pytest.raises(ValueError, match=".*overlapping sample indexes.*"):
+            s.append_samples(s[[1]])
+
     def test_from_dataframe(self, df_event: pd.DataFrame):
         s = samples.EventSamples.from_dataframe(df_event)
         assert s.dataframe().equals(df_event)
@@ -709,6 +1116,44 @@ class TestEventSamples:
         assert list(df.index) == expected_sample_index
         assert list(df.columns) == expected_feature_index
 
+    def test_from_arrays(self, df_event: pd.DataFrame):
+        s = samples.EventSamples(data=df_event)
+        df_event_time, df_event_value = s.split_as_two_dataframes()
+
+        s_from_arrays = samples.EventSamples.from_arrays(
+            df_event_time.to_numpy(),
+            df_event_value.to_numpy(),
+            sample_index=s.sample_index(),
+            feature_index=list(df_event.columns),
+        )
+
+        assert s_from_arrays.split().equals(s.split())
+        assert s_from_arrays.dataframe().equals(s.dataframe())
+        assert s_from_arrays.dataframe().index.name == s.dataframe().index.name
+
+    def test_from_arrays_default_indexes(self):
+        s = samples.EventSamples.from_arrays(np.asarray([[1.0, 2.0], [3.0, 4.0]]), np.asarray([[True, False]] * 2))
+
+        assert s.sample_index() == [0, 1]
+        assert list(s.dataframe().columns) == ["feat_0", "feat_1"]
+        assert s.dataframe().iloc[1, 0] == (3.0, True)
+
+    def test_from_arrays_fails_validation(self):
+        with pytest.raises(tempor.exc.DataValidationException) as excinfo:
+            samples.EventSamples.from_arrays(np.asarray([[1.0], [2.0]]), np.asarray([[0.5], [1.5]]))
+        assert re.search(r".*feat_0.*type.*UnionDtype.*", str(excinfo.getrepr()), re.S | re.IGNORECASE)
+
+    def test_from_arrays_fails_shape_mismatch(self):
+        with pytest.raises(ValueError, match=".*same shape.*"):
+            samples.EventSamples.from_arrays(np.ones((3, 2)), np.ones((3, 1), dtype=bool))
+
+    def test_dataframe_not_stored(self, df_event: pd.DataFrame):
+        s = samples.EventSamples(data=df_event)
+
+        s.dataframe().iloc[0, 0] = (100, False)
+
+        assert s.dataframe().equals(df_event)
+
     def test_sample_index(self, df_event: pd.DataFrame):
         s = samples.EventSamples.from_dataframe(df_event)
         assert s.sample_index() == [f"sample_{x}" for x in range(1, 3 + 1)]
@@ -792,10 +1237,19 @@ class TestEventSamples:
         assert s_split_df_event_time.equals(expected_df_event_time)
         assert s_split_df_event_value.equals(expected_df_event_value)
 
-    def test_split_fails_column_naming_conflict(self):
+    def test_split_as_two_dataframes_getitem(self, df_event: pd.DataFrame):
+        s = samples.EventSamples(data=df_event)
+        df_event_time, df_event_value = s.split_as_two_dataframes()
+
+        s_sub_event_time, s_sub_event_value = s[[2, 0]].split_as_two_dataframes()
+
+        assert s_sub_event_time.equals(df_event_time.iloc[[2, 0]])
+        assert s_sub_event_value.equals(df_event_value.iloc[[2, 0]])
+
+    def test_split_fails_column_naming_conflict(self, monkeypatch):
         df = pd.DataFrame({"feat_1_time": [(5, True), (6, False), (3, True)]})
 
-        samples.EventSamples.validate = Mock()  # Skip validation.
+        monkeypatch.setattr(samples.EventSamples, "validate", Mock())  # Skip validation.
 
         s = samples.EventSamples(data=df)
 
@@ -829,3 +1283,176 @@ class TestEventSamples:
         s = s[key]
         assert isinstance(s, samples.EventSamples)
         assert s.sample_index() == expected_sample_index
+
+
+class TestSamplesView:
+    @pytest.fixture
+    def s(self) -> samples.StaticSamples:
+        df = pd.DataFrame(
+            {
+                "sample_idx": [f"sample_{x}" for x in range(1, 10 + 1)],
+                "feat_1": [float(x) for x in range(1, 10 + 1)],
+            },
+        )
+        df.set_index("sample_idx", drop=True, inplace=True)
+        return samples.StaticSamples.from_dataframe(df)
+
+    @pytest.mark.parametrize(
+        "key, expected_sample_index",
+        [
+            (0, ["sample_1"]),
+            ([1, 5, 7], ["sample_2", "sample_6", "sample_8"]),
+            (slice(7, None), ["sample_8", "sample_9", "sample_10"]),
+        ],
+    )
+    def test_materialize(self, s: samples.StaticSamples, key, expected_sample_index):
+        view = samples.SamplesView(s, key)
+        assert len(view) == len(expected_sample_index)
+        materialized = samples.materialize(view)
+        assert isinstance(materialized, samples.StaticSamples)
+        assert materialized.sample_index() == expected_sample_index
+
+    def test_materialize_passthrough(self, s: samples.StaticSamples):
+        assert samples.materialize(s) is s
+
+    def test_of_composes(self, s: samples.StaticSamples):
+        view = samples.SamplesView.of(samples.SamplesView.of(s, slice(2, 8)), [4, 0])
+        assert view.source is s
+        assert list(view.key) == [6, 2]
+        assert view.materialize().sample_index() == ["sample_7", "sample_3"]
+
+    def test_pickle(self, s: samples.StaticSamples):
+        unpickled = pickle.loads(pickle.dumps(samples.SamplesView(s, [0, 9])))
+        assert isinstance(unpickled, samples.StaticSamples)
+        assert unpickled.sample_index() == ["sample_1", "sample_10"]
+
+
+class TestValidationIncremental:
+    @pytest.fixture
+    def df(self) -> pd.DataFrame:
+        index = pd.MultiIndex.from_product([["a", "b", "c"], [1.0, 2.0, 3.0]])
+        return pd.DataFrame({"feat_1": np.arange(9.0), "feat_2": np.arange(9)}, index=index)
+
+    def test_schemas_cached(self, df: pd.DataFrame):
+        samples.TimeSeriesSamples(df)
+        hits = pandera_utils.schema_cache.hits
+        s = samples.TimeSeriesSamples(df * 2)
+        assert pandera_utils.schema_cache.hits == hits + 1
+        assert s._schema is samples.TimeSeriesSamples(df)._schema  # pylint: disable=protected-access
+
+    def test_reference(self, df: pd.DataFrame, monkeypatch):
+        reference = samples.TimeSeriesSamples(df)
+        derived = reference.dataframe() * 2.0
+
+        full_validate = Mock()
+        monkeypatch.setattr(samples.TimeSeriesSamples, "_validate", full_validate)
+        s = samples.TimeSeriesSamples.from_dataframe(derived, _reference=reference)
+
+        full_validate.assert_not_called()
+        assert s.dataframe().equals(derived)
+        assert list(s.dataframe().index.names) == ["sample_idx", "time_idx"]
+
+    def test_reference_index_differs(self, df: pd.DataFrame, monkeypatch):
+        reference = samples.TimeSeriesSamples(df)
+        derived = reference.dataframe().iloc[:-1]
+
+        full_validate = Mock()
+        monkeypatch.setattr(samples.TimeSeriesSamples, "_validate", full_validate)
+        samples.TimeSeriesSamples.from_dataframe(derived, _reference=reference)
+
+        full_validate.assert_called_once()
+
+    def test_reference_changed_column_fails(self, df: pd.DataFrame):
+        reference = samples.TimeSeriesSamples(df)
+        derived = reference.dataframe().copy()
+        derived["feat_2"] = "string values"
+
+        with pytest.raises(tempor.exc.DataValidationException):
+            samples.TimeSeriesSamples.from_dataframe(derived, _reference=reference)
+
+    def test_reference_static(self):
+        df = pd.DataFrame({"feat_1": [1.0, np.nan, 3.0]}, index=["a", "b", "c"])
+        reference = samples.StaticSamples(df)
+        derived = reference.dataframe().fillna(0.0)
+        derived["feat_new"] = [True, False, True]
+
+        s = samples.StaticSamples.from_dataframe(derived, _reference=reference)
+        assert s.dataframe().equals(derived)
+
+        derived["feat_new"] = ["x", "y", "z"]
+        with pytest.raises(tempor.exc.DataValidationException):
+            samples.StaticSamples.from_dataframe(derived, _reference=reference)
+
+
+class TestConcat:
+    def test_concat(self, df_static: pd.DataFrame):
+        s = samples.StaticSamples(data=df_static)
+        combined = samples.concat([s[[2]], samples.SamplesView.of(s, [0]), s[[1]]])
+        assert combined.sample_index() == [s.sample_index()[i] for i in [2, 0, 1]]
+
+    def test_concat_fails_empty(self):
+        with pytest.raises(ValueError, match=".*No data samples.*"):
+            samples.concat([])
+
+    def test_concat_fails_different_types(self, df_static: pd.DataFrame, df_event: pd.DataFrame):
+        with pytest.raises(TypeError, match=".*different types.*"):
+            samples.concat([samples.StaticSamples(data=df_static), samples.EventSamples(data=df_event)])
+
+
+class _MinimalSamples(samples.DataSamples):
+    # A data samples type that only implements the abstract methods, e.g. one defined outside of TemporAI.
+    modality = data_typing.DataModality.STATIC
+
+    def __init__(self, data: pd.DataFrame, **kwargs) -> None:
+        self._data = data
+        super().__init__(data, _skip_validate=True)
+
+    def _validate(self) -> None:
+        pass
+
+    @staticmethod
+    def from_numpy(array: np.ndarray, **kwargs) -> "_MinimalSamples":
+        return _MinimalSamples(pd.DataFrame(array))
+
+    @staticmethod
+    def from_dataframe(dataframe: pd.DataFrame, **kwargs) -> "_MinimalSamples":
+        return _MinimalSamples(dataframe)
+
+    def numpy(self, **kwargs) -> np.ndarray:
+        return self._data.to_numpy()
+
+    def dataframe(self, **kwargs) -> pd.DataFrame:
+        return self._data
+
+    @property
+    def num_samples(self) -> int:
+        return self._data.shape[0]
+
+    def sample_index(self) -> data_typing.SampleIndex:
+        return list(self._data.index)
+
+    @property
+    def num_features(self) -> int:
+        return self._data.shape[1]
+
+    def short_repr(self) -> str:
+        return "_MinimalSamples"
+
+    def __getitem__(self, key: data_typing.GetItemKey) -> "_MinimalSamples":
+        return _MinimalSamples(self._data.iloc[key])
+
+
+class TestDataSamplesDefaults:
+    def test_concat_not_supported(self, df_static: pd.DataFrame):
+        s = _MinimalSamples(df_static)
+        with pytest.raises(NotImplementedError, match=".*_MinimalSamples.*"):
+            samples.concat([s, s])
+
+    def test_fingerprint(self, df_static: pd.DataFrame):
+        s = _MinimalSamples(df_static)
+        assert s.fingerprint() == _MinimalSamples(df_static.copy()).fingerprint()
+        assert s.fingerprint() != _MinimalSamples(df_static.iloc[:2]).fingerprint()
+
+    def test_compact(self, df_static: pd.DataFrame):
+        s = _MinimalSamples(df_static)
+        assert s.compact() is s
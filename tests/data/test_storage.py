@@ -0,0 +1,193 @@
+# pylint: disable=redefined-outer-name
+
+import json
+import pickle
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tempor.data import dataset, samples, storage
+
+
+def assert_samples_equal(a, b):
+    if a is None or b is None:
+        assert a is None and b is None
+    else:
+        assert type(a) is type(b)
+        pd.testing.assert_frame_equal(a.dataframe(), b.dataframe())
+
+
+def assert_datasets_equal(a: dataset.BaseDataset, b: dataset.BaseDataset):
+    assert type(a) is type(b)
+    assert_samples_equal(a.time_series, b.time_series)
+    assert_samples_equal(a.static, b.static)
+    if a.predictive is None or b.predictive is None:
+        assert a.predictive is None and b.predictive is None
+    else:
+        assert type(a.predictive) is type(b.predictive)
+        assert_samples_equal(a.predictive.targets, b.predictive.targets)
+        assert_samples_equal(a.predictive.treatments, b.predictive.treatments)
+
+
+@pytest.fixture
+def time_to_event_data() -> dataset.TimeToEventAnalysisDataset:
+    time_series = pd.DataFrame(
+        {"a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], "b": [1, 2, 3, 4, 5, 6]},
+        index=pd.MultiIndex.from_tuples([("s1", 0.5), ("s1", 1.5), ("s2", 0.1), ("s3", 1.0), ("s3", 2.0), ("s3", 3.0)]),
+    )
+    static = pd.DataFrame({"c": pd.Categorical(["x", "y", "x"]), "d": [0.1, 0.2, 0.3]}, index=["s1", "s2", "s3"])
+    targets = pd.DataFrame({"e": [(5.0, True), (2.5, False), (7.0, True)]}, index=["s1", "s2", "s3"])
+    return dataset.TimeToEventAnalysisDataset(time_series, static=static, targets=targets)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "sine_data_small",
+        "sine_data_missing_small",
+        "sine_data_temporal_small",
+        "clv_data_small",
+    ],
+)
+@pytest.mark.parametrize("mmap_mode", ["c", "r", None])
+def test_save_load(data: str, mmap_mode, get_dataset: Callable, tmp_path):
+    data = get_dataset(data)
+
+    storage.save_dataset(data, tmp_path)
+    loaded = storage.load_dataset(tmp_path, mmap_mode=mmap_mode)
+
+    assert_datasets_equal(loaded, data)
+    rag = loaded.time_series.ragged_array()
+    for array in (rag.values, np.asarray(rag.sample_index), np.asarray(rag.time_index)):
+        assert isinstance(array.base, np.memmap) is (mmap_mode is not None)
+
+
+def test_save_load_time_to_event(time_to_event_data: dataset.TimeToEventAnalysisDataset, tmp_path):
+    time_to_event_data.save(tmp_path)
+    loaded = dataset.TimeToEventAnalysisDataset.load(tmp_path)
+
+    assert_datasets_equal(loaded, time_to_event_data)
+    assert loaded.static is not None
+    assert loaded.static.dataframe()["c"].dtype == time_to_event_data.static.dataframe()["c"].dtype  # type: ignore
+    assert isinstance(loaded.predictive.targets, samples.EventSamples)
+
+
+def test_save_load_datetime_time_index(tmp_path):
+    time_series = pd.DataFrame(
+        {"a": [1.0, 2.0, 3.0]},
+        index=pd.MultiIndex.from_tuples(
+            [(0, pd.Timestamp("2020-01-01")), (0, pd.Timestamp("2020-01-02")), (1, pd.Timestamp("2020-01-01"))]
+        ),
+    )
+    data = dataset.CovariatesDataset(time_series)
+
+    data.save(tmp_path)
+    loaded = dataset.CovariatesDataset.load(tmp_path)
+
+    assert_datasets_equal(loaded, data)
+    assert loaded.time_series.time_indexes() == data.time_series.time_indexes()
+
+
+def test_load_selection(get_dataset: Callable, tmp_path):
+    data = get_dataset("sine_data_small")
+    data.save(tmp_path)
+
+    loaded = dataset.OneOffPredictionDataset.load(tmp_path)
+
+    assert_datasets_equal(loaded[[3, 1, 5]], data[[3, 1, 5]])
+    assert_datasets_equal(loaded[2:6], data[2:6])
+
+
+def test_loaded_copy_on_write(get_dataset: Callable, tmp_path):
+    data = get_dataset("sine_data_small")
+    data.save(tmp_path)
+
+    loaded = dataset.OneOffPredictionDataset.load(tmp_path)
+    loaded.static.dataframe().iloc[0, 0] = -100.0  # type: ignore
+
+    # Modified in memory, but not on disk.
+    assert loaded.static.dataframe().iloc[0, 0] == -100.0  # type: ignore
+    reloaded = dataset.OneOffPredictionDataset.load(tmp_path)
+    assert_samples_equal(reloaded.static, data.static)
+
+
+def test_loaded_pickle(get_dataset: Callable, tmp_path):
+    data = get_dataset("sine_data_small")
+    data.save(tmp_path)
+    loaded = dataset.OneOffPredictionDataset.load(tmp_path)
+
+    unpickled = pickle.loads(pickle.dumps(loaded))
+
+    assert_datasets_equal(unpickled, data)
+
+
+def test_load_wrong_class(get_dataset: Callable, tmp_path):
+    get_dataset("sine_data_small").save(tmp_path)
+
+    with pytest.raises(TypeError, match=".*OneOffPredictionDataset.*"):
+        dataset.TemporalPredictionDataset.load(tmp_path)
+
+
+def test_load_newer_format_version(get_dataset: Callable, tmp_path):
+    get_dataset("sine_data_small").save(tmp_path)
+    manifest_path = tmp_path / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["format_version"] = storage.FORMAT_VERSION + 1
+    manifest_path.write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError, match=".*version.*"):
+        storage.load_dataset(tmp_path)
+
+
+def test_load_unknown_class(get_dataset: Callable, tmp_path):
+    get_dataset("sine_data_small").save(tmp_path)
+    manifest_path = tmp_path / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    manifest["dataset_class"] = "Path"
+    manifest_path.write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError, match=".*Unknown class.*"):
+        storage.load_dataset(tmp_path)
+
+
+def test_save_replaces_previous(get_dataset: Callable, tmp_path):
+    path = tmp_path / "data"
+    get_dataset("clv_data_small").save(path)
+    assert (path / "treatments").is_dir()
+    loaded = storage.load_dataset(path)
+    data = get_dataset("sine_data_small")
+
+    data.save(path)
+
+    assert_datasets_equal(storage.load_dataset(path), data)
+    # No stale files of the previous dataset, or temporary directories, are left behind.
+    assert not (path / "treatments").exists()
+    assert [p.name for p in tmp_path.iterdir()] == ["data"]
+    # The previously loaded (memory-mapped) dataset is not affected.
+    assert_datasets_equal(loaded, get_dataset("clv_data_small"))
+
+
+def test_save_interrupted(get_dataset: Callable, tmp_path, monkeypatch):
+    path = tmp_path / "data"
+    previous = get_dataset("clv_data_small")
+    previous.save(path)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("Interrupted")
+
+    monkeypatch.setitem(storage._SAVERS, "StaticSamples", fail)  # pylint: disable=protected-access
+    with pytest.raises(RuntimeError, match=".*Interrupted.*"):
+        get_dataset("sine_data_small").save(path)
+
+    assert_datasets_equal(storage.load_dataset(path), previous)
+    assert [p.name for p in tmp_path.iterdir()] == ["data"]
+
+
+def test_save_fails_not_a_dataset(get_dataset: Callable, tmp_path):
+    (tmp_path / "other.txt").write_text("other")
+
+    with pytest.raises(ValueError, match=".*not a previously saved dataset.*"):
+        get_dataset("sine_data_small").save(tmp_path)
+    assert (tmp_path / "other.txt").exists()
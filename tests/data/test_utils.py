@@ -1,5 +1,6 @@
 # pylint: disable=redefined-outer-name, unused-argument
 
+import time
 from typing import Any, List, Tuple
 from unittest.mock import Mock
 
@@ -702,6 +703,26 @@ class TestUnpadTimeseriesArray3d:
             assert (unpadded[sample_i] == expected[sample_i]).all()
 
 
+class TestUnpadTimeseriesArray3dFlat:
+    def test_success(self):
+        array = np.asarray(
+            [
+                [[11, 1.1], [12, 1.2], [PAD, PAD]],
+                [[21, 2.1], [PAD, PAD], [PAD, PAD]],
+                [[31, 3.1], [32, 3.2], [33, 3.3]],
+            ]
+        )
+        values, lengths = utils.unpad_timeseries_array3d_flat(array, padding_indicator=PAD)
+        assert list(lengths) == [2, 1, 3]
+        assert (values == np.concatenate(utils.unpad_timeseries_array3d(array, padding_indicator=PAD))).all()
+
+    def test_no_padding(self):
+        array = np.ones(shape=(4, 3, 2))
+        values, lengths = utils.unpad_timeseries_array3d_flat(array, padding_indicator=None)
+        assert values.shape == (12, 2)
+        assert list(lengths) == [3, 3, 3, 3]
+
+
 class TestMakeSampleTimeIndexTuples:
     @pytest.mark.parametrize(
         "sample_index,time_indexes,expected",
@@ -1129,3 +1150,90 @@ class TestDatetimeTimeIndexToFloat:
         as_float = utils.datetime_time_index_to_float(time_index=time_index)
         assert all(issubclass(type(x), float) for x in as_float)
         assert np.isclose(as_float, np.asarray(time_index, dtype=float)).all()
+
+
+def _make_benchmark_multiindex_df(n_samples: int, max_timesteps: int, n_features: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=12345)
+    lengths = rng.integers(1, max_timesteps + 1, size=n_samples)
+    n_rows = lengths.sum()
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    multiindex = pd.MultiIndex.from_arrays(
+        [np.repeat(np.arange(n_samples), lengths), np.arange(n_rows) - starts],
+        names=["sample_idx", "time_idx"],
+    )
+    return pd.DataFrame(
+        rng.normal(size=(n_rows, n_features)),
+        index=multiindex,
+        columns=[f"feat_{i}" for i in range(n_features)],
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.skipci
+class TestCompactDtypes:
+    def test_compact(self):
+        df = pd.DataFrame({"a": [1.5, 2.5], "b": [1, 200], "c": [True, False]})
+        df["d"] = pd.Categorical(["x", "y"])
+
+        compacted = utils.compact_dtypes(df, downcast_int=True)
+
+        assert compacted.dtypes.tolist() == [np.float32, np.int16, bool, df["d"].dtype]
+        pd.testing.assert_frame_equal(compacted, df, check_dtype=False)
+        assert utils.compact_dtypes(df).dtypes["b"] == np.int64
+
+    def test_no_change(self):
+        df = pd.DataFrame({"a": np.asarray([1.5, 2.5], dtype=np.float32), "c": [True, False]})
+        assert utils.compact_dtypes(df, downcast_int=True) is df
+
+
+class TestContentHash:
+    def test_deterministic(self):
+        parts = ["a", pd.Index([1, 2]), pd.Series([1.0, 2.5]), np.array([3, 4]), None]
+        assert utils.content_hash(*parts) == utils.content_hash(*parts)
+        assert len(utils.content_hash(*parts)) == 64
+
+    def test_series_same_as_array(self):
+        assert utils.content_hash(pd.Series([1.0, 2.5])) == utils.content_hash(np.array([1.0, 2.5]))
+
+    @pytest.mark.parametrize(
+        "parts, other_parts",
+        [
+            ([pd.Series([1.0, 2.0])], [pd.Series([1.0, 2.5])]),
+            ([pd.Series([1, 2])], [pd.Series([1.0, 2.0])]),
+            ([pd.Series([1, 2]), pd.Series([3])], [pd.Series([1]), pd.Series([2, 3])]),
+            (["ab", "c"], ["a", "bc"]),
+        ],
+    )
+    def test_differs(self, parts: List[Any], other_parts: List[Any]):
+        assert utils.content_hash(*parts) != utils.content_hash(*other_parts)
+
+
+class TestConversionBenchmark:
+    """Benchmark harness for the (vectorized) timeseries conversion utilities. Run with, e.g.:
+    ``pytest tests/data/test_utils.py -m slow -k TestConversionBenchmark -s``.
+    """
+
+    @pytest.mark.parametrize("n_samples", [10_000, 100_000, 1_000_000])
+    def test_benchmark(self, n_samples: int):
+        df = _make_benchmark_multiindex_df(n_samples, max_timesteps=20, n_features=5)
+
+        t0 = time.perf_counter()
+        array = utils.multiindex_timeseries_dataframe_to_array3d(df, padding_indicator=PAD)
+        t1 = time.perf_counter()
+        lengths = utils.get_seq_lengths_timeseries_array3d(array, padding_indicator=PAD)
+        t2 = time.perf_counter()
+        df_back = utils.array3d_to_multiindex_timeseries_dataframe(
+            array,
+            sample_index=list(range(n_samples)),
+            time_indexes=[list(range(length)) for length in lengths],
+            feature_index=list(df.columns),
+            padding_indicator=PAD,
+        )
+        t3 = time.perf_counter()
+
+        print(
+            f"\n[n_samples={n_samples}] "
+            f"df->array3d: {t1 - t0:.3f}s, seq lengths: {t2 - t1:.3f}s, array3d->df: {t3 - t2:.3f}s"
+        )
+        assert lengths == df.groupby(level=0).size().tolist()
+        assert np.array_equal(df_back.to_numpy(), df.to_numpy())
@@ -6,7 +6,7 @@ from unittest.mock import Mock
 import numpy as np
 import pytest
 
-from tempor.models.ddh import DynamicDeepHitLayers, DynamicDeepHitModel
+from tempor.models.ddh import DynamicDeepHitLayers, DynamicDeepHitModel, get_padded_features
 from tempor.utils.dataloaders import PBCDataLoader
 
 
@@ -27,6 +27,22 @@ def get_test_data():
     return x, t, e, horizons
 
 
+@pytest.mark.parametrize("pad_size", [None, 2, 6])
+def test_get_padded_features(pad_size):
+    x = np.empty(3, dtype=object)
+    x[0], x[1], x[2] = np.ones((4, 2)), np.full((1, 2), 2.0), np.full((3, 2), 3, dtype=int)
+
+    padded = get_padded_features(x, pad_size=pad_size)
+
+    width = 4 if pad_size is None else pad_size
+    assert padded.shape == (3, width, 2)
+    assert padded.dtype == np.float32
+    for idx, item in enumerate(x):
+        length = min(len(item), width)
+        assert (padded[idx, :length] == item[:length]).all()
+        assert np.isnan(padded[idx, length:]).all()
+
+
 # Test DynamicDeepHitModel:
 
 
@@ -173,6 +189,40 @@ def test_ddh_predict_survival_all_step(get_test_data):
     assert output.shape[0] >= len(x)
 
 
+def _synthetic_data(n_samples: int = 40, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    x = np.empty(n_samples, dtype=object)
+    for idx in range(n_samples):
+        x[idx] = rng.random((rng.integers(2, 8), 3))
+    return x, rng.random(n_samples) * 10, rng.integers(0, 2, n_samples)
+
+
+def test_ddh_predict_survival_batched():
+    x, t, e = _synthetic_data()
+    model = DynamicDeepHitModel(n_iter=2, batch_size=20).fit(x=x, t=t, e=e)
+    horizons = [1.0, 2.0, 2.0, 5.0]
+
+    output = model.predict_survival(x=x, t=horizons, batch_size=7)
+
+    assert output.shape == (len(x), len(horizons))
+    assert np.allclose(output[:, 1], output[:, 2])
+    assert np.allclose(output, model.predict_survival(x=x, t=horizons, batch_size=1000), atol=1e-6)
+    assert np.allclose(output[3:4], model.predict_survival(x=x[3:4], t=horizons), atol=1e-6)
+
+
+def test_ddh_predict_survival_all_step_prefixes():
+    x, t, e = _synthetic_data()
+    model = DynamicDeepHitModel(n_iter=2, batch_size=20).fit(x=x, t=t, e=e)
+    horizons = [1.0, 5.0]
+
+    output = model.predict_survival(x=x[:3], t=horizons, all_step=True, batch_size=4)
+
+    prefixes = np.empty(sum(len(x_) for x_ in x[:3]), dtype=object)
+    prefixes[:] = [x_[: length + 1] for x_ in x[:3] for length in range(len(x_))]
+    assert output.shape == (len(prefixes), len(horizons))
+    assert np.allclose(output, model.predict_survival(x=prefixes, t=horizons), atol=1e-6)
+
+
 # Test DynamicDeepHitLayers:
 
 
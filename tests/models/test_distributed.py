@@ -0,0 +1,130 @@
+from typing import Any
+
+import numpy as np
+import pytest
+import torch
+import torch.distributed as dist
+
+from tempor.models import distributed
+from tempor.models.ddh import DynamicDeepHitModel
+from tempor.models.mlp import MLP
+from tempor.models.ts_model import TimeSeriesModel
+
+
+@pytest.fixture
+def single_process_group(tmp_path):
+    dist.init_process_group(distributed.BACKEND, init_method=(tmp_path / "rendezvous").as_uri(), rank=0, world_size=1)
+    yield
+    dist.destroy_process_group()
+
+
+def test_not_distributed():
+    assert not distributed.is_distributed()
+
+    a, b = torch.arange(6), torch.arange(12).reshape(6, 2)
+    assert distributed.shard(a, b) == (a, b)
+    assert distributed.broadcast(1.5) == 1.5
+
+    linear = torch.nn.Linear(2, 1)
+    linear(torch.ones(3, 2)).sum().backward()
+    grad = linear.weight.grad.clone()  # type: ignore
+    distributed.all_reduce_gradients(linear.parameters(), weight=0.5)
+    assert torch.equal(linear.weight.grad, grad)  # type: ignore
+
+
+def test_single_process_group(single_process_group):  # pylint: disable=unused-argument,redefined-outer-name
+    assert distributed.is_distributed()
+
+    a = torch.arange(6)
+    (shard,) = distributed.shard(a)
+    assert torch.equal(shard, a)
+    assert distributed.broadcast({"loss": 1.5}) == {"loss": 1.5}
+
+    linear = torch.nn.Linear(2, 1)
+    unused = torch.nn.Linear(2, 1)
+    linear(torch.ones(3, 2)).sum().backward()
+    grad = linear.weight.grad.clone()  # type: ignore
+    distributed.all_reduce_gradients([*linear.parameters(), *unused.parameters()], weight=0.5)
+    assert torch.allclose(linear.weight.grad, grad * 0.5)  # type: ignore
+    assert unused.weight.grad is None
+
+    torch.manual_seed(0)
+    expected = torch.rand(3)
+    torch.manual_seed(0)
+    distributed.sync_random_state()
+    assert torch.equal(torch.rand(3), expected)
+
+
+def test_train_fails():
+    model = MLP(task_type="regression", n_units_in=2, n_units_out=1)
+    with pytest.raises(ValueError, match=".*positive.*"):
+        distributed.train(model, "_train", torch.ones(4, 2), torch.ones(4), n_workers=0)
+
+    model = MLP(task_type="regression", n_units_in=2, n_units_out=1, device="meta")
+    with pytest.raises(ValueError, match=".*CPU.*"):
+        distributed.train(model, "_train", torch.ones(4, 2), torch.ones(4), n_workers=2)
+
+
+@pytest.mark.slow
+def test_mlp_same_as_single_process():
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(100, 4)), rng.normal(size=100)
+    kwargs: Any = dict(task_type="regression", n_units_in=4, n_units_out=1, n_iter=3, batch_size=32, dropout=0)
+
+    expected = MLP(**kwargs).fit(X, y).predict(X)
+    model = MLP(**kwargs, n_workers=2).fit(X, y)
+
+    np.testing.assert_allclose(model.predict(X), expected, atol=1e-5)
+
+
+@pytest.mark.slow
+def test_mlp_batch_norm_small_shards():
+    rng = np.random.default_rng(0)
+    X, y = rng.normal(size=(20, 4)), rng.normal(size=20)
+    kwargs: Any = dict(task_type="regression", n_units_in=4, n_units_out=1, n_iter=2, batch_size=3, batch_norm=True)
+
+    # Batches of 3 samples cannot be split into 2 shards of at least 2 samples, so the first worker takes each batch.
+    model = MLP(**kwargs, n_workers=2).fit(X, y)
+
+    assert model.predict(X).shape == (20,)
+
+
+@pytest.mark.slow
+def test_ts_model_same_as_single_process():
+    rng = np.random.default_rng(0)
+    static, temporal = rng.normal(size=(40, 2)), rng.normal(size=(40, 6, 3))
+    observation_times, outcome = np.tile(np.arange(6.0), (40, 1)), rng.normal(size=(40, 1))
+    kwargs: Any = dict(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=6,
+        output_shape=[1],
+        n_iter=3,
+        batch_size=15,
+        mode="GRU",
+        n_iter_print=1,
+    )
+
+    expected = TimeSeriesModel(**kwargs).fit(static, temporal, observation_times, outcome)
+    model = TimeSeriesModel(**kwargs, n_workers=2).fit(static, temporal, observation_times, outcome)
+
+    np.testing.assert_allclose(
+        model.predict(static, temporal, observation_times),
+        expected.predict(static, temporal, observation_times),
+        atol=1e-5,
+    )
+
+
+@pytest.mark.slow
+def test_ddh_fit():
+    rng = np.random.default_rng(0)
+    x = np.empty(40, dtype=object)
+    for idx in range(40):
+        x[idx] = rng.random((rng.integers(2, 8), 3))
+    t, e = rng.random(40) * 10, rng.integers(0, 2, 40)
+
+    model = DynamicDeepHitModel(n_iter=2, batch_size=20, n_workers=2).fit(x=x, t=t, e=e)
+
+    assert model.model is not None
+    assert model.predict_survival(x=x, t=[1.0, 5.0]).shape == (len(x), 2)
@@ -2,6 +2,7 @@
 
 import os
 
+import numpy as np
 import pytest
 import torch
 import torch.backends.cudnn
@@ -95,3 +96,18 @@ def test_get_nonlin_unknown():
 def test_get_sampler_unknown():
     with pytest.raises(ValueError):
         utils.get_sampler("unknown")  # type: ignore
+
+
+def test_to_float32_array():
+    array = np.random.rand(3, 4, 2)
+    assert utils.to_float32_array(array).dtype == np.float32
+    np.testing.assert_allclose(utils.to_float32_array(array), array, rtol=1e-6)
+    array_32 = array.astype(np.float32)
+    assert utils.to_float32_array(array_32) is array_32
+
+    objects = np.empty(2, dtype=object)
+    objects[0] = [[1, 2], [3, 4]]
+    objects[1] = np.asarray([[5.0, 6.0], [7.0, 8.0]])
+    stacked = utils.to_float32_array(objects)
+    assert stacked.dtype == np.float32
+    assert stacked.shape == (2, 2, 2)
@@ -257,3 +257,190 @@ def test_windowed_layer_forward_nans():
     t[0, 0, 0] = torch.nan
     with pytest.raises(ValueError, match=".*mismatch.*"):
         tsl.forward(s, t)
+
+
+def _ragged_data(n_samples: int = 30, n_features: int = 3, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(2, 12, size=n_samples)
+    static = rng.random((n_samples, 2))
+    temporal = np.empty(n_samples, dtype=object)
+    observation_times = np.empty(n_samples, dtype=object)
+    for idx, length in enumerate(lengths):
+        temporal[idx] = rng.random((length, n_features))
+        observation_times[idx] = list(range(length))
+    outcome = rng.random((n_samples, 1))
+    return static, temporal, observation_times, outcome
+
+
+def test_init_length_buckets_invalid():
+    with pytest.raises(ValueError, match=".*positive.*"):
+        TimeSeriesModel(
+            task_type="regression",
+            n_static_units_in=3,
+            n_temporal_units_in=3,
+            n_temporal_window=2,
+            output_shape=[2],
+            length_buckets=0,
+        )
+    with pytest.raises(ValueError, match=".*only supported.*"):
+        TimeSeriesModel(
+            task_type="regression",
+            n_static_units_in=3,
+            n_temporal_units_in=3,
+            n_temporal_window=2,
+            output_shape=[2],
+            mode="InceptionTime",
+            length_buckets=4,
+        )
+
+
+@pytest.mark.parametrize("length_buckets", [None, 1, 3])
+def test_window_batches(length_buckets):
+    _, _, observation_times, _ = _ragged_data()
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=12,
+        output_shape=[1],
+        length_buckets=length_buckets,
+    )
+
+    window_batches = model._window_batches(observation_times)  # pylint: disable=protected-access
+
+    n_distinct = len(set(len(item) for item in observation_times))
+    assert len(window_batches) == (n_distinct if length_buckets is None else length_buckets)
+    assert sorted(idx for indices in window_batches.values() for idx in indices) == list(range(len(observation_times)))
+    for window_len, indices in window_batches.items():
+        assert max(len(observation_times[idx]) for idx in indices) == window_len
+
+
+@pytest.mark.parametrize("length_buckets", [None, 3])
+def test_prepare_input_float32(length_buckets):
+    static, temporal, observation_times, outcome = _ragged_data()
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=12,
+        output_shape=[1],
+        length_buckets=length_buckets,
+    )
+
+    static_mb, temporal_mb, observation_times_mb, *_ = model._prepare_input(  # pylint: disable=protected-access
+        static, temporal, observation_times, outcome
+    )
+
+    for tensors in (static_mb, temporal_mb, observation_times_mb):
+        assert all(t.dtype == torch.float32 for t in tensors)
+
+
+@pytest.mark.parametrize("mode", ["RNN", "LSTM", "GRU"])
+def test_time_series_layer_forward_packed(mode):
+    tsl = TimeSeriesLayer(
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=5,
+        n_units_out=2,
+        mode=mode,
+        window_size=2,
+        device=torch.device("cpu"),
+    )
+    tsl.eval()
+    lengths = torch.tensor([5, 2, 4])
+    s = torch.rand(size=(3, 2))
+    t = torch.rand(size=(3, 5, 3))
+    t[1, 2:] = 0.0
+    t[2, 4:] = 0.0
+
+    out = tsl.forward(s, t, lengths)
+
+    # Same as for each (unpadded) sequence separately.
+    for idx, length in enumerate(lengths):
+        expected = tsl.forward(s[idx : idx + 1], t[idx : idx + 1, :length])
+        assert torch.allclose(out[idx : idx + 1], expected, atol=1e-6)
+
+
+def test_windowed_layer_forward_packed_short_sequences():
+    tsl = WindowLinearLayer(
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        window_size=3,
+        n_units_out=2,
+        device=torch.device("cpu"),
+    )
+    tsl.eval()
+    lengths = torch.tensor([5, 1, 2])
+    s = torch.rand(size=(3, 2))
+    t = torch.rand(size=(3, 5, 3))
+    t[1, 1:] = 0.0
+    t[2, 2:] = 0.0
+
+    out = tsl.forward(s, t, lengths)
+
+    # The steps before the start of sequences shorter than the window are zeroed, not filled with the first step.
+    for idx, length in enumerate(lengths):
+        window = torch.zeros(size=(1, 3, 3))
+        n_steps = min(int(length), 3)
+        window[:, 3 - n_steps :] = t[idx : idx + 1, length - n_steps : length]
+        expected = tsl.forward(s[idx : idx + 1], window)
+        assert torch.allclose(out[idx : idx + 1], expected, atol=1e-6)
+
+
+def test_fit_predict_length_buckets():
+    static, temporal, observation_times, outcome = _ragged_data()
+    model = TimeSeriesModel(
+        task_type="regression",
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=12,
+        output_shape=[1],
+        n_iter=10,
+        window_size=2,
+        length_buckets=3,
+    )
+
+    model.fit(static, temporal, observation_times, outcome)
+    y_pred = model.predict(static, temporal, observation_times)
+
+    assert y_pred.shape == outcome.shape
+    assert not np.isnan(y_pred).any()
+
+
+@pytest.mark.parametrize("task_type", get_args(ModelTaskType))
+def test_predict_inference_batch_size(task_type: ModelTaskType):
+    static, temporal, observation_times, _ = _ragged_data()
+    kwargs: Any = dict(
+        task_type=task_type,
+        n_static_units_in=2,
+        n_temporal_units_in=3,
+        n_temporal_window=12,
+        output_shape=[2],
+        mode="GRU",
+    )
+    model = TimeSeriesModel(**kwargs)
+    chunked = TimeSeriesModel(**kwargs, inference_batch_size=7)
+    chunked.load_state_dict(model.state_dict())
+
+    expected = model.predict(static, temporal, observation_times)
+    np.testing.assert_allclose(chunked.predict(static, temporal, observation_times), expected, atol=1e-6)
+
+    chunks = list(model.iter_predict(static, temporal, observation_times, chunk_size=7))
+    assert [len(c) for c in chunks] == [7, 7, 7, 7, 2]
+    np.testing.assert_allclose(np.concatenate(chunks), expected, atol=1e-6)
+
+    if task_type == "classification":
+        expected_proba = model.predict_proba(static, temporal, observation_times)
+        np.testing.assert_allclose(
+            chunked.predict_proba(static, temporal, observation_times), expected_proba, atol=1e-6
+        )
+        chunks = list(chunked.iter_predict(static, temporal, observation_times, proba=True))
+        np.testing.assert_allclose(np.concatenate(chunks), expected_proba, atol=1e-6)
+    else:
+        with pytest.raises(RuntimeError, match=".*classification.*"):
+            model.iter_predict(static, temporal, observation_times, proba=True)
+
+    with pytest.raises(ValueError, match=".*positive.*"):
+        model.iter_predict(static, temporal, observation_times, chunk_size=0)
+    with pytest.raises(ValueError, match=".*positive.*"):
+        TimeSeriesModel(**kwargs, inference_batch_size=0)
@@ -129,38 +129,89 @@ def test_init_inputs():
         )
 
 
-def test_forward_nans_found():
+def test_prepare_input_nans_found():
     model = NeuralODE(
         task_type="regression",
         n_static_units_in=3,
-        n_temporal_units_in=3,
+        n_temporal_units_in=2,
         output_shape=[2],
     )
 
+    s = np.ones((10, 3))
+    s[0, 1] = np.nan
     with pytest.raises(ValueError, match=".*NaNs.*static.*"):
-        model.forward(
-            static_data=torch.tensor([np.nan, np.nan]),
-            temporal_data=torch.ones(10, 3, 2),
-            observation_times=torch.ones(10, 3),
-        )
+        model.predict(static_data=s, temporal_data=np.ones((10, 3, 2)), observation_times=np.ones((10, 3)))
 
-    t = torch.ones(10, 3, 2)
-    t[0, 2, 1] = torch.nan
+    t = np.ones((10, 3, 2))
+    t[0, 2, 1] = np.nan
     with pytest.raises(ValueError, match=".*NaNs.*temporal.*"):
-        model.forward(
-            static_data=torch.ones(10, 3),
-            temporal_data=t,
-            observation_times=torch.ones(10, 3),
-        )
+        model.predict(static_data=np.ones((10, 3)), temporal_data=t, observation_times=np.ones((10, 3)))
 
-    o = torch.ones(10, 3)
-    o[0, 2] = torch.nan
+    o = np.ones((10, 3))
+    o[0, 2] = np.nan
     with pytest.raises(ValueError, match=".*NaNs.*horizon.*"):
-        model.forward(
-            static_data=torch.ones(10, 3),
-            temporal_data=torch.ones(10, 3, 2),
-            observation_times=o,
-        )
+        model.predict(static_data=np.ones((10, 3)), temporal_data=np.ones((10, 3, 2)), observation_times=o)
+
+
+@pytest.mark.parametrize("interpolation", ["cubic", "linear"])
+def test_precompute_coeffs(interpolation):
+    static, temporal = np.random.randn(6, 3), np.random.randn(6, 5, 2)
+    observation_times = np.tile(np.arange(5, dtype=float), (6, 1))
+
+    model = NeuralODE(
+        task_type="regression",
+        n_static_units_in=3,
+        n_temporal_units_in=2,
+        output_shape=[2],
+        n_units_hidden=8,
+        interpolation=interpolation,
+        device=torch.device("cpu"),
+    )
+    (
+        static_t,
+        temporal_t,
+        observation_times_t,
+        _,
+        _,
+        coeffs_t,
+    ) = model._prepare_input(  # pylint: disable=protected-access
+        static, temporal, observation_times
+    )
+    assert len(coeffs_t) == 1 and coeffs_t[0] is not None
+
+    model.eval()
+    with torch.no_grad():
+        expected = model(static_t[0], temporal_t[0], observation_times_t[0])
+        out = model(static_t[0], temporal_t[0], observation_times_t[0], coeffs_t[0])
+    assert torch.allclose(out, expected)
+
+    model.precompute_coeffs = False
+    *_, coeffs_t = model._prepare_input(static, temporal, observation_times)  # pylint: disable=protected-access
+    assert coeffs_t == [None]
+
+
+@pytest.mark.parametrize("backend", ["cde", "ode"])
+@pytest.mark.parametrize("method, step_size", [("dopri5", None), ("rk4", None), ("euler", 0.5)])
+def test_solver_methods(backend: ODEBackend, method: Any, step_size: Any):
+    static, temporal = np.random.randn(6, 3), np.random.randn(6, 5, 2)
+    observation_times = np.tile(np.arange(5, dtype=float), (6, 1))
+    outcome = np.random.randn(6, 1)
+
+    model = NeuralODE(
+        task_type="regression",
+        n_static_units_in=3,
+        n_temporal_units_in=2,
+        output_shape=[1],
+        n_units_hidden=8,
+        n_iter=2,
+        backend=backend,
+        method=method,
+        step_size=step_size,
+        device=torch.device("cpu"),
+    )
+    model.fit(static, temporal, observation_times, outcome)
+
+    assert model.predict(static, temporal, observation_times).shape == outcome.shape
 
 
 def test_forward_interpolation():
@@ -255,3 +306,34 @@ def test_check_tensor():
     )
     out = model._check_tensor(t)  # pylint: disable=protected-access
     assert out.device == model.device
+
+
+@pytest.mark.parametrize("backend", ["cde", "ode"])
+def test_predict_inference_batch_size(backend: ODEBackend):
+    static, temporal = np.random.randn(10, 3), np.random.randn(10, 5, 2)
+    observation_times = np.tile(np.arange(5, dtype=float), (10, 1))
+    kwargs: Any = dict(
+        task_type="regression",
+        n_static_units_in=3,
+        n_temporal_units_in=2,
+        output_shape=[2],
+        n_units_hidden=8,
+        backend=backend,
+        method="rk4",  # The steps of the adaptive solvers depend on all the samples in the batch.
+        device=torch.device("cpu"),
+    )
+    model = NeuralODE(**kwargs)
+    chunked = NeuralODE(**kwargs, inference_batch_size=4)
+    chunked.load_state_dict(model.state_dict())
+
+    expected = model.predict(static, temporal, observation_times)
+    np.testing.assert_allclose(chunked.predict(static, temporal, observation_times), expected, atol=1e-5)
+
+    chunks = list(chunked.iter_predict(static, temporal, observation_times))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    np.testing.assert_allclose(np.concatenate(chunks), expected, atol=1e-5)
+
+    with pytest.raises(RuntimeError, match=".*classification.*"):
+        model.iter_predict(static, temporal, observation_times, proba=True)
+    with pytest.raises(ValueError, match=".*positive.*"):
+        model.iter_predict(static, temporal, observation_times, chunk_size=0)
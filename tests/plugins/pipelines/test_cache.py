@@ -0,0 +1,148 @@
+# pylint: disable=redefined-outer-name
+
+import copy
+import pickle
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from tempor.data import samples
+from tempor.plugins.pipeline import TransformerCache, cache, pipeline
+
+PLUGINS_STR = [
+    "preprocessing.imputation.temporal.bfill",
+    "preprocessing.scaling.temporal.ts_minmax_scaler",
+    "prediction.one_off.regression.nn_regressor",
+]
+PLUGIN_PARAMS = {"nn_regressor": {"n_iter": 2, "random_state": 12345}}
+
+
+class TestTransformerCache:
+    def test_get_put(self):
+        c = TransformerCache(maxsize=2)
+
+        assert c.get("a") is None
+        item = {"x": [1, 2, 3]}
+        c.put("a", item)
+        got = c.get("a")
+
+        assert got == item
+        assert got is not item  # A copy is returned.
+        assert (c.hits, c.misses, len(c)) == (1, 1, 1)
+
+    def test_lru_eviction(self):
+        c = TransformerCache(maxsize=2)
+        c.put("a", 1)
+        c.put("b", 2)
+        c.get("a")  # Make "b" the least recently used.
+        c.put("c", 3)
+
+        assert len(c) == 2
+        assert c.get("b") is None
+        assert c.get("a") == 1
+        assert c.get("c") == 3
+
+    def test_clear(self):
+        c = TransformerCache()
+        c.put("a", 1)
+        c.get("a")
+        c.clear()
+
+        assert (c.hits, c.misses, len(c)) == (0, 0, 0)
+        assert c.get("a") is None
+
+    def test_disk_tier(self, tmp_path):
+        c = TransformerCache(maxsize=1, cache_dir=tmp_path)
+        c.put("a", 1)
+        c.put("b", 2)  # Evicts "a" from memory, but it remains on disk.
+
+        assert len(c) == 1
+        assert c.get("a") == 1
+
+        # Only the disk tier is shared by a pickled copy (e.g. in a worker process).
+        c_copy = pickle.loads(pickle.dumps(c))
+        assert len(c_copy) == 0
+        assert c_copy.get("b") == 2
+
+    def test_pickle_drops_memory_tier(self):
+        c = TransformerCache()
+        c.put("a", 1)
+
+        c_copy = pickle.loads(pickle.dumps(c))
+
+        assert len(c_copy) == 0
+        assert c_copy.get("a") is None
+
+
+def test_dataset_key(get_dataset: Callable):
+    data = get_dataset("sine_data_small")
+    data_same = copy.deepcopy(data)
+
+    assert cache.dataset_key(data) == cache.dataset_key(data_same)
+    assert cache.dataset_key(data[:5]) != cache.dataset_key(data)
+
+    df = data.time_series.dataframe().copy()
+    df.iloc[0, 0] += 1.0
+    data_same.time_series = samples.TimeSeriesSamples.from_dataframe(df)
+    assert cache.dataset_key(data_same) != cache.dataset_key(data)
+
+
+def test_dataset_key_modified_in_place(get_dataset: Callable):
+    data = get_dataset("sine_data_small")
+    key = cache.dataset_key(data)
+
+    data.static.dataframe().iloc[0, 0] += 1.0  # type: ignore [union-attr]
+
+    assert cache.dataset_key(data) != key
+
+
+def test_stage_key():
+    PipelineCls = pipeline(PLUGINS_STR)
+    stage_a = PipelineCls().stages[1]
+    stage_b = PipelineCls({"ts_minmax_scaler": {"clip": True}}).stages[1]
+
+    assert cache.stage_key("data", stage_a) == cache.stage_key("data", PipelineCls().stages[1])
+    assert cache.stage_key("data", stage_a) != cache.stage_key("data", stage_b)
+    assert cache.stage_key("data", stage_a) != cache.stage_key("other_data", stage_a)
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_pipeline_with_cache(get_dataset: Callable):
+    # NOTE: The transformers modify the data in place, so pass a copy each time.
+    data = get_dataset("sine_data_small")
+
+    PipelineCls = pipeline(PLUGINS_STR)
+    preds_no_cache = PipelineCls(PLUGIN_PARAMS).fit(copy.deepcopy(data)).predict(copy.deepcopy(data))
+
+    PipelineCls.transformer_cache = TransformerCache()
+    n_transformers = len(PLUGINS_STR) - 1
+
+    pipe = PipelineCls(PLUGIN_PARAMS).fit(copy.deepcopy(data))
+    assert PipelineCls.transformer_cache.misses == n_transformers
+    assert PipelineCls.transformer_cache.hits == 0
+
+    pipe = PipelineCls(PLUGIN_PARAMS).fit(copy.deepcopy(data))
+    assert PipelineCls.transformer_cache.hits == n_transformers
+    preds_cache = pipe.predict(copy.deepcopy(data))
+    assert PipelineCls.transformer_cache.misses == 2 * n_transformers  # The transform outputs.
+    pipe.predict(copy.deepcopy(data))
+    assert PipelineCls.transformer_cache.hits == 2 * n_transformers
+
+    assert np.allclose(preds_no_cache.numpy(), preds_cache.numpy())
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_pipeline_with_cache_input_unchanged(get_dataset: Callable):
+    data = get_dataset("sine_data_small")
+    expected = data.time_series.dataframe().copy()
+
+    PipelineCls = pipeline(PLUGINS_STR)
+    PipelineCls.transformer_cache = TransformerCache()
+
+    # Cache misses, then cache hits, for both fitting and predicting.
+    for _ in range(2):
+        PipelineCls(PLUGIN_PARAMS).fit(data).predict(data)
+
+    assert PipelineCls.transformer_cache.hits > 0
+    assert data.time_series.dataframe().equals(expected)
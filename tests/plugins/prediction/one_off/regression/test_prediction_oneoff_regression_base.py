@@ -44,7 +44,7 @@ def test_unpack_dataset_empty():
         PredictiveDataset,
         time_series=Mock(
             numpy=Mock(return_value=[1, 2, 3]),
-            time_indexes=Mock(return_value="mock_time_indexes"),
+            time_indexes_float=Mock(return_value="mock_time_indexes"),
         ),
         static=None,
         predictive=Mock(
@@ -1,9 +1,12 @@
 # pylint: disable=redefined-outer-name
 
+import copy
 from typing import Callable, Dict
 
+import pandas as pd
 import pytest
 
+from tempor.data.samples import TimeSeriesSamples
 from tempor.plugins.preprocessing.encoding import BaseEncoder
 from tempor.plugins.preprocessing.encoding.temporal.plugin_ts_onehot_encoder import TimeSeriesOneHotEncoder
 from tempor.utils.serialization import load, save
@@ -128,3 +131,34 @@ def test_transform_all_features(get_test_plugin: Callable, get_dataset: Callable
 
     for new_col in new_cols:
         assert sorted(output.time_series.dataframe()[new_col].unique().tolist()) == [0.0, 1.0]
+
+
+def test_fit_transform_chunks(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    expected = get_test_plugin("from_api", INIT_KWARGS).fit_transform(copy.deepcopy(dataset))
+
+    test_plugin: BaseEncoder = get_test_plugin("from_api", INIT_KWARGS)
+    test_plugin.fit_chunks(dataset.iter_chunks(chunk_size=2))
+    output = list(test_plugin.transform_chunks(dataset.iter_chunks(chunk_size=2)))
+
+    pd.testing.assert_frame_equal(
+        pd.concat([chunk.time_series.dataframe() for chunk in output]),
+        expected.time_series.dataframe(),
+    )
+
+
+def test_partial_fit_min_frequency_fails(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    test_plugin: BaseEncoder = get_test_plugin("from_api", {**INIT_KWARGS, "min_frequency": 2})
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+
+    with pytest.raises(ValueError, match=".*min_frequency.*"):
+        test_plugin.partial_fit(dataset)
+
+
+def test_transform_keeps_backend(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    dataset.time_series = TimeSeriesSamples(dataset.time_series.dataframe(), backend="ragged")
+
+    output = get_test_plugin("from_api", INIT_KWARGS).fit_transform(dataset)
+
+    assert output.time_series.backend == "ragged"
@@ -1,9 +1,12 @@
 # pylint: disable=redefined-outer-name
 
+import copy
 from typing import Any, Callable, Dict
 
+import pandas as pd
 import pytest
 
+from tempor.data.samples import TimeSeriesSamples
 from tempor.plugins.preprocessing.imputation import BaseImputer
 from tempor.plugins.preprocessing.imputation.temporal.plugin_ffill import FFillImputer
 from tempor.utils.serialization import load, save
@@ -80,3 +83,40 @@ def test_transform(
     output = reloaded.transform(dataset)
 
     assert output.time_series.dataframe().isna().sum().sum() == 0
+
+
+@pytest.mark.parametrize("data", TEST_ON_DATASETS)
+def test_transform_matches_per_sample_fill(data: str, get_test_plugin: Callable, get_dataset: Callable) -> None:
+    test_plugin: BaseImputer = get_test_plugin("from_api", INIT_KWARGS)
+    dataset = get_dataset(data)
+
+    # Reference: fill each sample separately.
+    df = dataset.time_series.dataframe().copy()
+    expected = pd.concat([df_sample.ffill().bfill().fillna(0.0) for _, df_sample in df.groupby(level=0, sort=False)])
+
+    output = test_plugin.fit_transform(dataset)
+
+    pd.testing.assert_frame_equal(output.time_series.dataframe(), expected)
+
+
+def test_transform_chunks(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    expected = get_test_plugin("from_api", INIT_KWARGS).fit_transform(copy.deepcopy(dataset))
+
+    test_plugin: BaseImputer = get_test_plugin("from_api", INIT_KWARGS)
+    test_plugin.fit_chunks(dataset.iter_chunks(chunk_size=3))
+    output = list(test_plugin.transform_chunks(dataset.iter_chunks(chunk_size=3)))
+
+    pd.testing.assert_frame_equal(
+        pd.concat([chunk.time_series.dataframe() for chunk in output]),
+        expected.time_series.dataframe(),
+    )
+
+
+def test_transform_keeps_backend(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    dataset.time_series = TimeSeriesSamples(dataset.time_series.dataframe(), backend="ragged")
+
+    output = get_test_plugin("from_api", INIT_KWARGS).fit_transform(dataset)
+
+    assert output.time_series.backend == "ragged"
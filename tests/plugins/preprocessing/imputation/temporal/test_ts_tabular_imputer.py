@@ -6,6 +6,7 @@ from typing import Any, Callable, Dict
 import pytest
 from typing_extensions import get_args
 
+from tempor.data.samples import TimeSeriesSamples
 from tempor.plugins.preprocessing.imputation import BaseImputer, TabularImputerType
 from tempor.plugins.preprocessing.imputation.temporal.plugin_ts_tabular_imputer import TemporalTabularImputer
 from tempor.utils.serialization import load, save
@@ -115,3 +116,23 @@ def test_random_state(get_test_plugin: Callable):
 
     with pytest.raises(ValueError, match=".*[Dd]o not pass.*random_state.*"):
         p = get_test_plugin("from_module", dict(imputer_params={"random_state": 12345}))
+
+
+def test_fit_chunks_not_supported(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    test_plugin: BaseImputer = get_test_plugin("from_api", INIT_KWARGS)
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+
+    assert not test_plugin.supports_partial_fit
+    with pytest.raises(NotImplementedError, match=".*chunks.*"):
+        test_plugin.partial_fit(dataset)
+    with pytest.raises(NotImplementedError, match=".*chunks.*"):
+        test_plugin.fit_chunks(dataset.iter_chunks(chunk_size=3))
+
+
+def test_transform_keeps_backend(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    dataset.time_series = TimeSeriesSamples(dataset.time_series.dataframe(), backend="ragged")
+
+    output = get_test_plugin("from_api", INIT_KWARGS).fit_transform(dataset)
+
+    assert output.time_series.backend == "ragged"
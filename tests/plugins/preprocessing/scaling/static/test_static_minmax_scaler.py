@@ -1,7 +1,9 @@
 # pylint: disable=redefined-outer-name
 
+import copy
 from typing import Callable, Dict
 
+import pandas as pd
 import pytest
 
 from tempor.plugins.preprocessing.scaling import BaseScaler
@@ -84,3 +86,19 @@ def test_transform(
 
     assert (output.static.numpy() < 1 + 1e-1).all()
     assert (output.static.numpy() >= 0).all()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_fit_transform_chunks(chunk_size: int, get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    expected = get_test_plugin("from_api", INIT_KWARGS).fit_transform(copy.deepcopy(dataset))
+
+    test_plugin: BaseScaler = get_test_plugin("from_api", INIT_KWARGS)
+    assert test_plugin.supports_partial_fit
+    test_plugin.fit_chunks(dataset.iter_chunks(chunk_size=chunk_size))
+    output = list(test_plugin.transform_chunks(dataset.iter_chunks(chunk_size=chunk_size)))
+
+    pd.testing.assert_frame_equal(
+        pd.concat([chunk.static.dataframe() for chunk in output]),
+        expected.static.dataframe(),
+    )
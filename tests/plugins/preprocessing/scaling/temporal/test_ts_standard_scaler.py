@@ -1,9 +1,12 @@
 # pylint: disable=redefined-outer-name
 
+import copy
 from typing import Callable, Dict
 
+import pandas as pd
 import pytest
 
+from tempor.data.samples import TimeSeriesSamples
 from tempor.plugins.preprocessing.scaling import BaseScaler
 from tempor.plugins.preprocessing.scaling.temporal.plugin_ts_standard_scaler import TimeSeriesStandardScaler
 from tempor.utils.serialization import load, save
@@ -83,3 +86,28 @@ def test_transform(
     output = reloaded.transform(dataset)
 
     assert (output.time_series.numpy() < 50).all()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3])
+def test_fit_transform_chunks(chunk_size: int, get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    expected = get_test_plugin("from_api", INIT_KWARGS).fit_transform(copy.deepcopy(dataset))
+
+    test_plugin: BaseScaler = get_test_plugin("from_api", INIT_KWARGS)
+    assert test_plugin.supports_partial_fit
+    test_plugin.fit_chunks(dataset.iter_chunks(chunk_size=chunk_size))
+    output = list(test_plugin.transform_chunks(dataset.iter_chunks(chunk_size=chunk_size)))
+
+    pd.testing.assert_frame_equal(
+        pd.concat([chunk.time_series.dataframe() for chunk in output]),
+        expected.time_series.dataframe(),
+    )
+
+
+def test_transform_keeps_backend(get_test_plugin: Callable, get_dataset: Callable) -> None:
+    dataset = get_dataset(TEST_ON_DATASETS[0])
+    dataset.time_series = TimeSeriesSamples(dataset.time_series.dataframe(), backend="ragged")
+
+    output = get_test_plugin("from_api", INIT_KWARGS).fit_transform(dataset)
+
+    assert output.time_series.backend == "ragged"
@@ -1,5 +1,6 @@
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 
 from tempor.exc import UnsupportedSetupException
@@ -13,6 +14,19 @@ def test_merge_data_no_static(pbc_data_full):
     emb._merge_data(None, temporal, observation_times)  # pylint: disable=protected-access
 
 
+def test_merge_data():
+    emb = DDHEmbedding(emb_model=DynamicDeepHitModel())
+    static = np.asarray([[10.0], [20.0]])
+    temporal = [np.ones((3, 2)), np.zeros((1, 2))]
+    observation_times = [np.asarray([0.0, 1.0, 2.0]), np.asarray([5.0])]
+
+    merged = emb._merge_data(static, temporal, observation_times)  # pylint: disable=protected-access
+
+    assert merged.dtype == object
+    assert merged[0].tolist() == [[1.0, 1.0, 10.0, 0.0], [1.0, 1.0, 10.0, 1.0], [1.0, 1.0, 10.0, 2.0]]
+    assert merged[1].tolist() == [[0.0, 0.0, 20.0, 5.0]]
+
+
 def test_convert_data_no_static_no_targets(pbc_data_full):
     emb = DDHEmbedding(emb_model=DynamicDeepHitModel())
     data = pbc_data_full